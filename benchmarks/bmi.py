@@ -0,0 +1,52 @@
+"""Benchmarks for driving a component through its BMI."""
+
+import numpy as np
+
+from landlab.bmi import wrap_as_bmi
+from landlab.components import LinearDiffuser
+
+CONFIG = """
+linear_diffuser:
+    linear_diffusivity: 0.01
+clock:
+    start: 0.0
+    stop: 1.0e+6
+    step: 1.0
+grid:
+    RasterModelGrid:
+    - [{0}, {0}]
+    - fields:
+        node:
+          topographic__elevation:
+            constant:
+              - value: 0.0
+"""
+
+
+class TimeBmi:
+    params = [20, 200]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.diffuser = wrap_as_bmi(LinearDiffuser)()
+        self.diffuser.initialize(CONFIG.format(size))
+
+        self.z = np.empty(self.diffuser.get_grid_size(0))
+        self.uplift_at = np.arange(0, len(self.z), 7)
+        self.uplift = np.empty(len(self.uplift_at))
+
+    def time_coupled_exchange(self, size):
+        # Exchange a field and a few values with the model at every time step.
+        for _ in range(2000):
+            self.diffuser.get_value("topographic__elevation", self.z)
+            self.diffuser.set_value("topographic__elevation", self.z)
+            self.diffuser.get_value_at_indices(
+                "topographic__elevation", self.uplift, self.uplift_at
+            )
+            self.diffuser.set_value_at_indices(
+                "topographic__elevation", self.uplift_at, self.uplift + 0.001
+            )
+            self.diffuser.update()
+
+    def time_update_until(self, size):
+        self.diffuser.update_until(self.diffuser.get_current_time() + 2000.0)
@@ -0,0 +1,57 @@
+"""Benchmarks for CellLab-CTS models."""
+
+import numpy as np
+
+from landlab import HexModelGrid, RasterModelGrid
+from landlab.ca.celllab_cts import Transition
+from landlab.ca.hex_cts import HexCTS
+from landlab.ca.raster_cts import RasterCTS
+
+
+def _transitions():
+    """A simple two-state diffusion-like model."""
+    return [
+        Transition((0, 1, 0), (1, 0, 0), 1.0, "left/down motion"),
+        Transition((1, 0, 0), (0, 1, 0), 1.0, "right/up motion"),
+    ]
+
+
+def _grid_with_states(grid_type, size):
+    if grid_type == "raster":
+        grid = RasterModelGrid((size, size))
+    else:
+        grid = HexModelGrid((size, size))
+    node_state = grid.add_zeros("node_state", at="node", dtype=int)
+    node_state[:] = np.random.RandomState(1945).randint(0, 2, grid.number_of_nodes)
+    return grid
+
+
+def _model(grid_type, grid):
+    cts = RasterCTS if grid_type == "raster" else HexCTS
+    return cts(
+        grid, {0: "empty", 1: "full"}, _transitions(), grid.at_node["node_state"]
+    )
+
+
+class TimeCreateCellLabCTS:
+    params = (["raster", "hex"], [20, 50])
+    param_names = ["grid_type", "size"]
+    # Creating a model adds fields to the grid, so each needs a new grid.
+    number = 1
+
+    def setup(self, grid_type, size):
+        self.grid = _grid_with_states(grid_type, size)
+
+    def time_create(self, grid_type, size):
+        _model(grid_type, self.grid)
+
+
+class TimeRunCellLabCTS:
+    params = (["raster", "hex"], [20, 50])
+    param_names = ["grid_type", "size"]
+
+    def setup(self, grid_type, size):
+        self.model = _model(grid_type, _grid_with_states(grid_type, size))
+
+    def time_run(self, grid_type, size):
+        self.model.run(self.model.current_time + 10.0)
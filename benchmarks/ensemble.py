@@ -0,0 +1,41 @@
+"""Benchmarks for running an ensemble of model realizations."""
+
+import numpy as np
+
+from landlab import HexModelGrid
+from landlab.components import FlowAccumulator, LinearDiffuser
+from landlab.utils import run_ensemble
+
+
+def _evolve(grid, linear_diffusivity=0.01, n_steps=10):
+    FlowAccumulator(grid).run_one_step()
+    diffuser = LinearDiffuser(grid, linear_diffusivity=linear_diffusivity)
+    for _ in range(n_steps):
+        diffuser.run_one_step(1.0)
+
+
+def _rough_grid(size):
+    grid = HexModelGrid((size, size))
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z[:] = np.random.RandomState(1945).rand(grid.number_of_nodes)
+    return grid
+
+
+class TimeEnsemble:
+    params = (["rebuild_grid", "shared_grid"], [50, 100])
+    param_names = ["method", "size"]
+
+    def setup(self, method, size):
+        self.members = [
+            {"linear_diffusivity": linear_diffusivity}
+            for linear_diffusivity in np.linspace(0.001, 0.01, 8)
+        ]
+
+    def time_run_members(self, method, size):
+        if method == "rebuild_grid":
+            for params in self.members:
+                _evolve(_rough_grid(size), **params)
+        else:
+            run_ensemble(
+                _rough_grid(size), _evolve, self.members, "topographic__elevation"
+            )
@@ -0,0 +1,115 @@
+"""Benchmarks for the main erosion and hillslope components."""
+
+import time
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import (
+    DepthDependentDiffuser,
+    ErosionDeposition,
+    ExponentialWeatherer,
+    FastscapeEroder,
+    FlowAccumulator,
+    LinearDiffuser,
+    SedDepEroder,
+    Space,
+    StreamPowerEroder,
+    TaylorNonLinearDiffuser,
+)
+
+
+def _landscape(size, soil=False):
+    grid = RasterModelGrid((size, size))
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z[:] = 0.01 * (grid.x_of_node + grid.y_of_node) + np.random.RandomState(1945).rand(
+        grid.number_of_nodes
+    )
+    if soil:
+        grid.add_ones("soil__depth", at="node")
+        grid.add_field("bedrock__elevation", z - 1.0, at="node")
+    return grid
+
+
+class TimeFluvialErosion:
+    params = (["FastscapeEroder", "StreamPowerEroder"], [50, 200, 500])
+    param_names = ["component", "size"]
+
+    def setup(self, component, size):
+        self.grid = _landscape(size)
+        self.accumulator = FlowAccumulator(self.grid, flow_director="D8")
+        self.accumulator.run_one_step()
+        if component == "FastscapeEroder":
+            self.eroder = FastscapeEroder(self.grid, K_sp=1e-5)
+        else:
+            self.eroder = StreamPowerEroder(self.grid, K_sp=1e-5)
+
+    def time_run_one_step(self, component, size):
+        self.eroder.run_one_step(1.0)
+
+
+class TimeSedimentFluxErosion:
+    params = (["ErosionDeposition", "Space"], [50, 100])
+    param_names = ["component", "size"]
+
+    def setup(self, component, size):
+        self.grid = _landscape(size, soil=(component == "Space"))
+        self.accumulator = FlowAccumulator(self.grid, flow_director="D8")
+        self.accumulator.run_one_step()
+        if component == "ErosionDeposition":
+            self.eroder = ErosionDeposition(
+                self.grid, K=1e-5, v_s=0.5, solver="adaptive"
+            )
+        else:
+            self.eroder = Space(
+                self.grid, K_sed=1e-5, K_br=1e-5, F_f=0.0, phi=0.0, H_star=1.0
+            )
+
+    def time_run_one_step(self, component, size):
+        self.eroder.run_one_step(1.0)
+
+
+class TimeSedDepEroder:
+    params = (["power_law", "MPM"], [50, 200])
+    param_names = ["Qc", "size"]
+
+    def setup(self, Qc, size):
+        self.grid = _landscape(size)
+        self.accumulator = FlowAccumulator(self.grid, flow_director="D8")
+        self.accumulator.run_one_step()
+        self.eroder = SedDepEroder(self.grid, K_sp=1e-5, Qc=Qc)
+
+    def time_run_one_step(self, Qc, size):
+        self.eroder.run_one_step(1.0)
+
+    def track_node_updates_per_second(self, Qc, size):
+        n_steps = 10
+        start = time.perf_counter()
+        for _ in range(n_steps):
+            self.eroder.run_one_step(1.0)
+        return n_steps * self.grid.number_of_nodes / (time.perf_counter() - start)
+
+    track_node_updates_per_second.unit = "nodes/s"
+
+
+class TimeHillslopeDiffusion:
+    params = (
+        ["LinearDiffuser", "TaylorNonLinearDiffuser", "DepthDependentDiffuser"],
+        [50, 200],
+    )
+    param_names = ["component", "size"]
+
+    def setup(self, component, size):
+        self.grid = _landscape(size, soil=(component == "DepthDependentDiffuser"))
+        if component == "LinearDiffuser":
+            self.diffuser = LinearDiffuser(self.grid, linear_diffusivity=0.01)
+        elif component == "TaylorNonLinearDiffuser":
+            self.diffuser = TaylorNonLinearDiffuser(
+                self.grid, linear_diffusivity=0.01, nterms=2
+            )
+        else:
+            ExponentialWeatherer(self.grid).calc_soil_prod_rate()
+            self.diffuser = DepthDependentDiffuser(self.grid, linear_diffusivity=0.01)
+
+    def time_run_one_step(self, component, size):
+        self.diffuser.run_one_step(1.0)
@@ -0,0 +1,75 @@
+"""Benchmarks for operators that act on fields."""
+
+import numpy as np
+
+from landlab import HexModelGrid, RasterModelGrid
+
+
+def _grid(grid_type, size):
+    if grid_type == "raster":
+        grid = RasterModelGrid((size, size))
+    else:
+        grid = HexModelGrid((size, size))
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z[:] = np.random.RandomState(1945).rand(grid.number_of_nodes)
+    return grid
+
+
+class TimeFieldOperators:
+    params = (["raster", "hex"], [50, 100])
+    param_names = ["grid_type", "size"]
+
+    def setup(self, grid_type, size):
+        self.grid = _grid(grid_type, size)
+        self.z = self.grid.at_node["topographic__elevation"]
+        self.grad = self.grid.calc_grad_at_link(self.z)
+        self.out_at_link = self.grid.empty(at="link")
+        self.out_at_node = self.grid.empty(at="node")
+
+    def time_add_zeros(self, grid_type, size):
+        self.grid.add_zeros("soil__depth", at="node", clobber=True)
+
+    def time_calc_grad_at_link(self, grid_type, size):
+        self.grid.calc_grad_at_link(self.z, out=self.out_at_link)
+
+    def time_calc_diff_at_link(self, grid_type, size):
+        self.grid.calc_diff_at_link(self.z, out=self.out_at_link)
+
+    def time_calc_flux_div_at_node(self, grid_type, size):
+        self.grid.calc_flux_div_at_node(self.grad, out=self.out_at_node)
+
+    def time_calc_slope_at_node(self, grid_type, size):
+        self.grid.calc_slope_at_node(self.z)
+
+    def time_calc_hillshade_at_node(self, grid_type, size):
+        self.grid.calc_hillshade_at_node(elevs=self.z)
+
+    def time_map_mean_of_link_nodes_to_link(self, grid_type, size):
+        self.grid.map_mean_of_link_nodes_to_link(self.z, out=self.out_at_link)
+
+    def time_map_max_of_link_nodes_to_link(self, grid_type, size):
+        self.grid.map_max_of_link_nodes_to_link(self.z, out=self.out_at_link)
+
+    def time_map_upwind_node_link_max_to_node(self, grid_type, size):
+        self.grid.map_upwind_node_link_max_to_node(self.grad, out=self.out_at_node)
+
+    def time_map_link_vector_to_nodes(self, grid_type, size):
+        self.grid.map_link_vector_to_nodes(self.grad)
+
+
+class TimeRasterGradients:
+    params = [100, 1000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.grid = RasterModelGrid((size, size))
+        self.z = self.grid.zeros(at="node")
+
+    def time_calc_grad_across_cell_faces(self, size):
+        self.grid.calc_grad_across_cell_faces(self.z)
+
+    def time_calc_grad_across_cell_corners(self, size):
+        self.grid.calc_grad_across_cell_corners(self.z)
+
+    def time_calc_slope_at_node(self, size):
+        self.grid.calc_slope_at_node(self.z)
@@ -0,0 +1,141 @@
+"""Benchmarks for every combination of flow director and accumulator."""
+
+import numpy as np
+
+from landlab import HexModelGrid, RasterModelGrid
+from landlab.components import FlowAccumulator
+from landlab.components.flow_director.flow_direction_dinf import (
+    flow_directions_dinf,
+)
+from landlab.utils import get_watershed_masks
+from landlab.utils.distance_to_divide import calculate_distance_to_divide
+from landlab.utils.flow__distance import calculate_flow__distance
+
+RASTER_DIRECTORS = ["Steepest", "D8", "MFD", "DINF"]
+HEX_DIRECTORS = ["Steepest", "MFD"]
+
+
+def _rough_grid(grid_type, size):
+    if grid_type == "raster":
+        grid = RasterModelGrid((size, size))
+    else:
+        grid = HexModelGrid((size, size))
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z[:] = (
+        grid.x_of_node
+        + grid.y_of_node
+        + np.random.RandomState(1945).rand(grid.number_of_nodes)
+    )
+    return grid
+
+
+class TimeFlowAccumulator:
+    params = (
+        ["raster", "hex"],
+        RASTER_DIRECTORS,
+        [None, "DepressionFinderAndRouter"],
+        [50, 100],
+    )
+    param_names = ["grid_type", "flow_director", "depression_finder", "size"]
+
+    def setup(self, grid_type, flow_director, depression_finder, size):
+        # Raising NotImplementedError skips a benchmark. FlowAccumulator
+        # raises it for combinations that it doesn't support.
+        if grid_type == "hex" and flow_director not in HEX_DIRECTORS:
+            raise NotImplementedError()
+        self.grid = _rough_grid(grid_type, size)
+
+        kwds = {}
+        if depression_finder is not None and flow_director == "Steepest":
+            if grid_type == "raster":
+                kwds["routing"] = "D4"
+        self.accumulator = FlowAccumulator(
+            self.grid,
+            flow_director=flow_director,
+            depression_finder=depression_finder,
+            **kwds
+        )
+
+    def time_run_one_step(self, grid_type, flow_director, depression_finder, size):
+        self.accumulator.run_one_step()
+
+    def peakmem_run_one_step(self, grid_type, flow_director, depression_finder, size):
+        self.accumulator.run_one_step()
+
+
+class TimeFlowDirectorOnly:
+    params = (RASTER_DIRECTORS, [50, 200, 500])
+    param_names = ["flow_director", "size"]
+
+    def setup(self, flow_director, size):
+        self.grid = _rough_grid("raster", size)
+        self.accumulator = FlowAccumulator(self.grid, flow_director=flow_director)
+        self.accumulator.run_one_step()
+
+    def time_direct_flow(self, flow_director, size):
+        self.accumulator.flow_director.run_one_step()
+
+    def time_accumulate_flow(self, flow_director, size):
+        self.accumulator.accumulate_flow(update_flow_director=False)
+
+
+class TimeFlowDirectorDINF:
+    params = [500, 2000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.grid = _rough_grid("raster", size)
+        self.accumulator = FlowAccumulator(self.grid, flow_director="DINF")
+
+    def time_flow_directions_dinf(self, size):
+        flow_directions_dinf(self.grid, "topographic__elevation")
+
+    def time_direct_flow(self, size):
+        self.accumulator.flow_director.run_one_step()
+
+    def time_run_one_step(self, size):
+        self.accumulator.run_one_step()
+
+
+class TimeFlowDirectorMFD:
+    params = ([False, True], [500, 2000])
+    param_names = ["diagonals", "size"]
+
+    def setup(self, diagonals, size):
+        self.grid = _rough_grid("raster", size)
+        self.accumulator = FlowAccumulator(
+            self.grid, flow_director="MFD", diagonals=diagonals
+        )
+
+    def time_direct_flow(self, diagonals, size):
+        self.accumulator.flow_director.run_one_step()
+
+    def time_run_one_step(self, diagonals, size):
+        self.accumulator.run_one_step()
+
+
+class TimeStackPropagation:
+    params = (["D8", "MFD"], [200, 1000])
+    param_names = ["flow_director", "size"]
+
+    def setup(self, flow_director, size):
+        self.grid = _rough_grid("raster", size)
+        FlowAccumulator(self.grid, flow_director=flow_director).run_one_step()
+
+    def time_flow__distance(self, flow_director, size):
+        calculate_flow__distance(self.grid)
+
+    def time_distance_to_divide(self, flow_director, size):
+        calculate_distance_to_divide(self.grid)
+
+
+class TimeWatershedMasks:
+    params = [200, 1000]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.grid = _rough_grid("raster", size)
+        FlowAccumulator(self.grid, flow_director="D8").run_one_step()
+
+    def time_watershed_masks(self, size):
+        get_watershed_masks(self.grid)
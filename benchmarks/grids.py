@@ -0,0 +1,76 @@
+"""Benchmarks for creating grids."""
+
+import tempfile
+
+import numpy as np
+
+from landlab import HexModelGrid, NetworkModelGrid, RasterModelGrid, VoronoiDelaunayGrid
+
+
+class TimeRasterModelGrid:
+    params = [(100, 100), (1000, 1000)]
+    param_names = ["shape"]
+
+    def time_create(self, shape):
+        RasterModelGrid(shape)
+
+    def time_create_with_connectivity(self, shape):
+        grid = RasterModelGrid(shape)
+        grid.links_at_node
+        grid.link_dirs_at_node
+        grid.patches_at_node
+        grid.active_links
+
+    def peakmem_create(self, shape):
+        RasterModelGrid(shape)
+
+
+class TimeHexModelGrid:
+    params = ([(20, 20), (60, 60)], ["rect", "hex"])
+    param_names = ["shape", "node_layout"]
+
+    def time_create(self, shape, node_layout):
+        HexModelGrid(shape, node_layout=node_layout)
+
+    def peakmem_create(self, shape, node_layout):
+        HexModelGrid(shape, node_layout=node_layout)
+
+
+class TimeVoronoiDelaunayGrid:
+    params = [1000, 100000]
+    param_names = ["n_nodes"]
+
+    def setup(self, n_nodes):
+        rng = np.random.RandomState(1945)
+        self.x = rng.rand(n_nodes)
+        self.y = rng.rand(n_nodes)
+
+        self.cache = tempfile.TemporaryDirectory()
+        VoronoiDelaunayGrid(self.x.copy(), self.y.copy(), cache_dir=self.cache.name)
+
+    def teardown(self, n_nodes):
+        self.cache.cleanup()
+
+    def time_create(self, n_nodes):
+        # the grid sorts the coordinates it is given, in place.
+        VoronoiDelaunayGrid(self.x.copy(), self.y.copy())
+
+    def time_create_from_cache(self, n_nodes):
+        VoronoiDelaunayGrid(self.x.copy(), self.y.copy(), cache_dir=self.cache.name)
+
+    def peakmem_create(self, n_nodes):
+        VoronoiDelaunayGrid(self.x.copy(), self.y.copy())
+
+
+class TimeNetworkModelGrid:
+    params = [100, 10000]
+    param_names = ["n_nodes"]
+
+    def setup(self, n_nodes):
+        # A binary tree of links.
+        self.y_of_node = -np.floor(np.log2(np.arange(n_nodes) + 1))
+        self.x_of_node = np.arange(n_nodes, dtype=float)
+        self.links = [((node - 1) // 2, node) for node in range(1, n_nodes)]
+
+    def time_create(self, n_nodes):
+        NetworkModelGrid((self.y_of_node, self.x_of_node), self.links)
@@ -0,0 +1,83 @@
+"""Benchmarks for the overland flow and groundwater components."""
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.components import (
+    GroundwaterDupuitPercolator,
+    KinwaveImplicitOverlandFlow,
+    OverlandFlow,
+)
+
+OVERLAND_FLOW_KERNELS = {
+    "arrays": {},
+    "fused": {"fused_kernel": True},
+    "fused_threaded": {"fused_kernel": True, "threads": 4},
+}
+
+
+class TimeOverlandFlow:
+    params = (list(OVERLAND_FLOW_KERNELS), [200, 1000])
+    param_names = ["kernel", "size"]
+
+    def setup(self, kernel, size):
+        grid = RasterModelGrid((size, size), xy_spacing=10.0)
+        rng = np.random.RandomState(1945)
+        z = grid.add_zeros("topographic__elevation", at="node")
+        z[:] = 0.01 * grid.y_of_node + 0.1 * rng.rand(grid.number_of_nodes)
+        h = grid.add_zeros("surface_water__depth", at="node")
+        h[:] = 0.05 * rng.rand(grid.number_of_nodes)
+
+        self.overland_flow = OverlandFlow(
+            grid, steep_slopes=True, **OVERLAND_FLOW_KERNELS[kernel]
+        )
+        self.overland_flow.overland_flow()
+
+    def time_overland_flow_substeps(self, kernel, size):
+        for _ in range(20):
+            self.overland_flow.overland_flow()
+
+
+class TimeKinwaveImplicitOverlandFlow:
+    params = [100, 200]
+    param_names = ["size"]
+
+    def setup(self, size):
+        grid = RasterModelGrid((size, size), xy_spacing=2.0)
+        z = grid.add_zeros("topographic__elevation", at="node")
+        z[:] = 0.01 * (grid.x_of_node + grid.y_of_node) + 0.1 * np.random.RandomState(
+            1945
+        ).rand(grid.number_of_nodes)
+
+        self.kinwave = KinwaveImplicitOverlandFlow(
+            grid, runoff_rate=10.0, changing_topo=False
+        )
+
+    def time_run_one_step(self, size):
+        for _ in range(20):
+            self.kinwave.run_one_step(10.0)
+
+
+class TimeGroundwaterDupuitPercolator:
+    params = (["adaptive", "implicit"], [100, 200])
+    param_names = ["solver", "size"]
+
+    def setup(self, solver, size):
+        grid = RasterModelGrid((size, size), xy_spacing=5.0)
+        grid.set_closed_boundaries_at_grid_edges(True, True, False, True)
+        elev = grid.add_zeros("topographic__elevation", at="node")
+        elev[:] = grid.x_of_node / 100.0 + 2.0
+        base = grid.add_zeros("aquifer_base__elevation", at="node")
+        base[:] = grid.x_of_node / 200.0
+        wt = grid.add_zeros("water_table__elevation", at="node")
+        wt[:] = base + 1.0
+
+        self.percolator = GroundwaterDupuitPercolator(
+            grid, hydraulic_conductivity=0.01, recharge_rate=1e-6
+        )
+
+    def time_run(self, solver, size):
+        if solver == "adaptive":
+            self.percolator.run_with_adaptive_time_step_solver(2e4)
+        else:
+            self.percolator.run_with_implicit_solver(2e4)
@@ -0,0 +1,18 @@
+"""Benchmarks for how long a fresh interpreter takes to import landlab.
+
+asv runs each ``timeraw_`` benchmark in a new Python process, so nothing
+is already in ``sys.modules``. Subtract the time to import numpy to get the
+cost of landlab itself.
+"""
+
+
+class TimeImport:
+    params = ["numpy", "landlab", "landlab.components"]
+    param_names = ["module"]
+
+    def timeraw_import(self, module):
+        return "import {0}".format(module)
+
+
+def timeraw_create_raster_model_grid():
+    return "from landlab import RasterModelGrid; RasterModelGrid((10, 10))"
@@ -0,0 +1,93 @@
+"""Benchmarks for reading and writing grids."""
+
+import os
+import tempfile
+
+import numpy as np
+
+from landlab import RasterModelGrid
+from landlab.io import read_esri_ascii, write_esri_ascii
+from landlab.io.native_landlab import load_grid, save_grid
+from landlab.io.netcdf import read_netcdf, write_netcdf
+from landlab.io.shapefile import read_shapefile
+
+
+class TimeReadersAndWriters:
+    params = [(100, 100), (500, 500)]
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.grid = RasterModelGrid(shape)
+        z = self.grid.add_zeros("topographic__elevation", at="node")
+        z[:] = np.random.RandomState(1945).rand(self.grid.number_of_nodes)
+
+        self.asc = self._path("grid.asc")
+        write_esri_ascii(self.asc, self.grid, names="topographic__elevation")
+        self.nc = self._path("grid.nc")
+        write_netcdf(self.nc, self.grid, names="topographic__elevation")
+        self.native = self._path("grid.grid")
+        save_grid(self.grid, self.native)
+
+    def teardown(self, shape):
+        self.tmpdir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def time_write_esri_ascii(self, shape):
+        write_esri_ascii(
+            self._path("out.asc"),
+            self.grid,
+            names="topographic__elevation",
+            clobber=True,
+        )
+
+    def time_read_esri_ascii(self, shape):
+        read_esri_ascii(self.asc)
+
+    def time_write_netcdf(self, shape):
+        write_netcdf(self._path("out.nc"), self.grid, names="topographic__elevation")
+
+    def time_read_netcdf(self, shape):
+        read_netcdf(self.nc)
+
+    def time_save_grid(self, shape):
+        save_grid(self.grid, self._path("out.grid"), clobber=True)
+
+    def time_load_grid(self, shape):
+        load_grid(self.native)
+
+
+class TimeReadShapefile:
+    params = [1000, 10000]
+    param_names = ["n_reaches"]
+
+    def setup(self, n_reaches):
+        import shapefile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.shp = os.path.join(self.tmpdir.name, "network.shp")
+
+        # A binary tree of reaches, each with a few vertices.
+        rng = np.random.RandomState(1945)
+        x_of_node = rng.rand(n_reaches + 1) * 1e5
+        y_of_node = rng.rand(n_reaches + 1) * 1e5
+        with shapefile.Writer(self.shp, shapeType=shapefile.POLYLINE) as w:
+            w.field("reach_id", "N")
+            w.field("slope", "F", decimal=6)
+            for reach in range(n_reaches):
+                head, tail = reach + 1, reach // 2
+                x = np.linspace(x_of_node[head], x_of_node[tail], 4)
+                y = np.linspace(y_of_node[head], y_of_node[tail], 4)
+                w.line([list(zip(x, y))])
+                w.record(reach, rng.rand())
+
+    def teardown(self, n_reaches):
+        self.tmpdir.cleanup()
+
+    def time_read_shapefile(self, n_reaches):
+        read_shapefile(self.shp)
+
+    def time_read_shapefile_with_snapping(self, n_reaches):
+        read_shapefile(self.shp, snap_tolerance=1e-6)
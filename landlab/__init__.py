@@ -10,6 +10,8 @@
 :License: MIT
 """
 
+import sys
+
 from numpy import set_printoptions
 
 from ._registry import registry
@@ -30,7 +32,33 @@ from .grid import (
 )
 from .grid.linkstatus import LinkStatus
 from .grid.nodestatus import NodeStatus
-from .plot import imshow_grid, imshow_grid_at_node
+
+# Plotting pulls in matplotlib, which is slow to import and not needed by
+# most model runs, so the plotting functions are only imported when first
+# used (PEP 562). Python 3.6 doesn't support module-level __getattr__.
+_LAZY_ATTRS = {
+    "imshow_grid": ".plot",
+    "imshow_grid_at_node": ".plot",
+}
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name in _LAZY_ATTRS:
+            import importlib
+
+            module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+            globals()[name] = getattr(module, name)
+            return globals()[name]
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+
+    def __dir__():
+        return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+else:  # pragma: no cover
+    from .plot import imshow_grid, imshow_grid_at_node
 
 try:
     set_printoptions(legacy="1.13")
@@ -63,4 +91,4 @@ __all__ = [
 ]
 
 __version__ = get_versions()["version"]
-del get_versions
+del get_versions, sys
@@ -356,23 +356,39 @@ def wrap_as_bmi(cls):
                 "boundary_condition_flag"
             ] = self._base.grid.status_at_node
 
-        def update(self):
-            """Update the component one time step."""
+            self._run_for = self._make_run_for()
+            self._values_at = {
+                name: self._base.grid[info["mapping"]]
+                for name, info in self._info.items()
+                if info["mapping"] in BMI_LOCATION
+            }
+
+        def _make_run_for(self):
+            """Choose, once, how to advance the component by a time step."""
             if hasattr(self._base, "update"):
-                self._base.update()
+                update = self._base.update
+                return lambda dt: update()
             elif hasattr(self._base, "run_one_step"):
-                args = []
-                for name, arg in inspect.signature(
-                    self._base.run_one_step
-                ).parameters.items():
-                    if arg.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
-                        args.append(name)
-
-                if len(args) == 0 or "dt" not in args:
-                    self._base.run_one_step()
+                run_one_step = self._base.run_one_step
+                args = [
+                    name
+                    for name, arg in inspect.signature(run_one_step).parameters.items()
+                    if arg.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+                ]
+                if "dt" in args:
+                    return run_one_step
                 else:
-                    self._base.run_one_step(self._clock.step)
+                    return lambda dt: run_one_step()
+            else:
+                return lambda dt: None
+
+        def _values(self, name):
+            """Get the array of values of a variable."""
+            return self._values_at[name][name]
 
+        def update(self):
+            """Update the component one time step."""
+            self._run_for(self._clock.step)
             self._clock.advance()
 
         def update_frac(self, frac):
@@ -383,11 +399,22 @@ def wrap_as_bmi(cls):
             self._clock.step = time_step
 
         def update_until(self, then):
-            """Update the component until a given time."""
+            """Update the component until a given time.
+
+            Components that divide their time step into stable substeps
+            themselves are advanced over the whole interval at once.
+            Otherwise, the component is advanced one time step at a time.
+            """
             n_steps = (then - self.get_current_time()) / self.get_time_step()
+            if self._base._substeps_internally:
+                if n_steps > 0.0:
+                    self.update_frac(n_steps)
+                return
+
             for _ in range(int(n_steps)):
                 self.update()
-            self.update_frac(n_steps - int(n_steps))
+            if n_steps > int(n_steps):
+                self.update_frac(n_steps - int(n_steps))
 
         def finalize(self):
             """Clean-up the component."""
@@ -419,13 +446,11 @@ def wrap_as_bmi(cls):
 
         def get_value_ref(self, name):
             """Get a reference to a variable's data."""
-            at = self._info[name]["mapping"]
-            return self._base.grid[at][name]
+            return self._values(name)
 
         def get_value(self, name, dest):
             """Get a copy of a variable's data."""
-            at = self._info[name]["mapping"]
-            dest[:] = self._base.grid[at][name]
+            dest[:] = self._values(name)
             return dest
 
         def set_value(self, name, values):
@@ -434,8 +459,7 @@ def wrap_as_bmi(cls):
                 if name == "boundary_condition_flag":
                     self._base.grid.status_at_node = values
                 else:
-                    at = self._info[name]["mapping"]
-                    self._base.grid[at][name][:] = values.flat
+                    self._values(name)[:] = np.reshape(values, -1)
             else:
                 raise KeyError("{name} is not an input item".format(name=name))
 
@@ -545,20 +569,18 @@ def wrap_as_bmi(cls):
             # Only should be implemented for presently non-existant 3D grids.
 
         def get_value_at_indices(self, name, dest, inds):
-            at = self._info[name]["mapping"]
-            dest[:] = self._base.grid[at][name][inds]
+            dest[:] = self._values(name)[inds]
             return dest
 
         def get_value_ptr(self, name):
-            at = self._info[name]["mapping"]
-            return self._base.grid[at][name]
+            """Get a reference to a variable's data (no copy is made)."""
+            return self._values(name)
 
         def get_var_location(self, name):
             return BMI_LOCATION[self._info[name]["mapping"]]
 
         def set_value_at_indices(self, name, inds, src):
-            at = self._info[name]["mapping"]
-            self._base.grid[at][name][inds] = src
+            self._values(name)[inds] = src
 
     BmiWrapper.__name__ = cls.__name__
     return BmiWrapper
@@ -33,8 +33,6 @@ from numpy import (
 from landlab import HexModelGrid, LinkStatus
 from landlab.core.utils import as_id_array
 
-from ..cfuncs import get_next_event_new  # , update_link_state_new
-
 _DEFAULT_NUM_ROWS = 5
 _DEFAULT_NUM_COLS = 5
 _TAN60 = 1.732
@@ -143,6 +141,14 @@ class HexLatticeTectonicizer(object):
         self.prop_data = prop_data
         self.prop_reset_value = prop_reset_value
 
+    def _link_states_from_node_states(self, ca, links, node_state):
+        """Return the states of links given the states of their nodes."""
+        return (
+            ca.link_orientation[links].astype(int) * ca.num_node_states_sq
+            + node_state[self.grid.node_at_link_tail[links]] * ca.num_node_states
+            + node_state[self.grid.node_at_link_head[links]]
+        )
+
 
 class LatticeNormalFault(HexLatticeTectonicizer):
     """Handles normal-fault displacement in CellLab-CTS models.
@@ -605,14 +611,7 @@ class LatticeNormalFault(HexLatticeTectonicizer):
         >>> (int(1000 * pq[61][0]), pq[61][1:])
         (575, (6, 35))
         """
-        for i in range(len(ca.priority_queue._queue)):
-            link = ca.priority_queue._queue[i][2]
-            if self.link_offset_id[link] != link:
-                ca.priority_queue._queue[i] = (
-                    ca.priority_queue._queue[i][0],
-                    ca.priority_queue._queue[i][1],
-                    self.link_offset_id[link],
-                )
+        ca.priority_queue.relabel(self.link_offset_id)
 
     def shift_link_states(self, ca, current_time):
         """Shift link data up and right.
@@ -657,18 +656,21 @@ class LatticeNormalFault(HexLatticeTectonicizer):
                 4, 11,  4,  0,  2,  4,  8,  6,  8,  0,  0,  0,  8,  4,  8,  4,  0,
                 0,  0,  0,  0,  0])
         """
-        num_links = self.grid.number_of_links
-        for lnk in range(num_links - 1, self.first_link_shifted_from - 1, -1):
-            link_offset = self.link_offset_id[lnk]
-            if link_offset != lnk:
-                ca.link_state[link_offset] = ca.link_state[lnk]
-                ca.next_trn_id[link_offset] = ca.next_trn_id[lnk]
-                ca.next_update[link_offset] = ca.next_update[lnk]
+        # Links are shifted up and to the right so, working from the top
+        # down, a link's data are always moved before they are overwritten.
+        is_shifted = self.link_offset_id != arange(self.grid.number_of_links)
+        shifted_from = where(is_shifted)[0][::-1]
+        shifted_to = self.link_offset_id[shifted_from]
+        for link_data in (ca.link_state, ca.next_trn_id, ca.next_update):
+            link_data[shifted_to] = link_data[shifted_from]
 
         self.shift_scheduled_transitions(ca, current_time)
 
-        for lnk in self.links_to_update:
-            self.assign_new_link_state_and_transition(lnk, ca, current_time)
+        ca.reschedule_links(
+            self.links_to_update,
+            self._link_states_from_node_states(ca, self.links_to_update, ca.node_state),
+            current_time,
+        )
 
     def do_offset(self, ca=None, current_time=0.0, rock_state=1):
         """Apply 60-degree normal-fault offset.
@@ -977,61 +979,42 @@ class LatticeUplifter(HexLatticeTectonicizer):
         # (or down)
         shift = nc + 2 * (nc - 1)
 
-        # Loop from top to bottom of grid, shifting the following link data
-        # upward: state of link, ID of its next transition, and time of its
-        # next transition.
-        for lnk in range(self.grid.number_of_links - 1, first_link - 1, -1):
-            ca.link_state[lnk] = ca.link_state[lnk - shift]
-            ca.next_trn_id[lnk] = ca.next_trn_id[lnk - shift]
-            ca.next_update[lnk] = ca.next_update[lnk - shift]
-
-        # Sweep through event queue, shifting links upward. Do NOT shift links
-        # with IDs greater than NL - [SHIFT + (NC - 1)], because these are so
-        # close to the top of the grid that either the events would refer to
-        # non-existent links (>= NL) or would involve shifting an event onto
-        # an upper-boundary link. Note that because the event data are stored
-        # in a tuple, we have to replace the entire tuple (can't simply change
-        # the one item, because tuples are immutable)
-        first_no_shift_id = self.grid.number_of_links - (shift + (nc - 1))
-        for i in range(len(ca.priority_queue._queue)):
-            if ca.priority_queue._queue[i][2] < first_no_shift_id:
-                ca.priority_queue._queue[i] = (
-                    ca.priority_queue._queue[i][0],
-                    ca.priority_queue._queue[i][1],
-                    (ca.priority_queue._queue[i][2] + shift),
-                )
-
-        # Update state of links along the boundaries.
-        for lk in self.links_to_update:
+        # Shift the following link data upward, from top to bottom of grid:
+        # state of link, ID of its next transition, and time of its next
+        # transition.
+        num_links = self.grid.number_of_links
+        for link_data in (ca.link_state, ca.next_trn_id, ca.next_update):
+            link_data[first_link:] = link_data[first_link - shift : num_links - shift]
 
-            # Update link state
-            fns = self.node_state[self.grid.node_at_link_tail[lk]]
-            tns = self.node_state[self.grid.node_at_link_head[lk]]
-            orientation = ca.link_orientation[lk]
-            new_link_state = (
-                orientation * ca.num_node_states_sq + fns * ca.num_node_states + tns
-            )
+        # Shift links in the event queue upward. Do NOT shift links with IDs
+        # greater than NL - [SHIFT + (NC - 1)], because these are so close to
+        # the top of the grid that either the events would refer to
+        # non-existent links (>= NL) or would involve shifting an event onto
+        # an upper-boundary link.
+        first_no_shift_id = num_links - (shift + (nc - 1))
+        shifted_link = arange(num_links)
+        shifted_link[: max(first_no_shift_id, 0)] += shift
+        ca.priority_queue.relabel(shifted_link)
+
+        # Update state of links along the boundaries, and schedule new
+        # transitions, if applicable.
+        ca.reschedule_links(
+            self.links_to_update,
+            self._link_states_from_node_states(
+                ca, self.links_to_update, self.node_state
+            ),
+            current_time,
+        )
 
-            # Schedule a new transition, if applicable
-            ca.link_state[lk] = new_link_state
-            if ca.n_trn[new_link_state] > 0:
-                (event_time, this_trn_id) = get_next_event_new(
-                    lk, new_link_state, current_time, ca.n_trn, ca.trn_id, ca.trn_rate
-                )
-                ca.priority_queue.push(lk, event_time)
-                ca.next_update[lk] = event_time
-                ca.next_trn_id[lk] = this_trn_id
-            else:
-                ca.next_update[lk] = _NEVER
-                ca.next_trn_id[lk] = -1
+    def _inner_nodes_above_base_row(self):
+        """IDs of inner nodes, by row, of all but the bottom row."""
+        return self.inner_base_row_nodes + self.nc * arange(1, self.nr).reshape((-1, 1))
 
     def uplift_property_ids(self):
         """Shift property IDs upward by one row."""
         top_row_propid = self.propid[self.inner_top_row_nodes]
-        for r in range(self.nr - 1, 0, -1):
-            self.propid[self.inner_base_row_nodes + self.nc * r] = self.propid[
-                self.inner_base_row_nodes + self.nc * (r - 1)
-            ]
+        upper_nodes = self._inner_nodes_above_base_row()
+        self.propid[upper_nodes] = self.propid[upper_nodes - self.nc]
         self.propid[self.inner_base_row_nodes] = top_row_propid
         self.prop_data[self.propid[self.inner_base_row_nodes]] = self.prop_reset_value
 
@@ -1072,12 +1055,9 @@ class LatticeUplifter(HexLatticeTectonicizer):
         """
 
         # Shift the node states up by a full row. A "full row" includes two
-        # staggered rows.
-        for r in range(self.nr - 1, 0, -1):
-            # This row gets the contents of the nodes 1 row down
-            self.node_state[self.inner_base_row_nodes + self.nc * r] = self.node_state[
-                self.inner_base_row_nodes + self.nc * (r - 1)
-            ]
+        # staggered rows. Each row gets the contents of the nodes 1 row down.
+        upper_nodes = self._inner_nodes_above_base_row()
+        self.node_state[upper_nodes] = self.node_state[upper_nodes - self.nc]
 
         # Fill the bottom rows with "fresh material" (code = rock_state), or
         # if using a block layer, with the right pattern of states.
@@ -127,6 +127,7 @@ from landlab.ca.cfuncs import (
     PriorityQueue,
     get_next_event_new,
     push_transitions_to_event_queue,
+    reschedule_links,
     run_cts_new,
 )
 from landlab.grid.nodestatus import NodeStatus
@@ -706,6 +707,60 @@ class CellLabCTSModel(object):
             self.next_update[link] = _NEVER
             self.next_trn_id[link] = -1
 
+    def reschedule_links(self, links, new_link_states, current_time):
+        """Assign new states to a batch of links and schedule their next
+        transitions.
+
+        This has the same effect as calling *update_link_state_new* for each
+        link in turn, without the adjustment of states at boundary links,
+        but pushes all of the new events onto the event queue at once.
+
+        Parameters
+        ----------
+        links : array of int
+            IDs of the links to update
+        new_link_states : array of int
+            Code for the new state of each link
+        current_time : float
+            Current time in simulation
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.ca.celllab_cts import Transition
+        >>> from landlab.ca.raster_cts import RasterCTS
+        >>> import numpy as np
+        >>> grid = RasterModelGrid((3, 5))
+        >>> nsd = {0 : 'zero', 1 : 'one'}
+        >>> trn_list = []
+        >>> trn_list.append(Transition((0, 1, 0), (1, 1, 0), 1.0))
+        >>> ins = np.zeros(15, dtype=int)
+        >>> ca = RasterCTS(grid, nsd, trn_list, ins)
+        >>> len(ca.priority_queue._queue)
+        0
+        >>> ca.reschedule_links(np.array([9, 10, 11]), np.array([1, 0, 1]), 2.0)
+        >>> list(ca.link_state[9:12])
+        [1, 0, 1]
+        >>> len(ca.priority_queue._queue)
+        2
+        >>> ca.next_trn_id[9:12]
+        array([ 0, -1,  0])
+        >>> bool(np.all(ca.next_update[[9, 11]] > 2.0))
+        True
+        """
+        reschedule_links(
+            np.asarray(links, dtype=int),
+            np.asarray(new_link_states, dtype=int),
+            current_time,
+            self.link_state,
+            self.n_trn,
+            self.trn_id,
+            self.trn_rate,
+            self.next_update,
+            self.next_trn_id,
+            self.priority_queue,
+        )
+
     def update_component_data(self, new_node_state_array):
         """Update all component data.
 
@@ -53,6 +53,35 @@ cdef class PriorityQueue:
         assert len(self._queue) > 0, 'Q is empty'
         return heappop(self._queue)
 
+    def push_many(self, np.ndarray[DTYPE_INT_t, ndim=1] items,
+                  np.ndarray[DTYPE_t, ndim=1] priorities):
+        """Push a batch of items, in order, onto the queue."""
+        cdef int i
+        cdef int item
+        cdef double priority
+        cdef list queue = self._queue
+
+        for i in range(len(items)):
+            item = items[i]
+            priority = priorities[i]
+            heappush(queue, (priority, self._index, item))
+            self._index += 1
+
+    def relabel(self, np.ndarray[DTYPE_INT_t, ndim=1] new_item):
+        """Replace every item, i, in the queue with new_item[i].
+
+        Items are replaced in place so the ordering of the queue, which
+        depends only on priorities and insertion order, is unchanged.
+        """
+        cdef int i
+        cdef int item
+        cdef list queue = self._queue
+
+        for i in range(len(queue)):
+            item = queue[i][2]
+            if new_item[item] != item:
+                queue[i] = (queue[i][0], queue[i][1], new_item[item])
+
 
 cdef class Event:
     """
@@ -473,6 +502,78 @@ cpdef push_transitions_to_event_queue(int number_of_active_links,
         else:
             next_update[i] = _NEVER
 
+@cython.boundscheck(True)
+@cython.wraparound(False)
+cpdef reschedule_links(np.ndarray[DTYPE_INT_t, ndim=1] links,
+                       np.ndarray[DTYPE_INT_t, ndim=1] new_link_states,
+                       DTYPE_t current_time,
+                       np.ndarray[DTYPE_INT_t, ndim=1] link_state,
+                       np.ndarray[DTYPE_INT_t, ndim=1] n_trn,
+                       np.ndarray[DTYPE_INT_t, ndim=2] trn_id,
+                       np.ndarray[DTYPE_t, ndim=1] trn_rate,
+                       np.ndarray[DTYPE_t, ndim=1] next_update,
+                       np.ndarray[DTYPE_INT_t, ndim=1] next_trn_id,
+                       PriorityQueue priority_queue):
+    """Assign new states to a batch of links and schedule their transitions.
+
+    This is equivalent to calling *get_next_event_new* for each link, in
+    order, and pushing the resulting events onto the queue but waiting
+    times for all potential transitions of all links are drawn with a
+    single call to the random number generator (which yields the same
+    sequence of numbers).
+
+    Parameters
+    ----------
+    links : ndarray of int
+        IDs of the links to update.
+    new_link_states : ndarray of int
+        New state code of each link.
+    current_time : float
+        Current time in simulation.
+    (see celllab_cts.py for other parameters)
+    """
+    cdef int n_links = len(links)
+    cdef int i, j, k
+    cdef int link, state
+    cdef int this_trn_id
+    cdef double next_time
+    cdef np.ndarray[DTYPE_INT_t, ndim=1] n_trn_at_link
+    cdef np.ndarray[DTYPE_t, ndim=1] waiting_time
+    cdef np.ndarray[DTYPE_t, ndim=1] event_time = np.empty(n_links, dtype=DTYPE)
+
+    n_trn_at_link = n_trn[new_link_states]
+    rows = np.repeat(new_link_states, n_trn_at_link)
+    cols = (
+        np.arange(len(rows))
+        - np.repeat(np.cumsum(n_trn_at_link) - n_trn_at_link, n_trn_at_link)
+    )
+    waiting_time = np.random.exponential(1.0 / trn_rate[trn_id[rows, cols]])
+
+    k = 0
+    for i in range(n_links):
+        link = links[i]
+        state = new_link_states[i]
+        link_state[link] = state
+
+        next_time = _NEVER
+        this_trn_id = -1
+        for j in range(n_trn_at_link[i]):
+            if waiting_time[k] < next_time:
+                next_time = waiting_time[k]
+                this_trn_id = trn_id[state, j]
+            k += 1
+
+        if this_trn_id >= 0:
+            next_update[link] = next_time + current_time
+        else:
+            next_update[link] = _NEVER
+        next_trn_id[link] = this_trn_id
+        event_time[i] = next_update[link]
+
+    scheduled = np.flatnonzero(n_trn_at_link > 0)
+    priority_queue.push_many(links[scheduled], event_time[scheduled])
+
+
 @cython.boundscheck(True)
 @cython.wraparound(False)
 cdef void update_link_state(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
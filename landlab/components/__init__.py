@@ -1,121 +1,98 @@
-from .chi_index import ChiFinder
-from .depression_finder import DepressionFinderAndRouter
-from .depth_dependent_diffusion import DepthDependentDiffuser
-from .depth_dependent_taylor_soil_creep import DepthDependentTaylorDiffuser
-from .detachment_ltd_erosion import DepthSlopeProductErosion, DetachmentLtdErosion
-from .diffusion import LinearDiffuser
-from .discharge_diffuser import DischargeDiffuser
-from .drainage_density import DrainageDensity
-from .erosion_deposition import ErosionDeposition
-from .fire_generator import FireGenerator
-from .flexure import Flexure, Flexure1D
-from .flow_accum import FlowAccumulator, LossyFlowAccumulator
-from .flow_director import (
-    FlowDirectorD8,
-    FlowDirectorDINF,
-    FlowDirectorMFD,
-    FlowDirectorSteepest,
-)
-from .fracture_grid import FractureGridGenerator
-from .gflex import gFlex
-from .groundwater import GroundwaterDupuitPercolator
-from .hack_calculator import HackCalculator
-from .lake_fill import LakeMapperBarnes
-from .landslides import LandslideProbability
-from .lateral_erosion import LateralEroder
-from .lithology import LithoLayers, Lithology
-from .network_sediment_transporter import NetworkSedimentTransporter
-from .nonlinear_diffusion import PerronNLDiffuse
-from .normal_fault import NormalFault
-from .overland_flow import (
-    KinwaveImplicitOverlandFlow,
-    KinwaveOverlandFlowModel,
-    OverlandFlow,
-    OverlandFlowBates,
-)
-from .pet import PotentialEvapotranspiration
-from .plant_competition_ca import VegCA
-from .potentiality_flowrouting import PotentialityFlowRouter
-from .profiler import ChannelProfiler, Profiler, TrickleDownProfiler
-from .radiation import Radiation
-from .sink_fill import SinkFiller, SinkFillerBarnes
-from .soil_moisture import SoilInfiltrationGreenAmpt, SoilMoisture
-from .space import Space
-from .spatial_precip import SpatialPrecipitationDistribution
-from .species_evolution import SpeciesEvolver
-from .steepness_index import SteepnessFinder
-from .stream_power import (
-    FastscapeEroder,
-    SedDepEroder,
-    StreamPowerEroder,
-    StreamPowerSmoothThresholdEroder,
-)
-from .taylor_nonlinear_hillslope_flux import TaylorNonLinearDiffuser
-from .transport_length_diffusion import TransportLengthHillslopeDiffuser
-from .uniform_precip import PrecipitationDistribution
-from .vegetation_dynamics import Vegetation
-from .weathering import ExponentialWeatherer
+"""Landlab components.
 
-COMPONENTS = [
-    ChannelProfiler,
-    ChiFinder,
-    DepressionFinderAndRouter,
-    DepthDependentDiffuser,
-    DepthDependentTaylorDiffuser,
-    DepthSlopeProductErosion,
-    DetachmentLtdErosion,
-    DischargeDiffuser,
-    DrainageDensity,
-    ErosionDeposition,
-    ExponentialWeatherer,
-    FastscapeEroder,
-    FireGenerator,
-    Flexure,
-    Flexure1D,
-    FlowAccumulator,
-    FlowDirectorD8,
-    FlowDirectorDINF,
-    FlowDirectorMFD,
-    FlowDirectorSteepest,
-    FractureGridGenerator,
-    gFlex,
-    GroundwaterDupuitPercolator,
-    HackCalculator,
-    KinwaveImplicitOverlandFlow,
-    KinwaveOverlandFlowModel,
-    LakeMapperBarnes,
-    LandslideProbability,
-    LateralEroder,
-    LinearDiffuser,
-    LithoLayers,
-    Lithology,
-    LossyFlowAccumulator,
-    NetworkSedimentTransporter,
-    NormalFault,
-    OverlandFlow,
-    OverlandFlowBates,
-    PerronNLDiffuse,
-    PotentialEvapotranspiration,
-    PotentialityFlowRouter,
-    PrecipitationDistribution,
-    Profiler,
-    Radiation,
-    SedDepEroder,
-    SinkFiller,
-    SinkFillerBarnes,
-    SoilMoisture,
-    SoilInfiltrationGreenAmpt,
-    Space,
-    SpatialPrecipitationDistribution,
-    SpeciesEvolver,
-    SteepnessFinder,
-    StreamPowerEroder,
-    StreamPowerSmoothThresholdEroder,
-    TaylorNonLinearDiffuser,
-    TransportLengthHillslopeDiffuser,
-    TrickleDownProfiler,
-    VegCA,
-    Vegetation,
-]
+Components are only imported when they are first accessed so that importing
+this package (and, with it, scipy, matplotlib and friends) stays cheap for
+models that only use a few of them. ``COMPONENTS`` imports all of them.
+"""
 
-__all__ = [cls.__name__ for cls in COMPONENTS]
+import importlib
+import sys
+
+_MODULE_OF_COMPONENT = {
+    "ChannelProfiler": ".profiler",
+    "ChiFinder": ".chi_index",
+    "DepressionFinderAndRouter": ".depression_finder",
+    "DepthDependentDiffuser": ".depth_dependent_diffusion",
+    "DepthDependentTaylorDiffuser": ".depth_dependent_taylor_soil_creep",
+    "DepthSlopeProductErosion": ".detachment_ltd_erosion",
+    "DetachmentLtdErosion": ".detachment_ltd_erosion",
+    "DischargeDiffuser": ".discharge_diffuser",
+    "DrainageDensity": ".drainage_density",
+    "ErosionDeposition": ".erosion_deposition",
+    "ExponentialWeatherer": ".weathering",
+    "FastscapeEroder": ".stream_power",
+    "FireGenerator": ".fire_generator",
+    "Flexure": ".flexure",
+    "Flexure1D": ".flexure",
+    "FlowAccumulator": ".flow_accum",
+    "FlowDirectorD8": ".flow_director",
+    "FlowDirectorDINF": ".flow_director",
+    "FlowDirectorMFD": ".flow_director",
+    "FlowDirectorSteepest": ".flow_director",
+    "FractureGridGenerator": ".fracture_grid",
+    "gFlex": ".gflex",
+    "GroundwaterDupuitPercolator": ".groundwater",
+    "HackCalculator": ".hack_calculator",
+    "KinwaveImplicitOverlandFlow": ".overland_flow",
+    "KinwaveOverlandFlowModel": ".overland_flow",
+    "LakeMapperBarnes": ".lake_fill",
+    "LandslideProbability": ".landslides",
+    "LateralEroder": ".lateral_erosion",
+    "LinearDiffuser": ".diffusion",
+    "LithoLayers": ".lithology",
+    "Lithology": ".lithology",
+    "LossyFlowAccumulator": ".flow_accum",
+    "NetworkSedimentTransporter": ".network_sediment_transporter",
+    "NormalFault": ".normal_fault",
+    "OverlandFlow": ".overland_flow",
+    "OverlandFlowBates": ".overland_flow",
+    "PerronNLDiffuse": ".nonlinear_diffusion",
+    "PotentialEvapotranspiration": ".pet",
+    "PotentialityFlowRouter": ".potentiality_flowrouting",
+    "PrecipitationDistribution": ".uniform_precip",
+    "Profiler": ".profiler",
+    "Radiation": ".radiation",
+    "SedDepEroder": ".stream_power",
+    "SinkFiller": ".sink_fill",
+    "SinkFillerBarnes": ".sink_fill",
+    "SoilMoisture": ".soil_moisture",
+    "SoilInfiltrationGreenAmpt": ".soil_moisture",
+    "Space": ".space",
+    "SpatialPrecipitationDistribution": ".spatial_precip",
+    "SpeciesEvolver": ".species_evolution",
+    "SteepnessFinder": ".steepness_index",
+    "StreamPowerEroder": ".stream_power",
+    "StreamPowerSmoothThresholdEroder": ".stream_power",
+    "TaylorNonLinearDiffuser": ".taylor_nonlinear_hillslope_flux",
+    "TransportLengthHillslopeDiffuser": ".transport_length_diffusion",
+    "TrickleDownProfiler": ".profiler",
+    "VegCA": ".plant_competition_ca",
+    "Vegetation": ".vegetation_dynamics",
+}
+
+__all__ = list(_MODULE_OF_COMPONENT)
+
+
+def _load_component(name):
+    module = importlib.import_module(_MODULE_OF_COMPONENT[name], __name__)
+    component = getattr(module, name)
+    globals()[name] = component
+    return component
+
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name == "COMPONENTS":
+            return [_load_component(name) for name in _MODULE_OF_COMPONENT]
+        elif name in _MODULE_OF_COMPONENT:
+            return _load_component(name)
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__) | {"COMPONENTS"})
+
+else:  # pragma: no cover
+    COMPONENTS = [_load_component(name) for name in _MODULE_OF_COMPONENT]
@@ -0,0 +1,85 @@
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _integrate_chi_avg_dx(np.ndarray[DTYPE_INT_t, ndim=1] valid_upstr_order,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=1] chi_integrand,
+                          np.ndarray[DTYPE_FLOAT_t, ndim=1] chi_array,
+                          np.ndarray[DTYPE_INT_t, ndim=1] receivers):
+    """Sum chi_integrand down the stack, assuming uniform node spacing.
+
+    Parameters
+    ----------
+    valid_upstr_order : array of ints
+        Nodes in the channel network in upstream order.
+    chi_integrand : array of floats
+        The value (A0/A)**concavity, in upstream order.
+    chi_array : array of floats
+        Array in which to store chi (not yet multiplied by the spacing).
+    receivers : array of ints
+        Flow receiver of each node.
+    """
+    cdef DTYPE_INT_t n_nodes = valid_upstr_order.shape[0]
+    cdef DTYPE_INT_t i
+    cdef DTYPE_INT_t node
+
+    with nogil:
+        for i in range(n_nodes):
+            node = valid_upstr_order[i]
+            chi_array[node] = chi_array[receivers[node]] + chi_integrand[i]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _integrate_chi_each_dx(np.ndarray[DTYPE_INT_t, ndim=1] valid_upstr_order,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] chi_integrand_at_nodes,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] chi_array,
+                           np.ndarray[DTYPE_INT_t, ndim=1] receivers,
+                           np.ndarray[DTYPE_INT_t, ndim=1] links,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] link_lengths,
+                           DTYPE_INT_t bad_index):
+    """Sum chi_integrand*dx down the stack with trapezium integration.
+
+    Parameters
+    ----------
+    valid_upstr_order : array of ints
+        Nodes in the channel network in upstream order.
+    chi_integrand_at_nodes : array of floats
+        The value (A0/A)**concavity, in *node* order.
+    chi_array : array of floats
+        Array in which to store chi.
+    receivers : array of ints
+        Flow receiver of each node.
+    links : array of ints
+        Link from each node to its receiver.
+    link_lengths : array of floats
+        Length of each link.
+    bad_index : int
+        Value of links that indicates a node has no receiver link.
+    """
+    cdef DTYPE_INT_t n_nodes = valid_upstr_order.shape[0]
+    cdef DTYPE_INT_t i
+    cdef DTYPE_INT_t node
+    cdef DTYPE_INT_t dstr_node
+    cdef DTYPE_INT_t dstr_link
+
+    with nogil:
+        for i in range(n_nodes):
+            node = valid_upstr_order[i]
+            dstr_link = links[node]
+            if dstr_link != bad_index:
+                dstr_node = receivers[node]
+                chi_array[node] = chi_array[dstr_node] + (
+                    0.5 * chi_integrand_at_nodes[node]
+                    + 0.5 * chi_integrand_at_nodes[dstr_node]
+                ) * link_lengths[dstr_link]
@@ -9,10 +9,7 @@ import numpy as np
 
 from landlab import Component, RasterModelGrid
 
-try:
-    from itertools import izip
-except ImportError:
-    izip = zip
+from .cfuncs import _integrate_chi_avg_dx, _integrate_chi_each_dx
 
 
 class ChiFinder(Component):
@@ -283,8 +280,8 @@ class ChiFinder(Component):
     ):
         """Calculates chi at each channel node by summing chi_integrand.
 
-        This method assumes a uniform, mean spacing between nodes. Method is
-        deliberately split out for potential cythonization at a later stage.
+        This method assumes a uniform, mean spacing between nodes. The sum is
+        carried out down the stack by a compiled routine.
 
         Parameters
         ----------
@@ -327,9 +324,12 @@ class ChiFinder(Component):
         receivers = self._grid.at_node["flow__receiver_node"]
         # because chi_array is all zeros, BC cases where node is receiver
         # resolve themselves
-        for (node, integrand) in izip(valid_upstr_order, chi_integrand):
-            dstr_node = receivers[node]
-            chi_array[node] = chi_array[dstr_node] + integrand
+        _integrate_chi_avg_dx(
+            np.asarray(valid_upstr_order, dtype=int),
+            np.asarray(chi_integrand, dtype=float),
+            chi_array,
+            np.asarray(receivers, dtype=int),
+        )
         chi_array *= mean_dx
 
     def integrate_chi_each_dx(
@@ -337,9 +337,9 @@ class ChiFinder(Component):
     ):
         """Calculates chi at each channel node by summing chi_integrand*dx.
 
-        This method accounts explicitly for spacing between each node. Method
-        is deliberately split out for potential cythonization at a later
-        stage. Uses a trapezium integration method.
+        This method accounts explicitly for spacing between each node. Uses a
+        trapezium integration method, carried out down the stack by a
+        compiled routine.
 
         Parameters
         ----------
@@ -413,17 +413,15 @@ class ChiFinder(Component):
 
         # because chi_array is all zeros, BC cases where node is receiver
         # resolve themselves
-        half_integrand = 0.5 * chi_integrand_at_nodes
-        for node in valid_upstr_order:
-            dstr_node = receivers[node]
-            dstr_link = links[node]
-            if dstr_link != self._grid.BAD_INDEX:
-                dstr_length = self._link_lengths[dstr_link]
-                half_head_val = half_integrand[node]
-                half_tail_val = half_integrand[dstr_node]
-                mean_val = half_head_val + half_tail_val
-                chi_to_add = mean_val * dstr_length
-                chi_array[node] = chi_array[dstr_node] + chi_to_add
+        _integrate_chi_each_dx(
+            np.asarray(valid_upstr_order, dtype=int),
+            np.asarray(chi_integrand_at_nodes, dtype=float),
+            chi_array,
+            np.asarray(receivers, dtype=int),
+            np.asarray(links, dtype=int),
+            np.asarray(self._link_lengths, dtype=float),
+            self._grid.BAD_INDEX,
+        )
 
     def mean_channel_node_spacing(self, ch_nodes):
         """Calculates the mean spacing between all adjacent channel nodes.
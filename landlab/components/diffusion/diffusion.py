@@ -108,6 +108,8 @@ class LinearDiffuser(Component):
 
     _unit_agnostic = True
 
+    _substeps_internally = True
+
     _info = {
         "hillslope_sediment__unit_volume_flux": {
             "dtype": float,
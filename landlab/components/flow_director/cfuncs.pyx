@@ -1,6 +1,7 @@
 import numpy as np
 cimport numpy as np
 cimport cython
+from libc.math cimport sqrt
 
 
 DTYPE_FLOAT = np.double
@@ -55,3 +56,145 @@ def adjust_flow_receivers(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
             receiver[dst_id] = src_id
             steepest_slope[dst_id] = - link_slope[i]
             receiver_link[dst_id] = active_links[i]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def flow_directions_mfd_at_node(
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] elev,
+    np.ndarray[DTYPE_INT_t, ndim=2] neighbors_at_node,
+    np.ndarray[DTYPE_INT_t, ndim=2] links_at_node,
+    np.ndarray[np.int8_t, ndim=2] active_link_dir_at_node,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] link_slope,
+    int use_square_root,
+    np.ndarray[DTYPE_INT_t, ndim=2] receivers,
+    np.ndarray[DTYPE_FLOAT_t, ndim=2] proportions,
+    np.ndarray[DTYPE_FLOAT_t, ndim=2] slopes_to_receivers,
+    np.ndarray[DTYPE_INT_t, ndim=2] receiver_links,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] steepest_slope,
+    np.ndarray[DTYPE_INT_t, ndim=1] steepest_receiver,
+    np.ndarray[DTYPE_INT_t, ndim=1] steepest_link,
+):
+    """Find multiple-flow-direction receivers and proportions at nodes.
+
+    This is the single-pass kernel behind
+    :func:`~landlab.components.flow_director.flow_direction_mfd.flow_directions_mfd`.
+    Flow goes from a node to every neighbor that is lower and is connected
+    through an active link. Each node is visited once and the results are
+    written directly into the output arrays, so no temporary arrays are
+    created.
+
+    Parameters
+    ----------
+    elev : ndarray of float, shape (n_nodes, )
+        Elevations at nodes.
+    neighbors_at_node : ndarray of int, shape (n_nodes, max_neighbors)
+        Neighbor nodes of each node (-1 where there is no neighbor).
+    links_at_node : ndarray of int, shape (n_nodes, max_neighbors)
+        Links to each of the neighbor nodes.
+    active_link_dir_at_node : ndarray of int8, shape (n_nodes, max_neighbors)
+        Direction of the links to the neighbors (0 if inactive).
+    link_slope : ndarray of float, shape (n_links, )
+        Gradient along links.
+    use_square_root : int
+        If non-zero, partition flow by the square root of slope, rather
+        than slope.
+    receivers : ndarray of int, shape (n_nodes, max_neighbors)
+        Output array of receiver nodes.
+    proportions : ndarray of float, shape (n_nodes, max_neighbors)
+        Output array of flow proportions.
+    slopes_to_receivers : ndarray of float, shape (n_nodes, max_neighbors)
+        Output array of slopes to receivers (0 where there is no flow).
+    receiver_links : ndarray of int, shape (n_nodes, max_neighbors)
+        Output array of links to receivers.
+    steepest_slope : ndarray of float, shape (n_nodes, )
+        Output array of steepest downhill slope.
+    steepest_receiver : ndarray of int, shape (n_nodes, )
+        Output array of the receiver along the steepest slope.
+    steepest_link : ndarray of int, shape (n_nodes, )
+        Output array of the link along the steepest slope.
+    """
+    cdef long n_nodes = neighbors_at_node.shape[0]
+    cdef long n_neighbors = neighbors_at_node.shape[1]
+    cdef long node
+    cdef long i
+    cdef long j
+    cdef long neighbor
+    cdef long steepest
+    cdef double partial[8]
+    cdef double slope
+    cdef double total
+    cdef int drains_to_self
+
+    for node in range(n_nodes):
+        drains_to_self = 1
+        for i in range(n_neighbors):
+            neighbor = neighbors_at_node[node, i]
+            if (
+                active_link_dir_at_node[node, i] != 0
+                and elev[node] > elev[neighbor]
+            ):
+                receivers[node, i] = neighbor
+                receiver_links[node, i] = links_at_node[node, i]
+                slopes_to_receivers[node, i] = (
+                    link_slope[links_at_node[node, i]]
+                    * active_link_dir_at_node[node, i]
+                )
+                drains_to_self = 0
+            else:
+                receivers[node, i] = -1
+                receiver_links[node, i] = -1
+                slopes_to_receivers[node, i] = 0.0
+
+        # The last of the steepest receivers (NaN counts as steepest).
+        steepest = 0
+        for i in range(1, n_neighbors):
+            slope = slopes_to_receivers[node, i]
+            if slope >= slopes_to_receivers[node, steepest] or (
+                slope != slope
+            ):
+                steepest = i
+        steepest_slope[node] = slopes_to_receivers[node, steepest]
+        steepest_link[node] = receiver_links[node, steepest]
+
+        if drains_to_self:
+            receivers[node, 0] = node
+            steepest_receiver[node] = node
+            proportions[node, 0] = 1.0
+            for i in range(1, n_neighbors):
+                proportions[node, i] = 0.0
+            continue
+
+        steepest_receiver[node] = receivers[node, steepest]
+
+        for i in range(n_neighbors):
+            if use_square_root:
+                proportions[node, i] = sqrt(slopes_to_receivers[node, i])
+            else:
+                proportions[node, i] = slopes_to_receivers[node, i]
+
+        # Add up values in the same order as numpy's pairwise summation so
+        # that proportions match those calculated with numpy.
+        if n_neighbors < 8:
+            total = 0.0
+            for i in range(n_neighbors):
+                total += proportions[node, i]
+        else:
+            for i in range(8):
+                partial[i] = proportions[node, i]
+            i = 8
+            while i < n_neighbors - n_neighbors % 8:
+                for j in range(8):
+                    partial[j] += proportions[node, i + j]
+                i += 8
+            total = (
+                (partial[0] + partial[1]) + (partial[2] + partial[3])
+            ) + ((partial[4] + partial[5]) + (partial[6] + partial[7]))
+            while i < n_neighbors:
+                total += proportions[node, i]
+                i += 1
+        if total <= 0.0:
+            total = 1.0
+
+        for i in range(n_neighbors):
+            proportions[node, i] /= total
@@ -176,67 +176,19 @@ def flow_directions_dinf(grid, elevs="topographic__elevation", baselevel_nodes=N
     # Step 3, create some triangle datastructures because landlab (smartly)
     # makes it hard to deal with diagonals.
 
-    # create list of triangle neighbors at node. Use orientation associated
-    # with tarboton's 1997 algorithm, orthogonal link first, then diagonal.
-    # has shape, (nnodes, 8 triangles, 2 neighbors)
+    # the orthogonal and diagonal neighbors that make up each of the eight
+    # triangular facets at a node. Use orientation associated with tarboton's
+    # 1997 algorithm, orthogonal link first, then diagonal.
+    ortho_at_facet = np.array([0, 1, 1, 2, 2, 3, 3, 0])
+    diag_at_facet = np.array([0, 0, 1, 1, 2, 2, 3, 3])
+
+    # create list of triangle neighbors at node.
+    # has shape, (nnodes, 2 neighbors, 8 triangles)
     n_at_node = grid.adjacent_nodes_at_node
     dn_at_node = grid.diagonal_adjacent_nodes_at_node
-
     triangle_neighbors_at_node = np.stack(
-        [
-            np.vstack((n_at_node[:, 0], dn_at_node[:, 0])),
-            np.vstack((n_at_node[:, 1], dn_at_node[:, 0])),
-            np.vstack((n_at_node[:, 1], dn_at_node[:, 1])),
-            np.vstack((n_at_node[:, 2], dn_at_node[:, 1])),
-            np.vstack((n_at_node[:, 2], dn_at_node[:, 2])),
-            np.vstack((n_at_node[:, 3], dn_at_node[:, 2])),
-            np.vstack((n_at_node[:, 3], dn_at_node[:, 3])),
-            np.vstack((n_at_node[:, 0], dn_at_node[:, 3])),
-        ],
-        axis=-1,
-    )
-    triangle_neighbors_at_node = triangle_neighbors_at_node.swapaxes(0, 1)
-
-    # next create, triangle links at node
-    l_at_node = grid.d8s_at_node[:, :4]
-    dl_at_node = grid.d8s_at_node[:, 4:]
-    triangle_links_at_node = np.stack(
-        [
-            np.vstack((l_at_node[:, 0], dl_at_node[:, 0])),
-            np.vstack((l_at_node[:, 1], dl_at_node[:, 0])),
-            np.vstack((l_at_node[:, 1], dl_at_node[:, 1])),
-            np.vstack((l_at_node[:, 2], dl_at_node[:, 1])),
-            np.vstack((l_at_node[:, 2], dl_at_node[:, 2])),
-            np.vstack((l_at_node[:, 3], dl_at_node[:, 2])),
-            np.vstack((l_at_node[:, 3], dl_at_node[:, 3])),
-            np.vstack((l_at_node[:, 0], dl_at_node[:, 3])),
-        ],
-        axis=-1,
-    )
-    triangle_links_at_node = triangle_links_at_node.swapaxes(0, 1)
-
-    # next create link directions and active link directions at node
-    # link directions
-    ld_at_node = grid.link_dirs_at_node
-    dld_at_node = grid.diagonal_dirs_at_node
-    triangle_link_dirs_at_node = np.stack(
-        [
-            np.vstack((ld_at_node[:, 0], dld_at_node[:, 0])),
-            np.vstack((ld_at_node[:, 1], dld_at_node[:, 0])),
-            np.vstack((ld_at_node[:, 1], dld_at_node[:, 1])),
-            np.vstack((ld_at_node[:, 2], dld_at_node[:, 1])),
-            np.vstack((ld_at_node[:, 2], dld_at_node[:, 2])),
-            np.vstack((ld_at_node[:, 3], dld_at_node[:, 2])),
-            np.vstack((ld_at_node[:, 3], dld_at_node[:, 3])),
-            np.vstack((ld_at_node[:, 0], dld_at_node[:, 3])),
-        ],
-        axis=-1,
+        (n_at_node[:, ortho_at_facet], dn_at_node[:, diag_at_facet]), axis=1
     )
-    triangle_link_dirs_at_node = triangle_link_dirs_at_node.swapaxes(0, 1)
-
-    # need to create a list of diagonal links since it doesn't exist.
-    diag_links = np.sort(np.unique(grid.d8s_at_node[:, 4:]))
-    diag_links = diag_links[diag_links > 0]
 
     # calculate graidents across diagonals and orthogonals
     diag_grads = grid.calc_grad_at_diagonal(elevs)
@@ -245,13 +197,6 @@ def flow_directions_dinf(grid, elevs="topographic__elevation", baselevel_nodes=N
     # finally compile link slopes
     link_slope = np.hstack((ortho_grads, diag_grads))
 
-    # Construct the array of slope to triangles at node. This also will adjust
-    # for the slope convention based on the direction of the links.
-    # this is a (nnodes, 2, 8) array
-    slopes_to_triangles_at_node = (
-        link_slope[triangle_links_at_node] * triangle_link_dirs_at_node
-    )
-
     # Step 3: make arrays necessary for the specific tarboton algorithm.
     # create a arrays
     ac = np.array([0.0, 1.0, 1.0, 2.0, 2.0, 3.0, 3.0, 4.0])
@@ -271,12 +216,8 @@ def flow_directions_dinf(grid, elevs="topographic__elevation", baselevel_nodes=N
 
     thresh = np.arctan(d2 / d1)
 
-    # Step 4, Initialize receiver and proportion arrays
-    receivers = grid.BAD_INDEX * np.ones((num_nodes, num_receivers), dtype=int)
-    receiver_closed = grid.BAD_INDEX * np.ones((num_nodes, num_receivers), dtype=int)
+    # Step 4, Initialize proportion array
     proportions = np.zeros((num_nodes, num_receivers), dtype=float)
-    receiver_links = grid.BAD_INDEX * np.ones((num_nodes, num_receivers), dtype=int)
-    slopes_to_receivers = np.zeros((num_nodes, num_receivers), dtype=float)
 
     # Step  5  begin the algorithm in earnest
 
@@ -299,14 +240,9 @@ def flow_directions_dinf(grid, elevs="topographic__elevation", baselevel_nodes=N
     e1[triangle_neighbors_at_node[:, 0, :] == -1] = np.nan
     e2[triangle_neighbors_at_node[:, 1, :] == -1] = np.nan
 
-    # loop through and calculate s1 and s2
-    # this will only loop nfacets times.
-    s1 = np.empty_like(e1)
-    s2 = np.empty_like(e2)
-
-    for i in range(num_facets):
-        s1[:, i] = (e0 - e1[:, i]) / d1[i]
-        s2[:, i] = (e1[:, i] - e2[:, i]) / d2[i]
+    # calculate s1 and s2
+    s1 = (e0[:, np.newaxis] - e1) / d1
+    s2 = (e1 - e2) / d2
 
     # calculate r and s, the direction and magnitude
     r = np.arctan2(s2, s1)
@@ -320,43 +256,51 @@ def flow_directions_dinf(grid, elevs="topographic__elevation", baselevel_nodes=N
     s[too_small] = s1[too_small]
 
     # to consider two big, we need to look by triangle.
-    for i in range(num_facets):
-        too_big = r[:, i] > thresh[i]
-        radj[too_big, i] = thresh[i]
-        s[too_big, i] = (e0[too_big] - e2[too_big, i]) / diag_length
+    too_big = r > thresh
+    radj = np.where(too_big, thresh, radj)
+    s = np.where(too_big, (e0[:, np.newaxis] - e2) / diag_length, s)
 
     # calculate the geospatial version of r based on radj
-    rg = np.empty_like(r)
-    for i in range(num_facets):
-        rg[:, i] = (af[i] * radj[:, i]) + (ac[i] * np.pi / 2.0)
+    rg = (af * radj) + (ac * np.pi / 2.0)
 
     # set slopes that are nan to below zero
     # if there is a flat slope, it should be chosen over the closed or non-existant
     # triangles that are represented by the nan values.
     s[np.isnan(s)] = -999.0
 
-    # sort slopes
+    # find the steepest triangle
     # we've set slopes going to closed or non-existant triangles to -999.0, so
-    # we shouldn't ever choose these.
-    steepest_sort = np.argsort(s)
-
-    # determine the steepest triangle
-    steepest_triangle = tri_numbers[steepest_sort[:, -1]]
-
-    # initialize arrays for the steepest rg and steepest s
-    steepest_rg = np.empty_like(node_id, dtype=float)
-    steepest_s = np.empty_like(node_id, dtype=float)
-
-    closed_triangle_neighbors = closed_nodes[triangle_neighbors_at_node]
-    for n in node_id:
-        steepest_rg[n] = rg[n, steepest_sort[n, -1]]
-        receiver_closed[n] = closed_triangle_neighbors[n, :, steepest_sort[n, -1]]
-        steepest_s[n] = s[n, steepest_sort[n, -1]]
-        receivers[n, :] = triangle_neighbors_at_node[n, :, steepest_sort[n, -1]]
-        receiver_links[n, :] = triangle_links_at_node[n, :, steepest_sort[n, -1]]
-        slopes_to_receivers[n, :] = slopes_to_triangles_at_node[
-            n, :, steepest_sort[n, -1]
-        ]
+    # we shouldn't ever choose these. Where more than one triangle is
+    # steepest, the last of them is chosen.
+    steepest_facet = num_facets - 1 - np.argmax(s[:, ::-1], axis=1)
+    steepest_triangle = tri_numbers[steepest_facet]
+
+    # gather the properties of the steepest triangle at each node.
+    steepest_rg = rg[node_id, steepest_facet]
+    steepest_s = s[node_id, steepest_facet]
+    receivers = triangle_neighbors_at_node[node_id, :, steepest_facet]
+    receiver_closed = closed_nodes[receivers].astype(int)
+
+    steepest_ortho = ortho_at_facet[steepest_facet]
+    steepest_diag = diag_at_facet[steepest_facet]
+    receiver_links = np.stack(
+        (
+            grid.d8s_at_node[node_id, steepest_ortho],
+            grid.d8s_at_node[node_id, 4 + steepest_diag],
+        ),
+        axis=1,
+    )
+
+    # get slopes to the receivers. This also will adjust for the slope
+    # convention based on the direction of the links.
+    receiver_link_dirs = np.stack(
+        (
+            grid.link_dirs_at_node[node_id, steepest_ortho],
+            grid.diagonal_dirs_at_node[node_id, steepest_diag],
+        ),
+        axis=1,
+    )
+    slopes_to_receivers = link_slope[receiver_links] * receiver_link_dirs
 
     # construct the baseline for proportions
     rg_baseline = np.array([0.0, 1.0, 1.0, 2.0, 2.0, 3.0, 3.0, 4]) * np.pi / 2.0
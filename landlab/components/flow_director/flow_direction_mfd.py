@@ -13,6 +13,8 @@ import numpy as np
 from landlab.core.utils import as_id_array
 from landlab.grid.base import BAD_INDEX_VALUE
 
+from .cfuncs import flow_directions_mfd_at_node
+
 
 def flow_directions_mfd(
     elev,
@@ -22,6 +24,7 @@ def flow_directions_mfd(
     link_slope,
     baselevel_nodes=None,
     partition_method="slope",
+    out=None,
 ):
 
     """Find multiple-flow-direction flow directions on a grid.
@@ -52,6 +55,10 @@ def flow_directions_mfd(
     partition_method: string, optional
         Method for partitioning flow. Options include 'slope' (default) and
         'square_root_of_slope'.
+    out : tuple of ndarray, optional
+        Arrays in which to place the *receivers*, *proportions*, *slopes*
+        and *receiver_links* outputs (for instance, the corresponding
+        at-node fields). If not provided, new arrays are created.
 
     Returns
     -------
@@ -225,97 +232,46 @@ def flow_directions_mfd(
     >>> proportions.sum(axis=-1)
     array([ 1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.,  1.])
     """
+    if partition_method not in ("slope", "square_root_of_slope"):
+        raise ValueError("Keyword argument to partition_method invalid.")
+
     # Calculate the number of nodes.
     num_nodes = len(elev)
 
     # Create a node array
     node_id = np.arange(num_nodes)
 
-    # Calculate the maximum number of neighbors at node.
-    max_number_of_neighbors = neighbors_at_node.shape[1]
-
-    # Make a copy of neighbors_at_node so we can change it into the receiver
-    # array.
-    receivers = neighbors_at_node.copy()
-
-    # Construct the array of slope to neighbors at node. This also will adjust
-    # for the slope convention based on the direction of the link.
-    slopes_to_neighbors_at_node = link_slope[links_at_node] * active_link_dir_at_node
-
-    # Make a copy so this can be changed based on where no flow occurs.
-    receiver_links = links_at_node.copy()
-
-    # some of these potential recievers may have already been assigned as
-    # BAD_INDEX_VALUE because the link was inactive. Make a mask of these for
-    # future use. Also find the close nodes.
-    inactive_link_to_neighbor = active_link_dir_at_node == 0
-    closed_nodes = np.sum(np.abs(active_link_dir_at_node), 1) == 0
-    # Now calculate where flow occurs.
-    # First, make an elevation array of potential receivers.
-    potential_receiver_elev = elev[neighbors_at_node]
-
-    # now make an array of the same shape (for direct comparison) of the source
-    # node elevation.
-    source_node_elev = elev[np.tile(node_id, (max_number_of_neighbors, 1)).T]
-
-    # find where flow does not occur (source is lower that receiver)
-    flow_does_not_occur = source_node_elev <= potential_receiver_elev
-
-    # Where the source is lower, set receivers to BAD_INDEX_VALUE
-    receivers[flow_does_not_occur] = BAD_INDEX_VALUE
-
-    # Where the link is not active, set receivers to BAD_INDEX_VALUE
-    receivers[inactive_link_to_neighbor] = BAD_INDEX_VALUE
-
-    # Next, find where a node drains to itself
-    drains_to_self = receivers.sum(1) == -1 * max_number_of_neighbors
-
-    # Where this occurs, set the receiver ID in the first column of receivers
-    # to the node ID.
-    receivers[drains_to_self, 0] = node_id[drains_to_self]
-
-    # Finally, set the first element of the closed nodes to themselves.
-    receivers[closed_nodes, 0] = node_id[closed_nodes]
-
-    # Next, calculate flow proportions.
-    # Copy slope array and mask by where flow is not occuring and where the
-    # link is inactive.
-    flow_slopes = slopes_to_neighbors_at_node.copy()
-    flow_slopes[flow_does_not_occur] = 0.0
-    flow_slopes[inactive_link_to_neighbor] = 0.0
-
-    if partition_method == "square_root_of_slope":
-        values_for_partitioning = flow_slopes ** 0.5
-    elif partition_method == "slope":
-        values_for_partitioning = flow_slopes
-    else:
-        raise ValueError("Keyword argument to partition_method invalid.")
-
-    # Calculate proportions by normalizing by rowsums.
-    denom = np.tile(values_for_partitioning.sum(1), (max_number_of_neighbors, 1)).T
-    denom[denom <= 0] = 1  # to prevent runtime errors
-    proportions = values_for_partitioning / denom
-    proportions[drains_to_self, 0] = 1
-    proportions[drains_to_self, 1:] = 0
-
-    # Might need to sort by proportions and rearrange to follow expectations
-    # of no BAD_INDEX_VALUE value in first column. KRB NOT SURE
-
-    # mask the receiver_links by where flow doesn't occur to return
-    receiver_links[flow_does_not_occur] = BAD_INDEX_VALUE
-    receiver_links[inactive_link_to_neighbor] = BAD_INDEX_VALUE
-
-    # identify the steepest link so that the steepest receiver, link, and slope
-    # can be returned.
-    slope_sort = np.argsort(np.argsort(flow_slopes, axis=1), axis=1) == (
-        max_number_of_neighbors - 1
+    if out is None:
+        out = (
+            np.empty(neighbors_at_node.shape, dtype=int),
+            np.empty(neighbors_at_node.shape, dtype=float),
+            np.empty(neighbors_at_node.shape, dtype=float),
+            np.empty(neighbors_at_node.shape, dtype=int),
+        )
+    receivers, proportions, slopes_to_neighbors_at_node, receiver_links = out
+
+    steepest_slope = np.empty(num_nodes, dtype=float)
+    steepest_receiver = np.empty(num_nodes, dtype=int)
+    steepest_link = np.empty(num_nodes, dtype=int)
+
+    # Find receivers, proportions, slopes and links in a single pass over
+    # the nodes. Nodes with no lower, active neighbor are their own
+    # receiver.
+    flow_directions_mfd_at_node(
+        np.asarray(elev, dtype=float),
+        np.asarray(neighbors_at_node, dtype=int),
+        np.asarray(links_at_node, dtype=int),
+        np.asarray(active_link_dir_at_node, dtype=np.int8),
+        np.asarray(link_slope, dtype=float),
+        partition_method == "square_root_of_slope",
+        receivers,
+        proportions,
+        slopes_to_neighbors_at_node,
+        receiver_links,
+        steepest_slope,
+        steepest_receiver,
+        steepest_link,
     )
-    steepest_slope = flow_slopes[slope_sort]
-
-    # identify the steepest link and steepest receiever.
-    steepest_link = receiver_links[slope_sort]
-    steepest_receiver = receivers[slope_sort]
-    steepest_receiver[drains_to_self] = node_id[drains_to_self]
 
     # Optionally, handle baselevel nodes: they are their own receivers
     if baselevel_nodes is not None:
@@ -332,9 +288,6 @@ def flow_directions_mfd(
     (sink,) = np.where(node_id == receivers[:, 0])
     sink = as_id_array(sink)
 
-    slopes_to_neighbors_at_node[flow_does_not_occur] = 0
-    slopes_to_neighbors_at_node[inactive_link_to_neighbor] = 0
-
     return (
         receivers,
         proportions,
@@ -347,6 +300,62 @@ def flow_directions_mfd(
     )
 
 
+def flow_receivers_as_csr(receivers, proportions, receiver_links=None):
+    """Compress multiple-flow-direction receivers into CSR form.
+
+    Receiver arrays returned by :func:`flow_directions_mfd` have a column for
+    every neighbor of a node, most of which, for neighbors that don't
+    receive flow, are ``BAD_INDEX_VALUE``. This function drops those entries
+    and returns the receivers of node *i* as
+    ``receivers[offset[i]:offset[i + 1]]``.
+
+    Parameters
+    ----------
+    receivers : ndarray of int, shape (n_nodes, max_neighbors)
+        Receivers of each node.
+    proportions : ndarray of float, shape (n_nodes, max_neighbors)
+        Proportion of flow to each receiver.
+    receiver_links : ndarray of int, shape (n_nodes, max_neighbors), optional
+        Links to each receiver.
+
+    Returns
+    -------
+    tuple of ndarray
+        Offsets into the compressed arrays (of length ``n_nodes + 1``),
+        receivers and proportions, followed by receiver links if
+        *receiver_links* was provided.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.components.flow_director.flow_direction_mfd import (
+    ...     flow_receivers_as_csr
+    ... )
+    >>> receivers = np.array([[0, -1, -1], [-1, 0, 2], [2, -1, -1]])
+    >>> proportions = np.array([[1.0, 0.0, 0.0], [0.0, 0.25, 0.75], [1, 0, 0]])
+    >>> offset, receivers, proportions = flow_receivers_as_csr(
+    ...     receivers, proportions
+    ... )
+    >>> offset
+    array([0, 1, 3, 4])
+    >>> receivers
+    array([0, 0, 2, 2])
+    >>> proportions
+    array([ 1.  ,  0.25,  0.75,  1.  ])
+    """
+    is_receiver = receivers != BAD_INDEX_VALUE
+
+    offset = np.empty(len(receivers) + 1, dtype=int)
+    offset[0] = 0
+    np.cumsum(is_receiver.sum(axis=1), out=offset[1:])
+
+    csr = (offset, receivers[is_receiver], proportions[is_receiver])
+    if receiver_links is not None:
+        csr += (receiver_links[is_receiver],)
+
+    return csr
+
+
 if __name__ == "__main__":  # pragma: no cover
     import doctest
 
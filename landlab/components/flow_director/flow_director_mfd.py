@@ -507,17 +507,13 @@ class FlowDirectorMFD(_FlowDirectorToMany):
             )
         )
 
-        # Calculate flow directions
-        (
-            self._receivers,
-            self._proportions,
-            slopes_to_receivers,
-            steepest_slope,
-            steepest_receiver,
-            sink,
-            receiver_links,
-            steepest_link,
-        ) = flow_direction_mfd.flow_directions_mfd(
+        # Calculate flow directions, writing the results directly into
+        # the output fields.
+        self._receivers = self._grid["node"]["flow__receiver_node"]
+        self._proportions = self._grid["node"]["flow__receiver_proportions"]
+        self._steepest_slope = self._grid["node"]["topographic__steepest_slope"]
+        self._receiver_links = self._grid["node"]["flow__link_to_receiver_node"]
+        sink = flow_direction_mfd.flow_directions_mfd(
             self._surface_values,
             neighbors_at_node,
             links_at_node,
@@ -525,13 +521,15 @@ class FlowDirectorMFD(_FlowDirectorToMany):
             link_slope,
             baselevel_nodes=baselevel_nodes,
             partition_method=self._partition_method,
-        )
-
-        # Save the four ouputs of this component.
-        self._grid["node"]["flow__receiver_node"][:] = self._receivers
-        self._grid["node"]["flow__receiver_proportions"][:] = self._proportions
-        self._grid["node"]["topographic__steepest_slope"][:] = slopes_to_receivers
-        self._grid["node"]["flow__link_to_receiver_node"][:] = receiver_links
+            out=(
+                self._receivers,
+                self._proportions,
+                self._steepest_slope,
+                self._receiver_links,
+            ),
+        )[5]
+
+        # Flag the sinks.
         self._grid["node"]["flow__sink_flag"][:] = False
         self._grid["node"]["flow__sink_flag"][sink] = True
 
@@ -152,6 +152,12 @@ class GroundwaterDupuitPercolator(Component):
     numerical solution. Flow discharge between neighboring nodes is calculated
     using the saturated thickness at the up-gradient node.
 
+    On fine grids or with high conductivity the explicit methods need many
+    (sub)steps to remain stable. The ``run_with_implicit_solver`` method
+    instead solves for the thickness at the end of the time step (backward
+    Euler), taking the full time step with Newton iterations on a sparse
+    linear system.
+
     References
     ----------
     **Required Software Citation(s) Specific to this Component**
@@ -366,6 +372,9 @@ class GroundwaterDupuitPercolator(Component):
         self.courant_coefficient = courant_coefficient
         self.vn_coefficient = vn_coefficient
 
+        # Sparsity pattern for the implicit solver, built on first use
+        self._implicit_pattern = None
+
     @property
     def courant_coefficient(self):
         """Courant coefficient for adaptive time step.
@@ -727,3 +736,253 @@ class GroundwaterDupuitPercolator(Component):
             self._num_substeps += 1
 
         self._qsavg[:] = qs_cumulative / dt
+
+    def _implicit_solver_pattern(self, cores):
+        """Sparsity pattern of the matrix used by the implicit solver.
+
+        Rows and columns correspond to core nodes. For each row there is a
+        diagonal entry and an entry for each active link that connects the
+        node to another core node. The pattern depends only on the node
+        statuses so is reused for every time step until they change.
+
+        Parameters
+        ----------
+        cores : ndarray of int
+            The core nodes of the grid.
+
+        Returns
+        -------
+        tuple of ndarray
+            The CSR ``indptr`` and ``indices`` of the matrix, the positions of
+            the diagonal entries within the matrix data, and, for each active
+            link, the positions of its off-diagonal entries in the rows of its
+            tail and head nodes (or -1 if the node is not a core node).
+        """
+        status_at_node = self._grid.status_at_node
+        if self._implicit_pattern is None or not np.array_equal(
+            self._implicit_pattern[0], status_at_node
+        ):
+            grid = self._grid
+            n_cores = len(cores)
+
+            row_of_node = np.full(grid.number_of_nodes, -1, dtype=int)
+            row_of_node[cores] = np.arange(n_cores)
+
+            links = grid.active_links
+            tail = row_of_node[grid.node_at_link_tail[links]]
+            head = row_of_node[grid.node_at_link_head[links]]
+            between_cores = (tail >= 0) & (head >= 0)
+
+            rows = np.concatenate(
+                (np.arange(n_cores), tail[between_cores], head[between_cores])
+            )
+            cols = np.concatenate(
+                (np.arange(n_cores), head[between_cores], tail[between_cores])
+            )
+            order = np.lexsort((cols, rows))
+            position = np.empty_like(order)
+            position[order] = np.arange(len(order))
+
+            indptr = np.zeros(n_cores + 1, dtype=int)
+            np.cumsum(np.bincount(rows, minlength=n_cores), out=indptr[1:])
+
+            n_between = np.count_nonzero(between_cores)
+            at_tail = np.full(len(links), -1, dtype=int)
+            at_head = np.full(len(links), -1, dtype=int)
+            at_tail[between_cores] = position[n_cores : n_cores + n_between]
+            at_head[between_cores] = position[n_cores + n_between :]
+
+            self._implicit_pattern = (
+                status_at_node.copy(),
+                (indptr, cols[order], position[:n_cores], at_tail, at_head),
+            )
+        return self._implicit_pattern[1]
+
+    def run_with_implicit_solver(self, dt, tolerance=1e-8, max_iterations=50):
+        """Advance component by one time step of size dt with an implicit
+        solver.
+
+        The thickness at the end of the time step is found with a backward
+        Euler scheme so that, unlike ``run_one_step``, ``dt`` is not limited
+        by stability conditions. The nonlinear system is solved with Newton
+        iterations on the thickness at core nodes, using the derivatives of
+        the groundwater flux at links with respect to the thickness at their
+        end nodes. The fraction of excess water that goes into storage,
+        rather than seeping to the surface, is lagged from the latest
+        iterate. The sparsity pattern of the Jacobian is reused across
+        iterations and time steps for as long as node statuses don't change.
+
+        Parameters
+        ----------
+        dt: float (time in seconds)
+            The imposed timestep.
+        tolerance: float, optional
+            Iterations stop once the largest change in aquifer thickness
+            between iterations is less than this value (m).
+        max_iterations: int, optional
+            Maximum number of Newton iterations.
+
+        Raises
+        ------
+        RuntimeError
+            If the solver does not converge within *max_iterations*.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import GroundwaterDupuitPercolator
+        >>> boundaries = {"top": "closed", "left": "closed", "bottom": "closed"}
+        >>> grid = RasterModelGrid((3, 3), bc=boundaries)
+        >>> base = grid.add_zeros("aquifer_base__elevation", at="node")
+        >>> elev = grid.add_ones("topographic__elevation", at="node")
+        >>> gdp = GroundwaterDupuitPercolator(
+        ...     grid, recharge_rate=1.0e-8, hydraulic_conductivity=0.01
+        ... )
+
+        A single long step reaches the steady state thickness,
+        sqrt(R / K) = 0.001 m, at the core node.
+
+        >>> gdp.run_with_implicit_solver(1e8)
+        >>> round(grid.at_node["aquifer__thickness"][4], 6)
+        0.001
+        """
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.linalg import spsolve
+
+        grid = self._grid
+        cores = grid.core_nodes
+        links = grid.active_links
+        tails = grid.node_at_link_tail[links]
+        heads = grid.node_at_link_head[links]
+
+        # check water table above surface
+        if (self._wtable > self._elev).any():
+            self._wtable[self._wtable > self._elev] = self._elev[
+                self._wtable > self._elev
+            ]
+            self._thickness[cores] = self._wtable[cores] - self._base[cores]
+
+        # Calculate base gradient
+        self._base_grad[links] = grid.calc_grad_at_link(self._base)[links]
+        cosa = np.cos(np.arctan(self._base_grad))
+
+        pattern = self._implicit_solver_pattern(cores)
+        indptr, indices, at_diagonal, at_tail, at_head = pattern
+        data = np.empty(len(indices))
+
+        reg_thickness = self._elev - self._base
+        soil_present = reg_thickness > 0.0
+        rel_thickness = np.ones_like(self._elev)
+
+        # Groundwater flux at links is the conductance times the upwind
+        # thickness times the difference in water table elevation.
+        conductance = (
+            (self._K * cosa * cosa)[links]
+            * grid.length_of_face[grid.face_at_link[links]]
+            / grid.length_of_link[links]
+        )
+        is_core = np.zeros(grid.number_of_nodes, dtype=bool)
+        is_core[cores] = True
+        area = grid.cell_area_at_node[cores]
+        storage = self._n[cores] / dt if dt > 0.0 else np.inf
+        thickness_old = self._thickness[cores].copy()
+
+        def at_tail_and_head(value_at_tail, value_at_head):
+            """Sum values over links at their tail and head nodes."""
+            return np.bincount(
+                tails, value_at_tail, minlength=grid.number_of_nodes
+            ) + np.bincount(heads, value_at_head, minlength=grid.number_of_nodes)
+
+        for _ in range(max_iterations if dt > 0.0 else 0):
+            hlink = map_value_at_max_node_to_link(
+                grid, "water_table__elevation", "aquifer__thickness"
+            )[links]
+            dwtable = self._wtable[tails] - self._wtable[heads]
+            flux = conductance * hlink * dwtable
+            dqdx = at_tail_and_head(flux, -flux)[cores] / area
+
+            # Fraction of excess water that goes into storage rather than
+            # seeping to the surface, lagged from the latest iterate
+            rel_thickness[soil_present] = np.minimum(
+                1, self._thickness[soil_present] / (reg_thickness[soil_present])
+            )
+            into_storage = np.where(
+                self._recharge[cores] - dqdx > 0.0,
+                1.0 - _regularize_G(rel_thickness[cores], self._r),
+                1.0,
+            )
+            residual = storage * (
+                self._thickness[cores] - thickness_old
+            ) - into_storage * (self._recharge[cores] - dqdx)
+
+            # Derivatives of the flux at each link with respect to the
+            # thickness at its tail and head nodes
+            upwind_is_tail = dwtable >= 0.0
+            dflux_dtail = conductance * (hlink + dwtable * upwind_is_tail)
+            dflux_dhead = conductance * (dwtable * ~upwind_is_tail - hlink)
+            dflux_dtail[~is_core[tails]] = 0.0
+            dflux_dhead[~is_core[heads]] = 0.0
+
+            coef = np.zeros(grid.number_of_nodes)
+            coef[cores] = into_storage / area
+
+            ddqdx = at_tail_and_head(dflux_dtail, -dflux_dhead)[cores]
+            data[at_diagonal] = storage + coef[cores] * ddqdx
+            data[at_tail[at_tail >= 0]] = (coef[tails] * dflux_dhead)[at_tail >= 0]
+            data[at_head[at_head >= 0]] = -(coef[heads] * dflux_dtail)[at_head >= 0]
+
+            change = spsolve(
+                csr_matrix((data, indices, indptr), shape=(len(cores), len(cores))),
+                -residual,
+            )
+            thickness = np.maximum(self._thickness[cores] + change, 0.0)
+
+            change = np.max(np.abs(thickness - self._thickness[cores]), initial=0.0)
+            self._thickness[cores] = thickness
+            self._wtable[cores] = (self._base + self._thickness)[cores]
+            if change < tolerance:
+                break
+        else:
+            if dt > 0.0:
+                raise RuntimeError(
+                    "Implicit solver failed to converge within {0} iterations".format(
+                        max_iterations
+                    )
+                )
+
+        # Calculate hydraulic gradient
+        self._hydr_grad[links] = (
+            grid.calc_grad_at_link(self._wtable)[links] * cosa[links]
+        )
+
+        # Calculate groundwater velocity
+        self._vel[:] = -self._K * self._hydr_grad
+        self._vel[grid.status_at_link == LinkStatus.INACTIVE] = 0.0
+
+        # Aquifer thickness at links (upwind)
+        hlink = (
+            map_value_at_max_node_to_link(
+                grid, "water_table__elevation", "aquifer__thickness"
+            )
+            * cosa
+        )
+
+        # Calculate specific discharge
+        self._q[:] = hlink * self._vel
+
+        # Groundwater flux divergence
+        dqdx = grid.calc_flux_div_at_node(self._q)
+
+        # Calculate surface discharge at nodes
+        rel_thickness[soil_present] = np.minimum(
+            1, self._thickness[soil_present] / (reg_thickness[soil_present])
+        )
+        self._qs[:] = _regularize_G(rel_thickness, self._r) * _regularize_R(
+            self._recharge - dqdx
+        )
+        self._qsavg[:] = self._qs
+
+        # Rate of change of the water table over the time step
+        self._dhdt[:] = 0.0
+        if dt > 0.0:
+            self._dhdt[cores] = (self._thickness[cores] - thickness_old) / dt
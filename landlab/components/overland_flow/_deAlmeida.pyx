@@ -0,0 +1,204 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+from libc.math cimport fabs, pow, sqrt
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+cdef double _SEVEN_OVER_THREE = 7.0 / 3.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def update_discharge_at_links(
+    const DTYPE_INT_t [:] node_at_link_tail,
+    const DTYPE_INT_t [:] node_at_link_head,
+    const DTYPE_FLOAT_t [:] length_of_link,
+    const np.uint8_t [:] is_active_link,
+    const DTYPE_INT_t [:, :] parallel_links_at_link,
+    const DTYPE_FLOAT_t [:] mannings_n,
+    const DTYPE_FLOAT_t [:] z,
+    const DTYPE_FLOAT_t [:] h,
+    const DTYPE_FLOAT_t [:] q_old,
+    DTYPE_FLOAT_t [:] q,
+    DTYPE_FLOAT_t [:] h_links,
+    DTYPE_FLOAT_t [:] water_surface_slope,
+    double g,
+    double theta,
+    double dt,
+    double dx,
+    int steep_slopes,
+    long start,
+    long stop,
+):
+    """Update water depth, water-surface slope and discharge at links.
+
+    This is a single pass over links *start* through *stop* that does the
+    same work as the array operations of
+    :meth:`~.OverlandFlow.overland_flow`. At active links, water depth is
+    the difference between the higher of the water surfaces and the higher
+    of the bed elevations of the link's nodes. Discharge is then updated at
+    every link using the de Almeida et al. (2012) formulation and, if
+    *steep_slopes*, limited by the Froude and Courant conditions.
+
+    Parameters
+    ----------
+    node_at_link_tail, node_at_link_head : ndarray of int
+        Nodes at the ends of each link.
+    length_of_link : ndarray of float
+        Length of each link.
+    is_active_link : ndarray of uint8
+        Flag indicating if a link is active.
+    parallel_links_at_link : ndarray of int, shape (n_links, 2)
+        Neighboring links in line with each link, or -1.
+    mannings_n : ndarray of float
+        Manning's roughness coefficient at links.
+    z, h : ndarray of float
+        Bed elevation and water depth at nodes.
+    q_old : ndarray of float
+        Discharge at links at the start of the time step.
+    q : ndarray of float
+        Discharge at links at the end of the time step (output).
+    h_links, water_surface_slope : ndarray of float
+        Water depth and water-surface slope at links, updated in place at
+        active links.
+    g, theta, dt, dx : float
+        Gravitational acceleration, weighting factor, time step and node
+        spacing.
+    steep_slopes : int
+        Flag to limit discharge on steep slopes.
+    start, stop : int
+        Range of links to update.
+    """
+    cdef long link
+    cdef long tail
+    cdef long head
+    cdef long neighbor
+    cdef double w_tail
+    cdef double w_head
+    cdef double q_link
+    cdef double q_before
+    cdef double q_after
+    cdef double h_link
+    cdef double n
+    cdef double calculated_q
+    cdef double q_courant
+    cdef double water_div_4
+    cdef double froude = 1.0
+
+    with nogil:
+        for link in range(start, stop):
+            if is_active_link[link]:
+                tail = node_at_link_tail[link]
+                head = node_at_link_head[link]
+                w_tail = h[tail] + z[tail]
+                w_head = h[head] + z[head]
+                h_links[link] = max(w_tail, w_head) - max(z[tail], z[head])
+                water_surface_slope[link] = (w_head - w_tail) / length_of_link[link]
+
+            q_before = 0.0
+            neighbor = parallel_links_at_link[link, 0]
+            if neighbor >= 0:
+                q_before = q_old[neighbor]
+            q_after = 0.0
+            neighbor = parallel_links_at_link[link, 1]
+            if neighbor >= 0:
+                q_after = q_old[neighbor]
+
+            q_link = q_old[link]
+            h_link = h_links[link]
+            n = mannings_n[link]
+            q_link = (
+                theta * q_link
+                + (1.0 - theta) / 2.0 * (q_before + q_after)
+                - g * h_link * dt * water_surface_slope[link]
+            ) / (
+                1.0
+                + g * dt * pow(n, 2.0) * fabs(q_link) / pow(h_link, _SEVEN_OVER_THREE)
+            )
+
+            if steep_slopes:
+                calculated_q = (q_link / h_link) / sqrt(g * h_link)
+                q_courant = q_link * dt / dx
+                water_div_4 = h_link / 4.0
+                if q_link > 0.0:
+                    if q_courant > water_div_4:
+                        q_link = h_link * dx / 5.0 / dt
+                    elif calculated_q > froude:
+                        q_link = h_link * (sqrt(g * h_link) * froude)
+                elif q_link < 0.0:
+                    if fabs(q_courant) > water_div_4:
+                        q_link = 0.0 - h_link * dx / 5.0 / dt
+                    elif fabs(calculated_q) > froude:
+                        q_link = 0.0 - h_link * sqrt(g * h_link) * froude
+
+            q[link] = q_link
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def update_depth_at_nodes(
+    const DTYPE_INT_t [:] core_nodes,
+    const DTYPE_INT_t [:, :] links_at_node,
+    const np.int8_t [:, :] link_dirs_at_node,
+    const DTYPE_FLOAT_t [:] length_of_face_at_link,
+    const DTYPE_FLOAT_t [:] area_of_cell_at_node,
+    const DTYPE_FLOAT_t [:] q,
+    DTYPE_FLOAT_t [:] h,
+    DTYPE_FLOAT_t [:] dhdt,
+    double rainfall_intensity,
+    double dt,
+    long start,
+    long stop,
+):
+    """Update water depth at core nodes from the divergence of discharge.
+
+    Parameters
+    ----------
+    core_nodes : ndarray of int
+        Core nodes of the grid.
+    links_at_node : ndarray of int, shape (n_nodes, n_links_per_node)
+        Links attached to each node.
+    link_dirs_at_node : ndarray of int8, shape (n_nodes, n_links_per_node)
+        Direction of each link relative to its node.
+    length_of_face_at_link : ndarray of float
+        Width of the face crossed by each link.
+    area_of_cell_at_node : ndarray of float
+        Area of the cell of each node.
+    q : ndarray of float
+        Discharge at links.
+    h : ndarray of float
+        Water depth at nodes, updated in place.
+    dhdt : ndarray of float
+        Rate of change of water depth at nodes (output).
+    rainfall_intensity, dt : float
+        Rainfall intensity and time step.
+    start, stop : int
+        Range of *core_nodes* to update.
+    """
+    cdef long n_links_per_node = links_at_node.shape[1]
+    cdef long i
+    cdef long j
+    cdef long node
+    cdef long link
+    cdef double net_flux
+
+    with nogil:
+        for i in range(start, stop):
+            node = core_nodes[i]
+            net_flux = 0.0
+            for j in range(n_links_per_node):
+                link = links_at_node[node, j]
+                net_flux = net_flux - (
+                    q[link] * length_of_face_at_link[link] * link_dirs_at_node[node, j]
+                )
+            dhdt[node] = rainfall_intensity - net_flux / area_of_cell_at_node[node]
+            h[node] = h[node] + dhdt[node] * dt
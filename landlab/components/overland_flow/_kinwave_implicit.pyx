@@ -0,0 +1,175 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+from libc.math cimport fabs, pow
+
+
+DTYPE_FLOAT = np.double
+ctypedef np.double_t DTYPE_FLOAT_t
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+cdef inline double _water_fn(
+    double x, double a, double b, double c, double d, double e
+):
+    return x - c + a * pow(b * x + (b - 1.0) * c, d) - e
+
+
+cdef inline double _water_fn_prime(
+    double x, double a, double b, double c, double d
+):
+    return 1.0 + a * b * d * pow(b * x + (b - 1.0) * c, d - 1.0)
+
+
+cdef double _solve_water_fn(
+    double x, double a, double b, double c, double d, double e,
+    double tol, int max_iter, int * converged
+):
+    """Find a root of the water-depth equation with Newton's method.
+
+    The iteration starts at *x*. Iterates are kept within the domain of the
+    equation, where ``b * x + (b - 1) * c`` is non-negative, by moving
+    halfway to the edge of the domain instead of stepping past it.
+    """
+    cdef double x_min = 0.0
+    cdef double x_new
+    cdef double f
+    cdef int i
+
+    if b > 0.0:
+        x_min = (1.0 - b) * c / b
+
+    converged[0] = 1
+    for i in range(max_iter):
+        f = _water_fn(x, a, b, c, d, e)
+        if f == 0.0:
+            return x
+
+        x_new = x - f / _water_fn_prime(x, a, b, c, d)
+        if b > 0.0 and x_new < x_min:
+            x_new = 0.5 * (x + x_min)
+
+        if fabs(x_new - x) <= tol:
+            return x_new
+        x = x_new
+
+    converged[0] = 0
+    return x
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def sweep_implicit_kinwave(
+    np.ndarray[DTYPE_INT_t, ndim=1] nodes_ordered,
+    np.ndarray[np.uint8_t, ndim=1] status_at_node,
+    np.ndarray[DTYPE_INT_t, ndim=2] adjacent_nodes_at_node,
+    np.ndarray[DTYPE_FLOAT_t, ndim=2] proportions,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] cell_area_at_node,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] grad_width_sum,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] depth,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] disch_in,
+    double dt,
+    double runoff_rate,
+    double weight,
+    double depth_exp,
+    double vel_coef,
+    double tol=1.48e-8,
+    int max_iter=50,
+):
+    """Route water from upstream to downstream, solving for new depths.
+
+    Core nodes are visited from upstream to downstream. At each, the new
+    water depth is found by solving the implicit water-depth equation
+    (see :func:`~.generate_overland_flow_implicit_kinwave.water_fn`) and
+    the resulting outflow is passed on to the node's neighbors in
+    proportion to *proportions*.
+
+    Parameters
+    ----------
+    nodes_ordered : ndarray of int
+        Nodes ordered downstream to upstream.
+    status_at_node : ndarray of uint8
+        Node status. Only core nodes are updated.
+    adjacent_nodes_at_node : ndarray of int, shape (n_nodes, n_neighbors)
+        Neighbors of each node.
+    proportions : ndarray of float, shape (n_nodes, n_neighbors)
+        Proportion of outflow sent to each neighbor.
+    cell_area_at_node : ndarray of float
+        Area of the cell of each node.
+    alpha : ndarray of float
+        The "alpha" parameter of the water-depth equation.
+    grad_width_sum : ndarray of float
+        Sum of square-root of gradient times face width over outflow faces.
+    depth : ndarray of float
+        Water depth, updated in place.
+    disch_in : ndarray of float
+        Inflow discharge, accumulated in place.
+    dt : float
+        Time step.
+    runoff_rate : float
+        Local runoff rate.
+    weight : float
+        Weighting on depth at new time step versus old time step.
+    depth_exp : float
+        Exponent on water depth in velocity equation.
+    vel_coef : float
+        Velocity coefficient.
+    tol : float, optional
+        Tolerance on the change in depth between Newton iterations.
+    max_iter : int, optional
+        Maximum number of Newton iterations.
+
+    Returns
+    -------
+    int
+        The first node where the iteration failed to converge, or -1 if
+        it converged everywhere.
+    """
+    cdef long n_nodes = nodes_ordered.shape[0]
+    cdef long n_neighbors = adjacent_nodes_at_node.shape[1]
+    cdef long i
+    cdef long j
+    cdef long node
+    cdef long neighbor
+    cdef long failed_at = -1
+    cdef int converged
+    cdef double old_depth
+    cdef double inflow
+    cdef double h_eff
+    cdef double outflow
+
+    for i in range(n_nodes - 1, -1, -1):
+        node = nodes_ordered[i]
+        if status_at_node[node] != 0:
+            continue
+
+        # Solve for new water depth
+        old_depth = depth[node]
+        inflow = (dt * runoff_rate) + (dt * disch_in[node] / cell_area_at_node[node])
+        depth[node] = _solve_water_fn(
+            old_depth,
+            alpha[node],
+            weight,
+            old_depth,
+            depth_exp,
+            inflow,
+            tol,
+            max_iter,
+            &converged,
+        )
+        if not converged and failed_at < 0:
+            failed_at = node
+
+        # Calc outflow and send it downstream
+        h_eff = weight * depth[node] + (1.0 - weight) * old_depth
+        outflow = vel_coef * pow(h_eff, depth_exp) * grad_width_sum[node]
+
+        for j in range(n_neighbors):
+            neighbor = adjacent_nodes_at_node[node, j]
+            if neighbor >= 0:
+                disch_in[neighbor] += outflow * proportions[node, j]
+
+    return failed_at
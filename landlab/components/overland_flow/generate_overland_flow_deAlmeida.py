@@ -86,12 +86,15 @@ array([ 0. ,  0. ,  0. ,  0. ,
         0. ,  1.1,  1.1,  1.1,  0. ,
         0. ,  0. ,  0. ,  0. ])
 """
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import scipy.constants
 
 from landlab import Component, FieldError
 
 from . import _links as links
+from ._deAlmeida import update_depth_at_nodes, update_discharge_at_links
 
 _SEVEN_OVER_THREE = 7.0 / 3.0
 
@@ -191,6 +194,8 @@ class OverlandFlow(Component):
 
     _unit_agnostic = False
 
+    _substeps_internally = True
+
     _cite_as = """@article{adams2017landlab,
         title={The Landlab v1. 0 OverlandFlow component: a Python
             tool for computing shallow-water flow across watersheds},
@@ -253,6 +258,8 @@ class OverlandFlow(Component):
         theta=0.8,
         rainfall_intensity=0.0,
         steep_slopes=False,
+        fused_kernel=False,
+        threads=1,
     ):
         """Create an overland flow component.
 
@@ -277,6 +284,12 @@ class OverlandFlow(Component):
         steep_slopes : bool, optional
             Modify the algorithm to handle steeper slopes at the expense of
             speed. If model runs become unstable, consider setting to True.
+        fused_kernel : bool, optional
+            Update links and nodes with compiled, single-pass kernels rather
+            than with a series of array operations. The results are the same
+            but each time step allocates no temporary arrays.
+        threads : int, optional
+            Number of threads used by the fused kernel.
         """
         super().__init__(grid)
 
@@ -294,6 +307,9 @@ class OverlandFlow(Component):
         self._theta = theta
         self._rainfall_intensity = rainfall_intensity
         self._steep_slopes = steep_slopes
+        self._fused_kernel = fused_kernel
+        self._threads = threads
+        self._executor = None
 
         # Now setting up fields at the links...
         # For water discharge
@@ -338,6 +354,7 @@ class OverlandFlow(Component):
 
         self._dt = None
         self._dhdt = grid.zeros()
+        self._q_old = None
 
         # When we instantiate the class we recognize that neighbors have not
         # been found. After the user either calls self.set_up_neighbor_array
@@ -515,6 +532,16 @@ class OverlandFlow(Component):
         Outputs water depth, discharge and shear stress values through time at
         every point in the input grid.
         """
+        if self._fused_kernel and self._threads > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self._threads)
+        try:
+            self._overland_flow(dt=dt)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _overland_flow(self, dt=None):
         # DH adds a loop to enable an imposed tstep while maintaining stability
         local_elapsed_time = 0.0
         if dt is None:
@@ -545,252 +572,354 @@ class OverlandFlow(Component):
             self._core_nodes = self._grid.core_nodes
             self._active_links = self._grid.active_links
 
-            # Per Bates et al., 2010, this solution needs to find difference
-            # between the highest water surface in the two cells and the
-            # highest bed elevation
-            zmax = self._grid.map_max_of_link_nodes_to_link(self._z)
-            w = self._h + self._z
-            wmax = self._grid.map_max_of_link_nodes_to_link(w)
-            hflow = wmax[self._grid.active_links] - zmax[self._grid.active_links]
-
-            # Insert this water depth into an array of water depths at the
-            # links.
-            self._h_links[self._active_links] = hflow
-
-            # Now we calculate the slope of the water surface elevation at
-            # active links
-            self._water_surface__gradient = self._grid.calc_grad_at_link(w)[
-                self._grid.active_links
-            ]
+            if self._fused_kernel:
+                self._update_with_fused_kernel()
+            else:
+                self._update_with_arrays()
+
+            if dt is np.inf:
+                break
+            local_elapsed_time += self._dt
+
+    def _update_with_arrays(self):
+        """Update discharge and water depth with array operations."""
+        # Per Bates et al., 2010, this solution needs to find difference
+        # between the highest water surface in the two cells and the
+        # highest bed elevation
+        zmax = self._grid.map_max_of_link_nodes_to_link(self._z)
+        w = self._h + self._z
+        wmax = self._grid.map_max_of_link_nodes_to_link(w)
+        hflow = wmax[self._grid.active_links] - zmax[self._grid.active_links]
+
+        # Insert this water depth into an array of water depths at the
+        # links.
+        self._h_links[self._active_links] = hflow
+
+        # Now we calculate the slope of the water surface elevation at
+        # active links
+        self._water_surface__gradient = self._grid.calc_grad_at_link(w)[
+            self._grid.active_links
+        ]
+
+        # And insert these values into an array of all links
+        self._water_surface_slope[self._active_links] = self._water_surface__gradient
+        # If the user chooses to set boundary links to the neighbor value,
+        # we set the discharge array to have the boundary links set to
+        # their neighbor value
+        if self._default_fixed_links is True:
+            self._q[self._grid.fixed_links] = self._q[self._active_neighbors]
+
+        # Now we can calculate discharge. To handle links with neighbors
+        # that do not exist, we will do a fancy indexing trick. Non-
+        # existent links or inactive links have an index of '-1', which in
+        # Python, looks to the end of a list or array. To accommodate these
+        # '-1' indices, we will simply insert an value of 0.0 discharge (in
+        # units of L^2/T) to the end of the discharge array.
+        self._q = np.append(self._q, [0])
+
+        horiz = self._horizontal_ids
+        vert = self._vertical_ids
+        # Now we calculate discharge in the horizontal direction
+        try:
+            self._q[horiz] = (
+                self._theta * self._q[horiz]
+                + (1.0 - self._theta)
+                / 2.0
+                * (self._q[self._west_neighbors] + self._q[self._east_neighbors])
+                - self._g
+                * self._h_links[horiz]
+                * self._dt
+                * self._water_surface_slope[horiz]
+            ) / (
+                1
+                + self._g
+                * self._dt
+                * self._mannings_n ** 2.0
+                * abs(self._q[horiz])
+                / self._h_links[horiz] ** _SEVEN_OVER_THREE
+            )
 
-            # And insert these values into an array of all links
-            self._water_surface_slope[
-                self._active_links
-            ] = self._water_surface__gradient
-            # If the user chooses to set boundary links to the neighbor value,
-            # we set the discharge array to have the boundary links set to
-            # their neighbor value
-            if self._default_fixed_links is True:
-                self._q[self._grid.fixed_links] = self._q[self._active_neighbors]
-
-            # Now we can calculate discharge. To handle links with neighbors
-            # that do not exist, we will do a fancy indexing trick. Non-
-            # existent links or inactive links have an index of '-1', which in
-            # Python, looks to the end of a list or array. To accommodate these
-            # '-1' indices, we will simply insert an value of 0.0 discharge (in
-            # units of L^2/T) to the end of the discharge array.
-            self._q = np.append(self._q, [0])
-
-            horiz = self._horizontal_ids
-            vert = self._vertical_ids
-            # Now we calculate discharge in the horizontal direction
-            try:
-                self._q[horiz] = (
-                    self._theta * self._q[horiz]
-                    + (1.0 - self._theta)
-                    / 2.0
-                    * (self._q[self._west_neighbors] + self._q[self._east_neighbors])
-                    - self._g
-                    * self._h_links[horiz]
-                    * self._dt
-                    * self._water_surface_slope[horiz]
-                ) / (
-                    1
-                    + self._g
-                    * self._dt
-                    * self._mannings_n ** 2.0
-                    * abs(self._q[horiz])
-                    / self._h_links[horiz] ** _SEVEN_OVER_THREE
-                )
-
-                # ... and in the vertical direction
-                self._q[vert] = (
-                    self._theta * self._q[vert]
-                    + (1 - self._theta)
-                    / 2.0
-                    * (self._q[self._north_neighbors] + self._q[self._south_neighbors])
-                    - self._g
-                    * self._h_links[vert]
-                    * self._dt
-                    * self._water_surface_slope[vert]
-                ) / (
-                    1
-                    + self._g
-                    * self._dt
-                    * self._mannings_n ** 2.0
-                    * abs(self._q[vert])
-                    / self._h_links[vert] ** _SEVEN_OVER_THREE
-                )
-
-            except ValueError:
-                self._mannings_n = self._grid["link"]["mannings_n"]
-                # if manning's n in a field
-                # calc discharge in horizontal
-                self._q[horiz] = (
-                    self._theta * self._q[horiz]
-                    + (1.0 - self._theta)
-                    / 2.0
-                    * (self._q[self._west_neighbors] + self._q[self._east_neighbors])
-                    - self._g
-                    * self._h_links[horiz]
-                    * self._dt
-                    * self._water_surface_slope[horiz]
-                ) / (
-                    1
-                    + self._g
-                    * self._dt
-                    * self._mannings_n[horiz] ** 2.0
-                    * abs(self._q[horiz])
-                    / self._h_links[horiz] ** _SEVEN_OVER_THREE
-                )
-
-                # ... and in the vertical direction
-                self._q[vert] = (
-                    self._theta * self._q[vert]
-                    + (1 - self._theta)
-                    / 2.0
-                    * (self._q[self._north_neighbors] + self._q[self._south_neighbors])
-                    - self._g
-                    * self._h_links[vert]
-                    * self._dt
-                    * self._water_surface_slope[self._vertical_ids]
-                ) / (
-                    1
-                    + self._g
-                    * self._dt
-                    * self._mannings_n[vert] ** 2.0
-                    * abs(self._q[vert])
-                    / self._h_links[vert] ** _SEVEN_OVER_THREE
-                )
-
-            # Now to return the array to its original length (length of number
-            # of all links), we delete the extra 0.0 value from the end of the
-            # array.
-            self._q = np.delete(self._q, len(self._q) - 1)
-
-            # Updating the discharge array to have the boundary links set to
-            # their neighbor
-            if self._default_fixed_links is True:
-                self._q[self._grid.fixed_links] = self._q[self._active_neighbors]
-
-            if self._steep_slopes is True:
-                # To prevent water from draining too fast for our time steps...
-                # Our Froude number.
-                Fr = 1.0
-                # Our two limiting factors, the froude number and courant
-                # number.
-                # Looking a calculated q to be compared to our Fr number.
-                calculated_q = (self._q / self._h_links) / np.sqrt(
-                    self._g * self._h_links
-                )
-
-                # Looking at our calculated q and comparing it to Courant no.,
-                q_courant = self._q * self._dt / self._grid.dx
-
-                # Water depth split equally between four links..
-                water_div_4 = self._h_links / 4.0
-
-                # IDs where water discharge is positive...
-                (positive_q,) = np.where(self._q > 0)
-
-                # ... and negative.
-                (negative_q,) = np.where(self._q < 0)
-
-                # Where does our calculated q exceed the Froude number? If q
-                # does exceed the Froude number, we are getting supercritical
-                # flow and discharge needs to be reduced to maintain stability.
-                (Froude_logical,) = np.where((calculated_q) > Fr)
-                (Froude_abs_logical,) = np.where(abs(calculated_q) > Fr)
-
-                # Where does our calculated q exceed the Courant number and
-                # water depth divided amongst 4 links? If the calculated q
-                # exceeds the Courant number and is greater than the water
-                # depth divided by 4 links, we reduce discharge to maintain
-                # stability.
-                (water_logical,) = np.where(q_courant > water_div_4)
-                (water_abs_logical,) = np.where(abs(q_courant) > water_div_4)
-
-                # Where are these conditions met? For positive and negative q,
-                # there are specific rules to reduce q. This step finds where
-                # the discharge values are positive or negative and where
-                # discharge exceeds the Froude or Courant number.
-                self._if_statement_1 = np.intersect1d(positive_q, Froude_logical)
-                self._if_statement_2 = np.intersect1d(negative_q, Froude_abs_logical)
-                self._if_statement_3 = np.intersect1d(positive_q, water_logical)
-                self._if_statement_4 = np.intersect1d(negative_q, water_abs_logical)
-
-                # Rules 1 and 2 reduce discharge by the Froude number.
-                self._q[self._if_statement_1] = self._h_links[self._if_statement_1] * (
-                    np.sqrt(self._g * self._h_links[self._if_statement_1]) * Fr
-                )
-
-                self._q[self._if_statement_2] = 0.0 - (
-                    self._h_links[self._if_statement_2]
-                    * np.sqrt(self._g * self._h_links[self._if_statement_2])
-                    * Fr
-                )
-
-                # Rules 3 and 4 reduce discharge by the Courant number.
-                self._q[self._if_statement_3] = (
-                    (self._h_links[self._if_statement_3] * self._grid.dx) / 5.0
-                ) / self._dt
-
-                self._q[self._if_statement_4] = (
-                    0.0
-                    - (self._h_links[self._if_statement_4] * self._grid.dx / 5.0)
-                    / self._dt
-                )
-
-            # Once stability has been restored, we calculate the change in
-            # water depths on all core nodes by finding the difference between
-            # inputs (rainfall) and the inputs/outputs (flux divergence of
-            # discharge)
-            self._dhdt = self._rainfall_intensity - self._grid.calc_flux_div_at_node(
-                self._q
+            # ... and in the vertical direction
+            self._q[vert] = (
+                self._theta * self._q[vert]
+                + (1 - self._theta)
+                / 2.0
+                * (self._q[self._north_neighbors] + self._q[self._south_neighbors])
+                - self._g
+                * self._h_links[vert]
+                * self._dt
+                * self._water_surface_slope[vert]
+            ) / (
+                1
+                + self._g
+                * self._dt
+                * self._mannings_n ** 2.0
+                * abs(self._q[vert])
+                / self._h_links[vert] ** _SEVEN_OVER_THREE
             )
 
-            # Updating our water depths...
-            self._h[self._core_nodes] = (
-                self._h[self._core_nodes] + self._dhdt[self._core_nodes] * self._dt
+        except ValueError:
+            self._mannings_n = self._grid["link"]["mannings_n"]
+            # if manning's n in a field
+            # calc discharge in horizontal
+            self._q[horiz] = (
+                self._theta * self._q[horiz]
+                + (1.0 - self._theta)
+                / 2.0
+                * (self._q[self._west_neighbors] + self._q[self._east_neighbors])
+                - self._g
+                * self._h_links[horiz]
+                * self._dt
+                * self._water_surface_slope[horiz]
+            ) / (
+                1
+                + self._g
+                * self._dt
+                * self._mannings_n[horiz] ** 2.0
+                * abs(self._q[horiz])
+                / self._h_links[horiz] ** _SEVEN_OVER_THREE
             )
 
-            # To prevent divide by zero errors, a minimum threshold water depth
-            # must be maintained. To reduce mass imbalances, this is set to
-            # find locations where water depth is smaller than h_init (default
-            # is 0.001) and the new value is self._h_init * 10^-3. This was set
-            # as it showed the smallest amount of mass creation in the grid
-            # during testing.
-            if self._steep_slopes is True:
-                self._h[self._h < self._h_init] = self._h_init * 10.0 ** -3
-
-            # And reset our field values with the newest water depth and
-            # discharge.
-            self._grid.at_node["surface_water__depth"] = self._h
-            self._grid.at_link["surface_water__discharge"] = self._q
-            #
-            #
-            #            self._helper_q = self._grid.map_upwind_node_link_max_to_node(self._q)
-            #            self._helper_s = self._grid.map_upwind_node_link_max_to_node(
-            #                                                    self._water_surface_slope)
-            #
-            #            self._helper_q = self._grid.map_max_of_link_nodes_to_link(self._helper_q)
-            #            self._helper_s = self._grid.map_max_of_link_nodes_to_link(self._helper_s)
-            #
-            #            self._grid['link']['surface_water__discharge'][
-            #                     self._active_links_at_open_bdy] = self._helper_q[
-            #                     self._active_links_at_open_bdy]
-            #
-            #            self._grid['link']['water_surface__gradient'][
-            #                self._active_links_at_open_bdy] = self._helper_s[
-            #                self._active_links_at_open_bdy]
-            # Update nodes near boundary locations - nodes adjacent to
-            # boundaries may have discharge and water surface slopes
-            # artifically reduced due to boundary effects. This step removes
-            # those errors.
+            # ... and in the vertical direction
+            self._q[vert] = (
+                self._theta * self._q[vert]
+                + (1 - self._theta)
+                / 2.0
+                * (self._q[self._north_neighbors] + self._q[self._south_neighbors])
+                - self._g
+                * self._h_links[vert]
+                * self._dt
+                * self._water_surface_slope[self._vertical_ids]
+            ) / (
+                1
+                + self._g
+                * self._dt
+                * self._mannings_n[vert] ** 2.0
+                * abs(self._q[vert])
+                / self._h_links[vert] ** _SEVEN_OVER_THREE
+            )
 
-            if dt is np.inf:
-                break
-            local_elapsed_time += self._dt
+        # Now to return the array to its original length (length of number
+        # of all links), we delete the extra 0.0 value from the end of the
+        # array.
+        self._q = np.delete(self._q, len(self._q) - 1)
+
+        # Updating the discharge array to have the boundary links set to
+        # their neighbor
+        if self._default_fixed_links is True:
+            self._q[self._grid.fixed_links] = self._q[self._active_neighbors]
+
+        if self._steep_slopes is True:
+            # To prevent water from draining too fast for our time steps...
+            # Our Froude number.
+            Fr = 1.0
+            # Our two limiting factors, the froude number and courant
+            # number.
+            # Looking a calculated q to be compared to our Fr number.
+            calculated_q = (self._q / self._h_links) / np.sqrt(self._g * self._h_links)
+
+            # Looking at our calculated q and comparing it to Courant no.,
+            q_courant = self._q * self._dt / self._grid.dx
+
+            # Water depth split equally between four links..
+            water_div_4 = self._h_links / 4.0
+
+            # IDs where water discharge is positive...
+            (positive_q,) = np.where(self._q > 0)
+
+            # ... and negative.
+            (negative_q,) = np.where(self._q < 0)
+
+            # Where does our calculated q exceed the Froude number? If q
+            # does exceed the Froude number, we are getting supercritical
+            # flow and discharge needs to be reduced to maintain stability.
+            (Froude_logical,) = np.where((calculated_q) > Fr)
+            (Froude_abs_logical,) = np.where(abs(calculated_q) > Fr)
+
+            # Where does our calculated q exceed the Courant number and
+            # water depth divided amongst 4 links? If the calculated q
+            # exceeds the Courant number and is greater than the water
+            # depth divided by 4 links, we reduce discharge to maintain
+            # stability.
+            (water_logical,) = np.where(q_courant > water_div_4)
+            (water_abs_logical,) = np.where(abs(q_courant) > water_div_4)
+
+            # Where are these conditions met? For positive and negative q,
+            # there are specific rules to reduce q. This step finds where
+            # the discharge values are positive or negative and where
+            # discharge exceeds the Froude or Courant number.
+            self._if_statement_1 = np.intersect1d(positive_q, Froude_logical)
+            self._if_statement_2 = np.intersect1d(negative_q, Froude_abs_logical)
+            self._if_statement_3 = np.intersect1d(positive_q, water_logical)
+            self._if_statement_4 = np.intersect1d(negative_q, water_abs_logical)
+
+            # Rules 1 and 2 reduce discharge by the Froude number.
+            self._q[self._if_statement_1] = self._h_links[self._if_statement_1] * (
+                np.sqrt(self._g * self._h_links[self._if_statement_1]) * Fr
+            )
+
+            self._q[self._if_statement_2] = 0.0 - (
+                self._h_links[self._if_statement_2]
+                * np.sqrt(self._g * self._h_links[self._if_statement_2])
+                * Fr
+            )
+
+            # Rules 3 and 4 reduce discharge by the Courant number.
+            self._q[self._if_statement_3] = (
+                (self._h_links[self._if_statement_3] * self._grid.dx) / 5.0
+            ) / self._dt
+
+            self._q[self._if_statement_4] = (
+                0.0
+                - (self._h_links[self._if_statement_4] * self._grid.dx / 5.0) / self._dt
+            )
+
+        # Once stability has been restored, we calculate the change in
+        # water depths on all core nodes by finding the difference between
+        # inputs (rainfall) and the inputs/outputs (flux divergence of
+        # discharge)
+        self._dhdt = self._rainfall_intensity - self._grid.calc_flux_div_at_node(
+            self._q
+        )
+
+        # Updating our water depths...
+        self._h[self._core_nodes] = (
+            self._h[self._core_nodes] + self._dhdt[self._core_nodes] * self._dt
+        )
+
+        # To prevent divide by zero errors, a minimum threshold water depth
+        # must be maintained. To reduce mass imbalances, this is set to
+        # find locations where water depth is smaller than h_init (default
+        # is 0.001) and the new value is self._h_init * 10^-3. This was set
+        # as it showed the smallest amount of mass creation in the grid
+        # during testing.
+        if self._steep_slopes is True:
+            self._h[self._h < self._h_init] = self._h_init * 10.0 ** -3
+
+        # And reset our field values with the newest water depth and
+        # discharge.
+        self._grid.at_node["surface_water__depth"] = self._h
+        self._grid.at_link["surface_water__discharge"] = self._q
+        #
+        #
+        #            self._helper_q = self._grid.map_upwind_node_link_max_to_node(self._q)
+        #            self._helper_s = self._grid.map_upwind_node_link_max_to_node(
+        #                                                    self._water_surface_slope)
+        #
+        #            self._helper_q = self._grid.map_max_of_link_nodes_to_link(self._helper_q)
+        #            self._helper_s = self._grid.map_max_of_link_nodes_to_link(self._helper_s)
+        #
+        #            self._grid['link']['surface_water__discharge'][
+        #                     self._active_links_at_open_bdy] = self._helper_q[
+        #                     self._active_links_at_open_bdy]
+        #
+        #            self._grid['link']['water_surface__gradient'][
+        #                self._active_links_at_open_bdy] = self._helper_s[
+        #                self._active_links_at_open_bdy]
+        # Update nodes near boundary locations - nodes adjacent to
+        # boundaries may have discharge and water surface slopes
+        # artifically reduced due to boundary effects. This step removes
+        # those errors.
+
+    def _set_up_fused_kernel(self):
+        """Create the arrays used by the fused link and node kernels."""
+        grid = self._grid
+
+        self._is_active_link = np.empty(grid.number_of_links, dtype=np.uint8)
+
+        # The neighbors, in line with each link, whose discharge feeds into
+        # the link's discharge update.
+        self._parallel_links_at_link = np.full((grid.number_of_links, 2), -1, dtype=int)
+        self._parallel_links_at_link[self._horizontal_ids, 0] = self._west_neighbors
+        self._parallel_links_at_link[self._horizontal_ids, 1] = self._east_neighbors
+        self._parallel_links_at_link[self._vertical_ids, 0] = self._north_neighbors
+        self._parallel_links_at_link[self._vertical_ids, 1] = self._south_neighbors
+
+        self._length_of_face_at_link = grid.length_of_face[grid.face_at_link]
+        self._area_of_cell_at_node = np.ones(grid.number_of_nodes)
+        self._area_of_cell_at_node[grid.node_at_cell] = grid.area_of_cell
+        self._q_old = np.empty(grid.number_of_links)
+
+        if not isinstance(self._mannings_n, np.ndarray):
+            self._mannings_n_at_link = np.full(
+                grid.number_of_links, float(self._mannings_n)
+            )
+
+    def _map_over_chunks(self, func, n_items, *args):
+        """Call *func* over chunks of items, in parallel if using threads."""
+        if self._executor is not None:
+            bounds = np.linspace(0, n_items, self._threads + 1).astype(int)
+            futures = [
+                self._executor.submit(func, *(args + (start, stop)))
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+        else:
+            func(*(args + (0, n_items)))
+
+    def _update_with_fused_kernel(self):
+        """Update discharge and water depth with the fused kernels."""
+        if self._q_old is None:
+            self._set_up_fused_kernel()
+
+        grid = self._grid
+        self._q = grid.at_link["surface_water__discharge"]
+
+        if isinstance(self._mannings_n, np.ndarray):
+            mannings_n = np.asarray(self._mannings_n, dtype=float)
+        else:
+            mannings_n = self._mannings_n_at_link
+
+        self._is_active_link.fill(0)
+        self._is_active_link[self._active_links] = 1
+
+        if self._default_fixed_links is True:
+            self._q[grid.fixed_links] = self._q[self._active_neighbors]
+        self._q_old[:] = self._q
+
+        self._map_over_chunks(
+            update_discharge_at_links,
+            grid.number_of_links,
+            grid.node_at_link_tail,
+            grid.node_at_link_head,
+            grid.length_of_link,
+            self._is_active_link,
+            self._parallel_links_at_link,
+            mannings_n,
+            self._z,
+            self._h,
+            self._q_old,
+            self._q,
+            self._h_links,
+            self._water_surface_slope,
+            self._g,
+            self._theta,
+            self._dt,
+            grid.dx,
+            self._steep_slopes,
+        )
+
+        if self._default_fixed_links is True:
+            self._q[grid.fixed_links] = self._q[self._active_neighbors]
+
+        self._map_over_chunks(
+            update_depth_at_nodes,
+            len(self._core_nodes),
+            self._core_nodes,
+            grid.links_at_node,
+            grid.link_dirs_at_node,
+            self._length_of_face_at_link,
+            self._area_of_cell_at_node,
+            self._q,
+            self._h,
+            self._dhdt,
+            self._rainfall_intensity,
+            self._dt,
+        )
+
+        if self._steep_slopes is True:
+            self._h[self._h < self._h_init] = self._h_init * 10.0 ** -3
 
     def run_one_step(self, dt=None):
         """Generate overland flow across a grid.
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from landlab import Component
 
@@ -242,6 +243,9 @@ class VegCA(Component):
         VegType[locs_shrubs[tp[locs_shrubs] < self._tpmax_sh_s]] = SHRUBSEEDLING
         grid["cell"]["plant__age"] = tp.astype(float)
 
+        self._first_ring = _ring_adjacency(grid.looped_neighbors_at_cell)
+        self._second_ring = _ring_adjacency(grid.second_ring_looped_neighbors_at_cell)
+
     @property
     def Edit_VegCov(self):
         """Flag to indicate whether an optional field is created.
@@ -285,15 +289,16 @@ class VegCA(Component):
         self._live_index = 1 - self._CumWS  # Plant live index = 1 - WS
         bare_cells = np.where(self._VegType == BARE)[0]
         n_bare = len(bare_cells)
-        first_ring = self._grid.looped_neighbors_at_cell[bare_cells]
-        second_ring = self._grid.second_ring_looped_neighbors_at_cell[bare_cells]
-        veg_type_fr = self._VegType[first_ring]
-        veg_type_sr = self._VegType[second_ring]
-        Sh_WS_fr = WS_PFT(veg_type_fr, SHRUB, self._live_index[first_ring])
-        Tr_WS_fr = WS_PFT(veg_type_fr, TREE, self._live_index[first_ring])
-        Tr_WS_sr = WS_PFT(veg_type_sr, TREE, self._live_index[second_ring])
-
-        n = count(veg_type_fr, SHRUB)
+        is_shrub = self._VegType == SHRUB
+        is_tree = self._VegType == TREE
+        Sh_WS_fr = (self._first_ring @ np.where(is_shrub, self._live_index, 0.0))[
+            bare_cells
+        ]
+        Tr_WS = np.where(is_tree, self._live_index, 0.0)
+        Tr_WS_fr = (self._first_ring @ Tr_WS)[bare_cells]
+        Tr_WS_sr = (self._second_ring @ Tr_WS)[bare_cells]
+
+        n = (self._first_ring @ is_shrub.astype(float))[bare_cells].astype(int)
         Phi_sh = Sh_WS_fr / 8.0
         Phi_tr = (Tr_WS_fr + Tr_WS_sr / 2.0) / 8.0
         Phi_g = np.mean(self._live_index[np.where(self._VegType == GRASS)])
@@ -374,21 +379,19 @@ class VegCA(Component):
         self._Mortified = plant_cells[Mortality]
 
 
-def count(Arr, value):
-    Res = np.zeros(Arr.shape[0], dtype=int)
-    x, y = Arr.shape
-    for i in range(0, x):
-        for j in range(0, y):
-            if Arr[i][j] == value:
-                Res[i] += 1
-    return Res
-
-
-def WS_PFT(VegType, PlantType, WS):
-    Phi = np.zeros(WS.shape[0])
-    x, y = WS.shape
-    for i in range(0, x):
-        for j in range(0, y):
-            if VegType[i][j] == PlantType:
-                Phi[i] += WS[i][j]
-    return Phi
+def _ring_adjacency(neighbors_at_cell):
+    """Sparse matrix that sums values over a ring of neighbors of each cell.
+
+    Column indices of each row are kept in the order of the neighbors (and
+    duplicates are kept) so that sums are accumulated in the same order as
+    they would be by looping over the neighbors.
+    """
+    n_cells, n_neighbors = neighbors_at_cell.shape
+    return csr_matrix(
+        (
+            np.ones(neighbors_at_cell.size),
+            np.asarray(neighbors_at_cell).reshape(-1),
+            np.arange(0, n_cells * n_neighbors + 1, n_neighbors),
+        ),
+        shape=(n_cells, n_cells),
+    )
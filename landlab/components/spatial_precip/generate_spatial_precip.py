@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.spatial import cKDTree
 from scipy.stats import fisk, genextreme
 
 from landlab import Component, RasterModelGrid
@@ -51,12 +52,19 @@ class SpatialPrecipitationDistribution(Component):
 
     The component offers the option to modify the maximum number of storms
     simulated per year. If you find simulations encountering this limit too
-    often, you may need to raise this limit. Conversely, it could be lowered
-    to reduce memory usage over small grids. However, in increasing the value,
-    beware - the component maintains two limit*nnodes arrays, which will chew
-    through memory if the limit gets too high. The default will happily
-    simulate grids up to around 50 km * 50 km using the default probability
-    distributions.
+    often, you may need to raise this limit. The limit does not affect memory
+    use; the component only stores running totals over the grid, and each
+    storm is rasterized only over the nodes that lie under its footprint.
+
+    Storm properties (interarrival time, area, location, duration, intensity
+    and radial weakening) can be drawn from their distributions in batches
+    by setting `batch_size`. Batches are drawn as arrays at the start of a
+    season and the storms are then yielded lazily one at a time, which is
+    much faster for long runs. Batching does not change the distributions the
+    storms are drawn from, but it does change the order in which random
+    numbers are consumed, so a seeded run will produce different (but
+    statistically equivalent) storms for different batch sizes. The default,
+    `batch_size=1`, reproduces the sequence of storms of unbatched sampling.
 
     Key methods are:
 
@@ -301,7 +309,12 @@ class SpatialPrecipitationDistribution(Component):
     }
 
     def __init__(
-        self, grid, number_of_years=1, orographic_scenario=None, max_numstorms=5000
+        self,
+        grid,
+        number_of_years=1,
+        orographic_scenario=None,
+        max_numstorms=5000,
+        batch_size=1,
     ):
         """Create the SpatialPrecipitationDistribution generator component.
 
@@ -317,18 +330,22 @@ class SpatialPrecipitationDistribution(Component):
             here that turns the provided elevation of the storm center into
             a length-11 curve weighting to select which orographic scenario
             to apply.
+        max_numstorms : int
+            The maximum number of storms permitted in a single season.
+        batch_size : int
+            The number of storms to draw from the storm property
+            distributions at once.
         """
         super().__init__(grid)
 
-        gaugecount = (grid.status_at_node != grid.BC_NODE_IS_CLOSED).sum()
-        self._gauge_dist_km = np.zeros(gaugecount, dtype="float")
-        self._temp_dataslots1 = np.zeros(gaugecount, dtype="float")
-        self._temp_dataslots2 = np.zeros(gaugecount, dtype="float")
         self._numyrs = number_of_years
 
         self._max_numstorms = max_numstorms
-        # This is for initializing matrices. Trailing zeros are deleted from
-        # matrixes at the end of the code.
+        # This is the upper limit on storms per season.
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self._batch_size = int(batch_size)
 
         assert orographic_scenario in (None, "Singer")
         self._orographic_scenario = orographic_scenario
@@ -1029,9 +1046,10 @@ class SpatialPrecipitationDistribution(Component):
             Zz = self._grid.at_node["topographic__elevation"][opennodes]
         except KeyError:
             assert self._orographic_scenario is None
-        numgauges = Xin.size  # number of rain gauges in the basin.
         # NOTE: In this version this produces output on a grid, rather than at
         # real gauge locations.
+        tree = cKDTree(np.column_stack((Xin, Yin)))
+        # ^ spatial index of the gauges, used to locate and rasterize storms
 
         assert FUZZMETHOD == "DEJH", "The Singer method for fuzz is no longer supported"
 
@@ -1069,15 +1087,11 @@ class SpatialPrecipitationDistribution(Component):
             storm_trend += storminess_trend
             year_storm_count = 0
             breaker = False
-            Storm_total_local_year = np.zeros((self._max_numstorms, num_opennodes))
             self._storm_running_sum_of_seasons = np.zeros(num_opennodes)
             self._storm_running_sum_1st_seas = np.zeros(num_opennodes)
-
-            storms_yr_so_far = 0
             for seas in range(reps):
                 seas_time = 0.0  # tracks elapsed season time in hours
-                Storm_running_sum_seas = np.zeros((2, num_opennodes))
-                # ^ 1st col is running total, 2nd is data to add to it
+                Storm_running_sum_seas = np.zeros(num_opennodes)
                 if seas == 0 and not style == "winter":
                     self._current_season = "M"
                     # This is the pdf fitted to all available station precip
@@ -1124,52 +1138,34 @@ class SpatialPrecipitationDistribution(Component):
                 self._Ptot_ann_global[syear] += season_rf_limit
                 if seas == 0 and not style == "winter":
                     self._Ptot_monsoon_global[syear] = season_rf_limit
-                Storm_total_local_seas = np.zeros((self._max_numstorms, num_opennodes))
-                seas_cum_Ptot_gauge = np.zeros(numgauges)
                 self._entries = 0
                 seas_storm_count = 0
+                storm_params = self._sample_storms(
+                    tree,
+                    Int_arr_pdf_GEV,
+                    Area_pdf_EV,
+                    Duration_pdf,
+                    Recess_pdf_norm,
+                    duration_is_GEV=(seas == 0 and not style == "winter"),
+                )
 
                 for storm in range(self._max_numstorms):
                     self._rain_int_gauge.fill(0.0)
-                    int_arr_val = genextreme.rvs(
-                        c=Int_arr_pdf_GEV["shape"],
-                        loc=Int_arr_pdf_GEV["mu"],
-                        scale=Int_arr_pdf_GEV["sigma"],
-                    )
-                    try:
-                        int_arr_val = np.clip(
-                            int_arr_val,
-                            Int_arr_pdf_GEV["trunc_interval"][0],
-                            Int_arr_pdf_GEV["trunc_interval"][1],
-                        )
-                    except KeyError:
-                        # ...just in case
-                        if int_arr_val < 0.0:
-                            int_arr_val = 0.0
-                    # now, correct the scaling relative to WG
-                    int_arr_val /= self._scaling_to_WG
+                    (
+                        int_arr_val,
+                        area_val,
+                        cx,
+                        cy,
+                        closest_gauge,
+                        duration_val,
+                        curve_prob,
+                        fuzz_prob,
+                        recess_val,
+                    ) = next(storm_params)
                     self._int_arr_val = int_arr_val
                     # ^Samples from distribution of interarrival times (hr).
                     # This can be used to develop STORM output for use in
                     # rainfall-runoff models or any water balance application.
-                    # sample uniformly from storm center matrix from grid w
-                    # 10 m spacings covering basin:
-
-                    area_val = genextreme.rvs(
-                        c=Area_pdf_EV["shape"],
-                        loc=Area_pdf_EV["mu"],
-                        scale=Area_pdf_EV["sigma"],
-                    )
-                    try:
-                        area_val = np.clip(
-                            area_val,
-                            Area_pdf_EV["trunc_interval"][0],
-                            Area_pdf_EV["trunc_interval"][1],
-                        )
-                    except KeyError:
-                        # ...just in case
-                        if area_val < 0.0:
-                            area_val = 0.0
                     self._area_val = area_val
                     # ^Samples from distribution of storm areas
 
@@ -1177,24 +1173,14 @@ class SpatialPrecipitationDistribution(Component):
                     rsq = r ** 2
                     # based on area above in meters to match the UTM values
 
-                    # This way of handling storm locations is really quite
-                    # different to MS's. He uses a fixed buffer width, and
-                    # throws away any storm that doesn't intersect. We
-                    # instead retain all storms, and *make sure* the storm
-                    # intersects using a dynamic buffer. MS's method will
-                    # preferentially sample larger storms, though unclear
-                    # what that would mean in practice.
-                    # MS also snaps his storms onto the grid. This seems
-                    # unnecessary, and we don't do it here.
-                    while 1:
-                        cx, cy = self._locate_storm(r)
-                        # Determine which gauges are hit by Euclidean geometry:
-                        gdist = (Xin - cx) ** 2 + (Yin - cy) ** 2
-                        mask_name = gdist <= rsq  # this is defacto MS's aa
-                        # this short circuits the storm loop in the case that
-                        # the storm does not affect any 'gauging' location
-                        if np.any(np.equal(mask_name, True)):
-                            break
+                    # The storm center has already been placed so that the
+                    # storm hits at least one gauge (see _sample_storms). Here
+                    # we find the footprint, i.e., the gauges within r of the
+                    # center, without touching the rest of the grid.
+                    gauges_hit = np.sort(tree.query_ball_point((cx, cy), r))
+                    gdist = (Xin[gauges_hit] - cx) ** 2 + (Yin[gauges_hit] - cy) ** 2
+                    gauges_hit = gauges_hit[gdist <= rsq]
+                    gdist = gdist[gdist <= rsq]
 
                     self._x = cx
                     self._y = cy
@@ -1219,8 +1205,7 @@ class SpatialPrecipitationDistribution(Component):
                         # this routine below allows for orography in precip by
                         # first determining the closest gauge and then
                         # determining its orographic grouping
-                        cc = np.argmin(gdist)
-                        closest_gauge_z = Zz[cc]  # this will be
+                        closest_gauge_z = Zz[closest_gauge]  # this will be
                         # compared against orographic gauge groupings to
                         # determine the appropriate set of intensity-duration
                         # curves
@@ -1242,28 +1227,6 @@ class SpatialPrecipitationDistribution(Component):
                             0.1090,
                             0.1182,
                         ]
-                    if seas == 0 and not style == "winter":
-                        duration_val = genextreme.rvs(
-                            c=Duration_pdf["shape"],
-                            loc=Duration_pdf["mu"],
-                            scale=Duration_pdf["sigma"],
-                        )
-                    else:
-                        duration_val = fisk.rvs(
-                            c=Duration_pdf["c"], scale=Duration_pdf["scale"]
-                        )
-                    # hacky fix to prevent occasional < 0 values:
-                    # (I think because Matlab is able to set limits manually)
-                    try:
-                        duration_val = np.clip(
-                            duration_val,
-                            Duration_pdf["trunc_interval"][0],
-                            Duration_pdf["trunc_interval"][1],
-                        )
-                    except KeyError:
-                        # ...just in case
-                        if duration_val < 0.0:
-                            duration_val = 0.0
                     durationhrs = duration_val / 60.0
                     self._durationhrs = durationhrs
                     year_time += durationhrs
@@ -1272,7 +1235,7 @@ class SpatialPrecipitationDistribution(Component):
                     # specified "total" time
 
                     # which curve did we pick?:
-                    int_dur_curve_val = np.random.choice(numcurves, p=wgts)
+                    int_dur_curve_val = _choose_curve(wgts, curve_prob)
 
                     intensity_val = (
                         lambda_[int_dur_curve_val] * np.exp(-0.508 * duration_val)
@@ -1282,7 +1245,7 @@ class SpatialPrecipitationDistribution(Component):
                     # ...these curves are based on empirical data from WG
 
                     # this dist should look identical, w/o discretisation
-                    fuzz_int_val = FUZZWIDTH * 2.0 * (np.random.rand() - 0.5)
+                    fuzz_int_val = FUZZWIDTH * 2.0 * (fuzz_prob - 0.5)
 
                     intensity_val += fuzz_int_val
                     # ^this allows for specified fuzzy tolerance around
@@ -1307,18 +1270,6 @@ class SpatialPrecipitationDistribution(Component):
                     # should hopefully remain pretty rare.)
                     self._intensity_val = intensity_val
 
-                    # area to determine which gauges are hit:
-                    recess_val = np.random.normal(
-                        loc=Recess_pdf_norm["mu"], scale=Recess_pdf_norm["sigma"]
-                    )
-                    try:
-                        recess_val = np.clip(
-                            recess_val,
-                            Recess_pdf_norm["trunc_interval"][0],
-                            Recess_pdf_norm["trunc_interval"][1],
-                        )
-                    except KeyError:
-                        pass  # this one is OK <0., I think
                     self._recess_val = recess_val
                     # this pdf of recession coefficients determines how
                     # intensity declines with distance from storm center (see
@@ -1326,60 +1277,32 @@ class SpatialPrecipitationDistribution(Component):
                     # determine cartesian distances to all hit gauges and
                     # associated intensity values at each gauge hit by the
                     # storm
-                    # This is a data storage solution to avoid issues that can
-                    # arise with slicing grid areas with heavy tailed sizes
-                    self._entries = np.sum(mask_name)  # only open nodes
-                    entries = self._entries
-                    # NOTE _gauge_dist_km only contains nodes under the storm!
-                    # The remaining entries are garbage
-                    # Xin -> only the open nodes, note
-                    self._gauge_dist_km[:entries] = np.sqrt(gdist[mask_name]) / 1000.0
-                    self._temp_dataslots2[:entries] = gdist[mask_name] / 1.0e6
-                    self._temp_dataslots2[:entries] *= -2.0 * recess_val ** 2
-                    np.exp(
-                        self._temp_dataslots2[:entries],
-                        out=self._temp_dataslots2[:entries],
-                    )
-                    self._temp_dataslots2[:entries] *= intensity_val
-                    mask_incl_closed = IDs_open[mask_name]
+                    self._entries = gauges_hit.size  # only open nodes
+                    rain_int_hit = gdist / 1.0e6
+                    rain_int_hit *= -2.0 * recess_val ** 2
+                    np.exp(rain_int_hit, out=rain_int_hit)
+                    rain_int_hit *= intensity_val
+                    mask_incl_closed = IDs_open[gauges_hit]
                     self._nodes_hit = mask_incl_closed
                     # ^note this is by ID, not bool
-                    self._rain_int_gauge[mask_incl_closed] = self._temp_dataslots2[
-                        :entries
-                    ]
+                    self._rain_int_gauge[mask_incl_closed] = rain_int_hit
                     # calc of _rain_int_gauge follows Rodriguez-Iturbe et al.,
                     # 1986; Morin et al., 2005 but sampled from a distribution
                     # only need to add the bit that got rained on, so:
-                    self._temp_dataslots2[:entries] *= duration_val / 60.0
-                    seas_cum_Ptot_gauge[mask_name] += self._temp_dataslots2[:entries]
-                    # collect storm totals for all gauges into rows by storm
-                    Storm_total_local_seas[storm, :] = (
-                        self._rain_int_gauge[opennodes] * duration_val / 60.0
-                    )
-                    Storm_total_local_year[
-                        (storm + storms_yr_so_far), :
-                    ] = Storm_total_local_seas[storm, :]
-                    self._max_storm_depth = Storm_total_local_seas[storm, :].max()
-
-                    self._Storm_total_local_seas = Storm_total_local_seas
-                    self._Storm_total_local_year = Storm_total_local_year
-                    Storm_running_sum_seas[1, :] = Storm_total_local_seas[storm, :]
-                    np.nansum(
-                        Storm_running_sum_seas, axis=0, out=Storm_running_sum_seas[0, :]
-                    )
-                    if np.any(Storm_total_local_seas < 0.0):
+                    storm_depth_hit = rain_int_hit * duration_val / 60.0
+                    if np.any(storm_depth_hit < 0.0):
                         raise ValueError(syear, storm)
-                    self._median_seas_rf_total = np.nanmedian(
-                        Storm_running_sum_seas[0, :]
-                    )
-                    self._Storm_running_sum_seas = Storm_running_sum_seas[0, :]
+                    self._max_storm_depth = storm_depth_hit.max(initial=0.0)
+
+                    Storm_running_sum_seas[gauges_hit] += storm_depth_hit
+                    self._Storm_running_sum_seas = Storm_running_sum_seas
 
                     if limit == "total_time":
                         if seas_time + int_arr_val > seas_total:
                             int_arr_val = (seas_total - seas_time).clip(0.0)
                             breaker = True
                     else:
-                        if self._median_seas_rf_total > season_rf_limit:
+                        if self.median_total_rainfall_this_season > season_rf_limit:
                             breaker = True
                     if yield_storms is True:
                         yield (durationhrs, int_arr_val)
@@ -1391,12 +1314,11 @@ class SpatialPrecipitationDistribution(Component):
                         break
                     if storm + 1 == self._max_numstorms:
                         raise ValueError("_max_numstorms set too low for this run")
-                storms_yr_so_far = seas_storm_count
-                self._storm_running_sum_of_seasons += Storm_running_sum_seas[0, :]
+                self._storm_running_sum_of_seasons += Storm_running_sum_seas
                 self._total_rainfall_last_season[
                     self._opennodes
-                ] = Storm_running_sum_seas[0, :]
-                self._storm_running_sum_1st_seas += Storm_running_sum_seas[0, :]
+                ] = Storm_running_sum_seas
+                self._storm_running_sum_1st_seas += Storm_running_sum_seas
                 if yield_seasons is True:
                     yield seas_storm_count
 
@@ -1486,14 +1408,130 @@ class SpatialPrecipitationDistribution(Component):
         else:
             return (summer_rf_limit, winter_rf_limit)
 
+    def _sample_storms(
+        self,
+        tree,
+        Int_arr_pdf_GEV,
+        Area_pdf_EV,
+        Duration_pdf,
+        Recess_pdf_norm,
+        duration_is_GEV=True,
+    ):
+        """Generate the random properties of successive storms in a season.
+
+        Properties are drawn from their distributions as arrays of
+        `batch_size` storms, then yielded one storm at a time. Each storm
+        center is placed (by rejection) such that the storm hits at least one
+        gauge.
+
+        Parameters
+        ----------
+        tree : cKDTree
+            Spatial index of the open nodes ("gauges") of the grid.
+        Int_arr_pdf_GEV, Area_pdf_EV, Duration_pdf, Recess_pdf_norm : dict
+            The distributions for the current season.
+        duration_is_GEV : bool
+            If True, Duration_pdf is a GEV, otherwise a Fisk distribution.
+
+        Yields
+        ------
+        tuple
+            (interarrival time, area, center x, center y, closest gauge,
+            duration, curve probability, fuzz probability, recession value)
+        """
+        size = self._batch_size
+        while 1:
+            int_arr_vals = _clip_to_trunc_interval(
+                genextreme.rvs(
+                    c=Int_arr_pdf_GEV["shape"],
+                    loc=Int_arr_pdf_GEV["mu"],
+                    scale=Int_arr_pdf_GEV["sigma"],
+                    size=size,
+                ),
+                Int_arr_pdf_GEV,
+            )
+            # now, correct the scaling relative to WG
+            int_arr_vals /= self._scaling_to_WG
+
+            area_vals = _clip_to_trunc_interval(
+                genextreme.rvs(
+                    c=Area_pdf_EV["shape"],
+                    loc=Area_pdf_EV["mu"],
+                    scale=Area_pdf_EV["sigma"],
+                    size=size,
+                ),
+                Area_pdf_EV,
+            )
+            radii = np.sqrt(area_vals / np.pi)
+
+            # This way of handling storm locations is really quite
+            # different to MS's. He uses a fixed buffer width, and
+            # throws away any storm that doesn't intersect. We
+            # instead retain all storms, and *make sure* the storm
+            # intersects using a dynamic buffer. MS's method will
+            # preferentially sample larger storms, though unclear
+            # what that would mean in practice.
+            # MS also snaps his storms onto the grid. This seems
+            # unnecessary, and we don't do it here.
+            cxs = np.empty(size)
+            cys = np.empty(size)
+            closest_gauges = np.empty(size, dtype=int)
+            missed = np.arange(size)
+            while missed.size > 0:
+                cx, cy = self._locate_storm(radii[missed])
+                dist, closest = tree.query(np.column_stack((cx, cy)))
+                cxs[missed] = cx
+                cys[missed] = cy
+                closest_gauges[missed] = closest
+                missed = missed[dist ** 2 > radii[missed] ** 2]
+
+            if duration_is_GEV:
+                duration_vals = genextreme.rvs(
+                    c=Duration_pdf["shape"],
+                    loc=Duration_pdf["mu"],
+                    scale=Duration_pdf["sigma"],
+                    size=size,
+                )
+            else:
+                duration_vals = fisk.rvs(
+                    c=Duration_pdf["c"], scale=Duration_pdf["scale"], size=size
+                )
+            # hacky fix to prevent occasional < 0 values:
+            # (I think because Matlab is able to set limits manually)
+            duration_vals = _clip_to_trunc_interval(duration_vals, Duration_pdf)
+
+            curve_probs = np.random.random_sample(size)
+            fuzz_probs = np.random.rand(size)
+
+            recess_vals = np.random.normal(
+                loc=Recess_pdf_norm["mu"], scale=Recess_pdf_norm["sigma"], size=size
+            )
+            if "trunc_interval" in Recess_pdf_norm:
+                # (this one is OK <0., I think, if not truncated)
+                recess_vals = _clip_to_trunc_interval(recess_vals, Recess_pdf_norm)
+
+            yield from zip(
+                int_arr_vals,
+                area_vals,
+                cxs,
+                cys,
+                closest_gauges,
+                duration_vals,
+                curve_probs,
+                fuzz_probs,
+                recess_vals,
+            )
+
     def _locate_storm(self, storm_radius):
         """Because of the way the stats fall out, any simulated storm from the
         distribution must intersect the catchment somewhere.
 
-        Note written in a grid-agnostic fashion.
+        Note written in a grid-agnostic fashion. If storm_radius is an array,
+        locate one storm for each radius.
         """
-        stormposx = np.random.rand() * (self._widthx + 2.0 * storm_radius)
-        stormposy = np.random.rand() * (self._widthy + 2.0 * storm_radius)
+        size = np.shape(storm_radius) or None
+        stormposx = np.random.random_sample(size) * (self._widthx + 2.0 * storm_radius)
+        stormposy = np.random.random_sample(size) * (self._widthy + 2.0 * storm_radius)
         stormx = self._minx - storm_radius + stormposx
         stormy = self._miny - storm_radius + stormposy
         return stormx, stormy
@@ -1589,7 +1627,7 @@ class SpatialPrecipitationDistribution(Component):
     def median_total_rainfall_this_season(self):
         """Get the accumulated median total rainfall over the open nodes of the
         grid so far this season (mm)."""
-        return self._median_seas_rf_total
+        return np.nanmedian(self._Storm_running_sum_seas)
 
     @property
     def median_total_rainfall_this_year(self):
@@ -1624,6 +1662,27 @@ class SpatialPrecipitationDistribution(Component):
         return self._season_rf_limit
 
 
+def _clip_to_trunc_interval(values, pdf):
+    """Clip sampled values to the "trunc_interval" of a distribution, if it
+    has one, or at zero if not."""
+    try:
+        return np.clip(values, pdf["trunc_interval"][0], pdf["trunc_interval"][1])
+    except KeyError:
+        # ...just in case
+        return np.clip(values, 0.0, None)
+
+
+def _choose_curve(wgts, prob):
+    """Select an intensity-duration curve given the curve weights and a
+    uniformly distributed random number in [0, 1).
+
+    This is equivalent to ``np.random.choice(len(wgts), p=wgts)``.
+    """
+    cdf = np.cumsum(wgts)
+    cdf /= cdf[-1]
+    return int(cdf.searchsorted(prob, side="right"))
+
+
 def Singer_orographic_rainfall(z_closest_node_to_center):
     """Return a set of curve weights for a provided z, assuming an orographic
     rule following that presented in Singer & Michaelides 2017 & Singer et al.
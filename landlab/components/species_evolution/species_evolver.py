@@ -12,7 +12,7 @@ SpeciesEvolver. The simulated life evolves following customizable processes.
 
 Component written by Nathan Lyons beginning August 2017.
 """
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 
 import numpy as np
 from pandas import DataFrame
@@ -20,6 +20,7 @@ from pandas import DataFrame
 from landlab import Component
 
 from .record import Record
+from .zone_taxon import ZoneTaxon
 
 
 class SpeciesEvolver(Component):
@@ -460,27 +461,29 @@ class SpeciesEvolver(Component):
         data = self._taxa_data
         objs = self._taxon_objs
 
-        t_recorded = self._taxon_objs
+        t_recorded = set(self._taxon_objs)
         t_introduced = [taxon for taxon in taxa_at_time if taxon in t_recorded]
         t_new = [taxon for taxon in taxa_at_time if taxon not in t_recorded]
 
         # Update previously introduced taxa.
 
-        for taxon in t_introduced:
-            if not taxon.extant:
-                idx = data["tid"].index(taxon.tid)
-                data["t_final"][idx] = time
-                objs.remove(taxon)
+        t_final = set(taxon for taxon in t_introduced if not taxon.extant)
+
+        if t_final:
+            idx_of_tid = {tid: idx for idx, tid in enumerate(data["tid"])}
+            for taxon in t_final:
+                data["t_final"][idx_of_tid[taxon.tid]] = time
+            objs[:] = [taxon for taxon in objs if taxon not in t_final]
 
         # Set the data of new taxa.
 
+        next_tid = max(data["tid"]) + 1 if data["tid"] else 0
+
         for taxon in t_new:
             # Set identifier.
 
-            if data["tid"]:
-                taxon._tid = max(data["tid"]) + 1
-            else:
-                taxon._tid = 0
+            taxon._tid = next_tid
+            next_tid += 1
 
             # Append taxon data.
 
@@ -685,13 +688,21 @@ class SpeciesEvolver(Component):
         return taxa
 
     def _get_taxa_richness_map(self):
-        """Get a map of the number of taxa."""
-        objs = self._taxon_objs
+        """Get a map of the number of taxa.
+
+        The range of a taxon that is made up of zones is the set of its zones,
+        so richness is summed by zone rather than by taxon range mask.
+        """
+        richness_mask = np.zeros(self._grid.number_of_nodes, dtype=int)
+        taxa_in_zone = Counter()
+
+        for taxon in self._taxon_objs:
+            if isinstance(taxon, ZoneTaxon):
+                taxa_in_zone.update(taxon.zones)
+            else:
+                richness_mask += taxon.range_mask
 
-        if objs:
-            masks = np.stack([taxon.range_mask for taxon in objs])
-            richness_mask = masks.sum(axis=0).astype(int)
-        else:
-            richness_mask = np.zeros(self._grid.number_of_nodes, dtype=int)
+        for zone, count in taxa_in_zone.items():
+            richness_mask[zone.nodes] += count
 
         return richness_mask
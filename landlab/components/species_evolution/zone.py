@@ -5,7 +5,6 @@ from collections import OrderedDict
 from enum import IntEnum, unique
 
 import numpy as np
-from pandas import Series
 
 
 @unique
@@ -33,10 +32,12 @@ def _update_zones(grid, prior_zones, new_zones, record):
     """Resolve the spatial connectivity of zones across two time steps.
 
     This method iterates over each zone of the prior time step to identify the
-    zones of the current time step it spatially intersects. This method updates
-    the zone attribute, ``successors``. Successor zones are the new zones
-    existing at the current time step that are the continuation of prior time
-    step zones referred to as the predecessor zones.
+    zones of the current time step it spatially intersects. Intersections are
+    found from a table of the node counts shared by each pair of prior and new
+    zones that is built once from the zone label arrays of the two time steps.
+    This method updates the zone attribute, ``successors``. Successor zones are
+    the new zones existing at the current time step that are the continuation
+    of prior time step zones referred to as the predecessor zones.
 
     The type of connection between predecessor and successor zones is described
     ``Connection``. The `_conn_type` property of zones are set by this method.
@@ -95,20 +96,24 @@ def _update_zones(grid, prior_zones, new_zones, record):
         ps_index_map = _create_index_map(grid, prior_zones)
         ns_index_map = _create_index_map(grid, new_zones)
 
+        # Get the zones that intersect each prior and new zone along with the
+        # count of nodes in each intersection.
+        ns_at_p, ps_at_n, overlap = _intersections(
+            ps_index_map, ns_index_map, prior_zones, new_zones
+        )
+
         replacements = OrderedDict()
 
         for i_p, p in enumerate(prior_zones):
-            # Retain a copy of the prior zone mask to compare with the new zone
-            # mask after the zone masks are updated.
-            p_mask_copy = p.mask.copy()
-
             # Get the new zones that intersect (`i`) the prior zone.
-            ns_i_p = _intersecting_zones(ps_index_map == i_p, ns_index_map, new_zones)
+            ns_i_p = ns_at_p[i_p]
             ns_i_p_ct = len(ns_i_p)
 
             # Get the other prior zones that intersect the new zones.
-            ns_mask = np.any([n.mask for n in ns_i_p], axis=0)
-            ps_i_ns = _intersecting_zones(ns_mask, ps_index_map, prior_zones)
+            i_ps = set()
+            for n in ns_i_p:
+                i_ps.update(ps_at_n[n])
+            ps_i_ns = [prior_zones[i] for i in sorted(i_ps)]
             ps_i_ns_ct = len(ps_i_ns)
 
             if ps_i_ns_ct == 0:
@@ -124,10 +129,8 @@ def _update_zones(grid, prior_zones, new_zones, record):
                 conn_type,
                 ps_i_ns,
                 ns_i_p,
-                prior_zones,
-                ps_index_map,
+                overlap,
                 replacements,
-                successors,
             )
 
             # Update statistics.
@@ -140,8 +143,9 @@ def _update_zones(grid, prior_zones, new_zones, record):
                 capture_ct += len(captured_zones)
 
                 for z in captured_zones:
-                    captured_mask = np.all([~p_mask_copy, z.mask], 0)
-                    area = grid.cell_area_at_node[captured_mask.flatten()].sum()
+                    # The nodes of the captured zone outside of the prior zone.
+                    nodes = z._nodes[ps_index_map[z._nodes] != i_p]
+                    area = grid.cell_area_at_node[nodes].sum()
                     area_captured.append(area)
 
             elif conn_type in [Connection.ONE_TO_MANY, Connection.MANY_TO_MANY]:
@@ -155,11 +159,11 @@ def _update_zones(grid, prior_zones, new_zones, record):
             successors.extend(p_successors)
 
         for key, value in replacements.items():
-            key._mask = value.mask
+            key._nodes = value._nodes
 
         # Get unique list of successors, preserving order.
 
-        successors = Series(successors).drop_duplicates().tolist()
+        successors = list(dict.fromkeys(successors))
 
     # Update the record.
 
@@ -178,20 +182,62 @@ def _update_zones(grid, prior_zones, new_zones, record):
 
 
 def _create_index_map(grid, zones):
-    i = np.where([z.mask for z in zones])
+    """Get the label array of zones.
+
+    Elements of the returned array are the index of the zone, in `zones`, at
+    each grid node or -1 where no zone exists.
+    """
+    index_map = np.full(grid.number_of_nodes, -1, dtype=int)
 
-    index_map = np.zeros(grid.number_of_nodes, dtype=int)
-    index_map[:] = -1
-    index_map[i[1]] = i[0]
+    for i, zone in enumerate(zones):
+        index_map[zone._nodes] = i
 
     return index_map
 
 
-def _intersecting_zones(condition, zone_index_map, zone_list):
-    mask = np.all([condition, zone_index_map > -1], 0)
-    indices = np.unique(zone_index_map[np.argwhere(mask)])
-    zones = [zone_list[i] for i in indices]
-    return zones
+def _intersections(ps_index_map, ns_index_map, prior_zones, new_zones):
+    """Get the intersections of prior and new zones.
+
+    Parameters
+    ----------
+    ps_index_map, ns_index_map : ndarray of int
+        The label arrays of the prior and new zones.
+    prior_zones, new_zones : Zone list
+        The zones of the prior and current time steps.
+
+    Returns
+    -------
+    ns_at_p : list of Zone lists
+        The new zones that intersect each prior zone.
+    ps_at_n : dict
+        The indices of the prior zones that intersect each new zone, keyed by
+        new zone.
+    overlap : dict
+        The count of nodes shared by a prior and a new zone keyed by the zone
+        pair in both orders. Zones that do not intersect are not included.
+    """
+    n_new = len(new_zones)
+
+    # Count the nodes of each (prior, new) label pair, which is the sparse
+    # contingency table of the two label arrays.
+    in_both = (ps_index_map > -1) & (ns_index_map > -1)
+    pairs, counts = np.unique(
+        ps_index_map[in_both] * n_new + ns_index_map[in_both], return_counts=True
+    )
+
+    ns_at_p = [[] for _ in prior_zones]
+    ps_at_n = {n: [] for n in new_zones}
+    overlap = {}
+
+    for pair, count in zip(pairs.tolist(), counts.tolist()):
+        i_p, i_n = divmod(pair, n_new)
+        p = prior_zones[i_p]
+        n = new_zones[i_n]
+        ns_at_p[i_p].append(n)
+        ps_at_n[n].append(i_p)
+        overlap[p, n] = overlap[n, p] = count
+
+    return ns_at_p, ps_at_n, overlap
 
 
 def _determine_connection_type(prior_zone_count, new_zone_count):
@@ -215,16 +261,7 @@ def _determine_connection_type(prior_zone_count, new_zone_count):
             return Connection.MANY_TO_MANY
 
 
-def _get_successors(
-    p,
-    conn_type,
-    ps_i_ns,
-    ns_i_p,
-    prior_zones,
-    ps_index_map,
-    replacements,
-    all_successors,
-):
+def _get_successors(p, conn_type, ps_i_ns, ns_i_p, overlap, replacements):
     if conn_type == Connection.ONE_TO_NONE:
         successors = []
 
@@ -239,13 +276,15 @@ def _get_successors(
         # Set the successors to the new zones that overlap p.
         # Although, replace the dominant n with p.
 
-        dn = p._get_largest_intersection(ns_i_p, exclusions=list(replacements.values()))
+        dn = _get_largest_intersection(
+            p, ns_i_p, overlap, exclusions=list(replacements.values())
+        )
 
         successors = []
 
         for i, n in enumerate(ns_i_p):
-            dp = n._get_largest_intersection(
-                ps_i_ns, exclusions=list(replacements.keys())
+            dp = _get_largest_intersection(
+                n, ps_i_ns, overlap, exclusions=list(replacements.keys())
             )
 
             if n == dn and n in replacements.values():
@@ -264,7 +303,7 @@ def _get_successors(
     elif conn_type == Connection.MANY_TO_ONE:
         # Set the successor to the prior zone that intersects n the most.
         n = ns_i_p[0]
-        dp = n._get_largest_intersection(ps_i_ns)
+        dp = _get_largest_intersection(n, ps_i_ns, overlap)
 
         if p == dp and n in replacements.values():
             successors = [_get_replacement(replacements, n)]
@@ -280,6 +319,24 @@ def _get_successors(
     return successors
 
 
+def _get_largest_intersection(zone, zones, overlap, exclusions=[]):
+    """Get the zone of `zones` that shares the most nodes with `zone`.
+
+    `zone` is returned when all of `zones` are in `exclusions`.
+    """
+    node_intersection_count = []
+    for z in zones:
+        if z in exclusions:
+            node_intersection_count.append(-1)
+        else:
+            node_intersection_count.append(overlap.get((zone, z), 0))
+
+    if all(x == -1 for x in node_intersection_count):
+        return zone
+
+    return zones[np.argmax(node_intersection_count)]
+
+
 def _get_replacement(replacements, new_zone):
     for key, value in replacements.items():
         if value == new_zone:
@@ -293,26 +350,41 @@ class Zone(object):
     class is not intended to be managed directly.
     """
 
-    def __init__(self, controller, mask):
+    def __init__(self, controller, nodes):
         """Initialize a zone.
 
         Parameters
         ----------
         controller : ZoneController
             A SpeciesEvolver ZoneController.
-        mask : ndarray
-            The mask of the zone. True elements of this array correspond to the
-            grid nodes of the zone.
+        nodes : ndarray
+            The grid nodes of the zone. A boolean array where True elements
+            correspond to the nodes of the zone is also accepted.
         """
+        nodes = np.asarray(nodes)
+        if nodes.dtype == bool:
+            nodes = np.flatnonzero(nodes)
+
         self._controller = controller
-        self._mask = mask.flatten()
+        self._nodes = np.sort(nodes.reshape(-1))
         self._conn_type = None
         self._successors = []
 
     @property
     def mask(self):
-        """The mask of the zone."""
-        return self._mask
+        """The mask of the zone.
+
+        The mask is an array with a length of grid number of nodes that is
+        True at the nodes of the zone.
+        """
+        mask = np.zeros(self._controller._grid.number_of_nodes, dtype=bool)
+        mask[self._nodes] = True
+        return mask
+
+    @property
+    def nodes(self):
+        """The grid nodes of the zone."""
+        return self._nodes
 
     @property
     def successors(self):
@@ -322,19 +394,5 @@ class Zone(object):
     @property
     def area(self):
         """Zone area calculated as the sum of cell area at grid nodes."""
-        area = self._controller._grid.cell_area_at_node[self._mask].sum()
+        area = self._controller._grid.cell_area_at_node[self._nodes].sum()
         return area
-
-    def _get_largest_intersection(self, zones, exclusions=[]):
-        node_intersection_count = []
-        for z in zones:
-            if z in exclusions:
-                node_intersection_count.append(-1)
-            else:
-                n = len(np.where(np.all([z.mask, self.mask], 0))[0])
-                node_intersection_count.append(n)
-
-        if all(x == -1 for x in node_intersection_count):
-            return self
-
-        return zones[np.argmax(node_intersection_count)]
@@ -412,15 +412,22 @@ class ZoneController(object):
 
         cluster_arr, cluster_ct = label(mask.reshape(self._grid.shape), structure=s)
 
+        # Group the nodes of each cluster using the label array rather than
+        # comparing the array with each label.
+
+        labels = cluster_arr.reshape(-1)
+        nodes = np.argsort(labels, kind="stable")
+        ends = np.cumsum(np.bincount(labels, minlength=cluster_ct + 1))
+
         # Create zones for clusters.
 
         zones = []
 
         for i in range(1, cluster_ct + 1):
-            mask = (cluster_arr == i).flatten()
-            cluster_area = self._grid.cell_area_at_node[mask].sum()
+            cluster_nodes = nodes[ends[i - 1] : ends[i]]
+            cluster_area = self._grid.cell_area_at_node[cluster_nodes].sum()
 
             if cluster_area >= self._min_area:
-                zones.append(Zone(self, mask))
+                zones.append(Zone(self, cluster_nodes))
 
         return zones
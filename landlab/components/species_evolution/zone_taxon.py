@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 """ZoneTaxon object of SpeciesEvolver."""
 import numpy as np
-from pandas import Series
 
 from .base_taxon import Taxon
 
@@ -125,10 +124,16 @@ class ZoneTaxon(Taxon):
 
         The mask is an array with a length of grid number of nodes. The taxon
         exists at nodes where mask elements are ``True``. The mask of a
-        ZoneTaxon object is the union of all of its zone masks.
+        ZoneTaxon object is the union of all of its zone masks. The mask is
+        False when the taxon has no zones.
         """
-        masks = [zone.mask for zone in self.zones]
-        mask = np.any(masks, 0)
+        if len(self.zones) == 0:
+            return np.False_
+
+        mask = self.zones[0].mask
+
+        for zone in self.zones[1:]:
+            mask[zone.nodes] = True
 
         return mask
 
@@ -207,7 +212,7 @@ class ZoneTaxon(Taxon):
         for zone in self._zones:
             successors.extend(zone.successors)
 
-        self._zones = Series(successors).drop_duplicates().tolist()
+        self._zones = list(dict.fromkeys(successors))
 
     def _update_allopatry_state(self, dt=None):
         """Update taxon time in allopatry.
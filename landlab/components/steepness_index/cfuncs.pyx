@@ -0,0 +1,77 @@
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+
+DTYPE_INT = np.int
+ctypedef np.int_t DTYPE_INT_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _find_channel_segments(np.ndarray[DTYPE_INT_t, ndim=1] valid_dstr_order,
+                           np.ndarray[DTYPE_INT_t, ndim=1] receivers,
+                           np.ndarray[np.uint8_t, ndim=1] nodes_incorporated,
+                           np.ndarray[DTYPE_INT_t, ndim=1] segment_nodes,
+                           np.ndarray[DTYPE_INT_t, ndim=1] segment_offsets):
+    """Split a channel network into unique reaches.
+
+    Starting from each channel head in turn (in the order given by
+    *valid_dstr_order*), follow receivers downstream until reaching either
+    the end of the flow path or a node already incorporated in a reach. The
+    node where a reach joins an existing one is included as the final node
+    of the reach.
+
+    Parameters
+    ----------
+    valid_dstr_order : array of ints
+        Channel nodes, ordered from upstream to downstream.
+    receivers : array of ints
+        Flow receiver of each node.
+    nodes_incorporated : array of uint8
+        Flag for each node; nonzero if the node has already been assigned
+        to a reach. Updated in place.
+    segment_nodes : array of ints
+        Output array for the nodes of all reaches, stored one reach after
+        another, each from top to bottom. Must be at least as long as the
+        number of nodes plus the length of *valid_dstr_order*.
+    segment_offsets : array of ints
+        Output array of offsets into *segment_nodes* to the start of each
+        reach. Must be at least one longer than *valid_dstr_order*.
+
+    Returns
+    -------
+    int
+        The number of reaches.
+    """
+    cdef DTYPE_INT_t n_heads = valid_dstr_order.shape[0]
+    cdef DTYPE_INT_t n_segments = 0
+    cdef DTYPE_INT_t count = 0
+    cdef DTYPE_INT_t i
+    cdef DTYPE_INT_t node
+    cdef DTYPE_INT_t next_node
+
+    with nogil:
+        segment_offsets[0] = 0
+        for i in range(n_heads):
+            node = valid_dstr_order[i]
+            if nodes_incorporated[node]:
+                continue
+            nodes_incorporated[node] = 1
+            segment_nodes[count] = node
+            count += 1
+            while True:
+                next_node = receivers[node]
+                if next_node == node:  # end of flow path
+                    break
+                segment_nodes[count] = next_node
+                count += 1
+                if nodes_incorporated[next_node]:
+                    break
+                nodes_incorporated[next_node] = 1
+                node = next_node
+            n_segments += 1
+            segment_offsets[n_segments] = count
+
+    return n_segments
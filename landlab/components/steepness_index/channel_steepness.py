@@ -9,6 +9,8 @@ import numpy as np
 
 from landlab import Component
 
+from .cfuncs import _find_channel_segments
+
 
 class SteepnessFinder(Component):
     """This component calculates steepness indices, sensu Wobus et al. 2006,
@@ -222,75 +224,143 @@ class SteepnessFinder(Component):
         )[::-1]
         # note elevs are guaranteed to be in order, UNLESS a fill
         # algorithm has been used.
-        nodes_incorporated = self._grid.zeros("node", dtype=bool)
-        # now do each poss channel in turn
-        # get the head of the first (longest!) channel:
-        for dstr_order_index in range(valid_dstr_order.size):
-            this_ch_top_node = valid_dstr_order[dstr_order_index]  # top node
-            if not nodes_incorporated[this_ch_top_node]:
-                nodes_incorporated[this_ch_top_node] = True
-                nodes_in_channel = [this_ch_top_node]
-                penultimate_node = this_ch_top_node
-                current_node_incorporated = False
-                while not current_node_incorporated:
-                    next_node = self._grid.at_node["flow__receiver_node"][
-                        penultimate_node
-                    ]
-                    if next_node == penultimate_node:  # end of flow path
-                        break
-                    nodes_in_channel.append(next_node)
-                    current_node_incorporated = nodes_incorporated[next_node]
-                    # ^ this is a COPY op, so we're free to update the array
-                    nodes_incorporated[next_node] = True
-                    penultimate_node = next_node
-                # by here, we have a full, unique reach in nodes_in_channel
-                # it incorporates a single, duplicate node at the lower end
-                # Now, if this segment long enough?
-                if elev_step:
-                    top_elev = self._elev[nodes_in_channel[0]]
-                    base_elev = self._elev[nodes_in_channel[-1]]
-                    # work up the channel from the base to make new interp pts
-                    interp_pt_elevs = np.arange(base_elev, top_elev, elev_step)
-                    if interp_pt_elevs.size <= 1:
-                        # <1 step; bail on this whole segment
-                        break
-                    # now we can fairly closely follow the Geomorphtools
-                    # algorithm:
-                    ch_nodes = np.array(nodes_in_channel)
-                    # ^ this is top-to-bottom
-                    ch_A = self._grid.at_node["drainage_area"][ch_nodes]
-                    ch_dists = self.channel_distances_downstream(ch_nodes)
-                    ch_S = self.interpolate_slopes_with_step(
-                        ch_nodes, ch_dists, interp_pt_elevs
-                    )
-                else:
-                    # all the nodes; much easier as links work
-                    ch_nodes = np.array(nodes_in_channel)
-                    ch_dists = self.channel_distances_downstream(ch_nodes)
-                    ch_A = self._grid.at_node["drainage_area"][ch_nodes]
-                    ch_S = self._grid.at_node["topographic__steepest_slope"][ch_nodes]
-                    assert np.all(ch_S >= 0.0)
-                # if we're doing spatial discretization, do it here:
-                if discretization_length:
-                    ch_ksn = self.calc_ksn_discretized(
-                        ch_dists, ch_A, ch_S, reftheta, discretization_length
-                    )
-                else:  # not discretized
-                    # also chopping off the final node, as above
-                    log_A = np.log10(ch_A[:-1])
-                    log_S = np.log10(ch_S[:-1])
-                    # we're potentially propagating nans here if S<=0
-                    log_ksn = log_S + reftheta * log_A
-                    ch_ksn = 10.0 ** log_ksn
-                # save the answers into the main arrays:
-                assert np.all(self._mask[ch_nodes[:-1]])
-                # Final node gets trimmed off...
-                self._ksn[ch_nodes[:-1]] = ch_ksn
-                self._mask[ch_nodes] = False
+        # now do each poss channel in turn, starting with the head of the
+        # first (longest!) channel. Each reach incorporates a single,
+        # duplicate node at the lower end.
+        seg_nodes, seg_offsets = self.channel_segments(valid_dstr_order)
+
+        if not elev_step and not discretization_length:
+            # all the nodes; much easier as links work, and every reach can be
+            # handled at once
+            self._calc_ksn_all_segments(seg_nodes, seg_offsets, reftheta)
+            seg_offsets = seg_offsets[:1]
+
+        for seg_start, seg_end in zip(seg_offsets[:-1], seg_offsets[1:]):
+            ch_nodes = seg_nodes[seg_start:seg_end]
+            # ^ this is top-to-bottom
+            # Now, if this segment long enough?
+            if elev_step:
+                top_elev = self._elev[ch_nodes[0]]
+                base_elev = self._elev[ch_nodes[-1]]
+                # work up the channel from the base to make new interp pts
+                interp_pt_elevs = np.arange(base_elev, top_elev, elev_step)
+                if interp_pt_elevs.size <= 1:
+                    # <1 step; bail on this whole segment
+                    break
+                # now we can fairly closely follow the Geomorphtools
+                # algorithm:
+                ch_A = self._grid.at_node["drainage_area"][ch_nodes]
+                ch_dists = self.channel_distances_downstream(ch_nodes)
+                ch_S = self.interpolate_slopes_with_step(
+                    ch_nodes, ch_dists, interp_pt_elevs
+                )
+            else:
+                ch_dists = self.channel_distances_downstream(ch_nodes)
+                ch_A = self._grid.at_node["drainage_area"][ch_nodes]
+                ch_S = self._grid.at_node["topographic__steepest_slope"][ch_nodes]
+                assert np.all(ch_S >= 0.0)
+            # if we're doing spatial discretization, do it here:
+            if discretization_length:
+                ch_ksn = self.calc_ksn_discretized(
+                    ch_dists, ch_A, ch_S, reftheta, discretization_length
+                )
+            else:  # not discretized
+                # also chopping off the final node, as above
+                log_A = np.log10(ch_A[:-1])
+                log_S = np.log10(ch_S[:-1])
+                # we're potentially propagating nans here if S<=0
+                log_ksn = log_S + reftheta * log_A
+                ch_ksn = 10.0 ** log_ksn
+            # save the answers into the main arrays:
+            assert np.all(self._mask[ch_nodes[:-1]])
+            # Final node gets trimmed off...
+            self._ksn[ch_nodes[:-1]] = ch_ksn
+            self._mask[ch_nodes] = False
         # now a final sweep to remove any undefined ksn values:
         self._mask[self._ksn == -1.0] = True
         self._ksn[self._ksn == -1.0] = 0.0
 
+    def channel_segments(self, valid_dstr_order):
+        """Split the channel network into unique reaches.
+
+        Each reach starts at a channel head and follows the flow downstream
+        until it reaches either the end of the flow path or a node belonging
+        to a reach already found. In the latter case, the reach includes the
+        node at the junction as its final node. Channel heads are taken in
+        the order given, so the first reach is the longest one.
+
+        Parameters
+        ----------
+        valid_dstr_order : array of ints
+            Channel nodes, ordered from upstream to downstream.
+
+        Returns
+        -------
+        (segment_nodes, segment_offsets) : (array of ints, array of ints)
+            The nodes of every reach, stored one reach after another from top
+            to bottom, and the offsets into *segment_nodes* of the start of
+            each reach (plus the end of the last reach).
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import FlowAccumulator
+        >>> mg = RasterModelGrid((5, 5))
+        >>> for nodes in (mg.nodes_at_right_edge, mg.nodes_at_bottom_edge,
+        ...               mg.nodes_at_top_edge):
+        ...     mg.status_at_node[nodes] = mg.BC_NODE_IS_CLOSED
+        >>> _ = mg.add_field("topographic__elevation",
+        ...                  mg.node_x + np.abs(mg.node_y - 2.), at="node")
+        >>> fr = FlowAccumulator(mg, flow_director='D8')
+        >>> sf = SteepnessFinder(mg)
+        >>> _ = fr.run_one_step()
+        >>> dstr_order = mg.at_node['flow__upstream_node_order'][::-1]
+        >>> ch_nodes = dstr_order[mg.at_node['drainage_area'][dstr_order] >= 1.]
+        >>> nodes, offsets = sf.channel_segments(ch_nodes)
+        >>> [list(nodes[start:end]) for start, end in zip(offsets[:-1], offsets[1:])]
+        [[16, 10], [17, 11, 10], [18, 12, 11], [13, 12], [8, 12], [7, 11], [6, 10]]
+        """
+        valid_dstr_order = np.asarray(valid_dstr_order, dtype=int)
+        nodes_incorporated = np.zeros(self._grid.number_of_nodes, dtype=np.uint8)
+        segment_nodes = np.empty(
+            self._grid.number_of_nodes + valid_dstr_order.size, dtype=int
+        )
+        segment_offsets = np.empty(valid_dstr_order.size + 1, dtype=int)
+
+        n_segments = _find_channel_segments(
+            valid_dstr_order,
+            np.asarray(self._grid.at_node["flow__receiver_node"], dtype=int),
+            nodes_incorporated,
+            segment_nodes,
+            segment_offsets,
+        )
+        segment_offsets = segment_offsets[: n_segments + 1]
+
+        return segment_nodes[: segment_offsets[-1]], segment_offsets
+
+    def _calc_ksn_all_segments(self, seg_nodes, seg_offsets, reftheta):
+        """Calculate undiscretized steepness indices for all reaches at once.
+
+        Each node gets a steepness index from its own slope and drainage
+        area, except for the final node of each reach.
+        """
+        is_last = np.zeros(seg_nodes.size, dtype=bool)
+        is_last[seg_offsets[1:] - 1] = True
+        ch_nodes = seg_nodes[~is_last]
+
+        ch_A = self._grid.at_node["drainage_area"][ch_nodes]
+        ch_S = self._grid.at_node["topographic__steepest_slope"][seg_nodes]
+        assert np.all(ch_S >= 0.0)
+        ch_S = ch_S[~is_last]
+
+        log_A = np.log10(ch_A)
+        log_S = np.log10(ch_S)
+        # we're potentially propagating nans here if S<=0
+        log_ksn = log_S + reftheta * log_A
+        self._ksn[ch_nodes] = 10.0 ** log_ksn
+        self._mask[seg_nodes] = False
+
     def channel_distances_downstream(self, ch_nodes):
         """Calculates distances downstream from top node of a defined flowpath.
 
@@ -6,6 +6,15 @@ import scipy.constants
 from landlab import Component, MissingKeyError
 from landlab.utils.decorators import make_return_array_immutable
 
+from .cfuncs import sed_flux_dep_incision
+
+_SED_DEPENDENCY_TYPES = {
+    "generalized_humped": 0,
+    "linear_decline": 1,
+    "almost_parabolic": 2,
+    "None": 3,
+}
+
 
 class SedDepEroder(Component):
     """
@@ -559,6 +568,13 @@ class SedDepEroder(Component):
         self._cell_areas.fill(np.mean(grid.area_of_cell))
         self._cell_areas[grid.node_at_cell] = grid.area_of_cell
 
+        # per-node buffers for routing sediment down the flow stack
+        self._dz = np.empty(grid.number_of_nodes, dtype=float)
+        self._sed_into_node = np.empty(grid.number_of_nodes, dtype=float)
+        self._rel_sed_flux = np.empty(grid.number_of_nodes, dtype=float)
+        self._no_flooding = np.zeros(grid.number_of_nodes, dtype=float)
+        self._not_flooded = np.zeros(grid.number_of_nodes, dtype=np.uint8)
+
         # set up the necessary fields:
         self.initialize_output_fields()
         if self._return_ch_props:
@@ -681,6 +697,67 @@ class SedDepEroder(Component):
         sed_flux_out = rel_sed_flux * trans_cap_vol_out
         return dz, sed_flux_out, rel_sed_flux, error_in_sed_flux_fn
 
+    def _route_sediment(
+        self,
+        s_in,
+        flow_receiver,
+        node_vol_capacities,
+        dz_prefactor,
+        flooded_depths,
+        flooded_nodes,
+    ):
+        """Erode and deposit while working downstream through the stack.
+
+        Parameters
+        ----------
+        s_in : ndarray of int
+            Nodes ordered upstream.
+        flow_receiver : ndarray of int
+            Receiver of each node.
+        node_vol_capacities : ndarray of float
+            Volume of sediment each node can transport over the time step.
+        dz_prefactor : ndarray of float
+            Incision at each node over the time step, without the sediment
+            flux function.
+        flooded_depths : ndarray of float
+            Flooded depths, updated as nodes fill with sediment.
+        flooded_nodes : ndarray of bool or None
+            Nodes, flooded at the start of the step, that remain flooded
+            even once filled.
+
+        Returns
+        -------
+        tuple of ndarray
+            The erosion (positive down) at each node, the volume of sediment
+            into each node and the relative sediment flux at each node.
+        """
+        if flooded_nodes is None:
+            was_flooded = self._not_flooded
+        else:
+            was_flooded = np.asarray(flooded_nodes, dtype=np.uint8)
+
+        self._dz.fill(0.0)
+        self._sed_into_node.fill(0.0)
+        sed_flux_dep_incision(
+            np.asarray(s_in, dtype=int),
+            np.asarray(flow_receiver, dtype=int),
+            self._cell_areas,
+            np.asarray(node_vol_capacities, dtype=float),
+            np.asarray(dz_prefactor, dtype=float),
+            flooded_depths,
+            was_flooded,
+            _SED_DEPENDENCY_TYPES[self._type],
+            getattr(self, "_kappa", 0.0),
+            getattr(self, "_nu", 0.0),
+            getattr(self, "_phi", 0.0),
+            getattr(self, "_c", 0.0),
+            self._pseudoimplicit_repeats,
+            self._dz,
+            self._sed_into_node,
+            self._rel_sed_flux,
+        )
+        return self._dz, self._sed_into_node, self._rel_sed_flux
+
     def run_one_step(self, dt):
         """Run the component across one timestep increment, dt.
 
@@ -707,10 +784,11 @@ class SedDepEroder(Component):
             flooded_nodes = flooded_depths > 0.0
         elif isinstance(self._flooded_depths, np.ndarray):
             assert self._flooded_depths.size == self._grid.number_of_nodes
-            flooded_nodes = self._flooded_depths > 0.0
+            flooded_depths = self._flooded_depths
+            flooded_nodes = flooded_depths > 0.0
             # need an *updateable* record of the pit depths
         else:
-            # if None, handle in loop
+            flooded_depths = self._no_flooding
             flooded_nodes = None
         steepest_link = "flow__link_to_receiver_node"
         link_length = np.empty(grid.number_of_nodes, dtype=float)
@@ -785,7 +863,6 @@ class SedDepEroder(Component):
             break_flag = False
             dt_secs = dt * 31557600.0
             counter = 0
-            rel_sed_flux = np.empty_like(node_Q)
             # excess_vol_overhead = 0.
 
             while 1:
@@ -816,107 +893,25 @@ class SedDepEroder(Component):
                 # ^timestep adjustment is made AFTER the dz calc
                 node_vol_capacities = transport_capacities * dt_this_step
 
-                sed_into_node = np.zeros(grid.number_of_nodes, dtype=float)
-                dz = np.zeros(grid.number_of_nodes, dtype=float)
-                cell_areas = self._cell_areas
                 try:
-                    raise NameError
-                    # ^tripped out deliberately for now; doesn't appear to
-                    # accelerate much
-                    weave.inline(
-                        self._routing_code,
-                        [
-                            "len_s_in",
-                            "sed_into_node",
-                            "transport_capacities",
-                            "dz",
-                            "cell_areas",
-                            "dt_this_step",
-                            "flow__receiver_node",
-                        ],
-                    )
-                except NameError:
-                    for i in s_in[::-1]:  # work downstream
-                        cell_area = cell_areas[i]
-                        if flooded_nodes is not None:
-                            flood_depth = flooded_depths[i]
-                        else:
-                            flood_depth = 0.0
-                        sed_flux_into_this_node = sed_into_node[i]
-                        node_capacity = transport_capacities[i]
-                        # ^we work in volume flux, not volume per se here
-                        node_vol_capacity = node_vol_capacities[i]
-                        if flood_depth > 0.0:
-                            node_vol_capacity = 0.0
-                            # requires special case handling - as much sed as
-                            # possible is dumped here, then the remainder
-                            # passed on
-                        if sed_flux_into_this_node < node_vol_capacity:
-                            # ^note incision is forbidden at capacity
-                            # flooded nodes never enter this branch
-                            # #implementing the pseudoimplicit method:
-                            try:
-                                thresh = variable_thresh
-                            except NameError:  # it doesn't exist
-                                thresh = self._thresh
-                            dz_prefactor = (
-                                self._K_unit_time
-                                * dt_this_step
-                                * (shear_tothe_a[i] - thresh).clip(0.0)
-                            )
-                            vol_prefactor = dz_prefactor * cell_area
-                            (
-                                dz_here,
-                                sed_flux_out,
-                                rel_sed_flux_here,
-                                error_in_sed_flux,
-                            ) = self.get_sed_flux_function_pseudoimplicit(
-                                sed_flux_into_this_node,
-                                node_vol_capacity,
-                                vol_prefactor,
-                                dz_prefactor,
-                            )
-                            # note now dz_here may never create more sed than
-                            # the out can transport...
-                            assert sed_flux_out <= node_vol_capacity, (
-                                "failed at node "
-                                + str(s_in.size - i)
-                                + " with rel sed flux "
-                                + str(sed_flux_out / node_capacity)
-                            )
-                            rel_sed_flux[i] = rel_sed_flux_here
-                            vol_pass = sed_flux_out
-                        else:
-                            rel_sed_flux[i] = 1.0
-                            vol_dropped = sed_flux_into_this_node - node_vol_capacity
-                            dz_here = -vol_dropped / cell_area
-                            # with the pits, we aim to inhibit incision, but
-                            # depo is OK. We have already zero'd any adverse
-                            # grads, so sed can make it to the bottom of the
-                            # pit but no further in a single step, which seems
-                            # raeasonable. Pit should fill.
-                            if flood_depth <= 0.0:
-                                vol_pass = node_vol_capacity
-                            else:
-                                height_excess = -dz_here - flood_depth
-                                # ...above water level
-                                if height_excess <= 0.0:
-                                    vol_pass = 0.0
-                                    # dz_here is already correct
-                                    flooded_depths[i] += dz_here
-                                else:
-                                    dz_here = -flood_depth
-                                    vol_pass = height_excess * cell_area
-                                    # ^bit cheeky?
-                                    flooded_depths[i] = 0.0
-                                    # note we must update flooded depths
-                                    # transiently to conserve mass
-                            # do we need to retain a small downhill slope?
-                            # ...don't think so. Will resolve itself on next
-                            # timestep.
-
-                        dz[i] -= dz_here
-                        sed_into_node[flow_receiver[i]] += vol_pass
+                    thresh = variable_thresh
+                except NameError:  # it doesn't exist
+                    thresh = self._thresh
+                dz_prefactor = (
+                    self._K_unit_time
+                    * dt_this_step
+                    * (shear_tothe_a - thresh).clip(0.0)
+                )
+                # flooded nodes that have already been filled behave as dry
+                # nodes
+                dz, sed_into_node, rel_sed_flux = self._route_sediment(
+                    s_in,
+                    flow_receiver,
+                    node_vol_capacities,
+                    dz_prefactor,
+                    flooded_depths,
+                    None,
+                )
 
                 break_flag = True
 
@@ -942,7 +937,6 @@ class SedDepEroder(Component):
             break_flag = False
             dt_secs = dt * 31557600.0
             counter = 0
-            rel_sed_flux = np.empty_like(node_A)
             while 1:
                 counter += 1
                 # print counter
@@ -962,73 +956,15 @@ class SedDepEroder(Component):
                 # ^timestep adjustment is made AFTER the dz calc
                 node_vol_capacities = transport_capacities * dt_this_step
 
-                sed_into_node = np.zeros(grid.number_of_nodes, dtype=float)
-                dz = np.zeros(grid.number_of_nodes, dtype=float)
-                cell_areas = self._cell_areas
-                for i in s_in[::-1]:  # work downstream
-                    cell_area = cell_areas[i]
-                    if flooded_nodes is not None:
-                        flood_depth = flooded_depths[i]
-                    else:
-                        flood_depth = 0.0
-                    sed_flux_into_this_node = sed_into_node[i]
-                    node_capacity = transport_capacities[i]
-                    # ^we work in volume flux, not volume per se here
-                    node_vol_capacity = node_vol_capacities[i]
-                    if flood_depth > 0.0:
-                        node_vol_capacity = 0.0
-                    if sed_flux_into_this_node < node_vol_capacity:
-                        # ^note incision is forbidden at capacity
-                        dz_prefactor = dt_this_step * erosion_prefactor_withS[i]
-                        vol_prefactor = dz_prefactor * cell_area
-                        (
-                            dz_here,
-                            sed_flux_out,
-                            rel_sed_flux_here,
-                            error_in_sed_flux,
-                        ) = self.get_sed_flux_function_pseudoimplicit(
-                            sed_flux_into_this_node,
-                            node_vol_capacity,
-                            vol_prefactor,
-                            dz_prefactor,
-                        )
-                        # note now dz_here may never create more sed than the
-                        # out can transport...
-                        assert sed_flux_out <= node_vol_capacity, (
-                            "failed at node "
-                            + str(s_in.size - i)
-                            + " with rel sed flux "
-                            + str(sed_flux_out / node_capacity)
-                        )
-                        rel_sed_flux[i] = rel_sed_flux_here
-                        vol_pass = sed_flux_out
-                    else:
-                        rel_sed_flux[i] = 1.0
-                        vol_dropped = sed_flux_into_this_node - node_vol_capacity
-                        dz_here = -vol_dropped / cell_area
-                        try:
-                            isflooded = flooded_nodes[i]
-                        except TypeError:  # was None
-                            isflooded = False
-                        if flood_depth <= 0.0 and not isflooded:
-                            vol_pass = node_vol_capacity
-                            # we want flooded nodes which have already been
-                            # filled to enter the else statement
-                        else:
-                            height_excess = -dz_here - flood_depth
-                            # ...above water level
-                            if height_excess <= 0.0:
-                                vol_pass = 0.0
-                                # dz_here is already correct
-                                flooded_depths[i] += dz_here
-                            else:
-                                dz_here = -flood_depth
-                                vol_pass = height_excess * cell_area
-                                # ^bit cheeky?
-                                flooded_depths[i] = 0.0
-
-                    dz[i] -= dz_here
-                    sed_into_node[flow_receiver[i]] += vol_pass
+                dz_prefactor = dt_this_step * erosion_prefactor_withS
+                dz, sed_into_node, rel_sed_flux = self._route_sediment(
+                    s_in,
+                    flow_receiver,
+                    node_vol_capacities,
+                    dz_prefactor,
+                    flooded_depths,
+                    flooded_nodes,
+                )
                 break_flag = True
 
                 node_z[grid.core_nodes] += dz[grid.core_nodes]
@@ -59,6 +59,8 @@ class Component:
     _name = None
     _cite_as = ""
     _unit_agnostic = None
+    # True if run_one_step divides any dt into stable substeps itself.
+    _substeps_internally = False
 
     def __new__(cls, *args, **kwds):
         registry.add(cls)
@@ -138,6 +140,86 @@ class Component:
             params = load_params(path)
         return cls(grid, **params)
 
+    def save_checkpoint(self, path, components=(), name="checkpoint", prune=True):
+        """Save the component, and its grid, to a checkpoint.
+
+        The component is saved as the first of the checkpoint's
+        components, followed by *components*. Use
+        :func:`~landlab.io.native_landlab.load_checkpoint` to resume a
+        run from the checkpoint.
+
+        Parameters
+        ----------
+        path : str
+            Directory in which to save checkpoints.
+        components : iterable, optional
+            Other components, and picklable objects, to save.
+        name : str, optional
+            Name of the checkpoint.
+        prune : bool, optional
+            If True, remove array files no longer used by any checkpoint
+            in *path*.
+
+        Returns
+        -------
+        int
+            The number of array files that were written.
+
+        See Also
+        --------
+        ~landlab.io.native_landlab.save_checkpoint
+        """
+        from ..io.native_landlab import save_checkpoint
+
+        return save_checkpoint(
+            path,
+            self.grid,
+            components=[self] + list(components),
+            name=name,
+            prune=prune,
+        )
+
+    @staticmethod
+    def profile(memory=False, grid_operators=True):
+        """Profile the methods of components and grids.
+
+        Parameters
+        ----------
+        memory : bool, optional
+            If True, also record the peak memory allocated by each method.
+        grid_operators : bool, optional
+            If True, also profile the ``calc_*`` and ``map_*`` methods of
+            grids.
+
+        Returns
+        -------
+        Profiler
+            A profiler to use as a context manager or to start and stop.
+
+        Examples
+        --------
+        >>> from landlab import Component, RasterModelGrid
+        >>> from landlab.components import FlowAccumulator
+
+        >>> grid = RasterModelGrid((4, 5))
+        >>> _ = grid.add_ones("topographic__elevation", at="node")
+        >>> accumulator = FlowAccumulator(grid)
+
+        >>> with Component.profile() as profiler:
+        ...     accumulator.run_one_step()
+        >>> profiler.stats["FlowAccumulator.run_one_step"].calls
+        1
+        >>> profiler.stats["FlowAccumulator.accumulate_flow"].calls
+        1
+
+        See Also
+        --------
+        ~landlab.core.profiler.Profiler
+        """
+        from .profiler import Profiler
+
+        return Profiler(memory=memory, grid_operators=grid_operators)
+
     @classproperty
     @classmethod
     def cite_as(cls):
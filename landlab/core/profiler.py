@@ -0,0 +1,295 @@
+"""Measure where time, and memory, goes in a coupled model.
+
+A :class:`Profiler` records, for each component method (``run_one_step``,
+``accumulate_flow``, ``direct_flow``, and so on) and each grid operator
+(the ``calc_*`` and ``map_*`` methods of a grid), the number of calls, the
+wall time spent in them and, optionally, the peak number of bytes they
+allocated. Methods are only wrapped while a profiler is active so that,
+when profiling is not enabled, there is no overhead at all.
+
+Examples
+--------
+>>> from landlab import Component, RasterModelGrid
+>>> from landlab.components import LinearDiffuser
+
+>>> grid = RasterModelGrid((4, 5))
+>>> _ = grid.add_zeros("topographic__elevation", at="node")
+>>> diffuser = LinearDiffuser(grid, linear_diffusivity=0.1)
+
+>>> with Component.profile() as profiler:
+...     for _ in range(10):
+...         diffuser.run_one_step(1.0)
+>>> stats = profiler.stats["LinearDiffuser.run_one_step"]
+>>> stats.calls
+10
+>>> stats.kind
+'component'
+>>> profiler.stats["RasterModelGrid.calc_grad_at_link"].calls
+10
+"""
+
+import csv
+import functools
+import inspect
+import json
+import time
+import tracemalloc
+
+
+class ProfileStats:
+    """Timing and memory statistics of a single profiled method.
+
+    Attributes
+    ----------
+    name : str
+        Name of the method as ``<class name>.<method name>``, where the
+        class is that of the object the method was called on.
+    kind : {"component", "grid"}
+        Whether the method belongs to a component or a grid.
+    calls : int
+        Number of calls.
+    total_time : float
+        Total wall time, in seconds, spent in the method.
+    max_time : float
+        Wall time, in seconds, of the slowest call.
+    peak_bytes : int or None
+        Largest peak of memory allocated by a single call, or None if
+        memory was not traced.
+    """
+
+    fields = ("name", "kind", "calls", "total_time", "max_time", "peak_bytes")
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.peak_bytes = None
+
+    @property
+    def mean_time(self):
+        """Mean wall time, in seconds, of a call."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def as_dict(self):
+        """Statistics as a dictionary."""
+        return {name: getattr(self, name) for name in self.fields}
+
+
+class Profiler:
+    """Record time and memory used by component methods and grid operators.
+
+    Use :meth:`landlab.Component.profile` to create a profiler. A profiler
+    records statistics while it is active, that is, between calls to
+    :meth:`start` and :meth:`stop` or within a ``with`` block. Only one
+    profiler can be active at a time.
+
+    Components and grids are profiled by wrapping the methods of every
+    subclass of :class:`~landlab.Component` and
+    :class:`~landlab.grid.base.ModelGrid` that has been imported when the
+    profiler is started. Methods are restored when the profiler stops.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        If True, also record the peak memory allocated within each method.
+        This uses :mod:`tracemalloc`, which slows down allocations
+        considerably, and requires Python 3.9 or later.
+    grid_operators : bool, optional
+        If True, profile the ``calc_*`` and ``map_*`` methods of grids
+        along with component methods.
+    """
+
+    _active = None
+
+    def __init__(self, memory=False, grid_operators=True):
+        if memory and not hasattr(tracemalloc, "reset_peak"):
+            raise RuntimeError("memory profiling requires Python 3.9 or later")
+        self._memory = memory
+        self._grid_operators = grid_operators
+        self._stats = {}
+        self._originals = []
+        self._started_tracemalloc = False
+        self._running = set()
+        self._peak_stack = []
+
+    @property
+    def stats(self):
+        """Statistics of each profiled method, keyed by method name."""
+        return dict(self._stats)
+
+    def report(self, sort_by="total_time"):
+        """Statistics of each profiled method, as a list of dictionaries.
+
+        Parameters
+        ----------
+        sort_by : str, optional
+            Name of the statistic to sort by, in descending order.
+
+        Returns
+        -------
+        list of dict
+            Statistics, one dictionary per method, with keys
+            ``name``, ``kind``, ``calls``, ``total_time``, ``max_time``
+            and ``peak_bytes``.
+        """
+        return sorted(
+            (stats.as_dict() for stats in self._stats.values()),
+            key=lambda row: row[sort_by] or 0,
+            reverse=True,
+        )
+
+    def write(self, path, format=None):
+        """Write the profiling report to a file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the output file.
+        format : {"csv", "json"}, optional
+            Format of the file. If not given, it is taken from the
+            extension of *path* and defaults to csv.
+        """
+        if format is None:
+            format = "json" if str(path).endswith(".json") else "csv"
+
+        if format == "json":
+            with open(path, "w") as fp:
+                json.dump(self.report(), fp, indent=2)
+        elif format == "csv":
+            with open(path, "w", newline="") as fp:
+                writer = csv.DictWriter(fp, fieldnames=ProfileStats.fields)
+                writer.writeheader()
+                writer.writerows(self.report())
+        else:
+            raise ValueError("format not understood ({0})".format(format))
+
+    def __str__(self):
+        lines = [
+            "{0:<60s} {1:>8s} {2:>12s} {3:>12s} {4:>14s}".format(
+                "name", "calls", "total (s)", "mean (s)", "peak (bytes)"
+            )
+        ]
+        for row in self.report():
+            lines.append(
+                "{0:<60s} {1:>8d} {2:>12.6f} {3:>12.6f} {4:>14s}".format(
+                    row["name"],
+                    row["calls"],
+                    row["total_time"],
+                    row["total_time"] / row["calls"],
+                    "-" if row["peak_bytes"] is None else str(row["peak_bytes"]),
+                )
+            )
+        return "\n".join(lines)
+
+    def start(self):
+        """Start profiling."""
+        if Profiler._active is not None:
+            raise RuntimeError("a profiler is already active")
+        Profiler._active = self
+
+        from ..grid.base import ModelGrid
+        from .model_component import Component
+
+        for cls in _subclasses(Component):
+            self._wrap_methods(cls, "component", _is_component_method)
+        if self._grid_operators:
+            for cls in [ModelGrid] + _subclasses(ModelGrid):
+                self._wrap_methods(cls, "grid", _is_grid_operator)
+
+        if self._memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def stop(self):
+        """Stop profiling, restoring the original methods."""
+        for cls, name, method in reversed(self._originals):
+            setattr(cls, name, method)
+        self._originals = []
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        Profiler._active = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _wrap_methods(self, cls, kind, is_profiled):
+        for name, method in list(vars(cls).items()):
+            if is_profiled(name, method):
+                self._originals.append((cls, name, method))
+                setattr(cls, name, self._wrap(method, kind))
+
+    def _wrap(self, method, kind):
+        method_name = method.__name__
+
+        @functools.wraps(method)
+        def _profiled(instance, *args, **kwds):
+            key = type(instance).__name__ + "." + method_name
+            if key in self._running:
+                # Don't count calls to overridden methods (by way of super)
+                # more than once.
+                return method(instance, *args, **kwds)
+
+            self._running.add(key)
+            if self._memory:
+                self._push_peak()
+            start = time.perf_counter()
+            try:
+                return method(instance, *args, **kwds)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._running.discard(key)
+                try:
+                    stats = self._stats[key]
+                except KeyError:
+                    stats = self._stats[key] = ProfileStats(key, kind)
+                stats.calls += 1
+                stats.total_time += elapsed
+                stats.max_time = max(stats.max_time, elapsed)
+                if self._memory:
+                    peak = self._pop_peak()
+                    stats.peak_bytes = max(stats.peak_bytes or 0, peak)
+
+        return _profiled
+
+    def _push_peak(self):
+        """Begin tracking the peak memory of a (possibly nested) call."""
+        current, peak = tracemalloc.get_traced_memory()
+        if self._peak_stack:
+            self._peak_stack[-1][1] = max(self._peak_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._peak_stack.append([current, current])
+
+    def _pop_peak(self):
+        """Finish tracking a call, returning the peak bytes it allocated."""
+        _, peak = tracemalloc.get_traced_memory()
+        start, outer_peak = self._peak_stack.pop()
+        peak = max(peak, outer_peak)
+        if self._peak_stack:
+            self._peak_stack[-1][1] = max(self._peak_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        return peak - start
+
+
+def _subclasses(cls):
+    """All subclasses of a class, however indirect."""
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_subclasses(subclass))
+    return list(dict.fromkeys(subclasses))
+
+
+def _is_component_method(name, method):
+    return not name.startswith("_") and inspect.isfunction(method)
+
+
+def _is_grid_operator(name, method):
+    return name.startswith(("calc_", "map_")) and inspect.isfunction(method)
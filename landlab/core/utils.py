@@ -27,13 +27,14 @@ import re
 import shutil
 
 import numpy as np
-import pkg_resources
 
 SIZEOF_INT = np.dtype(np.int).itemsize
 
 
 class ExampleData:
     def __init__(self, example, case=""):
+        import pkg_resources
+
         self._base = pathlib.Path(
             pkg_resources.resource_filename(
                 "landlab", str(pathlib.Path("data").joinpath(example, case))
@@ -305,7 +305,7 @@ class FieldDataset(dict):
     def __getitem__(self, name):
         if isinstance(name, str):
             try:
-                return self._ds[name].values
+                return self._ds.variables[name].values
             except KeyError:
                 raise FieldError(name)
         else:
@@ -22,8 +22,8 @@ def calc_area_at_patch(np.ndarray[long, ndim=2] nodes_at_patch,
                                   &x_of_node[0], &y_of_node[0])
 
 
-cdef calc_area_of_patch(long * nodes_at_patch, long n_vertices,
-                        double * x_of_node, double * y_of_node):
+cdef double calc_area_of_patch(long * nodes_at_patch, long n_vertices,
+                               double * x_of_node, double * y_of_node):
     cdef int n
     cdef int node
     cdef double * x_of_vertex = <double *>malloc(n_vertices * sizeof(double))
@@ -59,8 +59,9 @@ def calc_centroid_at_patch(np.ndarray[long, ndim=2] nodes_at_patch,
                                &out[n, 0])
 
 
-cdef calc_centroid_of_patch(long * nodes_at_patch, long n_vertices,
-                            double * x_of_node, double * y_of_node, double * out):
+cdef int calc_centroid_of_patch(long * nodes_at_patch, long n_vertices,
+                                double * x_of_node, double * y_of_node,
+                                double * out) except -1:
     cdef int n
     cdef int node
     cdef double * x = <double *>malloc(n_vertices * sizeof(double))
@@ -79,9 +80,11 @@ cdef calc_centroid_of_patch(long * nodes_at_patch, long n_vertices,
         free(y)
         free(x)
 
+    return 0
 
-cdef calc_centroid_of_polygon(double * x, double * y, long n_vertices,
-                              double * out):
+
+cdef int calc_centroid_of_polygon(double * x, double * y, long n_vertices,
+                                  double * out) except -1:
     cdef double x_of_centroid = 0.
     cdef double y_of_centroid = 0.
     cdef double area = calc_area_of_polygon(x, y, n_vertices)
@@ -107,8 +110,10 @@ cdef calc_centroid_of_polygon(double * x, double * y, long n_vertices,
     out[0] = x_of_centroid
     out[1] = y_of_centroid
 
+    return 0
+
 
-cdef calc_area_of_polygon(double * x, double * y, long n_vertices):
+cdef double calc_area_of_polygon(double * x, double * y, long n_vertices):
     cdef double area = 0.
     cdef int n
 
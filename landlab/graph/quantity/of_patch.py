@@ -31,11 +31,12 @@ def get_centroid_of_patch(graph, out=None):
     # )
 
     links_at_patch = graph.ds["links_at_patch"].values
+    xy_of_link = graph.xy_of_link
     calc_centroid_at_patch(
         links_at_patch,
         # graph.links_at_patch,
-        np.ascontiguousarray(graph.xy_of_link[:, 0]),
-        np.ascontiguousarray(graph.xy_of_link[:, 1]),
+        np.ascontiguousarray(xy_of_link[:, 0]),
+        np.ascontiguousarray(xy_of_link[:, 1]),
         # graph.ds["nodes_at_patch"].values,
         # graph.nodes_at_patch,
         # np.ascontiguousarray(graph.x_of_node),
@@ -1,3 +1,8 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
 import numpy as np
 
 from ..dual import DualGraph
@@ -8,7 +13,12 @@ from .voronoi_to_graph import VoronoiDelaunayToGraph
 
 class DualVoronoiGraph(DualGraph, DelaunayGraph):
     def __init__(
-        self, node_y_and_x, max_node_spacing=None, sort=False, perimeter_links=None
+        self,
+        node_y_and_x,
+        max_node_spacing=None,
+        sort=False,
+        perimeter_links=None,
+        cache_dir=None,
     ):
         """Create a voronoi grid.
 
@@ -16,6 +26,11 @@ class DualVoronoiGraph(DualGraph, DelaunayGraph):
         ----------
         nodes : tuple of array_like
             Coordinates of every node. First *y*, then *x*.
+        cache_dir : str, optional
+            Directory that holds a cache of finished graphs. If given, the
+            graph is looked up in the cache by the coordinates of its nodes
+            and is only built (and then added to the cache) if it is not
+            already there.
 
         Examples
         --------
@@ -45,6 +60,18 @@ class DualVoronoiGraph(DualGraph, DelaunayGraph):
         >>> graph.node_at_cell
         array([5, 6])
         """
+        if cache_dir is not None:
+            path = os.path.join(
+                cache_dir,
+                _graph_digest(node_y_and_x, sort, perimeter_links) + ".graph",
+            )
+            if os.path.isfile(path):
+                with open(path, "rb") as fp:
+                    ds, dual_ds = pickle.load(fp)
+                _set_dataset(self, ds)
+                self._dual = _set_dataset(Graph.__new__(Graph), dual_ds)
+                return
+
         mesh = VoronoiDelaunayToGraph(
             np.vstack((node_y_and_x[1], node_y_and_x[0])).T,
             perimeter_links=perimeter_links,
@@ -70,3 +97,47 @@ class DualVoronoiGraph(DualGraph, DelaunayGraph):
 
         if sort:
             self.sort()
+
+        if cache_dir is not None:
+            _write_atomic(path, (self.ds, self.dual.ds))
+
+
+def _graph_digest(node_y_and_x, sort, perimeter_links):
+    """Hash of everything that determines a DualVoronoiGraph."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(b"DualVoronoiGraph:1:sorted" if sort else b"DualVoronoiGraph:1")
+    for coord in node_y_and_x:
+        coord = np.ascontiguousarray(coord, dtype=float)
+        digest.update(str(coord.shape).encode())
+        digest.update(coord.tobytes())
+    if perimeter_links is not None:
+        digest.update(np.ascontiguousarray(perimeter_links, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def _set_dataset(graph, ds):
+    """Set up a graph from the dataset of a graph that was already built."""
+    # Unpickled arrays can be backed by read-only buffers, which would keep
+    # the graph from being thawed, so give it arrays of its own.
+    ds = ds.copy(deep=True)
+    graph._ds = ds.assign_coords(
+        {name: np.array(ds[name].values) for name in ds.indexes}
+    )
+    graph._frozen = False
+    graph.freeze()
+    graph._origin = (0.0, 0.0)
+    return graph
+
+
+def _write_atomic(path, obj):
+    """Pickle an object to a file so that it is never seen half written."""
+    cache_dir = os.path.dirname(path) or "."
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            pickle.dump(obj, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
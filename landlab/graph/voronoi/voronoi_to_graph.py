@@ -2,10 +2,7 @@ import re
 
 import numpy as np
 import xarray as xr
-from scipy.spatial import Delaunay, Voronoi
 
-from ...core.utils import as_id_array
-from ...utils import jaggedarray
 from ..sort.intpair import pair_isin
 from ..sort.sort import reverse_one_to_one
 
@@ -29,28 +26,51 @@ class VoronoiDelaunay(object):
         # ridge_vertices == corners_at_face
         # ridge_points == nodes_at_face
         # point_region == node_at_cell
+        #
+        # Rather than running qhull a second time to get the Voronoi
+        # diagram, it is derived from the Delaunay triangulation: the
+        # corners are the circumcenters of the triangles, there is a face
+        # for every edge of the triangulation, and the corners of a cell
+        # are the triangles that share its node.
+        from scipy.spatial import Delaunay
 
         delaunay = Delaunay(xy_of_node)
-        voronoi = Voronoi(xy_of_node)
+        points = delaunay.points
+        simplices = np.asarray(delaunay.simplices, dtype=int)
+        neighbors = np.asarray(delaunay.neighbors, dtype=int)
+
+        # qhull can leave flat triangles along straight edges of the convex
+        # hull (that the Voronoi diagram would have merged away).
+        if np.any(self._is_flat_triangle(points, simplices)):
+            simplices = self._flip_flat_triangles(points, simplices)
+            neighbors = self._neighbors_at_triangle(simplices)
+
+        xy_of_corner = self._circumcenter_of_triangle(points, simplices)
+        nodes_at_link, corners_at_face = self._edges_of_triangulation(
+            simplices, neighbors
+        )
+        corners_at_cell, n_corners_at_cell = self._corners_at_node(
+            points, simplices, corners_at_face, nodes_at_link
+        )
 
         mesh = xr.Dataset(
             {
                 "node": xr.DataArray(
-                    data=np.arange(len(voronoi.points)),
+                    data=np.arange(len(points)),
                     coords={
-                        "x_of_node": xr.DataArray(voronoi.points[:, 0], dims=("node",)),
-                        "y_of_node": xr.DataArray(voronoi.points[:, 1], dims=("node",)),
+                        "x_of_node": xr.DataArray(points[:, 0], dims=("node",)),
+                        "y_of_node": xr.DataArray(points[:, 1], dims=("node",)),
                     },
                     dims=("node",),
                 ),
                 "corner": xr.DataArray(
-                    data=np.arange(len(voronoi.vertices)),
+                    data=np.arange(len(xy_of_corner)),
                     coords={
                         "x_of_corner": xr.DataArray(
-                            voronoi.vertices[:, 0], dims=("corner",)
+                            xy_of_corner[:, 0], dims=("corner",)
                         ),
                         "y_of_corner": xr.DataArray(
-                            voronoi.vertices[:, 1], dims=("corner",)
+                            xy_of_corner[:, 1], dims=("corner",)
                         ),
                     },
                     dims=("corner",),
@@ -59,38 +79,196 @@ class VoronoiDelaunay(object):
         )
         mesh.update(
             {
-                "nodes_at_link": xr.DataArray(
-                    as_id_array(voronoi.ridge_points), dims=("link", "Two")
-                ),
-                "nodes_at_patch": xr.DataArray(
-                    np.asarray(delaunay.simplices, dtype=int), dims=("patch", "Three")
-                ),
-                "corners_at_face": xr.DataArray(
-                    voronoi.ridge_vertices, dims=("face", "Two")
-                ),
+                "nodes_at_link": xr.DataArray(nodes_at_link, dims=("link", "Two")),
+                "nodes_at_patch": xr.DataArray(simplices, dims=("patch", "Three")),
+                "corners_at_face": xr.DataArray(corners_at_face, dims=("face", "Two")),
                 "corners_at_cell": xr.DataArray(
-                    self._corners_at_cell(voronoi.regions),
-                    dims=("cell", "max_corners_per_cell"),
-                ),
-                "n_corners_at_cell": xr.DataArray(
-                    [len(cell) for cell in voronoi.regions], dims=("cell",)
+                    corners_at_cell, dims=("cell", "max_corners_per_cell")
                 ),
+                "n_corners_at_cell": xr.DataArray(n_corners_at_cell, dims=("cell",)),
                 "nodes_at_face": xr.DataArray(
-                    np.asarray(voronoi.ridge_points, dtype=int), dims=("face", "Two")
-                ),
-                "cell_at_node": xr.DataArray(
-                    np.asarray(voronoi.point_region, dtype=int), dims=("node",)
+                    nodes_at_link.copy(), dims=("face", "Two")
                 ),
+                "cell_at_node": xr.DataArray(np.arange(len(points)), dims=("node",)),
             }
         )
         self._mesh = mesh
 
     @staticmethod
-    def _corners_at_cell(regions):
-        jagged = jaggedarray.JaggedArray(regions)
-        return np.asarray(
-            jaggedarray.unravel(jagged.array, jagged.offset, pad=-1), dtype=int
+    def _circumcenter_of_triangle(xy_of_node, nodes_at_triangle):
+        """Coordinates of the circumcenter of each triangle."""
+        xy_of_vertex = xy_of_node[nodes_at_triangle]
+        b = xy_of_vertex[:, 1] - xy_of_vertex[:, 0]
+        c = xy_of_vertex[:, 2] - xy_of_vertex[:, 0]
+        b_squared = np.sum(b * b, axis=1)
+        c_squared = np.sum(c * c, axis=1)
+        d = 2.0 * (b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+
+        xy_of_center = np.empty((len(nodes_at_triangle), 2), dtype=float)
+        xy_of_center[:, 0] = (c[:, 1] * b_squared - b[:, 1] * c_squared) / d
+        xy_of_center[:, 1] = (b[:, 0] * c_squared - c[:, 0] * b_squared) / d
+        xy_of_center += xy_of_vertex[:, 0]
+
+        return xy_of_center
+
+    @staticmethod
+    def _is_flat_triangle(xy_of_node, nodes_at_triangle, rtol=1e-10):
+        """Test if triangles have (nearly) zero area."""
+        xy_of_vertex = xy_of_node[nodes_at_triangle]
+        b = xy_of_vertex[:, 1] - xy_of_vertex[:, 0]
+        c = xy_of_vertex[:, 2] - xy_of_vertex[:, 0]
+        twice_area = np.abs(b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+        longest_side = np.max(
+            np.sum(np.diff(xy_of_vertex[:, (0, 1, 2, 0)], axis=1) ** 2, axis=2), axis=1
+        )
+        return twice_area <= rtol * longest_side
+
+    @staticmethod
+    def _neighbors_at_triangle(nodes_at_triangle):
+        """Triangles that share an edge, with neighbor *i* opposite vertex *i*."""
+        n_triangles = len(nodes_at_triangle)
+        nodes_at_edge = np.sort(
+            np.stack(
+                (
+                    nodes_at_triangle[:, (1, 2, 0)].reshape((-1,)),
+                    nodes_at_triangle[:, (2, 0, 1)].reshape((-1,)),
+                ),
+                axis=1,
+            ),
+            axis=1,
         )
+        sorted_edges = np.lexsort((nodes_at_edge[:, 1], nodes_at_edge[:, 0]))
+        nodes_at_edge = nodes_at_edge[sorted_edges]
+
+        is_shared = np.all(nodes_at_edge[1:] == nodes_at_edge[:-1], axis=1)
+        first, second = sorted_edges[:-1][is_shared], sorted_edges[1:][is_shared]
+
+        neighbors = np.full(3 * n_triangles, -1, dtype=int)
+        neighbors[first] = second // 3
+        neighbors[second] = first // 3
+
+        return neighbors.reshape((n_triangles, 3))
+
+    @classmethod
+    def _flip_flat_triangles(cls, xy_of_node, nodes_at_triangle):
+        """Remove flat triangles from a triangulation.
+
+        The middle vertex of a flat triangle lies on its longest edge. If
+        there is a triangle on the other side of that edge, the edge is
+        flipped so that the two triangles become two that share the middle
+        vertex. Otherwise, the edge is on the convex hull and the flat
+        triangle is simply removed.
+        """
+        nodes_at_triangle = nodes_at_triangle.copy()
+        while True:
+            is_flat = cls._is_flat_triangle(xy_of_node, nodes_at_triangle)
+            if not np.any(is_flat):
+                return nodes_at_triangle
+            neighbors = cls._neighbors_at_triangle(nodes_at_triangle)
+
+            xy_of_vertex = xy_of_node[nodes_at_triangle]
+            length_of_side = np.sum(
+                (xy_of_vertex[:, (2, 0, 1)] - xy_of_vertex[:, (1, 2, 0)]) ** 2, axis=2
+            )
+            middle = np.argmax(length_of_side, axis=1)
+
+            is_changed = np.zeros(len(nodes_at_triangle), dtype=bool)
+            is_removed = np.zeros(len(nodes_at_triangle), dtype=bool)
+            for triangle in np.flatnonzero(is_flat):
+                i = middle[triangle]
+                neighbor = neighbors[triangle, i]
+                if neighbor == -1:
+                    is_removed[triangle] = True
+                    continue
+                # wait for flat neighbors to be fixed first.
+                if is_flat[neighbor] or is_changed[neighbor] or is_changed[triangle]:
+                    continue
+
+                a, c, b = nodes_at_triangle[triangle, (np.arange(i + 1, i + 4) % 3)]
+                d = nodes_at_triangle[neighbor][
+                    list(neighbors[neighbor]).index(triangle)
+                ]
+                nodes_at_triangle[triangle] = (a, b, d)
+                nodes_at_triangle[neighbor] = (b, c, d)
+                is_changed[(triangle, neighbor),] = True
+
+            if not np.any(is_changed | is_removed):
+                return nodes_at_triangle
+            nodes_at_triangle = nodes_at_triangle[~is_removed]
+
+    @staticmethod
+    def _edges_of_triangulation(nodes_at_triangle, triangles_at_triangle):
+        """Unique edges of a triangulation and the triangles on either side.
+
+        Edge *i* of a triangle is the one opposite its *i*-th vertex, which
+        is also the edge it shares with its *i*-th neighbor. Every edge is
+        taken from the triangle with the smaller ID, or the only triangle
+        for edges on the convex hull (which have a neighbor of -1).
+        """
+        n_triangles = len(nodes_at_triangle)
+        triangle = np.repeat(np.arange(n_triangles), 3)
+        neighbor = triangles_at_triangle.reshape((-1,))
+        is_first = (neighbor == -1) | (triangle < neighbor)
+
+        vertex = np.tile(np.arange(3), n_triangles)[is_first]
+        triangle, neighbor = triangle[is_first], neighbor[is_first]
+
+        nodes_at_edge = np.empty((len(triangle), 2), dtype=int)
+        nodes_at_edge[:, 0] = nodes_at_triangle[triangle, (vertex + 1) % 3]
+        nodes_at_edge[:, 1] = nodes_at_triangle[triangle, (vertex + 2) % 3]
+
+        triangles_at_edge = np.empty((len(triangle), 2), dtype=int)
+        triangles_at_edge[:, 0] = neighbor
+        triangles_at_edge[:, 1] = triangle
+
+        return nodes_at_edge, triangles_at_edge
+
+    @staticmethod
+    def _corners_at_node(xy_of_node, nodes_at_triangle, corners_at_face, nodes_at_face):
+        """Triangles that touch each node, ordered counterclockwise.
+
+        Nodes on the convex hull have unbounded cells and so, as with
+        :class:`scipy.spatial.Voronoi`, their list of corners also
+        contains -1.
+        """
+        n_nodes = len(xy_of_node)
+
+        node = nodes_at_triangle.reshape((-1,))
+        corner = np.repeat(np.arange(len(nodes_at_triangle)), 3)
+
+        # Every triangle of the fan around a node lies within its own wedge,
+        # so the angles to the triangle centroids give the order of the
+        # corners.
+        xy_of_centroid = xy_of_node[nodes_at_triangle].mean(axis=1)
+        angle = np.arctan2(
+            xy_of_centroid[corner, 1] - xy_of_node[node, 1],
+            xy_of_centroid[corner, 0] - xy_of_node[node, 0],
+        )
+
+        is_hull_face = corners_at_face[:, 0] == -1
+        hull_node = np.unique(nodes_at_face[is_hull_face])
+
+        node = np.concatenate((node, hull_node))
+        corner = np.concatenate((corner, np.full(len(hull_node), -1)))
+        angle = np.concatenate((angle, np.full(len(hull_node), 2.0 * np.pi)))
+
+        # sort by node, then angle, with a single key (much faster than
+        # np.lexsort). Angles are in [-pi, pi], or 2 pi for the hull, so
+        # the keys of one node never overlap those of the next.
+        sorted_corners = np.argsort(10.0 * node + angle)
+        node, corner = node[sorted_corners], corner[sorted_corners]
+
+        n_corners_at_node = np.bincount(node, minlength=n_nodes)
+        offset_to_node = np.empty(n_nodes + 1, dtype=int)
+        offset_to_node[0] = 0
+        np.cumsum(n_corners_at_node, out=offset_to_node[1:])
+
+        corners_at_node = np.full(
+            (n_nodes, max(n_corners_at_node.max(initial=0), 1)), -1, dtype=int
+        )
+        corners_at_node[node, np.arange(len(node)) - offset_to_node[node]] = corner
+
+        return corners_at_node, n_corners_at_node
 
     @property
     def number_of_nodes(self):
@@ -320,12 +498,13 @@ class VoronoiDelaunayToGraph(VoronoiDelaunay):
         self._mesh = self._mesh.drop_vars(list(at_))
         self._mesh.update(at_)
 
+        new_id = np.cumsum(is_a_keeper) - 1
+        new_id[~is_a_keeper] = -1
         for name in self.ids_with_prefix(at):
             var = self._mesh[name]
             array = var.values.reshape((-1,))
-            array[np.in1d(array, dropped_ids)] = -1
-            for id_ in dropped_ids[::-1]:
-                array[array > id_] -= 1
+            is_an_id = array >= 0
+            array[is_an_id] = new_id[array[is_an_id]]
 
     @property
     def links_at_patch(self):
@@ -15,7 +15,7 @@ import xarray as xr
 from landlab.utils.decorators import make_return_array_immutable
 
 from ..core import load_params
-from ..core.utils import add_module_functions_to_class
+from ..core.utils import add_module_functions_to_class, as_id_array
 from ..field.graph_field import GraphFields
 from ..layers.eventlayers import EventLayersMixIn
 from ..layers.materiallayers import MaterialLayersMixIn
@@ -494,6 +494,42 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
 
         return xr.Dataset(data)
 
+    def save_checkpoint(self, path, components=(), name="checkpoint", prune=True):
+        """Save the grid, and components that use it, to a checkpoint.
+
+        Only arrays that have changed since they were last saved to *path*
+        are written. Use :func:`~landlab.io.native_landlab.load_checkpoint`
+        to resume a run from the checkpoint.
+
+        Parameters
+        ----------
+        path : str
+            Directory in which to save checkpoints.
+        components : iterable, optional
+            Components, and other picklable objects, to save with the grid.
+        name : str, optional
+            Name of the checkpoint.
+        prune : bool, optional
+            If True, remove array files no longer used by any checkpoint
+            in *path*.
+
+        Returns
+        -------
+        int
+            The number of array files that were written.
+
+        See Also
+        --------
+        ~landlab.io.native_landlab.save_checkpoint
+
+        LLCATS: GINF
+        """
+        from ..io.native_landlab import save_checkpoint
+
+        return save_checkpoint(
+            path, self, components=components, name=name, prune=prune
+        )
+
     @property
     def xy_of_reference(self):
         """Return the coordinates (x, y) of the reference point.
@@ -1939,11 +1975,22 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
                 pass
             else:
                 raise TypeError("unit must be 'degrees' or 'radians'")
-            slp, slp_comps = self.calc_slope_at_node(elevs, return_components=True)
+            from .ext.slope import calc_hillshade_at_node
+
+            slp, (grad_x, grad_y) = self.calc_slope_at_node(
+                elevs, return_components=True
+            )
 
-            asp = self.calc_aspect_at_node(
-                slope_component_tuple=slp_comps, unit="radians"
+            shaded = self.empty(at="node", dtype=float)
+            calc_hillshade_at_node(
+                np.ascontiguousarray(slp, dtype=float),
+                np.ascontiguousarray(grad_x, dtype=float),
+                np.ascontiguousarray(grad_y, dtype=float),
+                alt,
+                az,
+                shaded,
             )
+            return shaded
         else:
             raise TypeError("Either both slp and asp must be set, or neither!")
 
@@ -2445,6 +2492,97 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
         else:
             return self._node_status[ids] == boundary_flag
 
+    @property
+    @cache_result_in_object(cache_as="_cached_kd_tree_of_node")
+    def _kd_tree_of_node(self):
+        """A k-d tree of node coordinates used for spatial queries.
+
+        The tree is built the first time it is needed and is then cached
+        with the grid.
+        """
+        from scipy.spatial import cKDTree
+
+        return cKDTree(np.column_stack((self.x_of_node, self.y_of_node)))
+
+    def find_nearest_node(self, coords):
+        """Node nearest a point.
+
+        Find the index to the node nearest the given x, y coordinates.
+        Coordinates are provided as numpy arrays in the *coords* tuple.
+        Nodes are looked up with a k-d tree of node coordinates that is
+        built the first time it is needed and then cached with the grid.
+
+        Parameters
+        ----------
+        coords : tuple of array-like
+            Coordinates of points as ``(x, y)``.
+
+        Returns
+        -------
+        int or ndarray of int
+            IDs of the nearest nodes.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid((3, 3))
+        >>> grid.find_nearest_node((1.1, 0.8))
+        4
+        >>> grid.find_nearest_node(([0.1, 2.4, 1.6], [0.0, 1.6, 1.9]))
+        array([0, 9, 8])
+
+        LLCATS: NINF SUBSET
+        """
+        x, y = np.broadcast_arrays(*coords)
+        _, nodes = self._kd_tree_of_node.query(np.stack((x, y), axis=-1))
+        if np.ndim(nodes) == 0:
+            return int(nodes)
+        else:
+            return as_id_array(nodes)
+
+    def nodes_within_radius(self, coord, radius):
+        """Nodes within some distance of a point.
+
+        Find the nodes whose distance from the point *coord* is less than
+        or equal to *radius*. Unlike
+        :attr:`~.ModelGrid.all_node_distances_map`, the search uses a
+        cached k-d tree of node coordinates and so never allocates more
+        than the number of nodes found.
+
+        Parameters
+        ----------
+        coord : tuple of float
+            Coordinates of point as ``(x, y)``.
+        radius : float
+            Search radius.
+
+        Returns
+        -------
+        ndarray of int
+            IDs of the nodes within the radius, in increasing order.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid((3, 3))
+        >>> x, y = grid.xy_of_node[4]
+        >>> grid.nodes_within_radius((x, y), 1.01)
+        array([0, 1, 3, 4, 5, 7, 8])
+        >>> grid.nodes_within_radius((x, y), 0.5)
+        array([4])
+        >>> grid.nodes_within_radius((10.0, 10.0), 0.5)
+        array([], dtype=int64)
+
+        LLCATS: NINF SUBSET MEAS
+        """
+        if len(coord) != 2:
+            raise ValueError("coordinate must iterable of length 2")
+        if radius < 0.0:
+            raise ValueError("radius must be non-negative")
+
+        nodes = self._kd_tree_of_node.query_ball_point(coord, radius)
+        return np.sort(as_id_array(nodes))
+
     def calc_distances_of_nodes_to_point(
         self, coord, get_az=None, node_subset=None, out_distance=None, out_azimuth=None
     ):
@@ -2460,6 +2598,10 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
         returns just the distance (and optionally azimuth) for that node.
         Point is provided as a tuple (x,y).
 
+        Distances to several points can be calculated in one call by
+        providing the coordinates as a tuple of arrays, (x, y). In this
+        case the returned distances have one row for each point.
+
         If out_distance (& out_azimuth) are provided, these arrays are used to
         store the outputs. This is recommended for memory management reasons if
         you are working with node subsets.
@@ -2471,8 +2613,8 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
 
         Parameters
         ----------
-        coord : tuple of float
-            Coodinates of point as (x, y).
+        coord : tuple of float or tuple of array_like
+            Coodinates of point, or points, as (x, y).
         get_az: {None, 'angles', 'displacements'}, optional
             Optionally calculate azimuths as either angles or displacements.
             The calculated values will be returned along with the distances
@@ -2495,18 +2637,10 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
 
         Notes
         -----
-        Once you start working with node subsets in Landlab, which can change
-        size between loops, it's quite possible for Python's internal memory
-        management to crap out after large numbers of loops (~>10k). This is
-        to do with the way it block allocates memory for arrays of differing
-        lengths, then cannot free this memory effectively.
-        The solution - as implemented here - is to pre-allocate all arrays as
-        nnodes long, then only work with the first [len_subset] entries by
-        slicing (in a pseudo-C-style). Care has to be taken not to
-        "accidentally" allow Python to allocate a new array you don't have
-        control over.
-        Then, to maintain efficient memory allocation, we create some "dummy"
-        nnode-long arrays to store intermediate parts of the solution in.
+        Temporary arrays are only as large as the output, that is, the
+        number of points times the number of nodes in *node_subset*. To
+        find the nodes near a point without calculating distances to
+        every node, use :meth:`~.ModelGrid.nodes_within_radius`.
 
         Examples
         --------
@@ -2538,6 +2672,13 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
         >>> out.take((2, 6, 7, 8, 12))
         array([ 1.,  1.,  0.,  1.,  1.])
 
+        Calculate distances from several points at once.
+
+        >>> grid.calc_distances_of_nodes_to_point(([2, 0], [1, 0]),
+        ...     node_subset=(2, 6, 7, 8, 12))
+        array([[ 1.        ,  1.        ,  0.        ,  1.        ,  1.        ],
+               [ 2.        ,  1.41421356,  2.23606798,  3.16227766,  2.82842712]])
+
         Calculate azimuths along with distances. The azimuths are calculated
         in radians but measured clockwise from north.
 
@@ -2574,68 +2715,49 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
             if not isinstance(node_subset, np.ndarray):
                 node_subset = np.array(node_subset)
             node_subset = node_subset.reshape((-1,))
-            len_subset = node_subset.size
+            x_of_node = self.x_of_node[node_subset]
+            y_of_node = self.y_of_node[node_subset]
         else:
-            len_subset = self.number_of_nodes
+            x_of_node = self.x_of_node
+            y_of_node = self.y_of_node
+
+        x, y = np.broadcast_arrays(*coord)
+        if x.ndim > 1:
+            raise ValueError("coordinates must be scalars or 1D arrays")
+        shape = x.shape + x_of_node.shape
 
         if out_distance is None:
-            out_distance = np.empty(len_subset, dtype=np.float)
-        if out_distance.size != len_subset:
+            out_distance = np.empty(shape, dtype=float)
+        if out_distance.size != np.prod(shape):
             raise ValueError("output array size mismatch for distances")
 
         if get_az is not None:
             if get_az == "displacements":
-                az_shape = (2, len_subset)
+                az_shape = (2,) + shape
             else:
-                az_shape = (len_subset,)
+                az_shape = shape
             if out_azimuth is None:
-                out_azimuth = np.empty(az_shape, dtype=np.float)
+                out_azimuth = np.empty(az_shape, dtype=float)
             if out_azimuth.shape != az_shape:
                 raise ValueError("output array mismatch for azimuths")
 
-        azimuths_as_displacements = np.empty((2, self.number_of_nodes))
-        dummy_nodes_1 = np.empty(self.number_of_nodes)
-        dummy_nodes_2 = np.empty(self.number_of_nodes)
-        dummy_nodes_3 = np.empty(self.number_of_nodes)
+        dx = np.subtract(x_of_node, x[..., np.newaxis]).reshape(shape)
+        dy = np.subtract(y_of_node, y[..., np.newaxis]).reshape(shape)
 
-        if node_subset is None:
-            azimuths_as_displacements[0] = self.node_x - coord[0]
-            azimuths_as_displacements[1] = self.node_y - coord[1]
-        else:
-            azimuths_as_displacements[0, :len_subset] = (
-                self.node_x[node_subset] - coord[0]
-            )
-            azimuths_as_displacements[1, :len_subset] = (
-                self.node_y[node_subset] - coord[1]
-            )
+        if get_az == "displacements":
+            out_azimuth[0] = dx
+            out_azimuth[1] = dy
+        elif get_az == "angles":
+            np.arctan2(dx, dy, out=out_azimuth)
+            out_azimuth[out_azimuth < 0.0] += 2.0 * np.pi
 
-        np.square(
-            azimuths_as_displacements[0, :len_subset], out=dummy_nodes_1[:len_subset]
-        )
-        np.square(
-            azimuths_as_displacements[1, :len_subset], out=dummy_nodes_2[:len_subset]
-        )
-        np.add(
-            dummy_nodes_1[:len_subset],
-            dummy_nodes_2[:len_subset],
-            out=dummy_nodes_3[:len_subset],
-        )
-        np.sqrt(dummy_nodes_3[:len_subset], out=out_distance)
+        np.square(dx, out=dx)
+        np.square(dy, out=dy)
+        np.add(dx, dy, out=dx)
+        np.sqrt(dx, out=dx)
+        out_distance[...] = dx.reshape(out_distance.shape)
 
         if get_az:
-            if get_az == "displacements":
-                out_azimuth[:] = azimuths_as_displacements[:, :len_subset]
-            elif get_az == "angles":
-                np.arctan2(
-                    azimuths_as_displacements[0, :len_subset],
-                    azimuths_as_displacements[1, :len_subset],
-                    out=out_azimuth[:len_subset],
-                )
-
-                less_than_zero = np.empty(self.number_of_nodes, dtype=bool)
-                np.less(out_azimuth, 0.0, out=less_than_zero[:len_subset])
-                out_azimuth[less_than_zero[:len_subset]] += 2.0 * np.pi
-
             return out_distance, out_azimuth
         else:
             return out_distance
@@ -2644,6 +2766,15 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
     def all_node_distances_map(self):
         """Get distances from every node to every other node.
 
+        .. note::
+
+            This creates a ``number_of_nodes`` by ``number_of_nodes``
+            array and so is only practical for small grids. To find
+            nodes near a point use
+            :meth:`~.ModelGrid.nodes_within_radius` or
+            :meth:`~.ModelGrid.find_nearest_node`, and to measure
+            distances use :meth:`~.ModelGrid.calc_distances_of_nodes_to_point`.
+
         Examples
         --------
         >>> from landlab import RasterModelGrid
@@ -2676,6 +2807,14 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
     def all_node_azimuths_map(self):
         """Get azimuths from every node to every other node.
 
+        .. note::
+
+            This creates a ``number_of_nodes`` by ``number_of_nodes``
+            array and so is only practical for small grids. Use
+            :meth:`~.ModelGrid.calc_distances_of_nodes_to_point` with
+            ``get_az="angles"`` to get azimuths from just the points
+            that are needed.
+
         Examples
         --------
         >>> import numpy as np
@@ -2731,26 +2870,12 @@ class ModelGrid(GraphFields, EventLayersMixIn, MaterialLayersMixIn):
         tuple of ndarrays
             Tuple of (distances, azimuths)
         """
-        self._all_node_distances_map = np.empty(
-            (self.number_of_nodes, self.number_of_nodes)
+        (
+            self._all_node_distances_map,
+            self._all_node_azimuths_map,
+        ) = self.calc_distances_of_nodes_to_point(
+            (self.x_of_node, self.y_of_node), get_az="angles"
         )
-        self._all_node_azimuths_map = np.empty(
-            (self.number_of_nodes, self.number_of_nodes)
-        )
-
-        node_coords = np.empty((self.number_of_nodes, 2))
-        node_coords[:, 0] = self.node_x
-        node_coords[:, 1] = self.node_y
-
-        for i in range(self.number_of_nodes):
-            (
-                self._all_node_distances_map[i, :],
-                self._all_node_azimuths_map[i, :],
-            ) = self.calc_distances_of_nodes_to_point(
-                (node_coords[i, 0], node_coords[i, 1]), get_az="angles"
-            )
-
-        assert np.all(self._all_node_distances_map >= 0.0)
 
         return self._all_node_distances_map, self._all_node_azimuths_map
 
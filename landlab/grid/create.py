@@ -2,8 +2,6 @@
 """Create landlab model grids."""
 
 from ..core import load_params
-from ..io import read_esri_ascii
-from ..io.netcdf import read_netcdf
 from ..values import constant, plane, random, sine
 from .hex import HexModelGrid
 from .network import NetworkModelGrid
@@ -128,8 +126,12 @@ def add_field_from_function(grid, name, functions, at="node"):
             synth_function = _SYNTHETIC_FIELD_CONSTRUCTORS[func_name]
             synth_function(grid, name, at=at, **kwargs)
         elif func_name == "read_esri_ascii":
+            from ..io import read_esri_ascii
+
             read_esri_ascii(*args, grid=grid, name=name, **kwargs)
         elif func_name == "read_netcdf":
+            from ..io.netcdf import read_netcdf
+
             read_netcdf(*args, grid=grid, name=name, **kwargs)
 
     return grid
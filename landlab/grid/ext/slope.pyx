@@ -0,0 +1,349 @@
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+from libc.math cimport acos, atan2, cos, fmod, sin, sqrt, M_PI
+
+
+cdef struct PatchSlope:
+    double slope
+    double grad_x
+    double grad_y
+
+
+cdef inline void _unit_normal(double ax, double ay, double az,
+                              double bx, double by, double bz,
+                              double * n) nogil:
+    """Unit normal to a triangle, as the normalized cross product a x b."""
+    cdef double mag
+
+    n[0] = ay * bz - az * by
+    n[1] = az * bx - ax * bz
+    n[2] = ax * by - ay * bx
+    mag = sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+
+    n[0] = n[0] / mag
+    n[1] = n[1] / mag
+    n[2] = n[2] / mag
+
+
+cdef inline PatchSlope _slope_of_raster_patch(
+    long p, long q, long r, long s, double * x, double * y, double * z
+) nogil:
+    """Mean slope, and its components, of the four subtriangles of a patch.
+
+    Corners are ordered counter-clockwise from the upper right (p) as for
+    nodes_at_patch of a raster grid.
+    """
+    cdef double pq[3]
+    cdef double ps[3]
+    cdef double rs[3]
+    cdef double qr[3]
+    cdef double n_tr[3]
+    cdef double n_tl[3]
+    cdef double n_bl[3]
+    cdef double n_br[3]
+    cdef double theta
+    cdef PatchSlope out
+
+    pq[0] = x[q] - x[p]
+    pq[1] = y[q] - y[p]
+    pq[2] = z[q] - z[p]
+    ps[0] = x[s] - x[p]
+    ps[1] = y[s] - y[p]
+    ps[2] = z[s] - z[p]
+    rs[0] = x[s] - x[r]
+    rs[1] = y[s] - y[r]
+    rs[2] = z[s] - z[r]
+    qr[0] = x[r] - x[q]
+    qr[1] = y[r] - y[q]
+    qr[2] = z[r] - z[q]
+
+    _unit_normal(pq[0], pq[1], pq[2], qr[0], qr[1], qr[2], n_tl)
+    _unit_normal(ps[0], ps[1], ps[2], rs[0], rs[1], rs[2], n_br)
+    _unit_normal(pq[0], pq[1], pq[2], ps[0], ps[1], ps[2], n_tr)
+    _unit_normal(qr[0], qr[1], qr[2], rs[0], rs[1], rs[2], n_bl)
+
+    out.slope = (
+        acos(n_tr[2]) + acos(n_tl[2]) + acos(n_bl[2]) + acos(n_br[2])
+    ) / 4.0
+    theta = atan2(
+        -(n_tr[1] + n_tl[1] + n_bl[1] + n_br[1]),
+        -(n_tr[0] + n_tl[0] + n_bl[0] + n_br[0]),
+    )
+    out.grad_x = cos(theta) * out.slope
+    out.grad_y = sin(theta) * out.slope
+
+    return out
+
+
+cdef inline PatchSlope _slope_of_triangle(
+    long p, long q, long r, double * x, double * y, double * z
+) nogil:
+    """Slope, and its components, of a triangular patch."""
+    cdef double n[3]
+    cdef double theta
+    cdef PatchSlope out
+
+    _unit_normal(
+        x[q] - x[p], y[q] - y[p], z[q] - z[p],
+        x[r] - x[p], y[r] - y[p], z[r] - z[p],
+        n,
+    )
+    out.slope = acos(n[2])
+    theta = atan2(-n[1], -n[0])
+    out.grad_x = cos(theta) * out.slope
+    out.grad_y = sin(theta) * out.slope
+
+    return out
+
+
+cdef inline void _add_patch(PatchSlope * total, PatchSlope * patch, int first) nogil:
+    if first:
+        total[0] = patch[0]
+    else:
+        total.slope = total.slope + patch.slope
+        total.grad_x = total.grad_x + patch.grad_x
+        total.grad_y = total.grad_y + patch.grad_y
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def calc_slope_at_raster_node(
+    shape,
+    np.ndarray[double, ndim=1, mode="c"] x_of_node,
+    np.ndarray[double, ndim=1, mode="c"] y_of_node,
+    np.ndarray[double, ndim=1, mode="c"] value_at_node,
+    np.ndarray[np.uint8_t, ndim=1, mode="c"] patch_is_used,
+    np.ndarray[double, ndim=1, mode="c"] slope_at_node,
+    np.ndarray[double, ndim=1, mode="c"] grad_x_at_node,
+    np.ndarray[double, ndim=1, mode="c"] grad_y_at_node,
+):
+    """Mean slope, and its components, of the patches around raster nodes.
+
+    The slope of a patch is the mean slope of its four subtriangles. Patches
+    are visited once, a row at a time, keeping only the two rows of patches
+    that touch the current row of nodes.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of rows and columns of nodes.
+    x_of_node, y_of_node : ndarray of float
+        Node coordinates.
+    value_at_node : ndarray of float
+        Surface elevation at nodes.
+    patch_is_used : ndarray of uint8
+        Patches to include when averaging.
+    slope_at_node, grad_x_at_node, grad_y_at_node : ndarray of float
+        Output buffers for slope and its x and y components, in radians.
+        Nodes without patches are given zero.
+    """
+    cdef long n_rows = shape[0]
+    cdef long n_cols = shape[1]
+    cdef long n_patch_cols = n_cols - 1
+    cdef double * x = &x_of_node[0]
+    cdef double * y = &y_of_node[0]
+    cdef double * z = &value_at_node[0]
+    cdef np.uint8_t * is_used = &patch_is_used[0]
+    cdef PatchSlope [:, :] patch_rows
+    cdef PatchSlope * upper
+    cdef PatchSlope * lower
+    cdef PatchSlope total
+    cdef PatchSlope zero
+    cdef long row, col, node, patch
+    cdef int count, slot
+    cdef bint valid
+
+    zero.slope = 0.0
+    zero.grad_x = 0.0
+    zero.grad_y = 0.0
+
+    patch_rows_buffer = np.empty(
+        (2, max(n_patch_cols, 1)),
+        dtype=np.dtype([("slope", float), ("grad_x", float), ("grad_y", float)]),
+    )
+    patch_rows = patch_rows_buffer
+
+    with nogil:
+        for row in range(n_rows):
+            # Patches above this row of nodes.
+            upper = &patch_rows[row % 2, 0]
+            if row < n_rows - 1:
+                for col in range(n_patch_cols):
+                    patch = row * n_patch_cols + col
+                    if is_used[patch]:
+                        node = row * n_cols + col
+                        upper[col] = _slope_of_raster_patch(
+                            node + n_cols + 1, node + n_cols, node, node + 1, x, y, z
+                        )
+            lower = &patch_rows[(row + 1) % 2, 0]
+
+            for col in range(n_cols):
+                # Patches are in the order of patches_at_node: upper right,
+                # upper left, lower left, lower right. Unused patches add
+                # zero, as for a masked mean.
+                count = 0
+                for slot in range(4):
+                    if slot < 2 and row < n_rows - 1:
+                        patch = row * n_patch_cols + col - slot
+                        valid = col - slot >= 0 and col - slot < n_patch_cols
+                    elif slot >= 2 and row > 0:
+                        patch = (row - 1) * n_patch_cols + col + slot - 3
+                        valid = col + slot - 3 >= 0 and col + slot - 3 < n_patch_cols
+                    else:
+                        valid = False
+
+                    if valid and is_used[patch]:
+                        if slot < 2:
+                            _add_patch(&total, &upper[col - slot], slot == 0)
+                        else:
+                            _add_patch(&total, &lower[col + slot - 3], slot == 0)
+                        count += 1
+                    else:
+                        _add_patch(&total, &zero, slot == 0)
+
+                node = row * n_cols + col
+                if count > 0:
+                    slope_at_node[node] = total.slope / count
+                    grad_x_at_node[node] = total.grad_x / count
+                    grad_y_at_node[node] = total.grad_y / count
+                else:
+                    slope_at_node[node] = 0.0
+                    grad_x_at_node[node] = 0.0
+                    grad_y_at_node[node] = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def calc_slope_at_node(
+    np.ndarray[long, ndim=2, mode="c"] nodes_at_patch,
+    np.ndarray[long, ndim=2, mode="c"] patches_at_node,
+    np.ndarray[np.uint8_t, ndim=2, mode="c"] patch_is_used_at_node,
+    np.ndarray[double, ndim=1, mode="c"] x_of_node,
+    np.ndarray[double, ndim=1, mode="c"] y_of_node,
+    np.ndarray[double, ndim=1, mode="c"] value_at_node,
+    np.ndarray[double, ndim=1, mode="c"] slope_at_node,
+    np.ndarray[double, ndim=1, mode="c"] grad_x_at_node,
+    np.ndarray[double, ndim=1, mode="c"] grad_y_at_node,
+):
+    """Mean slope, and its components, of the triangles around nodes.
+
+    Parameters
+    ----------
+    nodes_at_patch : ndarray of int, shape (n_patches, 3)
+        Nodes of each triangular patch.
+    patches_at_node : ndarray of int, shape (n_nodes, max_patches)
+        Patches around each node.
+    patch_is_used_at_node : ndarray of uint8, shape (n_nodes, max_patches)
+        Patches around each node to include when averaging.
+    x_of_node, y_of_node : ndarray of float
+        Node coordinates.
+    value_at_node : ndarray of float
+        Surface elevation at nodes.
+    slope_at_node, grad_x_at_node, grad_y_at_node : ndarray of float
+        Output buffers for slope and its x and y components, in radians.
+        Nodes without patches are given zero.
+    """
+    cdef long n_patches = nodes_at_patch.shape[0]
+    cdef long n_nodes = patches_at_node.shape[0]
+    cdef long n_slots = patches_at_node.shape[1]
+    cdef double * x = &x_of_node[0]
+    cdef double * y = &y_of_node[0]
+    cdef double * z = &value_at_node[0]
+    cdef PatchSlope [:] slope_at_patch
+    cdef PatchSlope total
+    cdef PatchSlope zero
+    cdef long node, patch, slot
+    cdef long count
+
+    zero.slope = 0.0
+    zero.grad_x = 0.0
+    zero.grad_y = 0.0
+
+    slope_at_patch_buffer = np.empty(
+        max(n_patches, 1),
+        dtype=np.dtype([("slope", float), ("grad_x", float), ("grad_y", float)]),
+    )
+    slope_at_patch = slope_at_patch_buffer
+
+    with nogil:
+        for patch in range(n_patches):
+            slope_at_patch[patch] = _slope_of_triangle(
+                nodes_at_patch[patch, 0],
+                nodes_at_patch[patch, 1],
+                nodes_at_patch[patch, 2],
+                x,
+                y,
+                z,
+            )
+
+        for node in range(n_nodes):
+            count = 0
+            for slot in range(n_slots):
+                patch = patches_at_node[node, slot]
+                if patch >= 0 and patch_is_used_at_node[node, slot]:
+                    _add_patch(&total, &slope_at_patch[patch], slot == 0)
+                    count += 1
+                else:
+                    _add_patch(&total, &zero, slot == 0)
+
+            if count > 0:
+                slope_at_node[node] = total.slope / count
+                grad_x_at_node[node] = total.grad_x / count
+                grad_y_at_node[node] = total.grad_y / count
+            else:
+                slope_at_node[node] = 0.0
+                grad_x_at_node[node] = 0.0
+                grad_y_at_node[node] = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def calc_hillshade_at_node(
+    np.ndarray[double, ndim=1, mode="c"] slope_at_node,
+    np.ndarray[double, ndim=1, mode="c"] grad_x_at_node,
+    np.ndarray[double, ndim=1, mode="c"] grad_y_at_node,
+    double alt,
+    double az,
+    np.ndarray[double, ndim=1, mode="c"] out,
+):
+    """Hillshade from slope and its components, all in radians.
+
+    Parameters
+    ----------
+    slope_at_node, grad_x_at_node, grad_y_at_node : ndarray of float
+        Slope and its x and y components.
+    alt : float
+        Sun altitude, in radians.
+    az : float
+        Sun azimuth, clockwise from north, in radians.
+    out : ndarray of float
+        Output buffer for hillshade, which is clipped at zero.
+    """
+    cdef long n_nodes = slope_at_node.shape[0]
+    cdef double sin_alt = sin(alt)
+    cdef double cos_alt = cos(alt)
+    cdef double aspect, shade
+    cdef long node
+
+    with nogil:
+        for node in range(n_nodes):
+            # Aspect, clockwise from north, as a floored modulo like numpy's.
+            aspect = fmod(
+                5.0 * M_PI / 2.0 - atan2(-grad_y_at_node[node], -grad_x_at_node[node]),
+                2.0 * M_PI,
+            )
+            if aspect < 0.0:
+                aspect = aspect + 2.0 * M_PI
+
+            shade = sin_alt * cos(slope_at_node[node]) + cos_alt * sin(
+                slope_at_node[node]
+            ) * cos(az - aspect)
+            if shade < 0.0:
+                shade = 0.0
+            out[node] = shade
@@ -384,6 +384,14 @@ def calc_slope_at_node(
     if method not in ("patch_mean", "Horn"):
         raise ValueError("method name not understood")
 
+    if method == "patch_mean" and grid.nodes_at_patch.shape[1] == 3:
+        return _calc_slope_at_node_of_triangles(
+            grid,
+            elevs,
+            ignore_closed_nodes=ignore_closed_nodes,
+            return_components=return_components,
+        )
+
     if not ignore_closed_nodes:
         patches_at_node = np.ma.masked_where(
             grid.patches_at_node == -1, grid.patches_at_node, copy=False
@@ -435,6 +443,49 @@ def calc_slope_at_node(
         return slope_mag
 
 
+def _calc_slope_at_node_of_triangles(
+    grid, elevs, ignore_closed_nodes=True, return_components=False
+):
+    """Mean slope at nodes of a grid whose patches are all triangles.
+
+    This gives the same result as the "patch_mean" method of
+    :func:`calc_slope_at_node` but, rather than building masked arrays of
+    values at the patches around each node, calculates slopes in a single
+    pass over patches and then over nodes.
+    """
+    from .ext.slope import calc_slope_at_node as _calc_slope_at_node
+
+    try:
+        z = grid.at_node[elevs]
+    except TypeError:
+        z = elevs
+
+    if ignore_closed_nodes:
+        patch_is_used = grid.patches_present_at_node
+    else:
+        patch_is_used = grid.patches_at_node != -1
+
+    slope_mag = grid.empty(at="node", dtype=float)
+    mean_grad_x = grid.empty(at="node", dtype=float)
+    mean_grad_y = grid.empty(at="node", dtype=float)
+    _calc_slope_at_node(
+        np.ascontiguousarray(grid.nodes_at_patch, dtype=int),
+        np.ascontiguousarray(grid.patches_at_node, dtype=int),
+        np.ascontiguousarray(patch_is_used, dtype=bool).view(np.uint8),
+        np.ascontiguousarray(grid.x_of_node, dtype=float),
+        np.ascontiguousarray(grid.y_of_node, dtype=float),
+        np.ascontiguousarray(z, dtype=float),
+        slope_mag,
+        mean_grad_x,
+        mean_grad_y,
+    )
+
+    if return_components:
+        return slope_mag, (mean_grad_x, mean_grad_y)
+    else:
+        return slope_mag
+
+
 def calc_aspect_at_node(
     grid,
     slope_component_tuple=None,
@@ -762,6 +762,44 @@ class RasterModelGrid(
         """
         return rfuncs.find_nearest_node(self, coords, mode=mode)
 
+    def nodes_within_radius(self, coord, radius):
+        """Nodes within some distance of a point.
+
+        Find the nodes whose distance from the point *coord* is less than
+        or equal to *radius*. Rather than searching a spatial index, nodes
+        are found by arithmetic on the window of rows and columns that
+        encloses the search circle.
+
+        Parameters
+        ----------
+        coord : tuple of float
+            Coordinates of point as ``(x, y)``.
+        radius : float
+            Search radius.
+
+        Returns
+        -------
+        ndarray of int
+            IDs of the nodes within the radius, in increasing order.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> rmg = RasterModelGrid((4, 5), xy_spacing=(2.0, 1.0))
+        >>> rmg.nodes_within_radius((4.0, 1.0), 1.0)
+        array([ 2,  7, 12])
+        >>> rmg.nodes_within_radius((4.0, 1.0), 2.5)
+        array([ 1,  2,  3,  6,  7,  8, 11, 12, 13, 17])
+
+        LLCATS: NINF SUBSET MEAS
+        """
+        if len(coord) != 2:
+            raise ValueError("coordinate must iterable of length 2")
+        if radius < 0.0:
+            raise ValueError("radius must be non-negative")
+
+        return rfuncs.nodes_within_radius(self, coord, radius)
+
     def set_closed_boundaries_at_grid_edges(
         self, right_is_closed, top_is_closed, left_is_closed, bottom_is_closed
     ):
@@ -1612,126 +1650,18 @@ class RasterModelGrid(
         >>> neighbors[5]
         array([3, 0, 2, 1, 4, 1, 2, 0])
         """
-        # CAUTION: Some terminology concerning cells in this module
-        # is asynchronous to general understanding. This is intentionally
-        # left as is until further discussion among dev group.
-        # Any such instances are marked with (*TC - Terminoly Caution)
         nrows, ncols = self.cell_grid_shape
-        interior_cells = sgrid.interior_nodes(self.cell_grid_shape)  # *TC
-        cells_at_corners_of_grid = self.cells_at_corners_of_grid  # *TC
+        row, col = np.divmod(np.arange(self.number_of_cells), ncols)
 
-        # The cells along the edges minus the corner cells.
-        top_edge_cells = self.cell_at_node[self.nodes[-2, :]][2:-2]
-        bottom_edge_cells = self.cell_at_node[self.nodes[1, :]][2:-2]
-        left_edge_cells = self.cell_at_node[self.nodes[:, 1]][2:-2]
-        right_edge_cells = self.cell_at_node[self.nodes[:, -2]][2:-2]
+        # order = [E,NE,N,NW,W,SW,S,SE]
+        d_row = np.array([0, 1, 1, 1, 0, -1, -1, -1])
+        d_col = np.array([1, 1, 0, -1, -1, -1, 0, 1])
 
-        looped_cell_neighbors = np.empty([self.number_of_cells, 8], dtype=int)
+        # Neighbors wrap around the edges of the grid of cells, as on a torus.
+        neighbor_row = (row.reshape((-1, 1)) + d_row) % nrows
+        neighbor_col = (col.reshape((-1, 1)) + d_col) % ncols
 
-        # order = [E,NE,N,NW,W,SW,S,SE]
-        for cell in range(0, self.number_of_cells):
-            if cell in interior_cells:
-                neighbor_ = [
-                    cell + 1,
-                    cell + 1 + ncols,
-                    cell + ncols,
-                    cell + ncols - 1,
-                    cell - 1,
-                    cell - ncols - 1,
-                    cell - ncols,
-                    cell - ncols + 1,
-                ]
-            elif cell in bottom_edge_cells:
-                neighbor_ = [
-                    cell + 1,
-                    cell + 1 + ncols,
-                    cell + ncols,
-                    cell + ncols - 1,
-                    cell - 1,
-                    cell + (nrows - 1) * ncols - 1,
-                    cell + (nrows - 1) * ncols,
-                    cell + (nrows - 1) * ncols + 1,
-                ]
-            elif cell in top_edge_cells:
-                neighbor_ = [
-                    cell + 1,
-                    cell - (nrows - 1) * ncols + 1,
-                    cell - (nrows - 1) * ncols,
-                    cell - (nrows - 1) * ncols - 1,
-                    cell - 1,
-                    cell - ncols - 1,
-                    cell - ncols,
-                    cell - ncols + 1,
-                ]
-            elif cell in right_edge_cells:
-                neighbor_ = [
-                    cell - ncols + 1,
-                    cell + 1,
-                    cell + ncols,
-                    cell + ncols - 1,
-                    cell - 1,
-                    cell - ncols - 1,
-                    cell - ncols,
-                    cell - 2 * ncols + 1,
-                ]
-            elif cell in left_edge_cells:
-                neighbor_ = [
-                    cell + 1,
-                    cell + ncols + 1,
-                    cell + ncols,
-                    cell + 2 * ncols - 1,
-                    cell + ncols - 1,
-                    cell - 1,
-                    cell - ncols,
-                    cell - ncols + 1,
-                ]
-            elif cell == cells_at_corners_of_grid[0]:  # SW corner
-                neighbor_ = [
-                    cell + 1,
-                    cell + ncols + 1,
-                    cell + ncols,
-                    cell + 2 * ncols - 1,
-                    cell + ncols - 1,
-                    cell + nrows * ncols - 1,
-                    cell + (nrows - 1) * ncols,
-                    cell + (nrows - 1) * ncols + 1,
-                ]
-            elif cell == cells_at_corners_of_grid[1]:  # SE corner
-                neighbor_ = [
-                    cell - ncols + 1,
-                    cell + 1,
-                    cell + ncols,
-                    cell + ncols - 1,
-                    cell - 1,
-                    cell + (nrows - 1) * ncols - 1,
-                    cell + (nrows - 1) * ncols,
-                    cell + (nrows - 2) * ncols + 1,
-                ]
-            elif cell == cells_at_corners_of_grid[2]:  # NW corner
-                neighbor_ = [
-                    cell + 1,
-                    cell - (nrows - 1) * ncols + 1,
-                    cell - (nrows - 1) * ncols,
-                    cell - (nrows - 2) * ncols - 1,
-                    cell + ncols - 1,
-                    cell - 1,
-                    cell - ncols,
-                    cell - ncols + 1,
-                ]
-            elif cell == cells_at_corners_of_grid[3]:  # NE corner
-                neighbor_ = [
-                    cell - ncols + 1,
-                    cell - nrows * ncols + 1,
-                    cell - (nrows - 1) * ncols,
-                    cell - (nrows - 1) * ncols - 1,
-                    cell - 1,
-                    cell - ncols - 1,
-                    cell - ncols,
-                    cell - 2 * ncols + 1,
-                ]
-            looped_cell_neighbors[cell] = neighbor_
-
-        return looped_cell_neighbors
+        return neighbor_row * ncols + neighbor_col
 
     @property
     @make_return_array_immutable
@@ -1782,26 +1712,19 @@ class RasterModelGrid(
         neighbors: Starts with E and goes counter clockwise
         """
         inf = self.looped_neighbors_at_cell
-        second_ring = np.empty([self.number_of_cells, 16], dtype=int)
         order = np.arange(-1, 15)
         order[0] = 15
-        for cell in range(0, self.number_of_cells):
-            cell1, cell2, cell3, cell4 = (
-                inf[cell][1],
-                inf[cell][3],
-                inf[cell][5],
-                inf[cell][7],
-            )
-            ring_tw = np.concatenate(
-                (
-                    inf[cell1][0:4],
-                    inf[cell2][2:6],
-                    inf[cell3][4:8],
-                    inf[cell4][6:8],
-                    inf[cell4][0:2],
-                )
-            )[order]
-            second_ring[cell] = ring_tw
+        cell1, cell2, cell3, cell4 = inf[:, 1], inf[:, 3], inf[:, 5], inf[:, 7]
+        second_ring = np.concatenate(
+            (
+                inf[cell1, 0:4],
+                inf[cell2, 2:6],
+                inf[cell3, 4:8],
+                inf[cell4, 6:8],
+                inf[cell4, 0:2],
+            ),
+            axis=1,
+        )[:, order]
 
         self._looped_second_ring_cell_neighbor_list_created = True
         return second_ring
@@ -2151,55 +2074,21 @@ class RasterModelGrid(
                 adjacency_method == "D4"
             ), "Method must be either 'D8'(default) or 'D4'"
 
-        # begin main code portion.
-        # initialize list of core nodes and new nodes
-        connected_nodes = list(outlet_id)
-        newNodes = connected_nodes
-
-        # keep track of the number of nodes added in the previous itteration.
-        numAdded = len(newNodes)
-
-        # continue running until no new nodes are added.
-        while numAdded > 0:
-
-            # find all potential new nodes by filtering the nodes connected to
-            # the most recent set of new nodes based on their status.
-            connected_orthogonal_nodes = self.adjacent_nodes_at_node[newNodes]
-            potentialNewNodes = list(
-                connected_orthogonal_nodes[
-                    self.status_at_node[connected_orthogonal_nodes]
-                    != self.BC_NODE_IS_CLOSED
-                ]
-            )
-
-            # if method is D8 (default), add the diagonal nodes.
-            if adjacency_method == "D8":
-                connected_diagonal_nodes = self.diagonal_adjacent_nodes_at_node[
-                    newNodes
-                ]
-                potentialNewNodes.extend(
-                    connected_diagonal_nodes[
-                        self.status_at_node[connected_diagonal_nodes]
-                        != self.BC_NODE_IS_CLOSED
-                    ]
-                )
+        # label the regions of open nodes that are connected to one another
+        # and keep only the one that contains the outlet.
+        from scipy.ndimage import label
 
-            # filter new nodes further based on if they are already present in
-            # the connected node list
-            newNodes = list(set(potentialNewNodes) - set(connected_nodes))
-            connected_nodes.extend(newNodes)
-
-            # update number added, when this is zero, the loop will end
-            numAdded = len(newNodes)
-
-        # create an array that identifies the nodes that should be closed
-        # of closed boundary nodes
-        not_connected = np.array((0 * self.status_at_node) + 1)
-        not_connected[np.array(connected_nodes)] = 0
+        is_open = (self.status_at_node != self.BC_NODE_IS_CLOSED).reshape(self.shape)
+        if adjacency_method == "D8":
+            structure = np.ones((3, 3), dtype=bool)
+        else:
+            structure = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool)
+        region, _ = label(is_open, structure=structure)
+        region = region.reshape(-1)
 
         # identify those nodes that should be closed, but are not yet closed.
-        is_not_connected_to_outlet = (self.status_at_node != self.BC_NODE_IS_CLOSED) & (
-            not_connected == 1
+        is_not_connected_to_outlet = is_open.reshape(-1) & (
+            region != region[outlet_id[0]]
         )
 
         # modify the node_data array to set those that are disconnected
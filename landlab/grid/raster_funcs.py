@@ -206,6 +206,62 @@ def _find_nearest_node_ndarray(rmg, coords, mode="raise"):
     return rmg.grid_coords_to_node_id(row_indices, column_indices, mode=mode)
 
 
+def nodes_within_radius(rmg, coord, radius):
+    """Find the nodes within some distance of a point.
+
+    Nodes are found by first selecting the window of rows and columns
+    that encloses the circle of radius *radius* about *coord* and then
+    keeping just those nodes of the window that are within the circle.
+    No temporary arrays larger than the window are created.
+
+    Parameters
+    ----------
+    rmg : RasterModelGrid
+        The source grid.
+    coord : tuple of float
+        Coordinates of point as (x, y).
+    radius : float
+        Search radius.
+
+    Returns
+    -------
+    ndarray of int
+        IDs of the nodes within the radius, in increasing order.
+
+    Examples
+    --------
+    >>> import landlab
+    >>> from landlab.grid.raster_funcs import nodes_within_radius
+    >>> rmg = landlab.RasterModelGrid((4, 5))
+    >>> nodes_within_radius(rmg, (2.0, 1.0), 1.0)
+    array([ 2,  6,  7,  8, 12])
+    >>> nodes_within_radius(rmg, (0.0, 0.0), 1.5)
+    array([0, 1, 5, 6])
+    >>> nodes_within_radius(rmg, (-5.0, 0.0), 1.5)
+    array([], dtype=int64)
+    """
+    x = (coord[0] - rmg.xy_of_lower_left[0]) / rmg.dx
+    y = (coord[1] - rmg.xy_of_lower_left[1]) / rmg.dy
+
+    col_start = max(int(np.ceil(x - radius / rmg.dx)) - 1, 0)
+    col_stop = min(int(np.floor(x + radius / rmg.dx)) + 2, rmg.number_of_node_columns)
+    row_start = max(int(np.ceil(y - radius / rmg.dy)) - 1, 0)
+    row_stop = min(int(np.floor(y + radius / rmg.dy)) + 2, rmg.number_of_node_rows)
+
+    if col_start >= col_stop or row_start >= row_stop:
+        return np.array([], dtype=int)
+
+    cols = np.arange(col_start, col_stop)
+    rows = np.arange(row_start, row_stop)
+    dx = (cols - x) * rmg.dx
+    dy = (rows - y) * rmg.dy
+
+    is_inside = dy[:, np.newaxis] ** 2 + dx[np.newaxis, :] ** 2 <= radius ** 2
+    rows, cols = np.nonzero(is_inside)
+
+    return (rows + row_start) * rmg.number_of_node_columns + cols + col_start
+
+
 def _value_is_in_bounds(value, bounds):
     """Check if a value is within bounds.
 
@@ -1791,58 +1791,49 @@ def calc_slope_at_node(
     """
     if method not in ("patch_mean", "Horn"):
         raise ValueError("method name not understood")
-    try:
-        patches_at_node = grid.patches_at_node()
-    except TypeError:  # was a property, not a fn (=> new style)
-        if not ignore_closed_nodes:
-            patches_at_node = np.ma.masked_where(
-                grid.patches_at_node == -1, grid.patches_at_node, copy=False
-            )
-        else:
-            patches_at_node = np.ma.masked_where(
-                np.logical_not(grid.patches_present_at_node),
-                grid.patches_at_node,
-                copy=False,
-            )
-    # now, we also want to mask any "closed" patches (any node closed)
+    # "closed" patches are those with any closed node
     closed_patches = (
         grid.status_at_node[grid.nodes_at_patch] == grid.BC_NODE_IS_CLOSED
     ).sum(axis=1) > 0
-    closed_patch_mask = np.logical_or(
-        patches_at_node.mask, closed_patches[patches_at_node.data]
-    )
 
     if method == "patch_mean":
-        n_TR, n_TL, n_BL, n_BR = grid.calc_unit_normals_at_patch_subtriangles(elevs)
-
-        mean_slope_at_patches = grid.calc_slope_at_patch(
-            elevs=elevs,
-            ignore_closed_nodes=ignore_closed_nodes,
-            subtriangle_unit_normals=(n_TR, n_TL, n_BL, n_BR),
-        )
+        from .ext.slope import calc_slope_at_raster_node
 
-        # now CAREFUL - patches_at_node is MASKED
-        slopes_at_node_unmasked = mean_slope_at_patches[patches_at_node]
-        slopes_at_node_masked = np.ma.array(
-            slopes_at_node_unmasked, mask=closed_patch_mask
+        try:
+            z = grid.at_node[elevs]
+        except TypeError:
+            z = elevs
+        slope_mag = grid.empty(at="node", dtype=float)
+        mean_grad_x = grid.empty(at="node", dtype=float)
+        mean_grad_y = grid.empty(at="node", dtype=float)
+        calc_slope_at_raster_node(
+            grid.shape,
+            np.ascontiguousarray(grid.x_of_node, dtype=float),
+            np.ascontiguousarray(grid.y_of_node, dtype=float),
+            np.ascontiguousarray(z, dtype=float),
+            np.logical_not(closed_patches).view(np.uint8),
+            slope_mag,
+            mean_grad_x,
+            mean_grad_y,
         )
-        slope_mag = np.mean(slopes_at_node_masked, axis=1).data
-        if return_components:
-            (x_slope_patches, y_slope_patches) = grid.calc_grad_at_patch(
-                elevs=elevs,
-                ignore_closed_nodes=ignore_closed_nodes,
-                subtriangle_unit_normals=(n_TR, n_TL, n_BL, n_BR),
-                slope_magnitude=mean_slope_at_patches,
-            )
-            x_slope_unmasked = x_slope_patches[patches_at_node]
-            x_slope_masked = np.ma.array(x_slope_unmasked, mask=closed_patch_mask)
-            x_slope = np.mean(x_slope_masked, axis=1).data
-            y_slope_unmasked = y_slope_patches[patches_at_node]
-            y_slope_masked = np.ma.array(y_slope_unmasked, mask=closed_patch_mask)
-            y_slope = np.mean(y_slope_masked, axis=1).data
-            mean_grad_x = x_slope
-            mean_grad_y = y_slope
     elif method == "Horn":
+        try:
+            patches_at_node = grid.patches_at_node()
+        except TypeError:  # was a property, not a fn (=> new style)
+            if not ignore_closed_nodes:
+                patches_at_node = np.ma.masked_where(
+                    grid.patches_at_node == -1, grid.patches_at_node, copy=False
+                )
+            else:
+                patches_at_node = np.ma.masked_where(
+                    np.logical_not(grid.patches_present_at_node),
+                    grid.patches_at_node,
+                    copy=False,
+                )
+        closed_patch_mask = np.logical_or(
+            patches_at_node.mask, closed_patches[patches_at_node.data]
+        )
+
         z = np.empty(grid.number_of_nodes + 1, dtype=float)
         mean_grad_x = grid.empty(at="node", dtype=float)
         mean_grad_y = grid.empty(at="node", dtype=float)
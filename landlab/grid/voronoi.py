@@ -121,6 +121,7 @@ class VoronoiDelaunayGrid(DualVoronoiGraph, ModelGrid):
         xy_of_reference=(0.0, 0.0),
         xy_axis_name=("x", "y"),
         xy_axis_units="-",
+        cache_dir=None,
     ):
         """Create a Voronoi Delaunay grid from a set of points.
 
@@ -138,6 +139,11 @@ class VoronoiDelaunayGrid(DualVoronoiGraph, ModelGrid):
         xy_of_reference : tuple, optional
             Coordinate value in projected space of (0., 0.)
             Default is (0., 0.)
+        cache_dir : str, optional
+            Directory in which to cache the graph of the grid. Building
+            the graph of a large grid can be slow, so if a grid with the
+            same nodes is created again, its graph is read from this
+            cache rather than rebuilt.
 
         Returns
         -------
@@ -153,7 +159,7 @@ class VoronoiDelaunayGrid(DualVoronoiGraph, ModelGrid):
         >>> vmg.number_of_nodes
         25
         """
-        DualVoronoiGraph.__init__(self, (y, x), sort=True)
+        DualVoronoiGraph.__init__(self, (y, x), sort=True, cache_dir=cache_dir)
         ModelGrid.__init__(
             self,
             xy_axis_name=xy_axis_name,
@@ -1,4 +1,7 @@
 """Modules that read/write ModelGrids from various file formats."""
+
+import sys
+
 from .esri_ascii import (
     BadHeaderLineError,
     DataSizeError,
@@ -12,7 +15,22 @@ from .esri_ascii import (
     read_esri_ascii,
     write_esri_ascii,
 )
-from .shapefile import read_shapefile
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        # Reading shapefiles requires pyshp, which is only imported when
+        # read_shapefile is first used.
+        if name == "read_shapefile":
+            from .shapefile import read_shapefile
+
+            return read_shapefile
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+
+else:  # pragma: no cover
+    from .shapefile import read_shapefile
 
 __all__ = [
     "read_esri_ascii",
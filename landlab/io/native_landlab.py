@@ -8,13 +8,24 @@ Read Landlab native
 
     ~landlab.io.native_landlab.load_grid
     ~landlab.io.native_landlab.save_grid
+    ~landlab.io.native_landlab.load_checkpoint
+    ~landlab.io.native_landlab.save_checkpoint
 """
 
+import glob
+import hashlib
+import io
 import os
 import pickle
 
+import numpy as np
+
 from landlab import ModelGrid
 
+_CHECKPOINT_VERSION = 1
+# Arrays smaller than this are stored within the checkpoint file itself.
+_CHECKPOINT_MIN_ARRAY_BYTES = 1024
+
 
 def save_grid(grid, path, clobber=False):
     """Save a grid and fields to a Landlab "native" format.
@@ -101,3 +112,235 @@ def load_grid(path):
         loaded_grid = pickle.load(file_like)
     assert issubclass(type(loaded_grid), ModelGrid)
     return loaded_grid
+
+
+def _array_digest(array):
+    """Hash the contents, type, and shape of an array."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(
+        repr((array.dtype.str, array.shape, np.isfortran(array))).encode("utf-8")
+    )
+    digest.update(np.ascontiguousarray(array).reshape(-1).view(np.uint8))
+    return digest.hexdigest()
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """Pickle objects, storing large arrays as content-addressed files.
+
+    Arrays are written to *array_dir* as ``<digest>.npy`` files, unless a
+    file with that digest already exists (that is, the array has not
+    changed since it was last saved).
+    """
+
+    def __init__(self, file_like, array_dir):
+        super().__init__(file_like, protocol=pickle.HIGHEST_PROTOCOL)
+        self._array_dir = array_dir
+        self._pids = {}
+        self._arrays = []
+        self.digests = set()
+        self.n_written = 0
+
+    def persistent_id(self, obj):
+        if (
+            type(obj) is not np.ndarray
+            or obj.dtype.hasobject
+            or obj.nbytes < _CHECKPOINT_MIN_ARRAY_BYTES
+        ):
+            return None
+        try:
+            return self._pids[id(obj)]
+        except KeyError:
+            pass
+
+        digest = _array_digest(obj)
+        path = os.path.join(self._array_dir, digest + ".npy")
+        if not os.path.exists(path):
+            with open(path + ".tmp", "wb") as fp:
+                np.save(fp, obj, allow_pickle=False)
+            os.replace(path + ".tmp", path)
+            self.n_written += 1
+        self.digests.add(digest)
+
+        # Arrays that are referenced more than once are restored as the
+        # same object, so objects that share an array still do so.
+        pid = (digest, len(self._pids), bool(obj.flags.writeable))
+        self._pids[id(obj)] = pid
+        self._arrays.append(obj)
+        return pid
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file_like, array_dir):
+        super().__init__(file_like)
+        self._array_dir = array_dir
+        self._arrays = {}
+
+    def persistent_load(self, pid):
+        digest, index, writeable = pid
+        try:
+            return self._arrays[index]
+        except KeyError:
+            array = np.load(os.path.join(self._array_dir, digest + ".npy"))
+            array.flags.writeable = writeable
+            self._arrays[index] = array
+            return array
+
+
+def _checkpoint_paths(path, name):
+    return os.path.join(path, name + ".checkpoint"), os.path.join(path, "arrays")
+
+
+def _read_checkpoint_header(file_like):
+    header = pickle.load(file_like)
+    if header.get("version") != _CHECKPOINT_VERSION:
+        raise ValueError(
+            "unsupported checkpoint version ({0})".format(header.get("version"))
+        )
+    return header
+
+
+def save_checkpoint(path, grid, components=(), name="checkpoint", prune=True):
+    """Save the state of a model run so that it can later be resumed.
+
+    A checkpoint consists of a grid, along with its fields, and any
+    number of components (or other objects, such as a
+    :class:`~landlab.data_record.DataRecord` or
+    :class:`~landlab.layers.EventLayers`) that operate on it. The state of
+    numpy's global random number generator is also saved.
+
+    Checkpoints are incremental. Arrays, whether they are fields or part of
+    an object's internal state, are stored in files named by their
+    contents, and so an array that has not changed since it was last saved
+    to *path* is not written again. Unlike
+    :func:`~landlab.io.native_landlab.save_grid`, then, saving a
+    checkpoint frequently during a long run only writes the values that
+    have changed.
+
+    Parameters
+    ----------
+    path : str
+        Directory in which to save checkpoints. It is created if it does
+        not exist.
+    grid : ModelGrid
+        The grid to save.
+    components : iterable, optional
+        Components, and other picklable objects, to save along with
+        the grid.
+    name : str, optional
+        Name of the checkpoint. A checkpoint with the same name is
+        replaced.
+    prune : bool, optional
+        If True, remove array files no longer used by any checkpoint
+        in *path*.
+
+    Returns
+    -------
+    int
+        The number of array files that were written.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import LinearDiffuser
+    >>> from landlab.io.native_landlab import load_checkpoint, save_checkpoint
+
+    >>> grid = RasterModelGrid((40, 50))
+    >>> z = grid.add_zeros("topographic__elevation", at="node")
+    >>> z[grid.core_nodes] = 1.0
+    >>> _ = grid.add_ones("soil__depth", at="node")
+    >>> diffuser = LinearDiffuser(grid, linear_diffusivity=0.1)
+
+    The first checkpoint writes all of the arrays.
+
+    >>> tmpdir = tempfile.TemporaryDirectory()
+    >>> n_written = save_checkpoint(tmpdir.name, grid, [diffuser])
+
+    Later checkpoints write only what has changed. Here, that's the
+    elevations (but not soil depths) along with some of the diffuser's
+    internal arrays.
+
+    >>> diffuser.run_one_step(1.0)
+    >>> 0 < save_checkpoint(tmpdir.name, grid, [diffuser]) < n_written
+    True
+    >>> save_checkpoint(tmpdir.name, grid, [diffuser])
+    0
+
+    Resume the run from the checkpoint.
+
+    >>> grid, (diffuser,) = load_checkpoint(tmpdir.name)
+    >>> diffuser.grid is grid
+    True
+    >>> diffuser.run_one_step(1.0)
+    >>> tmpdir.cleanup()
+    """
+    assert issubclass(type(grid), ModelGrid)
+
+    checkpoint_path, array_dir = _checkpoint_paths(path, name)
+    os.makedirs(array_dir, exist_ok=True)
+
+    payload = io.BytesIO()
+    pickler = _CheckpointPickler(payload, array_dir)
+    pickler.dump(
+        {
+            "grid": grid,
+            "components": list(components),
+            "random_state": np.random.get_state(),
+        }
+    )
+
+    # The header lists the array files that the checkpoint uses so that
+    # they can be found without unpickling the payload.
+    with open(checkpoint_path + ".tmp", "wb") as file_like:
+        pickle.dump(
+            {"version": _CHECKPOINT_VERSION, "arrays": sorted(pickler.digests)},
+            file_like,
+        )
+        file_like.write(payload.getbuffer())
+    os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+    if prune:
+        _prune_checkpoint_arrays(path)
+
+    return pickler.n_written
+
+
+def _prune_checkpoint_arrays(path):
+    """Remove array files not used by any of the checkpoints in *path*."""
+    in_use = set()
+    for checkpoint_path in glob.glob(os.path.join(path, "*.checkpoint")):
+        with open(checkpoint_path, "rb") as file_like:
+            in_use.update(_read_checkpoint_header(file_like)["arrays"])
+
+    for array_path in glob.glob(os.path.join(path, "arrays", "*.npy")):
+        if os.path.basename(array_path)[: -len(".npy")] not in in_use:
+            os.remove(array_path)
+
+
+def load_checkpoint(path, name="checkpoint"):
+    """Load a model run saved with :func:`save_checkpoint`.
+
+    The state of numpy's global random number generator is restored to
+    what it was when the checkpoint was saved.
+
+    Parameters
+    ----------
+    path : str
+        Directory that contains the checkpoint.
+    name : str, optional
+        Name of the checkpoint.
+
+    Returns
+    -------
+    (grid, components)
+        The saved grid and a list of the saved components, in the order
+        they were given to :func:`save_checkpoint`.
+    """
+    checkpoint_path, array_dir = _checkpoint_paths(path, name)
+    with open(checkpoint_path, "rb") as file_like:
+        _read_checkpoint_header(file_like)
+        payload = _CheckpointUnpickler(file_like, array_dir).load()
+
+    np.random.set_state(payload["random_state"])
+
+    return payload["grid"], payload["components"]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Functions to read shapefiles and create a NetworkModelGrid."""
+
 import pathlib
 
 import numpy as np
@@ -16,7 +17,7 @@ def _read_shapefile(file, dbf):
         file = str(file)
     try:
         sf = ps.Reader(file)
-    except ShapefileException:
+    except (ShapefileException, TypeError):
         try:
             sf = ps.Reader(shp=file, dbf=dbf)
         except ShapefileException:
@@ -37,14 +38,16 @@ def read_shapefile(
     link_field_dtype=None,
     node_field_dtype=None,
     threshold=0.0,
+    snap_tolerance=0.0,
 ):
     """Read shapefile and create a NetworkModelGrid.
 
     There are a number of assumptions that are requied about the shapefile.
         * The shape file must be a polyline shapefile.
-        * All polylines must be their own object (e.g. no multi-part
-          polylines).
-        * Polyline endpoints match perfectly.
+        * Polyline endpoints match perfectly, or to within *snap_tolerance*.
+
+    Each part of a multi-part polyline becomes its own link, and all of the
+    links from the same polyline share that polyline's attributes.
 
     You might notice that there is no ``write_shapefile`` function. If this is
     something you need for your work, please make a GitHub issue to start this
@@ -85,6 +88,14 @@ def read_shapefile(
         Maximum distance between a point in the point shapefile and a polyline
         junction in the polyline shapefile. Units are the same as in the
         shapefiles. Default is zero (requiring perfect overlap).
+    snap_tolerance: float, optional
+        Polyline endpoints that are closer together than this distance
+        are joined into a single node. Joining is transitive, so endpoints
+        farther apart than this distance are also joined if they are linked
+        through a chain of endpoints that are each within the distance of
+        the next. Units are the same as in the shapefiles. Default is zero
+        (requiring perfect overlap). A ValueError is raised if both ends of
+        a polyline are joined into the same node.
 
     Returns
     -------
@@ -214,136 +225,112 @@ def read_shapefile(
 
     # get record information, the first element is ('DeletionFlag', 'C', 1, 0)
     # which we will ignore.
-    records = sf.fields[1:]
-
-    # initialize data structures for node (x,y) tuples,
-    # link (head_node_id, tail_node_id) tuples, and a dictionary of at-link
-    # fields.
-    # besides the at-link fields on the shapefile, we'll also store an array of
-    # x and y of the full polyline segment'.
-
-    node_xy = []
-    links = []
-    fields = {rec[0]: [] for rec in records}
+    record_order = [rec[0] for rec in sf.fields[1:]]
 
     # store which link fields to retain
-    link_fields_to_retain = link_fields or list(fields.keys())
-    if store_polyline_vertices:
-        link_fields_to_retain.append("x_of_polyline")
-        link_fields_to_retain.append("y_of_polyline")
-    if store_polyline_vertices:
-        fields["x_of_polyline"] = []
-        fields["y_of_polyline"] = []
-
-    record_order = [rec[0] for rec in records]
-
-    # itterate through shapes and records
-    shapeRecs = sf.shapeRecords()
-    for sr in shapeRecs:
-
-        # if not a multi-part polyline:
-        if len(sr.shape.parts) == 1:
-
-            # get all the points on the polyline and deconstruct into x and y
-            points = sr.shape.points
-            x, y = zip(*points)
-
-            # construct the (x,y) tuples of the head and tail nodes of each
-            # polyline. Note here, that head and tail just refer to starting and
-            # ending, they will be re-oriented if necessary by landlab.
-
-            head_node_xy = (x[0], y[0])
-            tail_node_xy = (x[-1], y[-1])
-
-            # we should expect that the head node and tail node of later links will
-            # already be part of the model grid. So we check, and add the nodes,
-            # if they don't already exist.
-
-            if head_node_xy not in node_xy:
-                node_xy.append(head_node_xy)
-
-            if tail_node_xy not in node_xy:
-                node_xy.append(tail_node_xy)
-
-            # get the index of the head and tail node index.
-            head_node__node_id = node_xy.index(head_node_xy)
-            tail_node__node_id = node_xy.index(tail_node_xy)
-
-            # append the head and tail node ids to the link array
-            links.append((head_node__node_id, tail_node__node_id))
-
-            for i in range(len(sr.record)):
-                field_name = record_order[i]
-                fields[field_name].append(sr.record[i])
-
-            if store_polyline_vertices:
-                fields["x_of_polyline"].append(x)
-                fields["y_of_polyline"].append(y)
+    link_fields_to_retain = link_fields or list(record_order)
+
+    # Each part of a polyline becomes a link. Gather the vertices of each
+    # link, and the record that each link came from.
+    x_of_polyline, y_of_polyline, record_at_link = [], [], []
+    for record, shape in enumerate(sf.iterShapes()):
+        parts = list(shape.parts) + [len(shape.points)]
+        for start, stop in zip(parts[:-1], parts[1:]):
+            x, y = zip(*shape.points[start:stop])
+            x_of_polyline.append(x)
+            y_of_polyline.append(y)
+            record_at_link.append(record)
+    record_at_link = np.asarray(record_at_link, dtype=int)
+
+    # The head and tail nodes of each polyline. Note here, that head and
+    # tail just refer to starting and ending, they will be re-oriented if
+    # necessary by landlab.
+    xy_at_link_ends = np.empty((len(record_at_link), 2, 2), dtype=float)
+    xy_at_link_ends[:, 0, 0] = [x[0] for x in x_of_polyline]
+    xy_at_link_ends[:, 0, 1] = [y[0] for y in y_of_polyline]
+    xy_at_link_ends[:, 1, 0] = [x[-1] for x in x_of_polyline]
+    xy_at_link_ends[:, 1, 1] = [y[-1] for y in y_of_polyline]
+
+    node_xy, links = _unique_nodes(
+        xy_at_link_ends.reshape((-1, 2)), tolerance=snap_tolerance
+    )
+    links = links.reshape((-1, 2))
 
-        else:
-            raise ValueError(
-                (
-                    "landlab.io.shapefile currently does not support ",
-                    "reading multipart polyline shapefiles.",
+    is_loop = links[:, 0] == links[:, 1]
+    if np.any(is_loop):
+        raise ValueError(
+            (
+                "landlab.io.shapefile read requires that the ends of a "
+                "polyline are at different nodes. Both ends of the "
+                "polyline(s) with record(s) {records} are at the same node. "
+                "This may mean that snap_tolerance is too large.".format(
+                    records=", ".join(
+                        str(r) for r in np.unique(record_at_link[is_loop])
+                    )
                 )
             )
-
-    # Create a Network Model Grid.
-    x_of_node, y_of_node = zip(*node_xy)
+        )
 
     # We want to ensure that we maintain sorting, so start by creating an
     # unsorted network graph and sorting.
     # The sorting is important to ensure that the fields are assigned to
     # the correct links.
-    graph = NetworkGraph((y_of_node, x_of_node), links=links, sort=False)
+    # Sorting the graph also sorts the arrays it was created from, so give
+    # it copies.
+    graph = NetworkGraph(
+        (node_xy[:, 1].copy(), node_xy[:, 0].copy()), links=links, sort=False
+    )
     sorted_nodes, sorted_links, sorted_patches = graph.sort()
 
     # use the sorting information to make a new network model grid.
     grid = NetworkModelGrid(
-        (np.asarray(y_of_node)[sorted_nodes], np.asarray(x_of_node)[sorted_nodes]),
+        (node_xy[sorted_nodes, 1], node_xy[sorted_nodes, 0]),
         np.vstack((graph.node_at_link_head, graph.node_at_link_tail)).T,
     )
 
     # add values to fields.
-    for field_name in fields:
+    fields = _columns(sf.records(), record_order)
+    for field_name in record_order:
         if field_name in link_fields_to_retain:
             mapped_field_name = link_field_conversion.get(field_name, field_name)
             mapped_dtype = link_field_dtype.get(field_name, None)
             grid.at_link[mapped_field_name] = np.asarray(
                 fields[field_name], dtype=mapped_dtype
-            )[sorted_links]
+            )[record_at_link[sorted_links]]
+
+    if store_polyline_vertices:
+        grid.at_link["x_of_polyline"] = _as_polyline_array(x_of_polyline)[sorted_links]
+        grid.at_link["y_of_polyline"] = _as_polyline_array(y_of_polyline)[sorted_links]
 
     # if a points shapefile is added, bring in and use.
     if points_shapefile:
+        from scipy.spatial import cKDTree
+
         # get ready to store fields.
-        psf_records = psf.fields[1:]
-        psf_record_order = [rec[0] for rec in psf_records]
-        psf_fields = {rec[0]: [] for rec in psf_records}
+        psf_record_order = [rec[0] for rec in psf.fields[1:]]
 
         # store which node fields to retain
-        node_fields_to_retain = node_fields or list(psf_fields.keys())
+        node_fields_to_retain = node_fields or list(psf_record_order)
 
         # we don't need to store node xy, just need to store which index each
         # node maps to on the new grid.
         psf_node_mapping = -1 * np.ones(grid.x_of_node.shape, dtype=int)
 
-        # loop through each node
-        psf_shapeRecs = psf.shapeRecords()
-        for node_idx, sr in enumerate(psf_shapeRecs):
-            # find the closest
-            point_x = sr.shape.points[0][0]
-            point_y = sr.shape.points[0][1]
-            x_diff = grid.x_of_node - point_x
-            y_diff = grid.y_of_node - point_y
-
-            dist = np.sqrt(x_diff ** 2 + y_diff ** 2)
+        # find the closest node to each point
+        point_xy = np.asarray(
+            [shape.points[0] for shape in psf.iterShapes()], dtype=float
+        ).reshape((-1, 2))
+        dist, closest = cKDTree(
+            np.column_stack((grid.x_of_node, grid.y_of_node))
+        ).query(point_xy)
 
+        for node_idx, (point_x, point_y) in enumerate(point_xy):
             # check that the distance is small.
-            if np.min(dist) > threshold:
+            if dist[node_idx] > threshold:
                 msg = (
                     "landlab.io.shapefile: a point in the points shapefile "
                     "is {dist} away from the closet polyline junction in the ".format(
-                        dist=np.min(dist)
+                        dist=dist[node_idx]
                     ),
                     "polyline shapefile. This is larger than the threshold"
                     "value of {thresh}. This may mean that the threshold".format(
@@ -353,25 +340,21 @@ def read_shapefile(
                 )
                 raise ValueError(msg)
 
-            ind = np.nonzero(dist == np.min(dist))[0]
+            ind = closest[node_idx]
             # verify that there is only one closest.
 
-            if psf_node_mapping[ind[0]] >= 0:
+            if psf_node_mapping[ind] >= 0:
                 msg = (
                     "landlab.io.shapefile requires that the points file "
                     "have a 1-1 mapping to the polylines file. More than one "
                     "at-node point provided maps to the node with Landlab ID "
                     "{ind}, (x,y). This point has coordinates of ({x}, {y})".format(
-                        ind=ind[0], x=point_x, y=point_y
+                        ind=ind, x=point_x, y=point_y
                     )
                 )
                 raise ValueError(msg)
 
-            psf_node_mapping[ind[0]] = node_idx
-
-            for rec_idx in range(len(sr.record)):
-                field_name = psf_record_order[rec_idx]
-                psf_fields[field_name].append(sr.record[rec_idx])
+            psf_node_mapping[ind] = node_idx
 
         if np.any(psf_node_mapping < 0):
             msg = (
@@ -382,7 +365,8 @@ def read_shapefile(
             raise ValueError(msg)
 
         # add values to nodes.
-        for field_name in psf_fields:
+        psf_fields = _columns(psf.records(), psf_record_order)
+        for field_name in psf_record_order:
             if field_name in node_fields_to_retain:
                 mapped_field_name = node_field_conversion.get(field_name, field_name)
                 mapped_dtype = node_field_dtype.get(field_name, None)
@@ -392,3 +376,91 @@ def read_shapefile(
                 )[psf_node_mapping]
 
     return grid
+
+
+def _columns(records, names):
+    """Transpose a list of records into a dict of columns."""
+    if len(records) == 0:
+        return {name: [] for name in names}
+    return dict(zip(names, zip(*records)))
+
+
+def _as_polyline_array(vertices):
+    """Array of polyline vertices, one polyline per row.
+
+    If the polylines have different numbers of vertices, the array is
+    an object array of tuples.
+    """
+    if len(set(len(v) for v in vertices)) <= 1:
+        return np.asarray(vertices, dtype=float)
+    array = np.empty(len(vertices), dtype=object)
+    for i, v in enumerate(vertices):
+        array[i] = v
+    return array
+
+
+def _unique_nodes(xy, tolerance=0.0):
+    """Find the unique points in a set of points.
+
+    Parameters
+    ----------
+    xy : ndarray of float, shape (n_points, 2)
+        Coordinates of points.
+    tolerance : float, optional
+        Points closer than this are considered the same point. Points are
+        grouped transitively, so two points farther apart than this are
+        the same point if a chain of close points connects them.
+
+    Returns
+    -------
+    (unique_xy, node_at_point)
+        Coordinates of the unique points, in the order of their first
+        appearance in *xy*, and the index of the unique point that
+        each point maps to.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.shapefile.read_shapefile import _unique_nodes
+    >>> xy = np.array([[5.0, 5.0], [10.0, 10.0], [5.0, 0.0], [5.0, 5.0]])
+    >>> unique_xy, node_at_point = _unique_nodes(xy)
+    >>> unique_xy
+    array([[  5.,   5.],
+           [ 10.,  10.],
+           [  5.,   0.]])
+    >>> node_at_point
+    array([0, 1, 2, 0])
+
+    >>> xy[3] += 0.001
+    >>> _unique_nodes(xy)[1]
+    array([0, 1, 2, 3])
+    >>> _unique_nodes(xy, tolerance=0.01)[1]
+    array([0, 1, 2, 0])
+    """
+    _, first, label = np.unique(xy, axis=0, return_index=True, return_inverse=True)
+    label = label.reshape(-1)
+
+    if tolerance > 0.0 and len(first) > 1:
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+        from scipy.spatial import cKDTree
+
+        # Group points (and groups of points) that are within the tolerance
+        # of one another.
+        pairs = cKDTree(xy[first]).query_pairs(tolerance, output_type="ndarray")
+        adjacency = coo_matrix(
+            (np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])),
+            shape=(len(first), len(first)),
+        )
+        _, group = connected_components(adjacency, directed=False)
+
+        first_of_group = np.full(group.max() + 1, len(xy), dtype=int)
+        np.minimum.at(first_of_group, group, first)
+        first, label = first_of_group, group[label]
+
+    # Number the nodes in the order they first appear.
+    order = np.argsort(first)
+    node_at_label = np.empty_like(order)
+    node_at_label[order] = np.arange(len(order))
+
+    return xy[first[order]], node_at_label[label]
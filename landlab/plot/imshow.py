@@ -10,6 +10,8 @@ Plotting functions
     ~landlab.plot.imshow.imshow_grid_at_cell
     ~landlab.plot.imshow.imshow_grid_at_node
 """
+import weakref
+
 import numpy as np
 
 from landlab.grid.raster import RasterModelGrid
@@ -19,14 +21,18 @@ from ..field import FieldError
 
 try:
     import matplotlib.pyplot as plt
-    from matplotlib.patches import Polygon
-    from matplotlib.collections import PatchCollection, LineCollection
+    from matplotlib.collections import LineCollection, PolyCollection
 except ImportError:
     import warnings
 
     warnings.warn("matplotlib not found", ImportWarning)
 
 
+# Geometry used to draw irregular grids, keyed by grid.
+_cell_polygons_of_grid = weakref.WeakKeyDictionary()
+_cell_at_pixel_of_grid = weakref.WeakKeyDictionary()
+
+
 def imshow_grid_at_node(grid, values, **kwds):
     """imshow_grid_at_node(grid, values, plot_name=None, var_name=None,
     var_units=None, grid_units=None, symmetric_cbar=False, cmap='pink',
@@ -100,6 +106,15 @@ def imshow_grid_at_node(grid, values, **kwds):
         If True, and grid is a Voronoi, the faces will be plotted in black
         along with just the colour of the cell, defining the cell outlines
         (defaults False).
+    resolution : int, "auto" or None
+        If given, draw the grid as an image with at most this many pixels
+        along either axis rather than drawing every cell. Irregular grids are
+        rasterized once and the result reused by later calls for the same
+        grid. If "auto", use the pixel size of the current figure. The
+        default, None, draws every cell.
+    reducer : {"mean", "max"}
+        How raster values are combined into a pixel when *resolution* is
+        less than the number of rows or columns of the grid.
     output : None, string, or bool
         If None (or False), the image is sent to the imaging buffer to await
         an explicit call to show() or savefig() from outside this function.
@@ -193,6 +208,15 @@ def imshow_grid_at_cell(grid, values, **kwds):
         If True, and grid is a Voronoi, the faces will be plotted in black
         along with just the colour of the cell, defining the cell outlines
         (defaults False).
+    resolution : int, "auto" or None
+        If given, draw the grid as an image with at most this many pixels
+        along either axis rather than drawing every cell. Irregular grids are
+        rasterized once and the result reused by later calls for the same
+        grid. If "auto", use the pixel size of the current figure. The
+        default, None, draws every cell.
+    reducer : {"mean", "max"}
+        How raster values are combined into a pixel when *resolution* is
+        less than the number of rows or columns of the grid.
     output : None, string, or bool
         If None (or False), the image is sent to the imaging buffer to await
         an explicit call to show() or savefig() from outside this function.
@@ -260,9 +284,16 @@ def _imshow_grid_values(
     color_for_background=None,
     show_elements=False,
     output=None,
+    resolution=None,
+    reducer="mean",
 ):
     cmap = plt.get_cmap(cmap)
 
+    if resolution == "auto":
+        resolution = int(max(plt.gcf().get_size_inches() * plt.gcf().dpi))
+    if reducer not in ("mean", "max"):
+        raise ValueError("reducer not understood ({0})".format(reducer))
+
     if color_for_closed is not None:
         cmap.set_bad(color=color_for_closed)
     else:
@@ -285,6 +316,7 @@ def _imshow_grid_values(
 
         kwds = dict(cmap=cmap)
         (kwds["vmin"], kwds["vmax"]) = (values.min(), values.max())
+
         if (limits is None) and ((vmin is None) and (vmax is None)):
             if symmetric_cbar:
                 (var_min, var_max) = (values.min(), values.max())
@@ -298,6 +330,13 @@ def _imshow_grid_values(
             if vmax is not None:
                 kwds["vmax"] = vmax
 
+        if resolution is not None:
+            step = -(-max(values.shape) // resolution)
+            if step > 1:
+                values = _block_reduce(values, step, reducer)
+                y = np.append(y[:-1:step], y[-1])
+                x = np.append(x[:-1:step], x[-1])
+
         myimage = plt.pcolormesh(x, y, values, **kwds)
         myimage.set_rasterized(True)
         plt.gca().set_aspect(1.0)
@@ -325,23 +364,21 @@ def _imshow_grid_values(
         scalarMap = cmx.ScalarMappable(norm=cNorm, cmap=cmap)
         colorVal = scalarMap.to_rgba(values)[grid.node_at_cell]
 
-        patches = []
-
-        for corners in grid.corners_at_cell:
-            valid_corners = corners[corners != grid.BAD_INDEX]
-            closed_loop_corners = np.concatenate([valid_corners, [valid_corners[0]]])
-
-            x = grid.x_of_corner[closed_loop_corners]
-            y = grid.y_of_corner[closed_loop_corners]
-            xy = np.vstack((x, y)).T
-            patches.append(Polygon(xy, closed=True, fill=True))
-
-        patchcollection = PatchCollection(
-            patches, facecolor=colorVal, edgecolor=colorVal
-        )
-
         ax = plt.gca()
-        ax.add_collection(patchcollection)
+
+        if resolution is None:
+            ax.add_collection(
+                PolyCollection(
+                    _cell_polygons(grid), facecolor=colorVal, edgecolor=colorVal
+                )
+            )
+        else:
+            cell_at_pixel, extent = _cell_at_pixel(grid, resolution)
+            rgba = colorVal[cell_at_pixel]
+            rgba[cell_at_pixel == -1] = 0.0
+            ax.imshow(
+                rgba, extent=extent, origin="lower", interpolation="nearest"
+            )
 
         if show_elements:
             x = grid.x_of_corner[grid.corners_at_face]
@@ -403,6 +440,104 @@ def _imshow_grid_values(
             plt.show()
 
 
+def _block_reduce(values, step, reducer):
+    """Reduce blocks of *step* by *step* raster values to a single value.
+
+    Blocks along the top and right edges may be smaller than the others.
+    Masked values are ignored and blocks of only masked values are masked.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.plot.imshow import _block_reduce
+    >>> values = np.arange(15.0).reshape((3, 5))
+    >>> _block_reduce(values, 2, "mean").data
+    array([[  3. ,   5. ,   6.5],
+           [ 10.5,  12.5,  14. ]])
+    >>> _block_reduce(values, 2, "max").data
+    array([[  6.,   8.,   9.],
+           [ 11.,  13.,  14.]])
+    """
+    values = np.ma.asarray(values)
+    shape = (-(-values.shape[0] // step), -(-values.shape[1] // step))
+
+    blocks = np.ma.masked_all((shape[0] * step, shape[1] * step), dtype=float)
+    blocks[: values.shape[0], : values.shape[1]] = values
+    blocks = blocks.reshape((shape[0], step, shape[1], step))
+
+    return getattr(blocks, reducer)(axis=(1, 3))
+
+
+def _cell_polygons(grid):
+    """Polygons of the cells of a grid, as lists of vertices."""
+    try:
+        return _cell_polygons_of_grid[grid]
+    except KeyError:
+        pass
+
+    polygons = []
+    for corners in grid.corners_at_cell:
+        valid_corners = corners[corners != grid.BAD_INDEX]
+        polygons.append(
+            np.column_stack(
+                (grid.x_of_corner[valid_corners], grid.y_of_corner[valid_corners])
+            )
+        )
+    _cell_polygons_of_grid[grid] = polygons
+
+    return polygons
+
+
+def _cell_at_pixel(grid, resolution):
+    """Rasterize the cells of an irregular grid.
+
+    Pixels cover the extent of the grid nodes with at most *resolution*
+    pixels along either axis. Each pixel is given the cell that contains
+    its center, which, as cells are Voronoi polygons, is the cell of the
+    nearest node, or -1 if the nearest node has no cell.
+
+    Returns
+    -------
+    (ndarray of int, tuple of float)
+        The cell at each pixel, and the extent of the image as
+        (*left*, *right*, *bottom*, *top*).
+    """
+    from scipy.spatial import cKDTree
+
+    cached = _cell_at_pixel_of_grid.setdefault(grid, {})
+    try:
+        return cached[resolution]
+    except KeyError:
+        pass
+
+    extent = (
+        grid.x_of_node.min(),
+        grid.x_of_node.max(),
+        grid.y_of_node.min(),
+        grid.y_of_node.max(),
+    )
+    width, height = extent[1] - extent[0], extent[3] - extent[2]
+    if width >= height:
+        shape = (max(int(round(resolution * height / width)), 1), resolution)
+    else:
+        shape = (resolution, max(int(round(resolution * width / height)), 1))
+
+    y, x = np.meshgrid(
+        extent[2] + (np.arange(shape[0]) + 0.5) * height / shape[0],
+        extent[0] + (np.arange(shape[1]) + 0.5) * width / shape[1],
+        indexing="ij",
+    )
+    _, node_at_pixel = cKDTree(grid.xy_of_node).query(
+        np.column_stack((x.reshape(-1), y.reshape(-1)))
+    )
+    cell_at_pixel = grid.cell_at_node[node_at_pixel].reshape(shape)
+    cell_at_pixel[cell_at_pixel == grid.BAD_INDEX] = -1
+
+    cached[resolution] = (cell_at_pixel, extent)
+
+    return cell_at_pixel, extent
+
+
 def imshow_grid(grid, values, **kwds):
     """imshow_grid(grid, values, plot_name=None, var_name=None, var_units=None,
     grid_units=None, symmetric_cbar=False, cmap='pink', limits=(values.min(),
@@ -478,6 +613,15 @@ def imshow_grid(grid, values, **kwds):
         If True, and grid is a Voronoi, the faces will be plotted in black
         along with just the colour of the cell, defining the cell outlines
         (defaults False).
+    resolution : int, "auto" or None
+        If given, draw the grid as an image with at most this many pixels
+        along either axis rather than drawing every cell. Irregular grids are
+        rasterized once and the result reused by later calls for the same
+        grid. If "auto", use the pixel size of the current figure. The
+        default, None, draws every cell.
+    reducer : {"mean", "max"}
+        How raster values are combined into a pixel when *resolution* is
+        less than the number of rows or columns of the grid.
     output : None, string, or bool
         If None (or False), the image is sent to the imaging buffer to await
         an explicit call to show() or savefig() from outside this function.
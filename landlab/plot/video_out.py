@@ -13,9 +13,11 @@ Initialize the video object vid at the start of your code, then simply call
 vid.add_frame(grid, data) each time you want to add a frame. At the end of
 the model run, call vid.produce_video().
 
-CAUTION: This component may prove *very* memory-intensive. It is recommended
-that the total number of frames included in the output multiplied by the
-number of pixels (nodes) in the image not exceed XXXXXXXXX.
+Frames are not held in memory. As they are added, they are written to a
+temporary file (in *buffer_dir*, if given) that is read back, as a
+memory-mapped array, when the video is produced. Frames are then rendered
+by a pool of worker processes and passed, in order, to the movie writer as
+they become available.
 
 Due to some issues with codecs in matplotlib, at the moment on .gif output
 movies are recommended. If this irritates you, you can modify your own
@@ -23,12 +25,20 @@ PYTHONPATH to allow .mp4 compilation (try a google search for the warning
 raised by this method for some hints). These (known) issues are apparently
 likely to resolve themselves in a future release of matplotlib.
 """
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
 import matplotlib.animation as animation
 import matplotlib.pyplot as plt
 import numpy as np
 
 from landlab.plot import imshow
 
+_renderer = None
+
 
 class VideoPlotter(object):
 
@@ -48,9 +58,20 @@ class VideoPlotter(object):
         Model time at which filming stops.
     step : float, optional
         Model time frequency at which frames are made.
+    buffer_dir : str, optional
+        Directory in which to keep frames until the video is produced. The
+        default is the system's temporary directory.
     """
 
-    def __init__(self, grid, data_centering="node", start=None, stop=None, step=None):
+    def __init__(
+        self,
+        grid,
+        data_centering="node",
+        start=None,
+        stop=None,
+        step=None,
+        buffer_dir=None,
+    ):
         """Create Landlab movies.
 
         Parameters
@@ -65,10 +86,12 @@ class VideoPlotter(object):
             Model time at which filming stops.
         step : float, optional
             Model time frequency at which frames are made.
+        buffer_dir : str, optional
+            Directory in which to keep frames until the video is produced.
         """
-        self.initialize(grid, data_centering, start, stop, step)
+        self.initialize(grid, data_centering, start, stop, step, buffer_dir=buffer_dir)
 
-    def initialize(self, grid, data_centering, start, stop, step):
+    def initialize(self, grid, data_centering, start, stop, step, buffer_dir=None):
         """Set up the plotter.
 
         A copy of the grid is required.
@@ -92,6 +115,8 @@ class VideoPlotter(object):
             Model time at which filming stops.
         step : float
             Model time frequency at which frames are made.
+        buffer_dir : str, optional
+            Directory in which to keep frames until the video is produced.
         """
         options_for_data_centering = ["node", "cell"]
 
@@ -99,8 +124,9 @@ class VideoPlotter(object):
             raise ValueError("data_centering not valid")
 
         self.grid = grid
-        # self.image_list = []
-        self.data_list = []
+        self._buffer_dir = buffer_dir
+        self._buffer = None
+        self.clear_module()
 
         # this controls the intervals at which to plot
         self.last_remainder = float("inf")
@@ -117,11 +143,24 @@ class VideoPlotter(object):
             self.plotfunc = imshow.imshow_grid_at_node
         elif data_centering == "cell":
             self.centering = "c"
-            self.plotfunc = imshow.imshow_cell_grid
+            self.plotfunc = imshow.imshow_grid_at_cell
 
         self.randomized_name = "my_animation_" + str(int(np.random.random() * 10000))
         self.fig = plt.figure(self.randomized_name)  # randomized name
 
+    @property
+    def data_list(self):
+        """The frames added so far, as a read-only memory-mapped array."""
+        if self._n_frames == 0:
+            return []
+        self._buffer.flush()
+        return np.memmap(
+            self._buffer,
+            dtype=self._frame_dtype,
+            mode="r",
+            shape=(self._n_frames,) + self._frame_shape,
+        )
+
     def add_frame(self, grid, data, elapsed_t, **kwds):
         """Add a frame to the video.
 
@@ -156,7 +195,7 @@ class VideoPlotter(object):
         if self.step_control_tuple[0] <= elapsed_t < self.step_control_tuple[1]:
             if not self.step_control_tuple[2]:  # no step provided
                 print("Adding frame to video at elapsed time %f" % elapsed_t)
-                self.data_list.append(data_in.copy())
+                self._write_frame(data_in)
             else:
                 excess_fraction = normalized_elapsed_t % self.step_control_tuple[2]
                 # Problems with rounding errors make this double check
@@ -165,16 +204,45 @@ class VideoPlotter(object):
                     excess_fraction, self.step_control_tuple[2]
                 ):
                     print("Adding frame to video at elapsed time %f" % elapsed_t)
-                    self.data_list.append(data_in.copy())
+                    self._write_frame(data_in)
                 self.last_remainder = excess_fraction
         self.last_t = elapsed_t
 
+    def _write_frame(self, data):
+        """Append a frame to the frame buffer and update the data limits."""
+        data = np.asarray(data)
+
+        if self._n_frames == 0:
+            self._buffer = tempfile.TemporaryFile(
+                prefix="landlab_video_", dir=self._buffer_dir
+            )
+            self._frame_shape = data.shape
+            self._frame_dtype = data.dtype
+        elif data.shape != self._frame_shape:
+            raise ValueError(
+                "frame shape mismatch ({0} != {1})".format(
+                    data.shape, self._frame_shape
+                )
+            )
+
+        self._buffer.write(
+            np.ascontiguousarray(data, dtype=self._frame_dtype).tobytes()
+        )
+        self._n_frames += 1
+
+        self._data_limits = (
+            min(self._data_limits[0], np.amin(data)),
+            max(self._data_limits[1], np.amax(data)),
+        )
+
     def produce_video(
         self,
         interval=200,
         repeat_delay=2000,
         filename="video_output.gif",
         override_min_max=None,
+        processes=None,
+        writer=None,
     ):
         """Finalize and save the video of the data.
 
@@ -183,66 +251,89 @@ class VideoPlotter(object):
         interval : int, optional
             Interval between frames in milliseconds.
         repeat_delay : int, optional
-            Repeat delay before restart in milliseconds.
+            Repeat delay before restart in milliseconds. This is not used
+            when writing to a file.
         filename : str, optional
             Name of the file to save in the present working directory. At
             present, only *.gifs* will implement reliably without
             tweaking Python's PATHs.
         override_min_max : tuple of float
             Minimum and maximum for the scale on the plot as (*min*, *max*).
+        processes : int, optional
+            Number of processes that render frames. The default is the
+            number of CPUs. If 1, frames are rendered in the current process.
+        writer : MovieWriter or str, optional
+            The movie writer, or the name of one, used to encode the frames.
+            The default is matplotlib's ``animation.writer`` if it is
+            available and, otherwise, pillow.
         """
         print("Assembling video output, may take a while...")
-        plt.figure(self.randomized_name)
+        if self._n_frames == 0:
+            raise ValueError("Animation must have at least one frame.")
+
         # find the limits for the plot:
         if not override_min_max:
-            self.min_limit = np.amin(self.data_list[0])
-            self.max_limit = np.amax(self.data_list[0])
-
-            if len(self.data_list) <= 1:
+            if self._n_frames <= 1:
                 raise ValueError("Animation must have at least one frame.")
-
-            # assumes there is more than one frame in the loop
-            for i in self.data_list[1:]:
-                self.min_limit = min((self.min_limit, np.amin(i)))
-                self.max_limit = max((self.max_limit, np.amax(i)))
+            self.min_limit, self.max_limit = self._data_limits
         else:
             self.min_limit = override_min_max[0]
             self.max_limit = override_min_max[1]
 
-        self.fig.colorbar(
-            self.plotfunc(
-                self.grid,
-                self.data_list[0],
-                limits=(self.min_limit, self.max_limit),
-                allow_colorbar=False,
-                **self.kwds
-            )
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        writer = _get_writer(writer, fps=1000.0 / interval)
+
+        # Frames are rendered on figures with the size of this one, and
+        # then drawn, pixel for pixel, onto this figure to be encoded.
+        figsize, dpi = tuple(self.fig.get_size_inches()), self.fig.dpi
+        self.fig.clf()
+        ax = self.fig.add_axes([0.0, 0.0, 1.0, 1.0])
+        ax.set_axis_off()
+        image = None
+
+        with writer.saving(self.fig, filename, dpi):
+            for rgba in self._rendered_frames(figsize, dpi, processes):
+                if image is None:
+                    image = ax.imshow(rgba, interpolation="none")
+                else:
+                    image.set_data(rgba)
+                writer.grab_frame()
+        plt.close(self.fig)
+
+    def _rendered_frames(self, figsize, dpi, processes):
+        """Render frames, in order, as RGBA arrays."""
+        renderer_args = (
+            self.grid,
+            self.plotfunc,
+            (self.min_limit, self.max_limit),
+            self.kwds,
+            figsize,
+            dpi,
         )
-
-        ani = animation.FuncAnimation(
-            self.fig,
-            _make_image,
-            frames=self._yield_image,
-            interval=interval,
-            blit=True,
-            repeat_delay=repeat_delay,
-        )
-        ani.save(filename, fps=1000.0 / interval)
-        plt.close()
-
-    def _yield_image(self):
-        """Helper function designed to generate image_list items for plotting,
-        rather than storing them all."""
-
-        for i in self.data_list:
-            # yield self.grid.node_vector_to_raster(i)
-            yield (
-                i,
-                self.plotfunc,
-                (self.min_limit, self.max_limit),
-                self.grid,
-                self.kwds,
-            )
+        frames = self.data_list
+
+        if processes == 1:
+            renderer = _FrameRenderer(*renderer_args)
+            for frame in frames:
+                yield renderer.render(frame)
+            return
+
+        # Keep only a few frames in flight so that memory use doesn't grow
+        # with the length of the video.
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_renderer,
+            initargs=renderer_args,
+        ) as pool:
+            pending = deque()
+            for frame in frames:
+                pending.append(pool.submit(_render_frame, np.array(frame)))
+                if len(pending) > 2 * processes:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
     def clear_module(self):
         """Clear internally held data.
@@ -250,16 +341,54 @@ class VideoPlotter(object):
         Wipe all internally held data that would cause trouble if module
         were to be rerun without being reinstantiated.
         """
-        self.data_list = []
-
-
-def _make_image(yielded_tuple):
-    yielded_raster_data = yielded_tuple[0]
-    plotfunc = yielded_tuple[1]
-    limits_in = yielded_tuple[2]
-    grid = yielded_tuple[3]
-    kwds = yielded_tuple[4]
-    im = plotfunc(
-        grid, yielded_raster_data, limits=limits_in, allow_colorbar=False, **kwds
-    )
-    return im
+        if self._buffer is not None:
+            self._buffer.close()
+        self._buffer = None
+        self._n_frames = 0
+        self._frame_shape = None
+        self._frame_dtype = None
+        self._data_limits = (np.inf, -np.inf)
+
+
+class _FrameRenderer(object):
+    """Render frames as RGBA arrays on figures of a given size."""
+
+    def __init__(self, grid, plotfunc, limits, kwds, figsize, dpi):
+        self._grid = grid
+        self._plotfunc = plotfunc
+        self._limits = limits
+        self._kwds = dict(kwds)
+        self._kwds.setdefault("allow_colorbar", True)
+        self._figsize = figsize
+        self._dpi = dpi
+
+    def render(self, data):
+        fig = plt.figure(figsize=self._figsize, dpi=self._dpi)
+        try:
+            self._plotfunc(self._grid, data, limits=self._limits, **self._kwds)
+            fig.canvas.draw()
+            rgba = np.array(fig.canvas.buffer_rgba())
+        finally:
+            plt.close(fig)
+        return rgba
+
+
+def _init_renderer(*args):
+    global _renderer
+    plt.switch_backend("agg")
+    _renderer = _FrameRenderer(*args)
+
+
+def _render_frame(data):
+    return _renderer.render(data)
+
+
+def _get_writer(writer, fps):
+    """Get a movie writer, by name or the default, that writes at *fps*."""
+    if writer is None:
+        writer = matplotlib.rcParams["animation.writer"]
+        if not animation.writers.is_available(writer):
+            writer = "pillow"
+    if isinstance(writer, str):
+        writer = animation.writers[writer](fps=fps)
+    return writer
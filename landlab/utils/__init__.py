@@ -5,6 +5,7 @@ from .add_halo import add_halo
 # import landlab.utils.count_repeats
 # from landlab.utils.count_repeats import count_repeats
 from .count_repeats import count_repeated_values
+from .ensemble import run_ensemble
 from .return_array import return_array_at_link, return_array_at_node
 from .source_tracking_algorithm import (
     convert_arc_flow_directions_to_landlab_node_ids,
@@ -34,4 +35,5 @@ __all__ = [
     "StablePriorityQueue",
     "return_array_at_node",
     "return_array_at_link",
+    "run_ensemble",
 ]
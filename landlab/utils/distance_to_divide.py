@@ -4,6 +4,8 @@ import numpy as np
 
 from landlab import FieldError, RasterModelGrid
 
+from .ext.stack_propagation import propagate_extreme_sum_downstream
+
 
 def calculate_distance_to_divide(
     grid, longest_path=True, add_to_grid=False, clobber=False
@@ -178,56 +180,26 @@ def calculate_distance_to_divide(
     if not longest_path:
         distance_to_divide[:] = 2 * grid.size("node") * np.max(flow_link_lengths)
 
+    # if drainage are is equal to node cell area, set distance to zeros
+    # this should handle the drainage divide cells as boundary cells have
+    # their area set to zero.
+    is_divide = drainage_area == grid.cell_area_at_node
+
+    # route-to-one is handled as route-to-multiple with a single receiver.
+    if to_one:
+        flow__receiver_node = flow__receiver_node.reshape((-1, 1))
+        flow_link_lengths = flow_link_lengths.reshape((-1, 1))
+
     # iterate through the flow__upstream_node_order backwards.
-    for node in reversed(flow__upstream_node_order):
-
-        # if drainage are is equal to node cell area, set distance to zeros
-        # this should handle the drainage divide cells as boundary cells have
-        # their area set to zero.
-        if drainage_area[node] == grid.cell_area_at_node[node]:
-            distance_to_divide[node] = 0
-
-        # get flow recievers
-        reciever = flow__receiver_node[node]
-
-        if to_one:
-            # if not processing an outlet node.
-            if reciever != node:
-
-                if longest_path:
-                    cond = (
-                        distance_to_divide[reciever]
-                        < distance_to_divide[node] + flow_link_lengths[node]
-                    )
-                else:
-                    cond = (
-                        distance_to_divide[reciever]
-                        > distance_to_divide[node] + flow_link_lengths[node]
-                    )
-
-                if cond:
-                    distance_to_divide[reciever] = (
-                        distance_to_divide[node] + flow_link_lengths[node]
-                    )
-
-        else:
-            # non-existant links are coded with -1
-            useable_receivers = np.where(reciever != grid.BAD_INDEX)[0]
-
-            for idx in range(len(useable_receivers)):
-                r = reciever[useable_receivers][idx]
-                fll = flow_link_lengths[node][useable_receivers][idx]
-
-                # if not processing an outlet node.
-                if r != node:
-
-                    if longest_path:
-                        cond = distance_to_divide[r] < distance_to_divide[node] + fll
-                    else:
-                        cond = distance_to_divide[r] > distance_to_divide[node] + fll
-
-                    if cond:
-                        distance_to_divide[r] = distance_to_divide[node] + fll
+    propagate_extreme_sum_downstream(
+        np.asarray(flow__upstream_node_order, dtype=int),
+        np.asarray(flow__receiver_node, dtype=int),
+        np.asarray(flow_link_lengths, dtype=float),
+        is_divide.view(np.uint8),
+        distance_to_divide,
+        grid.BAD_INDEX,
+        longest=longest_path,
+    )
 
     # store on the grid
     if add_to_grid:
@@ -0,0 +1,344 @@
+#! /usr/bin/env python
+"""Run an ensemble of model realizations that share a single grid.
+
+Parameter studies typically run the same component chain, on the same grid,
+many times over with different parameter values. Rather than having every
+realization rebuild the grid from scratch, :func:`run_ensemble` builds the
+grid once, places the arrays that describe its graph (node coordinates and
+the node/link/patch connectivity) into shared memory, and has a pool of
+worker processes attach to that memory. Each worker keeps its own copy of
+the grid for all of the members it runs, so connectivity arrays that are
+derived lazily from the graph are also only computed once per worker. The
+requested output fields of each member are gathered into a single
+:class:`xarray.Dataset` stacked along a *member* dimension.
+"""
+
+import gc
+import io
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+
+import numpy as np
+import xarray as xr
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+
+_worker = None
+
+
+def run_ensemble(
+    grid, run_member, members, names, at="node", processes=None, path=None
+):
+    """Run a model for each member of an ensemble and stack the output.
+
+    Parameters
+    ----------
+    grid : ModelGrid, str or dict
+        The grid that all members share. If not a grid, it is passed to
+        :func:`~landlab.grid.create.create_grid` to build one. Fields
+        and boundary conditions of *grid* provide the initial state of
+        every member.
+    run_member : callable
+        Function, called as ``run_member(grid, **params)``, that runs one
+        member on *grid*. It must be picklable (that is, defined at the
+        top level of a module) so that it can be sent to worker processes.
+    members : iterable of dict
+        Keyword parameters for each member.
+    names : str or iterable of str
+        Names of the fields to collect from each member once it has run.
+    at : str, optional
+        Grid location of the fields to collect.
+    processes : int, optional
+        Number of worker processes. The default is the number of CPUs. If
+        1, members are run one after another in the current process.
+    path : str, optional
+        If given, also write the stacked output to this netCDF file.
+
+    Returns
+    -------
+    xarray.Dataset
+        The collected fields, each with dimensions ``("member", at)``.
+        Member parameters that are scalars are included as variables along
+        the *member* dimension.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.utils.ensemble import run_ensemble
+
+    >>> grid = RasterModelGrid((3, 4))
+    >>> _ = grid.add_zeros("topographic__elevation", at="node")
+
+    The function that runs each member would normally set up and run
+    a chain of components. Here it simply raises the core nodes.
+
+    >>> def uplift(grid, rate=0.0):
+    ...     grid.at_node["topographic__elevation"][grid.core_nodes] += rate
+
+    >>> ds = run_ensemble(
+    ...     grid,
+    ...     uplift,
+    ...     [{"rate": 1.0}, {"rate": 2.0}],
+    ...     "topographic__elevation",
+    ...     processes=1,
+    ... )
+    >>> ds["rate"].values
+    array([ 1.,  2.])
+    >>> ds["topographic__elevation"].values.reshape((2, 3, 4))
+    array([[[ 0.,  0.,  0.,  0.],
+            [ 0.,  1.,  1.,  0.],
+            [ 0.,  0.,  0.,  0.]],
+    <BLANKLINE>
+           [[ 0.,  0.,  0.,  0.],
+            [ 0.,  2.,  2.,  0.],
+            [ 0.,  0.,  0.,  0.]]])
+
+    Members always start from the state of the original grid.
+
+    >>> grid.at_node["topographic__elevation"].max()
+    0.0
+    """
+    from ..grid.base import ModelGrid
+
+    if not isinstance(grid, ModelGrid):
+        from ..grid.create import create_grid
+
+        grid = create_grid(grid)
+    if isinstance(names, str):
+        names = [names]
+    names = list(names)
+    members = [dict(params) for params in members]
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    blocks = []
+    try:
+        grid_bytes = _dumps_with_shared_graph(grid, blocks)
+        if processes == 1 or len(members) <= 1:
+            with _EnsembleWorker(grid_bytes) as worker:
+                outputs = [
+                    worker.run(run_member, params, names, at) for params in members
+                ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(processes, len(members)),
+                initializer=_init_worker,
+                initargs=(grid_bytes,),
+            ) as pool:
+                outputs = list(
+                    pool.map(
+                        _run_member,
+                        [run_member] * len(members),
+                        members,
+                        [names] * len(members),
+                        [at] * len(members),
+                    )
+                )
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    ds = _stack_outputs(grid, outputs, members, names, at)
+    if path is not None:
+        ds.to_netcdf(path)
+    return ds
+
+
+def _stack_outputs(grid, outputs, members, names, at):
+    """Gather the output of all members into a single dataset."""
+    data_vars = {}
+    for name in names:
+        data_vars[name] = (
+            ("member", at),
+            np.stack([output[name] for output in outputs]),
+            {"units": grid.field_units(at, name)} if grid.has_field(at, name) else {},
+        )
+    for key in sorted(set().union(*members)) if members else []:
+        values = [params.get(key) for params in members]
+        if all(np.isscalar(value) for value in values) and key not in data_vars:
+            data_vars[key] = (("member",), np.asarray(values))
+
+    return xr.Dataset(data_vars, coords={"member": np.arange(len(members))})
+
+
+def _graphs_of(grid):
+    """Iterate over the graphs (a grid and its dual) that make up a grid."""
+    yield grid
+    dual = getattr(grid, "_dual", None)
+    if dual is not None and hasattr(dual, "_ds"):
+        yield dual
+
+
+def _graph_arrays_of(grid):
+    """Arrays that define the graph(s) of a grid, keyed by variable name."""
+    graph_arrays = []
+    for graph in _graphs_of(grid):
+        arrays = {}
+        for name, var in graph._ds.data_vars.items():
+            array = var.variable._data
+            if (
+                isinstance(array, np.ndarray)
+                and array.dtype.kind in "biuf"
+                and array.nbytes > 0
+            ):
+                arrays[name] = array
+        graph_arrays.append(arrays)
+    return graph_arrays
+
+
+def _dumps_with_shared_graph(grid, blocks):
+    """Pickle a grid with its graph arrays moved into shared memory.
+
+    Arrays that define the graph(s) of *grid* are copied into blocks of
+    shared memory (which are appended to *blocks*) and pickled, along with
+    the grid, as references to those blocks. Everything else, fields
+    included, is pickled as usual.
+    """
+    if shared_memory is None:
+        return pickle.dumps(grid, protocol=pickle.HIGHEST_PROTOCOL)
+
+    graph_arrays = _graph_arrays_of(grid)
+    is_graph_array = {
+        id(array) for arrays in graph_arrays for array in arrays.values()
+    }
+    shared = {}
+
+    def share(array):
+        block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        blocks.append(block)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return block.name, array.shape, array.dtype.str
+
+    class _GraphPickler(pickle.Pickler):
+        def persistent_id(self, obj):
+            if isinstance(obj, np.ndarray) and id(obj) in is_graph_array:
+                if id(obj) not in shared:
+                    shared[id(obj)] = share(obj)
+                return shared[id(obj)]
+            return None
+
+    # Some grids (RasterModelGrid, for instance) don't pickle their graph
+    # but rebuild it from their shape when unpickled, so the graph arrays
+    # are pickled alongside the grid to be attached once it is rebuilt.
+    buffer = io.BytesIO()
+    _GraphPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(
+        (grid, graph_arrays)
+    )
+    return buffer.getvalue()
+
+
+def _loads_with_shared_graph(grid_bytes, blocks):
+    """Unpickle a grid whose graph arrays live in shared memory.
+
+    Blocks of shared memory that are attached to are appended to *blocks*.
+    """
+    if shared_memory is None:
+        return pickle.loads(grid_bytes)
+
+    attached = {}
+
+    def attach(pid):
+        name, shape, dtype = pid
+        if name not in attached:
+            block = shared_memory.SharedMemory(name=name)
+            blocks.append(block)
+            array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            array.flags.writeable = False
+            attached[name] = array
+        return attached[name]
+
+    class _GraphUnpickler(pickle.Unpickler):
+        def persistent_load(self, pid):
+            return attach(pid)
+
+    grid, graph_arrays = _GraphUnpickler(io.BytesIO(grid_bytes)).load()
+    for graph, arrays in zip(_graphs_of(grid), graph_arrays):
+        for name, array in arrays.items():
+            variable = graph._ds[name].variable
+            if variable._data is not array:
+                variable.data = array
+    return grid
+
+
+class _EnsembleWorker:
+    """Run members on a grid that is reused from one member to the next.
+
+    Before each member is run, the fields and node status of the grid are
+    restored to those of the original grid. Call :meth:`close` to detach
+    from shared memory once the worker is no longer needed.
+    """
+
+    def __init__(self, grid_bytes):
+        self._blocks = []
+        self._grid = _loads_with_shared_graph(grid_bytes, self._blocks)
+        self._status_at_node = self._grid.status_at_node.copy()
+        self._fields = {}
+        for at in self._grid.groups:
+            self._fields[at] = {
+                name: (
+                    np.array(self._grid[at][name], copy=True),
+                    self._grid.field_units(at, name),
+                )
+                for name in self._grid[at]
+            }
+
+    def reset(self):
+        """Restore the grid to its original state."""
+        grid = self._grid
+        for at, fields in self._fields.items():
+            for name in list(grid[at]):
+                grid.delete_field(at, name)
+            for name, (values, units) in fields.items():
+                grid.add_field(name, values.copy(), at=at, units=units)
+        if not np.array_equal(grid.status_at_node, self._status_at_node):
+            grid.status_at_node = self._status_at_node
+
+    def run(self, run_member, params, names, at):
+        """Run a single member and return copies of its output fields."""
+        self.reset()
+        run_member(self._grid, **params)
+        return {name: np.array(self._grid[at][name], copy=True) for name in names}
+
+    def close(self):
+        """Release the grid and close the worker's shared memory handles.
+
+        Arrays derived from the graph may still be cached by the grid, in
+        which case the memory remains mapped until the process exits.
+        """
+        grid, self._grid = self._grid, None
+        if grid is not None:
+            for graph in _graphs_of(grid):
+                graph._ds = graph._ds.drop_vars(list(graph._ds.data_vars))
+            del grid
+        gc.collect()
+
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _init_worker(grid_bytes):
+    global _worker
+    _worker = _EnsembleWorker(grid_bytes)
+    # worker processes don't run atexit handlers, but do run finalizers
+    Finalize(_worker, _worker.close, exitpriority=10)
+
+
+def _run_member(run_member, params, names, at):
+    return _worker.run(run_member, params, names, at)
@@ -0,0 +1,223 @@
+"""Propagate values along a flow stack.
+
+These are the compiled building blocks for utilities that walk over the
+``flow__upstream_node_order`` stack, either upstream (from outlets to
+divides) or downstream (from divides to outlets), setting each node's value
+from its receiver(s) or its receiver's value(s) from the node.
+"""
+import numpy as np
+
+cimport numpy as np
+cimport cython
+
+
+ctypedef np.int_t DTYPE_INT_t
+ctypedef np.double_t DTYPE_FLOAT_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def propagate_sum_upstream(np.ndarray[DTYPE_INT_t, ndim=1] stack,
+                           np.ndarray[DTYPE_INT_t, ndim=1] receivers,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] increment,
+                           np.ndarray[DTYPE_FLOAT_t, ndim=1] out):
+    """Add an increment at each node to the value at its receiver.
+
+    Nodes are visited in stack order (downstream to upstream) and, unless a
+    node is its own receiver, ``out[node] = out[receiver] + increment[node]``.
+
+    Parameters
+    ----------
+    stack : ndarray of int
+        Nodes ordered from downstream to upstream.
+    receivers : ndarray of int
+        Receiver of each node.
+    increment : ndarray of float
+        Value to add at each node.
+    out : ndarray of float
+        Values at nodes, updated in place.
+    """
+    cdef long n_nodes = stack.shape[0]
+    cdef long i
+    cdef DTYPE_INT_t node
+    cdef DTYPE_INT_t receiver
+
+    with nogil:
+        for i in range(n_nodes):
+            node = stack[i]
+            receiver = receivers[node]
+            if receiver != node:
+                out[node] = out[receiver] + increment[node]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def propagate_label_upstream(np.ndarray[DTYPE_INT_t, ndim=1] stack,
+                             np.ndarray[DTYPE_INT_t, ndim=1] receivers,
+                             np.ndarray[DTYPE_INT_t, ndim=1] out):
+    """Copy the label at each node's receiver to the node.
+
+    Parameters
+    ----------
+    stack : ndarray of int
+        Nodes ordered from downstream to upstream.
+    receivers : ndarray of int
+        Receiver of each node.
+    out : ndarray of int
+        Labels at nodes, updated in place.
+    """
+    cdef long n_nodes = stack.shape[0]
+    cdef long i
+    cdef DTYPE_INT_t node
+
+    with nogil:
+        for i in range(n_nodes):
+            node = stack[i]
+            out[node] = out[receivers[node]]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def propagate_mask_upstream(np.ndarray[DTYPE_INT_t, ndim=1] stack,
+                            np.ndarray[DTYPE_INT_t, ndim=1] receivers,
+                            np.ndarray[np.uint8_t, ndim=1] out):
+    """Mark nodes whose receiver is marked.
+
+    Parameters
+    ----------
+    stack : ndarray of int
+        Nodes ordered from downstream to upstream.
+    receivers : ndarray of int
+        Receiver of each node.
+    out : ndarray of uint8
+        Mask at nodes, updated in place.
+    """
+    cdef long n_nodes = stack.shape[0]
+    cdef long i
+    cdef DTYPE_INT_t node
+
+    with nogil:
+        for i in range(n_nodes):
+            node = stack[i]
+            if out[receivers[node]]:
+                out[node] = 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def propagate_min_sum_upstream_to_multiple(
+    np.ndarray[DTYPE_INT_t, ndim=1] stack,
+    np.ndarray[DTYPE_INT_t, ndim=2] receivers,
+    np.ndarray[DTYPE_FLOAT_t, ndim=2] increment,
+    np.ndarray[DTYPE_FLOAT_t, ndim=1] out,
+    DTYPE_INT_t bad_index,
+):
+    """Set each node from the receiver with the smallest value.
+
+    For route-to-multiple flow. Nodes are visited in stack order and, unless
+    a node's first receiver is itself, the node takes the smallest value of
+    its receivers plus the increment to that receiver. Where several
+    receivers tie for the smallest value, the smallest increment is used.
+
+    Parameters
+    ----------
+    stack : ndarray of int
+        Nodes ordered from downstream to upstream.
+    receivers : ndarray of int, shape (n_nodes, n_receivers)
+        Receivers of each node.
+    increment : ndarray of float, shape (n_nodes, n_receivers)
+        Value to add for each receiver of each node.
+    out : ndarray of float
+        Values at nodes, updated in place.
+    bad_index : int
+        Value of receivers that do not exist.
+    """
+    cdef long n_nodes = stack.shape[0]
+    cdef long n_receivers = receivers.shape[1]
+    cdef long i
+    cdef long j
+    cdef DTYPE_INT_t node
+    cdef DTYPE_INT_t receiver
+    cdef DTYPE_FLOAT_t min_value
+    cdef DTYPE_FLOAT_t min_increment
+    cdef int found
+
+    with nogil:
+        for i in range(n_nodes):
+            node = stack[i]
+            if receivers[node, 0] == node:
+                continue
+            found = 0
+            for j in range(n_receivers):
+                receiver = receivers[node, j]
+                if receiver == bad_index:
+                    continue
+                if not found or out[receiver] < min_value:
+                    min_value = out[receiver]
+                    min_increment = increment[node, j]
+                    found = 1
+                elif out[receiver] == min_value and increment[node, j] < min_increment:
+                    min_increment = increment[node, j]
+            if found:
+                out[node] = min_value + min_increment
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def propagate_extreme_sum_downstream(np.ndarray[DTYPE_INT_t, ndim=1] stack,
+                                     np.ndarray[DTYPE_INT_t, ndim=2] receivers,
+                                     np.ndarray[DTYPE_FLOAT_t, ndim=2] increment,
+                                     np.ndarray[np.uint8_t, ndim=1] reset,
+                                     np.ndarray[DTYPE_FLOAT_t, ndim=1] out,
+                                     DTYPE_INT_t bad_index,
+                                     longest=True):
+    """Push the largest (or smallest) value plus increment to receivers.
+
+    Nodes are visited in reverse stack order (upstream to downstream). A
+    node flagged in *reset* is first set to zero. Then, for each receiver
+    that is not the node itself, the receiver takes ``out[node] +
+    increment`` if this is larger (or, if not *longest*, smaller) than its
+    current value. Route-to-one flow is handled by passing receivers and
+    increments with a single column.
+
+    Parameters
+    ----------
+    stack : ndarray of int
+        Nodes ordered from downstream to upstream.
+    receivers : ndarray of int, shape (n_nodes, n_receivers)
+        Receivers of each node.
+    increment : ndarray of float, shape (n_nodes, n_receivers)
+        Value to add for each receiver of each node.
+    reset : ndarray of uint8
+        Nodes whose value is reset to zero when visited.
+    out : ndarray of float
+        Values at nodes, updated in place.
+    bad_index : int
+        Value of receivers that do not exist.
+    longest : bool, optional
+        Keep the largest value if True, otherwise the smallest.
+    """
+    cdef long n_nodes = stack.shape[0]
+    cdef long n_receivers = receivers.shape[1]
+    cdef long i
+    cdef long j
+    cdef DTYPE_INT_t node
+    cdef DTYPE_INT_t receiver
+    cdef DTYPE_FLOAT_t value
+    cdef int keep_largest = bool(longest)
+
+    with nogil:
+        for i in range(n_nodes - 1, -1, -1):
+            node = stack[i]
+            if reset[node]:
+                out[node] = 0.0
+            for j in range(n_receivers):
+                receiver = receivers[node, j]
+                if receiver == bad_index or receiver == node:
+                    continue
+                value = out[node] + increment[node, j]
+                if keep_largest:
+                    if out[receiver] < value:
+                        out[receiver] = value
+                elif out[receiver] > value:
+                    out[receiver] = value
@@ -4,6 +4,11 @@ import numpy as np
 
 from landlab import FieldError, RasterModelGrid
 
+from .ext.stack_propagation import (
+    propagate_min_sum_upstream_to_multiple,
+    propagate_sum_upstream,
+)
+
 
 def calculate_flow__distance(grid, add_to_grid=False, clobber=False):
     """Calculate the along flow distance from node to outlet.
@@ -145,75 +150,27 @@ def calculate_flow__distance(grid, add_to_grid=False, clobber=False):
     # create an array that representes the outlet lengths.
     flow__distance = np.zeros(grid.nodes.size)
 
-    # iterate through the flow__upstream_node_order, this will already have
-    # identified the locations of the outlet nodes and have
-    for node in flow__upstream_node_order:
-
-        # get flow recievers
-        reciever = flow__receiver_node[node]
-
-        # assess if this is a to one (D8/D4) or to multiple (Dinf, MFD)
-        # flow directing method.
-        if to_one:
-            potential_outlet = reciever
-        else:
-            # if this is an outlet, the first element of the recievers will be
-            # the nodes ID.
-            potential_outlet = reciever[0]
-
-        # assess if this is an outlet or not.
-        if potential_outlet == node:
-            not_outlet = False
-        else:
-            not_outlet = True
-
-        # if not an outlet
-        if not_outlet:
-
-            # deal with the two cases of route to one and route to multiple.
-            if to_one:
-                # get the stream length of the downstream node
-                downstream_stream_length = flow__distance[reciever]
-
-                # get the stream segment length from this node to its downstream
-                # neigbor
-                stream_increment_length = flow_link_lengths[node]
-
-            else:
-                # non-existant links are coded with -1
-                useable_receivers = np.where(reciever != grid.BAD_INDEX)[0]
-
-                # we will have the stream flow to the downstream node with the
-                # shortest distance to the outlet.
-                # in the event of a tie, we will choose the shorter link length.
-
-                # get the flow distances of the downstream nodes
-                potential_downstream_stream_lengths = flow__distance[
-                    flow__receiver_node[node]
-                ][useable_receivers]
-
-                # get the stream segment lengths from this node to its downstream
-                # neighbor
-                potential_stream_increment_lengths = flow_link_lengths[node][
-                    useable_receivers
-                ]
-
-                # get the lowest downstream stream length.
-                downstream_stream_length = np.min(potential_downstream_stream_lengths)
-
-                # determine which of the stream increments flowed to this
-                # downstream neighbor.
-                which_link = np.where(
-                    potential_downstream_stream_lengths == downstream_stream_length
-                )[0]
-
-                # and choose the smallest of these links.
-                stream_increment_length = np.min(
-                    potential_stream_increment_lengths[which_link]
-                )
-
-            # set the total stream length of this node
-            flow__distance[node] = downstream_stream_length + stream_increment_length
+    # walk up the flow__upstream_node_order, this will already have
+    # identified the locations of the outlet nodes, adding the length of the
+    # link to the receiver to the distance of the receiver.
+    if to_one:
+        propagate_sum_upstream(
+            np.asarray(flow__upstream_node_order, dtype=int),
+            np.asarray(flow__receiver_node, dtype=int),
+            np.asarray(flow_link_lengths, dtype=float),
+            flow__distance,
+        )
+    else:
+        # we will have the stream flow to the downstream node with the
+        # shortest distance to the outlet.
+        # in the event of a tie, we will choose the shorter link length.
+        propagate_min_sum_upstream_to_multiple(
+            np.asarray(flow__upstream_node_order, dtype=int),
+            np.asarray(flow__receiver_node, dtype=int),
+            np.asarray(flow_link_lengths, dtype=float),
+            flow__distance,
+            grid.BAD_INDEX,
+        )
 
     # store on the grid
     if add_to_grid:
@@ -63,6 +63,10 @@ def flatten_jagged_array(jagged, dtype=None):
     >>> offset
     array([0, 2, 2, 5])
     """
+    if isinstance(jagged, np.ndarray) and jagged.ndim == 2:
+        offset = np.arange(len(jagged) + 1, dtype=int) * jagged.shape[1]
+        return jagged.reshape((-1,)).astype(dtype=dtype), offset
+
     data = np.concatenate(jagged).astype(dtype=dtype)
     # if len(jagged) > 1:
     #     data = np.concatenate(jagged).astype(dtype=dtype)
@@ -5,6 +5,8 @@ import numpy as np
 
 from landlab import FieldError
 
+from .ext.stack_propagation import propagate_label_upstream, propagate_mask_upstream
+
 
 def get_watershed_mask(grid, outlet_id):
     """Get the watershed of an outlet returned as a boolean array.
@@ -80,21 +82,16 @@ def get_watershed_mask(grid, outlet_id):
 
     # Prepare output.
     watershed_mask = np.zeros(grid.number_of_nodes, dtype=bool)
+    watershed_mask[outlet_id] = True
 
-    # loop through all nodes once based on upstream node order. This means we
-    # only need to loop through the nodes once.
-    for node in upstream_node_order:
-        # when the outlet_id is encountered, mark it as true, and set
-        # outlet_found to True.
-
-        if node == outlet_id:
-            watershed_mask[node] = True
-
-        # once the outlet is found, set the watershed mask to the value of
-        # the reciever at node, this will paint the watershed in as we move
-        # upstream.
-        if watershed_mask[receiver_at_node[node]]:
-            watershed_mask[node] = True
+    # loop through all nodes once based on upstream node order, setting the
+    # watershed mask to the value of the reciever at node. This will paint
+    # the watershed in as we move upstream of the outlet.
+    propagate_mask_upstream(
+        np.asarray(upstream_node_order, dtype=int),
+        np.asarray(receiver_at_node, dtype=int),
+        watershed_mask.view(np.uint8),
+    )
 
     return watershed_mask
 
@@ -212,8 +209,11 @@ def get_watershed_masks(grid):
     flow__receiver_node = grid.at_node["flow__receiver_node"]
     watershed_mask = np.arange(grid.size("node"), dtype=int)
 
-    for node_id in upstream_node_order:
-        watershed_mask[node_id] = watershed_mask[flow__receiver_node[node_id]]
+    propagate_label_upstream(
+        np.asarray(upstream_node_order, dtype=int),
+        np.asarray(flow__receiver_node, dtype=int),
+        watershed_mask,
+    )
 
     return watershed_mask
 
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import Component
+from landlab.bmi import wrap_as_bmi
+
+CONFIG = """
+counter:
+    rate: 2.0
+clock:
+    start: 0.0
+    stop: 100.0
+    step: 1.0
+grid:
+    RasterModelGrid:
+    - [3, 4]
+    - fields:
+        node:
+          total:
+            constant:
+              - value: 0.0
+"""
+
+
+class Counter(Component):
+    """Accumulate a rate into a field, counting calls to run_one_step."""
+
+    _name = "Counter"
+
+    _unit_agnostic = True
+
+    _info = {
+        "total": {
+            "dtype": float,
+            "intent": "inout",
+            "optional": False,
+            "units": "-",
+            "mapping": "node",
+            "doc": "accumulated value",
+        }
+    }
+
+    def __init__(self, grid, rate=1.0):
+        super().__init__(grid)
+        self._rate = rate
+        self.calls = []
+
+    def run_one_step(self, dt):
+        self.calls.append(dt)
+        self.grid.at_node["total"] += self._rate * dt
+
+
+class SubsteppingCounter(Counter):
+    _name = "SubsteppingCounter"
+
+    _substeps_internally = True
+
+
+@pytest.fixture
+def counter():
+    bmi = wrap_as_bmi(Counter)()
+    bmi.initialize(CONFIG)
+    return bmi
+
+
+def test_update(counter):
+    counter.update()
+    counter.update()
+    assert counter._base.calls == [1.0, 1.0]
+    assert counter.get_current_time() == 2.0
+
+
+def test_update_until_steps(counter):
+    counter.update_until(3.5)
+    assert counter._base.calls == [1.0, 1.0, 1.0, 0.5]
+    assert counter.get_current_time() == pytest.approx(3.5)
+
+    counter.update_until(5.5)
+    assert counter._base.calls == [1.0, 1.0, 1.0, 0.5, 1.0, 1.0]
+
+
+def test_update_until_forwards_interval():
+    bmi = wrap_as_bmi(SubsteppingCounter)()
+    bmi.initialize(CONFIG.replace("counter:", "substepping_counter:"))
+    bmi.update_until(3.5)
+
+    assert bmi._base.calls == [3.5]
+    assert bmi.get_current_time() == pytest.approx(3.5)
+    assert bmi.get_time_step() == 1.0
+    assert_array_equal(bmi.get_value_ptr("total"), 7.0)
+
+
+def test_get_value_ptr_is_not_a_copy(counter):
+    total = counter.get_value_ptr("total")
+    assert np.shares_memory(total, counter._base.grid.at_node["total"])
+
+    counter.update()
+    assert_array_equal(total, 2.0)
+
+
+def test_get_and_set_value(counter):
+    counter.set_value("total", np.arange(12.0).reshape((3, 4)))
+    dest = np.empty(12)
+    assert counter.get_value("total", dest) is dest
+    assert_array_equal(dest, np.arange(12.0))
+
+
+def test_get_and_set_value_at_indices(counter):
+    counter.set_value_at_indices(
+        "total", np.array([1, 5, 7]), np.array([1.0, 5.0, 7.0])
+    )
+
+    dest = np.empty(3)
+    counter.get_value_at_indices("total", dest, np.array([7, 1, 0]))
+    assert_array_equal(dest, [7.0, 1.0, 0.0])
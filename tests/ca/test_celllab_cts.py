@@ -233,6 +233,68 @@ def test_priority_queue():
     assert item == 5, "incorrect item in PQ test"
 
 
+def test_priority_queue_push_many():
+    """Test pushing a batch of events is the same as pushing them in turn."""
+    from landlab.ca.cfuncs import PriorityQueue
+
+    items = np.array([2, 5, 0, 4, 1, 3])
+    priorities = np.array([2.2, 5.5, 0.11, 4.4, 1.1, 3.3])
+
+    pq = PriorityQueue()
+    for item, priority in zip(items, priorities):
+        pq.push(item, priority)
+
+    pq_batch = PriorityQueue()
+    pq_batch.push_many(items, priorities)
+
+    assert pq_batch._queue == pq._queue
+    assert pq_batch._index == 6
+
+
+def test_priority_queue_relabel():
+    """Test replacing the items of queued events."""
+    from landlab.ca.cfuncs import PriorityQueue
+
+    pq = PriorityQueue()
+    pq.push_many(np.array([2, 0, 1]), np.array([2.2, 0.11, 1.1]))
+    queue = pq._queue
+
+    pq.relabel(np.array([10, 1, 12]))
+
+    assert pq._queue is queue
+    assert [pq.pop() for _ in range(3)] == [(0.11, 1, 10), (1.1, 2, 1), (2.2, 0, 12)]
+
+
+def test_reschedule_links():
+    """Test rescheduling a batch of links matches updating them in turn."""
+    nsd = {0: "zero", 1: "one"}
+    xnlist = [
+        Transition((0, 1, 0), (1, 0, 0), 1.0),
+        Transition((0, 1, 0), (1, 1, 0), 2.0),
+        Transition((1, 1, 0), (0, 1, 0), 0.5),
+    ]
+
+    def new_ca():
+        grid = HexModelGrid((5, 5), orientation="vertical", node_layout="rect")
+        return HexCTS(grid, nsd, xnlist, np.zeros(grid.number_of_nodes, dtype=int))
+
+    np.random.seed(1945)
+    ca = new_ca()
+    links = ca.grid.active_links[ca.bnd_lnk[ca.grid.active_links] == 0]
+    new_link_states = np.arange(len(links)) % 4
+    for link, state in zip(links, new_link_states):
+        ca.update_link_state_new(link, state, 1.0)
+
+    np.random.seed(1945)
+    ca_batch = new_ca()
+    ca_batch.reschedule_links(links, new_link_states, 1.0)
+
+    assert_array_equal(ca_batch.link_state, ca.link_state)
+    assert_array_equal(ca_batch.next_update, ca.next_update)
+    assert_array_equal(ca_batch.next_trn_id, ca.next_trn_id)
+    assert ca_batch.priority_queue._queue == ca.priority_queue._queue
+
+
 def test_run_oriented_raster():
     """Test running with a small grid, 2 states, 4 transition types."""
 
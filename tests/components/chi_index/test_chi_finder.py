@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from landlab import HexModelGrid, RasterModelGrid
@@ -35,3 +36,21 @@ def test_functions_with_Hex():
 
     ch = ChiFinder(mg, min_drainage_area=1.0, reference_concavity=1.0)
     ch.calculate_chi()
+
+
+@pytest.mark.parametrize("use_true_dx", [True, False])
+def test_chi_increases_upstream(use_true_dx):
+    mg = RasterModelGrid((20, 20), xy_spacing=10.0)
+    z = mg.add_zeros("topographic__elevation", at="node")
+    np.random.seed(0)
+    z += mg.x_of_node + mg.y_of_node + np.random.rand(z.size)
+    fa = FlowAccumulator(mg, flow_director="D8")
+    fa.run_one_step()
+
+    cf = ChiFinder(mg, min_drainage_area=0.0, use_true_dx=use_true_dx)
+    cf.calculate_chi()
+
+    chi = cf.chi_indices
+    receivers = mg.at_node["flow__receiver_node"]
+    core = mg.core_nodes
+    assert np.all(chi[core] > chi[receivers[core]])
@@ -205,3 +205,69 @@ def test_MFD_S_slope_w_diag():
 
     assert_array_equal(true_receivers, fa.flow_director._receivers)
     assert_array_almost_equal(true_proportions, fa.flow_director._proportions)
+
+
+def test_mfd_out_arrays():
+    mg = RasterModelGrid((5, 6))
+    z = mg.add_field("topographic__elevation", mg.node_x ** 2 + mg.node_y, at="node")
+    args = (
+        z,
+        mg.adjacent_nodes_at_node,
+        mg.links_at_node,
+        mg.active_link_dirs_at_node,
+        mg.calc_grad_at_link(z),
+    )
+    out = (
+        np.empty((mg.number_of_nodes, 4), dtype=int),
+        np.empty((mg.number_of_nodes, 4), dtype=float),
+        np.empty((mg.number_of_nodes, 4), dtype=float),
+        np.empty((mg.number_of_nodes, 4), dtype=int),
+    )
+    expected = flow_direction_mfd.flow_directions_mfd(*args)
+    actual = flow_direction_mfd.flow_directions_mfd(*args, out=out)
+
+    for i, array in zip((0, 1, 2, 6), out):
+        assert actual[i] is array
+        assert_array_equal(array, expected[i])
+
+
+def test_mfd_writes_to_fields():
+    mg = RasterModelGrid((5, 6))
+    mg.add_field("topographic__elevation", mg.node_x + mg.node_y ** 2, at="node")
+    fd = FlowDirectorMFD(mg, diagonals=True)
+    receivers = mg.at_node["flow__receiver_node"]
+
+    fd.run_one_step()
+
+    assert mg.at_node["flow__receiver_node"] is receivers
+    assert_array_almost_equal(
+        mg.at_node["flow__receiver_proportions"].sum(axis=1),
+        np.ones(mg.number_of_nodes),
+    )
+
+
+def test_mfd_receivers_as_csr():
+    mg = RasterModelGrid((5, 6))
+    z = mg.add_field("topographic__elevation", mg.node_x + mg.node_y ** 2, at="node")
+    fd = FlowDirectorMFD(mg, diagonals=True)
+    fd.run_one_step()
+
+    receivers = mg.at_node["flow__receiver_node"]
+    proportions = mg.at_node["flow__receiver_proportions"]
+    links = mg.at_node["flow__link_to_receiver_node"]
+    offset, csr_receivers, csr_proportions, csr_links = (
+        flow_direction_mfd.flow_receivers_as_csr(receivers, proportions, links)
+    )
+
+    assert len(offset) == mg.number_of_nodes + 1
+    assert np.all(csr_receivers >= 0)
+    for node in range(mg.number_of_nodes):
+        is_receiver = receivers[node] != -1
+        row = slice(offset[node], offset[node + 1])
+        assert_array_equal(csr_receivers[row], receivers[node, is_receiver])
+        assert_array_equal(csr_proportions[row], proportions[node, is_receiver])
+        assert_array_equal(csr_links[row], links[node, is_receiver])
+    assert_array_almost_equal(
+        np.add.reduceat(csr_proportions, offset[:-1]), np.ones(mg.number_of_nodes)
+    )
+    assert np.all(z[csr_receivers] <= np.repeat(z, np.diff(offset)))
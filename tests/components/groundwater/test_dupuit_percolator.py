@@ -7,6 +7,7 @@ Created on Tue Jun  4 16:26:31 2019
 """
 
 import numpy as np
+import pytest
 from numpy.testing import assert_almost_equal, assert_equal
 
 from landlab import HexModelGrid, RasterModelGrid
@@ -304,3 +305,152 @@ def test_k_func():
 
     gdp1.run_with_adaptive_time_step_solver(0)
     assert np.equal(0.005, gdp1.K).all()
+
+
+def test_simple_water_table_implicit():
+    """Test a one-node steady simulation with the implicit solver.
+
+    Notes
+    -----
+    This test demonstrates the same simple water table as
+    test_simple_water_table, but with the run_with_implicit_solver method
+    and a time step far longer than the explicit methods allow.
+    """
+    boundaries = {"top": "closed", "left": "closed", "bottom": "closed"}
+    rg = RasterModelGrid((3, 3), bc=boundaries)
+    rg.add_zeros("aquifer_base__elevation", at="node")
+    rg.add_ones("topographic__elevation", at="node")
+    gdp = GroundwaterDupuitPercolator(
+        rg, recharge_rate=1.0e-8, hydraulic_conductivity=0.01
+    )
+    for i in range(10):
+        gdp.run_with_implicit_solver(1e6)
+
+    assert_equal(np.round(gdp._thickness[4], 5), 0.001)
+
+
+def test_conservation_of_mass_implicit():
+    """ test conservation of mass in a sloping aquifer with the implicit
+    solver.
+
+    Notes
+    ----
+    Because fluxes are calculated from the state at the end of each time
+    step, the backward Euler scheme of the implicit solver conserves mass
+    to within the solver tolerance.
+    """
+
+    grid = RasterModelGrid((3, 10), xy_spacing=10.0)
+    grid.set_closed_boundaries_at_grid_edges(True, True, False, True)
+    elev = grid.add_zeros("topographic__elevation", at="node")
+    grid.add_zeros("aquifer_base__elevation", at="node")
+
+    elev[:] = grid.x_of_node / 100 + 1
+    wt = grid.add_zeros("water_table__elevation", at="node")
+    wt[:] = elev
+
+    # initialize the groundwater model
+    gdp = GroundwaterDupuitPercolator(
+        grid, hydraulic_conductivity=0.0005, recharge_rate=1e-7
+    )
+    fa = FlowAccumulator(grid, runoff_rate="surface_water__specific_discharge")
+
+    # initialize fluxes we will record
+    recharge_flux = 0
+    gw_flux = 0
+    sw_flux = 0
+    storage_0 = gdp.calc_total_storage()
+
+    dt = 1e5
+    for i in range(50):
+        gdp.run_with_implicit_solver(dt)
+        fa.run_one_step()
+
+        recharge_flux += gdp.calc_recharge_flux_in() * dt
+        gw_flux += gdp.calc_gw_flux_out() * dt
+        sw_flux += gdp.calc_sw_flux_out() * dt
+    storage = gdp.calc_total_storage()
+
+    assert_almost_equal(
+        (gw_flux + sw_flux + storage - storage_0) / recharge_flux, 1.0, decimal=6
+    )
+
+
+def test_symmetry_of_solution_implicit():
+    """ test that water table is symmetric under constant recharge with the
+    implicit solver.
+    """
+    hmg = HexModelGrid(shape=(7, 4), spacing=10.0)
+    x = hmg.x_of_node
+    y = hmg.y_of_node
+    elev = hmg.add_zeros("topographic__elevation", at="node")
+    elev[:] = 1e-3 * (x * (max(x) - x) + y * (max(y) - y)) + 2
+    base = hmg.add_zeros("aquifer_base__elevation", at="node")
+    base[:] = elev - 2
+    wt = hmg.add_zeros("water_table__elevation", at="node")
+    wt[:] = elev
+    wt[hmg.open_boundary_nodes] = 0.0
+
+    gdp = GroundwaterDupuitPercolator(
+        hmg, recharge_rate=1e-7, hydraulic_conductivity=1e-4
+    )
+    for i in range(10):
+        gdp.run_with_implicit_solver(1e5)
+
+    tc = hmg.at_node["aquifer__thickness"]
+    assert_almost_equal(tc[5], tc[31])  # SW-NE
+    assert_almost_equal(tc[29], tc[7])  # NW-SE
+    assert_almost_equal(tc[16], tc[20])  # W-E
+
+
+
+def test_implicit_solver_after_status_change():
+    """ test that the implicit solver picks up changes to node statuses.
+    """
+
+    def make_grid(status_at_node=None):
+        grid = RasterModelGrid((4, 6), xy_spacing=10.0)
+        grid.add_ones("topographic__elevation", at="node")
+        grid.add_zeros("aquifer_base__elevation", at="node")
+        grid.add_full("water_table__elevation", 0.5, at="node")
+        if status_at_node is not None:
+            grid.status_at_node[:] = status_at_node
+        return grid
+
+    grid = make_grid()
+    gdp = GroundwaterDupuitPercolator(
+        grid, recharge_rate=1e-7, hydraulic_conductivity=1e-4
+    )
+    gdp.run_with_implicit_solver(1e5)
+
+    grid.status_at_node[grid.nodes_at_left_edge] = grid.BC_NODE_IS_CLOSED
+    grid.status_at_node[8] = grid.BC_NODE_IS_FIXED_VALUE
+
+    expected = make_grid(np.array(grid.status_at_node))
+    expected.at_node["water_table__elevation"][:] = grid.at_node[
+        "water_table__elevation"
+    ]
+    GroundwaterDupuitPercolator(
+        expected, recharge_rate=1e-7, hydraulic_conductivity=1e-4
+    ).run_with_implicit_solver(1e5)
+    gdp.run_with_implicit_solver(1e5)
+
+    assert_almost_equal(
+        grid.at_node["aquifer__thickness"][grid.core_nodes],
+        expected.at_node["aquifer__thickness"][grid.core_nodes],
+    )
+
+
+def test_implicit_solver_not_converging():
+    """ test that the implicit solver raises an error if it can't converge.
+    """
+    grid = RasterModelGrid((4, 6), xy_spacing=10.0)
+    grid.add_ones("topographic__elevation", at="node")
+    grid.add_zeros("aquifer_base__elevation", at="node")
+    grid.add_full("water_table__elevation", 0.5, at="node")
+    gdp = GroundwaterDupuitPercolator(
+        grid, recharge_rate=1e-7, hydraulic_conductivity=1e-4
+    )
+
+    with pytest.raises(RuntimeError):
+        gdp.run_with_implicit_solver(1e5, max_iterations=1)
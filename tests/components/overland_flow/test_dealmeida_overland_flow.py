@@ -4,7 +4,11 @@ Unit tests for landlab.components.overland_flow.OverlandFlow
 
 last updated: 3/14/16
 """
+import threading
+
 import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
 
 from landlab import RasterModelGrid
 from landlab.components.overland_flow import OverlandFlow
@@ -147,3 +151,51 @@ def test_deAlm_analytical_imposed_dt_long():
     hdeAlm = hdeAlm[1][1:]
     hdeAlm = np.append(hdeAlm, [0])
     np.testing.assert_almost_equal(h_analytical, hdeAlm, decimal=1)
+
+
+def _run_sloped_basin(**kwds):
+    grid = RasterModelGrid((20, 30), xy_spacing=10.0)
+    np.random.seed(42)
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z += 0.01 * grid.y_of_node + 0.1 * np.random.rand(grid.number_of_nodes)
+    h = grid.add_zeros("surface_water__depth", at="node")
+    h += 0.05 * np.random.rand(grid.number_of_nodes)
+    grid.set_closed_boundaries_at_grid_edges(True, False, True, False)
+
+    of = OverlandFlow(grid, **kwds)
+    for _ in range(5):
+        of.run_one_step(100.0)
+
+    return (
+        grid.at_node["surface_water__depth"],
+        grid.at_link["surface_water__discharge"],
+        grid.at_link["surface_water__depth"],
+        grid.at_link["water_surface__gradient"],
+    )
+
+
+@pytest.mark.parametrize("threads", [1, 3])
+@pytest.mark.parametrize(
+    "kwds",
+    [{}, {"steep_slopes": True}, {"rainfall_intensity": 1e-5, "theta": 0.6}],
+)
+def test_deAlm_fused_kernel(kwds, threads):
+    expected = _run_sloped_basin(**kwds)
+    actual = _run_sloped_basin(fused_kernel=True, threads=threads, **kwds)
+
+    for expected_values, actual_values in zip(expected, actual):
+        assert_array_equal(actual_values, expected_values)
+
+
+def test_deAlm_fused_kernel_threads_are_shut_down():
+    grid = RasterModelGrid((20, 30), xy_spacing=10.0)
+    grid.add_ones("topographic__elevation", at="node")
+    grid.add_ones("surface_water__depth", at="node")
+
+    n_threads = threading.active_count()
+    of = OverlandFlow(grid, fused_kernel=True, threads=3)
+    for _ in range(3):
+        of.run_one_step(100.0)
+
+    assert of._executor is None
+    assert threading.active_count() == n_threads
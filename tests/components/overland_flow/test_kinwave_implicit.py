@@ -9,9 +9,14 @@ Created on Sat Apr  1 10:49:33 2017
 """
 
 import numpy as np
+from numpy.testing import assert_array_almost_equal
+from scipy.optimize import newton
 
-from landlab import RasterModelGrid
+from landlab import HexModelGrid, RasterModelGrid
 from landlab.components import KinwaveImplicitOverlandFlow
+from landlab.components.overland_flow.generate_overland_flow_implicit_kinwave import (
+    water_fn,
+)
 
 
 def test_initialization():
@@ -137,8 +142,57 @@ def test_curved_surface():
         )
 
 
+def _run_one_step_with_scipy(kw, dt):
+    """Reference upstream-to-downstream loop that uses scipy's newton."""
+    grid = kw.grid
+    kw._flow_accum.run_one_step()
+    kw._disch_in[:] = 0.0
+    for n in kw._nodes_ordered[::-1]:
+        if grid.status_at_node[n] == 0:
+            cc = kw._depth[n]
+            ee = (dt * kw._runoff_rate) + (
+                dt * kw._disch_in[n] / grid.area_of_cell[grid.cell_at_node[n]]
+            )
+            kw._depth[n] = newton(
+                water_fn, cc, args=(kw._alpha[n], kw._weight, cc, kw._depth_exp, ee)
+            )
+            Heff = kw._weight * kw._depth[n] + (1.0 - kw._weight) * cc
+            outflow = kw._vel_coef * (Heff ** kw._depth_exp) * kw._grad_width_sum[n]
+            adjacent = grid.adjacent_nodes_at_node[n]
+            proportions = kw._flow_accum.flow_director._proportions[n]
+            kw._disch_in[adjacent[adjacent >= 0]] += (
+                outflow * proportions[adjacent >= 0]
+            )
+
+
+def test_sweep_matches_scipy_newton():
+    """Test the compiled sweep against a loop over scipy's newton."""
+    for grid in (
+        RasterModelGrid((12, 15), xy_spacing=2.0),
+        HexModelGrid((10, 10), spacing=2.0),
+    ):
+        np.random.seed(1)
+        z = grid.add_zeros("topographic__elevation", at="node")
+        z[:] = 0.02 * grid.y_of_node + 0.1 * np.random.rand(grid.number_of_nodes)
+
+        kw = KinwaveImplicitOverlandFlow(grid, runoff_rate=10.0, roughness=0.02)
+        for _ in range(10):
+            kw.run_one_step(10.0)
+        depth, disch_in = kw.depth.copy(), kw._disch_in.copy()
+
+        kw.depth[:] = 0.0
+        for _ in range(10):
+            _run_one_step_with_scipy(kw, 10.0)
+
+        assert_array_almost_equal(depth, kw.depth, decimal=6)
+        assert_array_almost_equal(
+            disch_in / disch_in.max(), kw._disch_in / disch_in.max(), decimal=4
+        )
+
+
 if __name__ == "__main__":
     test_initialization()
     test_first_iteration()
     test_steady_basic_ramp()
     test_curved_surface()
+    test_sweep_matches_scipy_newton()
@@ -3,7 +3,17 @@ Unit tests for landlab.components.plant_competition_ca.plant_competition_ca
 """
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.components.plant_competition_ca.plant_competition_ca import (
+    BARE,
+    GRASS,
+    SHRUB,
+    TREE,
+    VegCA,
+    _ring_adjacency,
+)
 
 (_SHAPE, _SPACING, _ORIGIN) = ((20, 20), (10e0, 10e0), (0.0, 0.0))
 _ARGS = (_SHAPE, _SPACING, _ORIGIN)
@@ -71,3 +81,53 @@ def test_field_initialized_to_zero(ca_veg):
     for name in ca_veg.grid["node"]:
         field = ca_veg.grid["node"][name]
         assert_array_almost_equal(field, np.zeros(ca_veg.grid.number_of_nodes))
+
+
+def _sum_over_neighbors(values, neighbors):
+    total = np.zeros(len(neighbors))
+    for (cell, ring) in enumerate(neighbors):
+        for neighbor in ring:
+            total[cell] += values[neighbor]
+    return total
+
+
+def test_neighbor_sums_match_loop():
+    grid = RasterModelGrid((7, 6))
+    rng = np.random.default_rng(1945)
+    veg_type = rng.integers(0, 6, grid.number_of_cells)
+    live_index = rng.random(grid.number_of_cells)
+
+    for neighbors in (
+        grid.looped_neighbors_at_cell,
+        grid.second_ring_looped_neighbors_at_cell,
+    ):
+        adjacency = _ring_adjacency(neighbors)
+        tree_live_index = np.where(veg_type == TREE, live_index, 0.0)
+        is_shrub = (veg_type == SHRUB).astype(float)
+        assert_array_equal(
+            adjacency @ tree_live_index,
+            _sum_over_neighbors(tree_live_index, neighbors),
+        )
+        assert_array_equal(
+            adjacency @ is_shrub, _sum_over_neighbors(is_shrub, neighbors)
+        )
+
+
+def test_looped_neighbors_of_narrow_grid():
+    grid = RasterModelGrid((5, 3))
+    assert_array_equal(
+        grid.looped_neighbors_at_cell,
+        [[0, 1, 1, 1, 0, 2, 2, 2], [1, 2, 2, 2, 1, 0, 0, 0], [2, 0, 0, 0, 2, 1, 1, 1]],
+    )
+
+    grid.add_zeros("vegetation__cumulative_water_stress", at="cell")
+    grid.add_field(
+        "vegetation__plant_functional_type", np.array([0, 1, 2]), at="cell"
+    )
+    np.random.seed(1)
+    VegCA(grid).update()
+
+    assert_array_equal(
+        grid.at_cell["vegetation__plant_functional_type"], [GRASS, BARE, TREE]
+    )
+    assert_array_almost_equal(grid.at_cell["plant__age"], [1.0, 0.0, 38.0])
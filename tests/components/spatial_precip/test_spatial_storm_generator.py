@@ -132,3 +132,47 @@ def test_MS_params():
     #     style='monsoonal', monsoon_storm_interarrival_GEV={
     #                          'shape': -0.807971, 'sigma': 9.4957,
     #                          'mu': 10.6108, 'trunc_interval': (0., 720.)})]
+
+
+def test_batched_storms_fill_the_year():
+    mg = RasterModelGrid((10, 10), xy_spacing=1000.0)
+    np.random.seed(1)
+    rain = SpatialPrecipitationDistribution(mg, number_of_years=3, batch_size=50)
+
+    total_t = 0.0
+    for (storm, istorm) in rain.yield_storms():
+        total_t += storm + istorm
+        assert np.all(mg.at_node["rainfall__flux"] >= 0.0)
+        assert rain.number_of_nodes_under_storm > 0
+        assert np.all(mg.at_node["rainfall__flux"][rain.nodes_under_storm] >= 0.0)
+    assert np.isclose(total_t / 24.0, 3.0 * 365.0)
+
+
+def test_batch_size_one_matches_seeded_sequence():
+    mg = RasterModelGrid((10, 10), xy_spacing=1000.0)
+    np.random.seed(1)
+    rain = SpatialPrecipitationDistribution(mg, batch_size=1)
+    storms = list(rain.yield_storms())
+    assert len(storms) == 41
+    assert mg.at_node["rainfall__flux"].argmax() == 80
+
+
+def test_batched_storm_statistics():
+    mg = RasterModelGrid((10, 10), xy_spacing=1000.0)
+
+    def mean_storm_properties(batch_size):
+        rain = SpatialPrecipitationDistribution(
+            mg, number_of_years=200, batch_size=batch_size
+        )
+        durations = []
+        intensities = []
+        for (storm, istorm) in rain.yield_storms(style="monsoonal"):
+            durations.append(storm)
+            intensities.append(rain.storm_intensity_last_storm)
+        return np.mean(durations), np.mean(intensities)
+
+    np.random.seed(2)
+    unbatched = mean_storm_properties(1)
+    batched = mean_storm_properties(64)
+
+    assert np.allclose(batched, unbatched, rtol=0.1)
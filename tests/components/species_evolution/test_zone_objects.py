@@ -476,6 +476,58 @@ def test_zone_taxon_range_mask(zone_example_grid):
     np.testing.assert_array_equal(taxa[0].range_mask, expected_mask)
 
 
+def test_zone_nodes(zone_example_grid):
+    mg, z = zone_example_grid
+    z[[8, 9, 12, 19, 26]] = 1
+
+    sc = ZoneController(mg, zone_func, neighborhood_structure="D4")
+
+    assert [zone.nodes.tolist() for zone in sc.zones] == [[8, 9], [12, 19, 26]]
+    for zone in sc.zones:
+        np.testing.assert_array_equal(np.flatnonzero(zone.mask), zone.nodes)
+        np.testing.assert_equal(zone.area, 4.0 * len(zone.nodes))
+
+
+def test_intersections(zone_example_grid):
+    mg, z = zone_example_grid
+    sc = ZoneController(mg, zone_func)
+
+    prior_zones = [zn.Zone(sc, [8, 9, 10]), zn.Zone(sc, [12, 13])]
+    new_zones = [zn.Zone(sc, [10, 11, 12]), zn.Zone(sc, [15]), zn.Zone(sc, [13])]
+
+    ns_at_p, ps_at_n, overlap = zn._intersections(
+        zn._create_index_map(mg, prior_zones),
+        zn._create_index_map(mg, new_zones),
+        prior_zones,
+        new_zones,
+    )
+
+    assert ns_at_p == [[new_zones[0]], [new_zones[0], new_zones[2]]]
+    assert ps_at_n == {new_zones[0]: [0, 1], new_zones[1]: [], new_zones[2]: [1]}
+    assert overlap == {
+        (prior_zones[0], new_zones[0]): 1,
+        (new_zones[0], prior_zones[0]): 1,
+        (prior_zones[1], new_zones[0]): 1,
+        (new_zones[0], prior_zones[1]): 1,
+        (prior_zones[1], new_zones[2]): 1,
+        (new_zones[2], prior_zones[1]): 1,
+    }
+
+
+def test_taxa_richness_of_zone_taxa(zone_example_grid):
+    mg, z = zone_example_grid
+    z[[8, 9, 12, 19, 26]] = 1
+
+    se = SpeciesEvolver(mg)
+    sc = ZoneController(mg, zone_func, neighborhood_structure="D4")
+    se.track_taxa(sc.populate_zones_uniformly(2))
+    se.track_taxa(ZoneTaxon(sc.zones))
+
+    expected = np.zeros(mg.number_of_nodes, dtype=int)
+    expected[[8, 9, 12, 19, 26]] = 3
+    np.testing.assert_array_equal(mg.at_node["taxa__richness"], expected)
+
+
 def test_time_to_allopatric_speciation(zone_example_grid):
     mg, z = zone_example_grid
 
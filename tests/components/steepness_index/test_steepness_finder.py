@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
 from landlab import RasterModelGrid
-from landlab.components import FlowAccumulator, SteepnessFinder
+from landlab.components import FastscapeEroder, FlowAccumulator, SteepnessFinder
 
 
 def test_route_to_multiple_error_raised():
@@ -13,3 +14,41 @@ def test_route_to_multiple_error_raised():
 
     with pytest.raises(NotImplementedError):
         SteepnessFinder(mg)
+
+
+def test_channel_segments_cover_network():
+    mg = RasterModelGrid((20, 20), xy_spacing=100.0)
+    z = mg.add_zeros("topographic__elevation", at="node")
+    np.random.seed(0)
+    z += np.random.rand(z.size)
+    fa = FlowAccumulator(mg, flow_director="D8")
+    sp = FastscapeEroder(mg, K_sp=0.01)
+    for _ in range(10):
+        z[mg.core_nodes] += 10.0
+        fa.run_one_step()
+        sp.run_one_step(1000.0)
+    fa.run_one_step()
+
+    sf = SteepnessFinder(mg, min_drainage_area=1.0e5)
+    dstr_order = mg.at_node["flow__upstream_node_order"][::-1]
+    ch_nodes = dstr_order[mg.at_node["drainage_area"][dstr_order] >= 1.0e5]
+    nodes, offsets = sf.channel_segments(ch_nodes)
+
+    receivers = mg.at_node["flow__receiver_node"]
+    seen = set()
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        reach = nodes[start:end]
+        assert np.all(receivers[reach[:-1]] == reach[1:])
+        assert seen.isdisjoint(reach[:-1])
+        seen.update(reach)
+    assert seen >= set(ch_nodes)
+
+    sf.calculate_steepnesses()
+    is_last = np.zeros(nodes.size, dtype=bool)
+    is_last[offsets[1:] - 1] = True
+    upper = nodes[~is_last]
+    expected = 10.0 ** (
+        np.log10(mg.at_node["topographic__steepest_slope"][upper])
+        + 0.5 * np.log10(mg.at_node["drainage_area"][upper])
+    )
+    assert np.allclose(sf.steepness_indices[upper], expected)
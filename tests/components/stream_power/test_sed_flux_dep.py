@@ -7,6 +7,7 @@ a few more times, to ensure repeatability.
 import os
 
 import numpy as np
+import pytest
 from numpy.testing import assert_array_almost_equal
 
 from landlab import RasterModelGrid
@@ -95,3 +96,24 @@ def test_sed_dep_new():
         z[mg.core_nodes] += 20.0 * up
 
     assert_array_almost_equal(z, np.loadtxt(finalconds))
+
+
+def test_sed_dep_flooded_depths_array():
+    mg = RasterModelGrid((5, 5), xy_spacing=100.0)
+    mg.set_closed_boundaries_at_grid_edges(False, True, True, True)
+    z = mg.add_zeros("topographic__elevation", at="node")
+    z[:] = mg.x_of_node / 100.0
+    z[12] = 0.5
+
+    flooded_depths = np.zeros(mg.number_of_nodes)
+    flooded_depths[12] = 1.0
+
+    FlowAccumulator(mg, flow_director="D8").run_one_step()
+    sde = SedDepEroder(mg, K_sp=1.0e-4, K_t=1.0e-4, flooded_depths=flooded_depths)
+    sde.run_one_step(100.0)
+
+    sed_in = mg.at_node["channel_sediment__volumetric_flux"][12]
+    assert sed_in > 0.0
+    assert flooded_depths[12] == pytest.approx(1.0 - sed_in / mg.area_of_cell[4])
+    assert z[12] == pytest.approx(0.5 + sed_in / mg.area_of_cell[4])
+    assert mg.at_node["channel_sediment__volumetric_flux"][11] == 0.0
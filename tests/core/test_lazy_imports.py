@@ -0,0 +1,67 @@
+import subprocess
+import sys
+
+import pytest
+
+import landlab
+import landlab.components
+import landlab.io
+
+SLOW_TO_IMPORT = ("matplotlib", "scipy", "shapefile", "pkg_resources")
+
+
+def _modules_imported_by(statement):
+    script = "import sys; {0}; print(' '.join(sys.modules))".format(statement)
+    output = subprocess.check_output([sys.executable, "-c", script])
+    return set(output.decode().split())
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import landlab",
+        "import landlab.components",
+        "from landlab import RasterModelGrid, HexModelGrid",
+        "from landlab.io import read_esri_ascii",
+    ],
+)
+def test_import_does_not_load_slow_modules(statement):
+    modules = _modules_imported_by(statement)
+    assert not [name for name in SLOW_TO_IMPORT if name in modules]
+
+
+def test_component_import_is_selective():
+    modules = _modules_imported_by("from landlab.components import LinearDiffuser")
+    assert "landlab.components.diffusion" in modules
+    assert "landlab.components.flexure" not in modules
+    assert "matplotlib" not in modules
+
+
+def test_lazy_plot_functions():
+    from landlab.plot import imshow_grid, imshow_grid_at_node
+
+    assert landlab.imshow_grid is imshow_grid
+    assert landlab.imshow_grid_at_node is imshow_grid_at_node
+    assert "imshow_grid" in dir(landlab)
+
+
+def test_lazy_read_shapefile():
+    from landlab.io.shapefile import read_shapefile
+
+    assert landlab.io.read_shapefile is read_shapefile
+
+
+def test_lazy_components():
+    from landlab.components.flow_accum import FlowAccumulator
+
+    assert landlab.components.FlowAccumulator is FlowAccumulator
+    assert len(landlab.components.COMPONENTS) == len(landlab.components.__all__)
+    assert [cls.__name__ for cls in landlab.components.COMPONENTS] == (
+        landlab.components.__all__
+    )
+
+
+@pytest.mark.parametrize("module", [landlab, landlab.components, landlab.io])
+def test_missing_attribute(module):
+    with pytest.raises(AttributeError):
+        module.not_an_attribute
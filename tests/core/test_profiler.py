@@ -0,0 +1,117 @@
+import csv
+import json
+import sys
+
+import numpy as np
+import pytest
+
+from landlab import Component, RasterModelGrid
+from landlab.components import FlowAccumulator, LinearDiffuser
+
+
+class Allocator(Component):
+    _name = "Allocator"
+    _info = {}
+
+    def __init__(self, grid, n_bytes=8000000):
+        super().__init__(grid)
+        self._n_bytes = n_bytes
+
+    def run_one_step(self):
+        self.allocate()
+        self.allocate()
+
+    def allocate(self):
+        return np.ones(self._n_bytes // 8).sum()
+
+
+@pytest.fixture
+def grid():
+    grid = RasterModelGrid((10, 10))
+    grid.add_field(
+        "topographic__elevation",
+        grid.x_of_node + grid.y_of_node,
+        at="node",
+    )
+    return grid
+
+
+def test_methods_are_restored(grid):
+    run_one_step = LinearDiffuser.run_one_step
+    calc_grad_at_link = RasterModelGrid.calc_grad_at_link
+
+    profiler = Component.profile()
+    profiler.start()
+    assert LinearDiffuser.run_one_step is not run_one_step
+    profiler.stop()
+
+    assert LinearDiffuser.run_one_step is run_one_step
+    assert RasterModelGrid.calc_grad_at_link is calc_grad_at_link
+
+
+def test_call_counts(grid):
+    accumulator = FlowAccumulator(grid)
+    diffuser = LinearDiffuser(grid, linear_diffusivity=0.01)
+
+    with Component.profile() as profiler:
+        for _ in range(3):
+            accumulator.run_one_step()
+            diffuser.run_one_step(1.0)
+    accumulator.run_one_step()
+
+    stats = profiler.stats
+    assert stats["FlowAccumulator.run_one_step"].calls == 3
+    assert stats["FlowAccumulator.accumulate_flow"].calls == 3
+    assert stats["FlowDirectorSteepest.direct_flow"].calls == 3
+    assert stats["LinearDiffuser.run_one_step"].calls == 3
+    assert stats["RasterModelGrid.calc_grad_at_link"].kind == "grid"
+    assert (
+        stats["FlowAccumulator.run_one_step"].total_time
+        >= stats["FlowAccumulator.accumulate_flow"].total_time
+    )
+
+
+def test_without_grid_operators(grid):
+    diffuser = LinearDiffuser(grid, linear_diffusivity=0.01)
+
+    with Component.profile(grid_operators=False) as profiler:
+        diffuser.run_one_step(1.0)
+
+    assert {row["kind"] for row in profiler.report()} == {"component"}
+
+
+def test_only_one_active_profiler():
+    with Component.profile():
+        with pytest.raises(RuntimeError):
+            Component.profile().start()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="requires reset_peak")
+def test_peak_memory(grid):
+    allocator = Allocator(grid)
+
+    with Component.profile(memory=True) as profiler:
+        allocator.run_one_step()
+
+    stats = profiler.stats
+    assert stats["Allocator.allocate"].calls == 2
+    assert 8000000 <= stats["Allocator.allocate"].peak_bytes < 9000000
+    assert 8000000 <= stats["Allocator.run_one_step"].peak_bytes < 9000000
+
+
+def test_write(tmpdir, grid):
+    diffuser = LinearDiffuser(grid, linear_diffusivity=0.01)
+    with Component.profile() as profiler:
+        diffuser.run_one_step(1.0)
+
+    with tmpdir.as_cwd():
+        profiler.write("profile.json")
+        profiler.write("profile.csv")
+        with open("profile.json") as fp:
+            from_json = json.load(fp)
+        with open("profile.csv") as fp:
+            from_csv = list(csv.DictReader(fp))
+
+    assert from_json == profiler.report()
+    assert [row["name"] for row in from_csv] == [row["name"] for row in from_json]
+    assert "LinearDiffuser.run_one_step" in str(profiler)
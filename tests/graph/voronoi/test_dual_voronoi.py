@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import VoronoiDelaunayGrid
+from landlab.graph import DualVoronoiGraph
+from landlab.graph.voronoi import dual_voronoi
+
+
+@pytest.fixture
+def xy_of_node():
+    return np.random.RandomState(1945).rand(2, 50)
+
+
+def assert_same_graph(actual, expected):
+    for a, b in ((actual.ds, expected.ds), (actual.dual.ds, expected.dual.ds)):
+        assert set(a.variables) == set(b.variables)
+        for name in a.variables:
+            assert_array_equal(a[name].values, b[name].values)
+
+
+def test_cache_is_written(tmpdir, xy_of_node):
+    y, x = xy_of_node
+    graph = DualVoronoiGraph((y.copy(), x.copy()), sort=True, cache_dir=str(tmpdir))
+
+    files = os.listdir(str(tmpdir))
+    assert len(files) == 1
+    assert files[0].endswith(".graph")
+    assert_same_graph(graph, DualVoronoiGraph((y.copy(), x.copy()), sort=True))
+
+
+def test_cache_is_read(tmpdir, xy_of_node, monkeypatch):
+    y, x = xy_of_node
+    expected = DualVoronoiGraph((y.copy(), x.copy()), sort=True, cache_dir=str(tmpdir))
+
+    def fail(*args, **kwds):
+        raise AssertionError("graph was rebuilt")
+
+    monkeypatch.setattr(dual_voronoi, "VoronoiDelaunayToGraph", fail)
+    actual = DualVoronoiGraph((y.copy(), x.copy()), sort=True, cache_dir=str(tmpdir))
+
+    assert_same_graph(actual, expected)
+    assert actual.frozen
+    assert actual.dual.frozen
+    assert_array_equal(actual.x_of_corner, expected.x_of_corner)
+
+
+def test_cache_key(tmpdir, xy_of_node):
+    y, x = xy_of_node
+    DualVoronoiGraph((y.copy(), x.copy()), sort=True, cache_dir=str(tmpdir))
+    DualVoronoiGraph((y.copy(), x.copy()), sort=False, cache_dir=str(tmpdir))
+    x[0] += 1e-6
+    DualVoronoiGraph((y.copy(), x.copy()), sort=True, cache_dir=str(tmpdir))
+    DualVoronoiGraph((y.copy(), x.copy()), sort=True, cache_dir=str(tmpdir))
+
+    assert len(os.listdir(str(tmpdir))) == 3
+
+
+def test_grid_from_cache(tmpdir, xy_of_node):
+    y, x = xy_of_node
+    expected = VoronoiDelaunayGrid(x.copy(), y.copy(), cache_dir=str(tmpdir))
+    actual = VoronoiDelaunayGrid(x.copy(), y.copy(), cache_dir=str(tmpdir))
+
+    assert_same_graph(actual, expected)
+    assert_array_equal(actual.status_at_node, expected.status_at_node)
+    assert_array_equal(actual.area_of_cell, expected.area_of_cell)
+    assert_array_equal(actual.length_of_face, expected.length_of_face)
@@ -100,8 +100,12 @@ def pytest_generate_tests(metafunc):
         )
 
 
+def _xy_key(xy):
+    return tuple(np.round(xy, decimals=9))
+
+
 def test_voronoi_name_mapping(xy_of_hex):
-    """Test scipy Voronoi names are mapped to landlab-style names."""
+    """Test the Voronoi diagram matches the one from scipy."""
     voronoi = Voronoi(xy_of_hex)
     delaunay = Delaunay(xy_of_hex)
     graph = VoronoiDelaunay(xy_of_hex)
@@ -109,20 +113,39 @@ def test_voronoi_name_mapping(xy_of_hex):
     assert np.all(graph.x_of_node == approx(voronoi.points[:, 0]))
     assert np.all(graph.y_of_node == approx(voronoi.points[:, 1]))
 
-    assert np.all(graph.x_of_corner == approx(voronoi.vertices[:, 0]))
-    assert np.all(graph.y_of_corner == approx(voronoi.vertices[:, 1]))
+    xy_of_corner = np.vstack((graph.x_of_corner, graph.y_of_corner)).T
+    assert sorted(_xy_key(xy) for xy in xy_of_corner) == sorted(
+        _xy_key(xy) for xy in voronoi.vertices
+    )
 
-    assert np.all(graph.nodes_at_link == voronoi.ridge_points)
+    def faces(nodes_at_face, corners_at_face, xy_of_corner):
+        return {
+            tuple(sorted(nodes)): frozenset(
+                _xy_key(xy_of_corner[corner]) if corner >= 0 else None
+                for corner in corners
+            )
+            for nodes, corners in zip(nodes_at_face, corners_at_face)
+        }
 
-    assert tuple(graph.n_corners_at_cell) == tuple(
-        len(region) for region in voronoi.regions
+    assert faces(graph.nodes_at_face, graph.corners_at_face, xy_of_corner) == faces(
+        voronoi.ridge_points, voronoi.ridge_vertices, voronoi.vertices
     )
-    for cell, corners in enumerate(graph.corners_at_cell):
-        assert np.all(corners[: graph.n_corners_at_cell[cell]] == voronoi.regions[cell])
-        assert np.all(corners[graph.n_corners_at_cell[cell] :] == -1)
-    assert np.all(graph.corners_at_face == voronoi.ridge_vertices)
-    assert np.all(graph.nodes_at_face == voronoi.ridge_points)
-    assert np.all(graph.cell_at_node == voronoi.point_region)
+    assert np.all(graph.nodes_at_link == graph.nodes_at_face)
+
+    for node in range(len(xy_of_hex)):
+        cell = graph.cell_at_node[node]
+        corners = graph.corners_at_cell[cell, : graph.n_corners_at_cell[cell]]
+        assert np.all(
+            graph.corners_at_cell[cell, graph.n_corners_at_cell[cell] :] == -1
+        )
+
+        region = voronoi.regions[voronoi.point_region[node]]
+        assert {
+            _xy_key(xy_of_corner[corner]) if corner >= 0 else None for corner in corners
+        } == {
+            _xy_key(voronoi.vertices[vertex]) if vertex >= 0 else None
+            for vertex in region
+        }
 
     assert np.all(graph.nodes_at_patch == delaunay.simplices)
 
@@ -252,3 +275,24 @@ def test_big_graph(n_nodes):
     xy_of_node = np.random.rand(2 * n_nodes).reshape((-1, 2))
     graph = VoronoiDelaunayToGraph(xy_of_node)
     assert graph.number_of_nodes == n_nodes
+
+
+@pytest.mark.parametrize("xy_of_lower_left", [(0.0, 0.0), (-543.21, -812.7)])
+def test_no_flat_patches(xy_of_lower_left):
+    """Test collinear nodes on the hull don't leave flat triangles."""
+    from landlab.graph.hex.hex import HorizontalHexTriGraph
+
+    x_of_node, y_of_node = HorizontalHexTriGraph.xy_of_node(
+        (12, 12), spacing=2.0, xy_of_lower_left=xy_of_lower_left
+    )
+    xy_of_node = np.vstack((x_of_node, y_of_node)).T
+    graph = VoronoiDelaunay(xy_of_node)
+
+    xy_at_patch = xy_of_node[graph.nodes_at_patch]
+    area_of_patch = 0.5 * np.abs(
+        np.cross(
+            xy_at_patch[:, 1] - xy_at_patch[:, 0], xy_at_patch[:, 2] - xy_at_patch[:, 0]
+        )
+    )
+    assert np.all(area_of_patch == approx(np.sqrt(3.0)))
+    assert graph.number_of_links == len(xy_of_node) + graph.number_of_patches - 1
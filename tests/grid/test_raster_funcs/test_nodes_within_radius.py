@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.grid import raster_funcs as rfuncs
+
+
+@pytest.mark.parametrize("xy_spacing", [(1.0, 1.0), (2.0, 0.5), (0.3, 1.7)])
+@pytest.mark.parametrize("xy_of_lower_left", [(0.0, 0.0), (-10.0, 5.5)])
+def test_matches_brute_force(xy_spacing, xy_of_lower_left):
+    """Test the windowed search against distances to every node."""
+    grid = RasterModelGrid(
+        (9, 11), xy_spacing=xy_spacing, xy_of_lower_left=xy_of_lower_left
+    )
+    np.random.seed(1945)
+    x0, y0 = xy_of_lower_left
+    for _ in range(200):
+        coord = (
+            np.random.uniform(x0 - 5.0, x0 + 25.0),
+            np.random.uniform(y0 - 5.0, y0 + 20.0),
+        )
+        radius = np.random.uniform(0.0, 8.0)
+
+        dist = grid.calc_distances_of_nodes_to_point(coord)
+        assert_array_equal(
+            rfuncs.nodes_within_radius(grid, coord, radius),
+            np.where(dist <= radius)[0],
+        )
+
+
+def test_radius_of_zero():
+    grid = RasterModelGrid((4, 5))
+    assert_array_equal(rfuncs.nodes_within_radius(grid, (2.0, 1.0), 0.0), [7])
+    assert rfuncs.nodes_within_radius(grid, (2.1, 1.0), 0.0).size == 0
+
+
+def test_point_off_grid():
+    grid = RasterModelGrid((4, 5))
+    assert_array_equal(rfuncs.nodes_within_radius(grid, (-1.0, -1.0), 1.5), [0])
+    assert rfuncs.nodes_within_radius(grid, (100.0, 1.0), 5.0).size == 0
+
+
+def test_matches_kd_tree():
+    grid = RasterModelGrid((6, 7), xy_spacing=(2.0, 3.0))
+    assert_array_equal(
+        grid.nodes_within_radius((5.0, 7.0), 4.0),
+        np.sort(grid._kd_tree_of_node.query_ball_point((5.0, 7.0), 4.0)),
+    )
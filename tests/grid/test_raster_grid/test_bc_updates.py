@@ -58,3 +58,36 @@ def test_bc_set_code_change():
     rmg = RasterModelGrid((4, 5))
     rmg.status_at_node[rmg.nodes_at_bottom_edge] = rmg.BC_NODE_IS_CLOSED
     assert rmg.bc_set_code != rmg.BC_NODE_IS_CORE
+
+
+def test_open_nodes_disconnected_from_watershed_d4_vs_d8():
+    # nodes 8 and 18 only touch the watershed across a diagonal.
+    z = np.array(
+        [
+            [-9999.0, -9999.0, -9999.0, -9999.0, -9999.0],
+            [-9999.0, 5.0, -9999.0, 2.0, -9999.0],
+            [-9999.0, 4.0, 3.0, -9999.0, -9999.0],
+            [-9999.0, 1.0, -9999.0, 7.0, -9999.0],
+            [-9999.0, -9999.0, -9999.0, -9999.0, -9999.0],
+        ]
+    ).flatten()
+
+    grid = RasterModelGrid((5, 5))
+    grid.status_at_node[z == -9999.0] = grid.BC_NODE_IS_CLOSED
+    d8 = z.copy()
+    grid.set_open_nodes_disconnected_from_watershed_to_closed(
+        d8, outlet_id=np.array([16]), adjacency_method="D8"
+    )
+    assert_array_equal(np.flatnonzero(d8 != -9999.0), [6, 8, 11, 12, 16, 18])
+
+    grid = RasterModelGrid((5, 5))
+    grid.status_at_node[z == -9999.0] = grid.BC_NODE_IS_CLOSED
+    d4 = z.copy()
+    grid.set_open_nodes_disconnected_from_watershed_to_closed(
+        d4, outlet_id=np.array([16]), adjacency_method="D4"
+    )
+    assert_array_equal(np.flatnonzero(d4 != -9999.0), [6, 11, 12, 16])
+    assert_array_equal(
+        np.flatnonzero(grid.status_at_node != grid.BC_NODE_IS_CLOSED),
+        [6, 11, 12, 16],
+    )
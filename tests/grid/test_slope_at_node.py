@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from landlab import HexModelGrid, RasterModelGrid, VoronoiDelaunayGrid
+
+
+def _mean_over_patches(grid, value_at_patch, patch_is_used):
+    value_at_node = np.ma.array(
+        value_at_patch[grid.patches_at_node], mask=~patch_is_used
+    )
+    return np.mean(value_at_node, axis=1).filled(0.0)
+
+
+def _slope_at_raster_node(grid, z):
+    normals = grid.calc_unit_normals_at_patch_subtriangles(z)
+    slope_at_patch = grid.calc_slope_at_patch(
+        elevs=z, subtriangle_unit_normals=normals, ignore_closed_nodes=False
+    )
+    grad_at_patch = grid.calc_grad_at_patch(
+        elevs=z,
+        subtriangle_unit_normals=normals,
+        slope_magnitude=slope_at_patch,
+        ignore_closed_nodes=False,
+    )
+    is_closed = grid.status_at_node[grid.nodes_at_patch] == grid.BC_NODE_IS_CLOSED
+    patch_is_used = (grid.patches_at_node != -1) & ~np.any(is_closed, axis=1)[
+        grid.patches_at_node
+    ]
+
+    return (
+        _mean_over_patches(grid, slope_at_patch, patch_is_used),
+        (
+            _mean_over_patches(grid, grad_at_patch[0], patch_is_used),
+            _mean_over_patches(grid, grad_at_patch[1], patch_is_used),
+        ),
+    )
+
+
+def _slope_at_node_of_triangles(grid, z, ignore_closed_nodes):
+    slope_at_patch = grid.calc_slope_at_patch(elevs=z, ignore_closed_nodes=False)
+    grad_at_patch = grid.calc_grad_at_patch(
+        elevs=z, slope_magnitude=slope_at_patch, ignore_closed_nodes=False
+    )
+    if ignore_closed_nodes:
+        patch_is_used = grid.patches_present_at_node
+    else:
+        patch_is_used = grid.patches_at_node != -1
+
+    return (
+        _mean_over_patches(grid, slope_at_patch, patch_is_used),
+        (
+            _mean_over_patches(grid, grad_at_patch[0], patch_is_used),
+            _mean_over_patches(grid, grad_at_patch[1], patch_is_used),
+        ),
+    )
+
+
+@pytest.mark.parametrize("shape", [(2, 3), (4, 5), (7, 6)])
+def test_slope_at_raster_node(shape):
+    grid = RasterModelGrid(shape, xy_spacing=(2.0, 3.0))
+    grid.status_at_node[[0, grid.number_of_nodes // 2]] = grid.BC_NODE_IS_CLOSED
+    z = np.random.default_rng(1945).random(grid.number_of_nodes)
+
+    slope, (grad_x, grad_y) = grid.calc_slope_at_node(z, return_components=True)
+    expected_slope, (expected_x, expected_y) = _slope_at_raster_node(grid, z)
+
+    assert_array_almost_equal(slope, expected_slope)
+    assert_array_almost_equal(grad_x, expected_x)
+    assert_array_almost_equal(grad_y, expected_y)
+
+
+def test_slope_at_raster_node_surrounded_by_closed_nodes():
+    grid = RasterModelGrid((3, 3))
+    grid.status_at_node[grid.perimeter_nodes] = grid.BC_NODE_IS_CLOSED
+
+    slope = grid.calc_slope_at_node(grid.x_of_node.copy())
+
+    assert np.all(slope == 0.0)
+
+
+@pytest.mark.parametrize("ignore_closed_nodes", [True, False])
+@pytest.mark.parametrize("node_layout", ["hex", "rect"])
+def test_slope_at_hex_node(node_layout, ignore_closed_nodes):
+    grid = HexModelGrid((5, 6), node_layout=node_layout)
+    grid.status_at_node[[2, 14]] = grid.BC_NODE_IS_CLOSED
+    z = np.random.default_rng(1945).random(grid.number_of_nodes)
+
+    slope, (grad_x, grad_y) = grid.calc_slope_at_node(
+        z, ignore_closed_nodes=ignore_closed_nodes, return_components=True
+    )
+    expected_slope, (expected_x, expected_y) = _slope_at_node_of_triangles(
+        grid, z, ignore_closed_nodes
+    )
+
+    assert_array_almost_equal(slope, expected_slope)
+    assert_array_almost_equal(grad_x, expected_x)
+    assert_array_almost_equal(grad_y, expected_y)
+
+
+def test_slope_at_voronoi_node():
+    rng = np.random.default_rng(1945)
+    grid = VoronoiDelaunayGrid(rng.random(50) * 10.0, rng.random(50) * 10.0)
+    z = rng.random(grid.number_of_nodes)
+
+    slope = grid.calc_slope_at_node(z)
+    expected_slope, _ = _slope_at_node_of_triangles(grid, z, True)
+
+    assert_array_almost_equal(slope, expected_slope)
+
+
+@pytest.mark.parametrize(
+    "grid", [RasterModelGrid((5, 6), xy_spacing=2.0), HexModelGrid((5, 6))]
+)
+def test_hillshade_at_node(grid):
+    z = grid.add_field(
+        "topographic__elevation",
+        np.random.default_rng(1945).random(grid.number_of_nodes),
+        at="node",
+    )
+    slope, components = grid.calc_slope_at_node(z, return_components=True)
+    aspect = grid.calc_aspect_at_node(slope_component_tuple=components, unit="radians")
+
+    alt, az = np.radians(30.0), np.radians(210.0)
+    expected = np.sin(alt) * np.cos(slope) + np.cos(alt) * np.sin(slope) * np.cos(
+        az - aspect
+    )
+
+    assert_array_almost_equal(
+        grid.calc_hillshade_at_node(alt=30.0, az=210.0), expected.clip(0.0)
+    )
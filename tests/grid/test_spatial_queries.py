@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from landlab import HexModelGrid, RadialModelGrid, RasterModelGrid, VoronoiDelaunayGrid
+
+
+def _grids():
+    np.random.seed(42)
+    return [
+        RasterModelGrid((5, 6), xy_spacing=(2.0, 1.0)),
+        HexModelGrid((6, 5)),
+        RadialModelGrid(n_rings=3, nodes_in_first_ring=8),
+        VoronoiDelaunayGrid(np.random.rand(40) * 10.0, np.random.rand(40) * 10.0),
+    ]
+
+
+@pytest.mark.parametrize("grid", _grids())
+def test_nodes_within_radius(grid):
+    for coord, radius in [((1.0, 2.0), 2.5), ((3.3, 0.4), 1.0), ((0.0, 0.0), 0.0)]:
+        dist = grid.calc_distances_of_nodes_to_point(coord)
+        assert_array_equal(
+            grid.nodes_within_radius(coord, radius), np.where(dist <= radius)[0]
+        )
+
+
+@pytest.mark.parametrize("grid", _grids())
+def test_find_nearest_node(grid):
+    x = np.array([0.2, 1.7, 3.1, 4.9])
+    y = np.array([0.1, 2.2, 0.6, 3.3])
+    dist = grid.calc_distances_of_nodes_to_point((x, y))
+
+    nodes = grid.find_nearest_node((x, y))
+    assert_array_almost_equal(dist[np.arange(len(x)), nodes], dist.min(axis=1))
+    for i in range(len(x)):
+        assert grid.find_nearest_node((x[i], y[i])) == nodes[i]
+
+
+def test_nearest_node_is_itself():
+    grid = HexModelGrid((4, 5))
+    assert_array_equal(
+        grid.find_nearest_node((grid.x_of_node, grid.y_of_node)),
+        np.arange(grid.number_of_nodes),
+    )
+
+
+def test_kd_tree_is_cached():
+    grid = HexModelGrid((4, 5))
+    assert grid._kd_tree_of_node is grid._kd_tree_of_node
+
+
+def test_bad_radius():
+    grid = HexModelGrid((4, 5))
+    with pytest.raises(ValueError):
+        grid.nodes_within_radius((0.0, 0.0), -1.0)
+    with pytest.raises(ValueError):
+        grid.nodes_within_radius((0.0, 0.0, 0.0), 1.0)
+
+
+@pytest.mark.parametrize("get_az", ["angles", "displacements"])
+def test_batched_distances(get_az):
+    grid = HexModelGrid((4, 5))
+    x, y = [0.5, 2.0, 3.5], [0.0, 1.2, 2.5]
+    subset = [1, 4, 7, 11]
+
+    dist, az = grid.calc_distances_of_nodes_to_point(
+        (x, y), get_az=get_az, node_subset=subset
+    )
+    assert dist.shape == (3, 4)
+    for i in range(3):
+        expected_dist, expected_az = grid.calc_distances_of_nodes_to_point(
+            (x[i], y[i]), get_az=get_az, node_subset=subset
+        )
+        assert_array_equal(dist[i], expected_dist)
+        if get_az == "displacements":
+            assert_array_equal(az[:, i], expected_az)
+        else:
+            assert_array_equal(az[i], expected_az)
+
+
+def test_distances_into_non_contiguous_out():
+    grid = HexModelGrid((4, 5))
+    x, y = [0.5, 2.0, 3.5], [0.0, 1.2, 2.5]
+    out = np.zeros((grid.number_of_nodes, 6)).T[::2]
+
+    dist = grid.calc_distances_of_nodes_to_point((x, y), out_distance=out)
+
+    assert dist is out
+    assert_array_equal(out, grid.calc_distances_of_nodes_to_point((x, y)))
+
+
+def test_all_node_maps_match_distances():
+    grid = HexModelGrid((4, 5))
+    for node in range(grid.number_of_nodes):
+        dist, az = grid.calc_distances_of_nodes_to_point(
+            grid.xy_of_node[node], get_az="angles"
+        )
+        assert_array_equal(grid.all_node_distances_map[node], dist)
+        assert_array_equal(grid.all_node_azimuths_map[node], az)
@@ -259,10 +259,50 @@ def test_points(datadir):
         read_shapefile(shp_file)
 
 
-def test_multipart(datadir):
-    shp_file = datadir / "multipartpolyline.shp"
-    with raises(ValueError):
-        read_shapefile(shp_file)
+def test_multipart():
+    shp = BytesIO()
+    shx = BytesIO()
+    dbf = BytesIO()
+    w = shapefile.Writer(shp=shp, shx=shx, dbf=dbf)
+    w.shapeType = 3
+    w.field("spam", "N")
+    w.line([[[5, 5], [10, 10]], [[5, 0], [5, 5]]])
+    w.record(37)
+    w.line([[[5, 5], [0, 10]]])
+    w.record(239)
+    w.close()
+
+    grid = read_shapefile(shp, dbf=dbf)
+
+    assert_array_equal(grid.x_of_node, [5.0, 5.0, 0.0, 10.0])
+    assert_array_equal(grid.y_of_node, [0.0, 5.0, 10.0, 10.0])
+    assert_array_equal(grid.nodes_at_link, [[0, 1], [2, 1], [1, 3]])
+    assert_array_equal(grid.at_link["spam"], [37, 239, 37])
+
+
+def test_snap_tolerance():
+    shp = BytesIO()
+    shx = BytesIO()
+    dbf = BytesIO()
+    w = shapefile.Writer(shp=shp, shx=shx, dbf=dbf)
+    w.shapeType = 3
+    w.field("spam", "N")
+    w.line([[[5, 5], [10, 10]]])
+    w.record(37)
+    w.line([[[5, 0], [5.001, 5]]])
+    w.record(100)
+    w.line([[[4.999, 5.001], [0, 10]]])
+    w.record(239)
+    w.close()
+
+    grid = read_shapefile(shp, dbf=dbf)
+    assert grid.number_of_nodes == 6
+
+    grid = read_shapefile(shp, dbf=dbf, snap_tolerance=0.01)
+    assert_array_equal(grid.x_of_node, [5.0, 5.0, 0.0, 10.0])
+    assert_array_equal(grid.y_of_node, [0.0, 5.0, 10.0, 10.0])
+    assert_array_equal(grid.nodes_at_link, [[0, 1], [2, 1], [1, 3]])
+    assert_array_equal(grid.at_link["spam"], [100, 239, 37])
 
 
 def test_bad_points():
@@ -474,3 +514,46 @@ def test_simple_reorder():
             assert_array_equal(grid.at_link["spam"], np.array([100, 239, 37]))
 
             del grid, w, shp, shx, dbf
+
+
+def test_snap_tolerance_joins_ends_of_a_polyline():
+    shp = BytesIO()
+    shx = BytesIO()
+    dbf = BytesIO()
+    w = shapefile.Writer(shp=shp, shx=shx, dbf=dbf)
+    w.shapeType = 3
+    w.field("spam", "N")
+    w.line([[[0, 0], [10, 0]]])
+    w.record(37)
+    w.line([[[10, 0], [10.5, 0]]])
+    w.record(100)
+    w.line([[[10.5, 0], [20, 5]]])
+    w.record(239)
+    w.close()
+
+    grid = read_shapefile(shp, dbf=dbf)
+    assert grid.number_of_links == 3
+
+    with raises(ValueError, match="record"):
+        read_shapefile(shp, dbf=dbf, snap_tolerance=1.0)
+
+
+def test_snap_tolerance_is_transitive():
+    shp = BytesIO()
+    shx = BytesIO()
+    dbf = BytesIO()
+    w = shapefile.Writer(shp=shp, shx=shx, dbf=dbf)
+    w.shapeType = 3
+    w.field("spam", "N")
+    w.line([[[0, 0], [0, 10]]])
+    w.record(37)
+    w.line([[[0.8, 0], [5, 10]]])
+    w.record(100)
+    w.line([[[1.6, 0], [10, 10]]])
+    w.record(239)
+    w.close()
+
+    grid = read_shapefile(shp, dbf=dbf, snap_tolerance=1.0)
+    assert_array_equal(grid.x_of_node, [0.0, 0.0, 5.0, 10.0])
+    assert_array_equal(grid.y_of_node, [0.0, 10.0, 10.0, 10.0])
+    assert_array_equal(grid.nodes_at_link, [[0, 1], [0, 2], [0, 3]])
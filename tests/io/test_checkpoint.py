@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from landlab import HexModelGrid, RasterModelGrid
+from landlab.components import FastscapeEroder, FlowAccumulator, LinearDiffuser
+from landlab.data_record import DataRecord
+from landlab.io.native_landlab import load_checkpoint, save_checkpoint
+from landlab.layers import EventLayers
+
+
+def _set_up_model(grid):
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z[grid.core_nodes] = np.random.rand(grid.number_of_core_nodes)
+    accumulator = FlowAccumulator(grid)
+    eroder = FastscapeEroder(grid, K_sp=0.01)
+    diffuser = LinearDiffuser(grid, linear_diffusivity=0.01)
+    record = DataRecord(
+        grid,
+        time=[0.0],
+        items={"grid_element": "node", "element_id": np.array([[grid.core_nodes[0]]])},
+        data_vars={"mean_elevation": (["time"], [z.mean()])},
+    )
+    return [accumulator, eroder, diffuser, record]
+
+
+def _run_model(grid, components, n_steps):
+    accumulator, eroder, diffuser, record = components
+    z = grid.at_node["topographic__elevation"]
+    for _ in range(n_steps):
+        z[grid.core_nodes] += 0.01 * np.random.rand(grid.number_of_core_nodes)
+        accumulator.run_one_step()
+        eroder.run_one_step(1.0)
+        diffuser.run_one_step(1.0)
+        record.add_record(
+            time=[record.latest_time + 1.0],
+            new_record={"mean_elevation": (["time"], [z.mean()])},
+        )
+
+
+@pytest.mark.parametrize("grid_type", [RasterModelGrid, HexModelGrid])
+def test_resume_is_bit_for_bit(tmpdir, grid_type):
+    np.random.seed(1945)
+    grid = grid_type((8, 9))
+    components = _set_up_model(grid)
+    _run_model(grid, components, 5)
+
+    save_checkpoint(str(tmpdir), grid, components)
+    _run_model(grid, components, 5)
+
+    restored, restored_components = load_checkpoint(str(tmpdir))
+    _run_model(restored, restored_components, 5)
+
+    assert_array_equal(
+        restored.at_node["topographic__elevation"],
+        grid.at_node["topographic__elevation"],
+    )
+    assert_array_equal(restored.at_node["drainage_area"], grid.at_node["drainage_area"])
+    assert_array_equal(
+        restored_components[3].dataset["mean_elevation"],
+        components[3].dataset["mean_elevation"],
+    )
+
+
+def test_components_share_restored_grid(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    components = _set_up_model(grid)
+    _run_model(grid, components, 1)
+
+    grid.save_checkpoint(str(tmpdir), components)
+    restored, (accumulator, eroder, diffuser, record) = load_checkpoint(str(tmpdir))
+
+    assert accumulator.grid is restored
+    assert diffuser.grid is restored
+    assert record._grid is restored
+    assert accumulator.surface_values is restored.at_node["topographic__elevation"]
+
+
+def test_only_changed_arrays_are_written(tmpdir):
+    grid = RasterModelGrid((32, 32))
+    z = grid.add_zeros("topographic__elevation", at="node")
+    grid.add_ones("soil__depth", at="node")
+
+    n_arrays = save_checkpoint(str(tmpdir), grid)
+    assert n_arrays > 2
+    assert save_checkpoint(str(tmpdir), grid) == 0
+
+    z += 2.0
+    assert save_checkpoint(str(tmpdir), grid) == 1
+    assert len(os.listdir(str(tmpdir.join("arrays")))) == n_arrays
+
+
+def test_prune_keeps_arrays_of_other_checkpoints(tmpdir):
+    grid = RasterModelGrid((32, 32))
+    z = grid.add_zeros("topographic__elevation", at="node")
+
+    n_arrays = save_checkpoint(str(tmpdir), grid, name="first")
+    z += 1.0
+    save_checkpoint(str(tmpdir), grid, name="second")
+    z += 1.0
+    save_checkpoint(str(tmpdir), grid, name="second")
+
+    first, _ = load_checkpoint(str(tmpdir), name="first")
+    second, _ = load_checkpoint(str(tmpdir), name="second")
+    assert_array_equal(first.at_node["topographic__elevation"], 0.0)
+    assert_array_equal(second.at_node["topographic__elevation"], 2.0)
+    assert len(os.listdir(str(tmpdir.join("arrays")))) == n_arrays + 1
+
+
+def test_component_save_checkpoint(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    grid.add_zeros("topographic__elevation", at="node")
+    diffuser = LinearDiffuser(grid, linear_diffusivity=0.01)
+    layers = EventLayers(grid.number_of_nodes)
+    layers.add(1.0, age=3.0)
+
+    diffuser.save_checkpoint(str(tmpdir), [layers])
+    restored, (restored_diffuser, restored_layers) = load_checkpoint(str(tmpdir))
+
+    assert isinstance(restored_diffuser, LinearDiffuser)
+    assert restored_diffuser.grid is restored
+    assert_array_equal(restored_layers.thickness, layers.thickness)
+    assert_array_equal(restored_layers["age"], layers["age"])
+
+
+def test_random_state_is_restored(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    save_checkpoint(str(tmpdir), grid)
+    expected = np.random.rand(10)
+
+    load_checkpoint(str(tmpdir))
+    assert_array_equal(np.random.rand(10), expected)
@@ -4,6 +4,7 @@ import pytest
 from matplotlib.backends.backend_pdf import PdfPages
 
 import landlab
+from landlab.plot.imshow import _cell_at_pixel, imshow_grid
 
 
 @pytest.mark.slow
@@ -22,3 +23,53 @@ def test_imshow_grid():
     landlab.plot.imshow_grid(rmg, values, values_at="cell", symmetric_cbar=True)
     pp.savefig()
     pp.close()
+
+
+@pytest.mark.parametrize("reducer", ["mean", "max"])
+def test_imshow_grid_raster_at_resolution(reducer):
+    rmg = landlab.RasterModelGrid((40, 50))
+    values = np.arange(rmg.number_of_nodes, dtype=float)
+
+    plt.clf()
+    imshow_grid(rmg, values, resolution=10, reducer=reducer)
+    image = plt.gca().collections[0]
+
+    assert image.get_array().size == 8 * 10
+    assert image.get_clim() == (0.0, rmg.number_of_nodes - 1.0)
+
+
+def test_imshow_grid_raster_symmetric_cbar_at_resolution():
+    rmg = landlab.RasterModelGrid((100, 100))
+    values = np.zeros(rmg.number_of_nodes)
+    values[5050] = 10.0
+
+    plt.clf()
+    imshow_grid(rmg, values, symmetric_cbar=True, resolution=10)
+    image = plt.gca().collections[0]
+
+    assert image.get_array().size == 10 * 10
+    assert image.get_clim() == (-10.0, 10.0)
+
+
+def test_imshow_grid_raster_at_bad_reducer():
+    rmg = landlab.RasterModelGrid((4, 5))
+    with pytest.raises(ValueError):
+        imshow_grid(rmg, np.arange(20.0), resolution=2, reducer="median")
+
+
+def test_imshow_grid_hex_at_resolution():
+    grid = landlab.HexModelGrid((10, 10))
+    values = grid.x_of_node
+
+    plt.clf()
+    imshow_grid(grid, values, resolution=32)
+    image = plt.gca().images[0]
+    assert max(image.get_array().shape[:2]) == 32
+
+    cell_at_pixel, _ = _cell_at_pixel(grid, 32)
+    assert cell_at_pixel.max() == grid.number_of_cells - 1
+    assert np.all(cell_at_pixel >= -1)
+
+    plt.clf()
+    imshow_grid(grid, values, resolution=32)
+    assert _cell_at_pixel(grid, 32)[0] is cell_at_pixel
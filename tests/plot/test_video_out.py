@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from landlab import RasterModelGrid
+from landlab.plot.video_out import VideoPlotter
+
+
+@pytest.fixture()
+def video(tmpdir):
+    grid = RasterModelGrid((4, 5))
+    z = grid.add_zeros("topographic__elevation", at="node")
+
+    vid = VideoPlotter(grid, buffer_dir=str(tmpdir))
+    for t in range(4):
+        z[:] = np.arange(grid.number_of_nodes) * t
+        vid.add_frame(grid, "topographic__elevation", float(t))
+    return vid
+
+
+def test_frames_are_buffered(video):
+    assert isinstance(video.data_list, np.memmap)
+    assert video.data_list.shape == (4, 20)
+    assert np.all(video.data_list[2] == np.arange(20) * 2)
+
+
+def test_frames_are_copied(video):
+    data = np.ones(20)
+    video.add_frame(video.grid, data, 4.0)
+    data[:] = 2.0
+
+    assert np.all(video.data_list[4] == 1.0)
+
+
+def test_frame_shape_mismatch(video):
+    with pytest.raises(ValueError):
+        video.add_frame(video.grid, np.zeros(12), 4.0)
+
+
+def test_clear_module(video):
+    video.add_frame(video.grid, np.zeros(20), 0.0)
+    assert len(video.data_list) == 1
+
+    video.clear_module()
+    assert len(video.data_list) == 0
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_produce_video(tmpdir, video, processes):
+    with tmpdir.as_cwd():
+        video.produce_video(filename="video.gif", processes=processes)
+        image = Image.open("video.gif")
+        assert image.n_frames == 4
+
+    assert video.min_limit == 0.0
+    assert video.max_limit == 57.0
+
+
+def test_produce_video_at_cell(tmpdir):
+    grid = RasterModelGrid((4, 5))
+
+    vid = VideoPlotter(grid, data_centering="cell")
+    for t in range(3):
+        vid.add_frame(grid, np.full(grid.number_of_cells, t), float(t))
+
+    with tmpdir.as_cwd():
+        vid.produce_video(filename="video.gif", override_min_max=(0, 5), processes=1)
+        assert Image.open("video.gif").n_frames == 3
+
+
+def test_produce_video_without_frames(tmpdir):
+    vid = VideoPlotter(RasterModelGrid((4, 5)))
+    with tmpdir.as_cwd():
+        with pytest.raises(ValueError):
+            vid.produce_video(filename="video.gif")
@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+import xarray as xr
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from landlab import HexModelGrid, RasterModelGrid
+from landlab.components import LinearDiffuser
+from landlab.utils import run_ensemble
+from landlab.utils.ensemble import _dumps_with_shared_graph, _EnsembleWorker
+
+
+def diffuse(grid, linear_diffusivity=0.1, n_steps=5):
+    diffuser = LinearDiffuser(grid, linear_diffusivity=linear_diffusivity)
+    for _ in range(n_steps):
+        diffuser.run_one_step(1.0)
+
+
+def close_and_raise(grid, amount=1.0):
+    grid.status_at_node[grid.boundary_nodes] = grid.BC_NODE_IS_CLOSED
+    grid.at_node["topographic__elevation"] += amount
+    grid.add_ones("extra", at="node")
+
+
+def record_sharing(grid):
+    is_shared = [
+        not array.flags.owndata and not array.flags.writeable
+        for array in (grid.x_of_node, grid.nodes_at_link, grid.nodes_at_face)
+    ]
+    grid.add_field("is_shared", np.full(grid.number_of_nodes, all(is_shared)), at="node")
+
+
+def _grid_with_bump(grid):
+    z = grid.add_zeros("topographic__elevation", at="node")
+    z[grid.number_of_nodes // 2] = 1.0
+    return grid
+
+
+def _run_each(grid, func, members):
+    z = []
+    for params in members:
+        copy = _grid_with_bump(grid.__class__(grid.shape))
+        func(copy, **params)
+        z.append(copy.at_node["topographic__elevation"])
+    return np.stack(z)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_matches_independent_runs(processes):
+    grid = _grid_with_bump(RasterModelGrid((9, 11)))
+    members = [{"linear_diffusivity": d} for d in (0.01, 0.1, 0.2)]
+
+    ds = run_ensemble(
+        grid, diffuse, members, "topographic__elevation", processes=processes
+    )
+
+    assert ds["topographic__elevation"].dims == ("member", "node")
+    assert_array_equal(ds["linear_diffusivity"], [0.01, 0.1, 0.2])
+    assert_array_almost_equal(
+        ds["topographic__elevation"], _run_each(grid, diffuse, members)
+    )
+
+
+def test_serial_and_parallel_are_the_same():
+    grid = _grid_with_bump(HexModelGrid((7, 7)))
+    members = [{"linear_diffusivity": d} for d in (0.01, 0.05, 0.1, 0.2)]
+
+    serial = run_ensemble(grid, diffuse, members, "topographic__elevation", processes=1)
+    parallel = run_ensemble(
+        grid, diffuse, members, "topographic__elevation", processes=2
+    )
+
+    xr.testing.assert_identical(serial, parallel)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_members_start_from_original_grid(processes):
+    grid = _grid_with_bump(RasterModelGrid((4, 5)))
+    status = grid.status_at_node.copy()
+    members = [{"amount": 1.0}, {"amount": 2.0}, {"amount": 3.0}]
+
+    ds = run_ensemble(
+        grid,
+        close_and_raise,
+        members,
+        ["topographic__elevation", "extra"],
+        processes=processes,
+    )
+
+    assert_array_equal(ds["topographic__elevation"].max(dim="node"), [2.0, 3.0, 4.0])
+    assert_array_equal(ds["extra"], 1.0)
+    assert_array_equal(grid.status_at_node, status)
+    assert "extra" not in grid.at_node
+
+
+def test_grid_from_config(tmpdir):
+    config = {
+        "RasterModelGrid": [
+            (4, 5),
+            {
+                "fields": {
+                    "node": {"topographic__elevation": {"constant": [{"value": 1.0}]}}
+                }
+            },
+        ]
+    }
+    with tmpdir.as_cwd():
+        ds = run_ensemble(
+            config,
+            close_and_raise,
+            [{"amount": 1.0}],
+            "topographic__elevation",
+            path="ensemble.nc",
+        )
+        with xr.open_dataset("ensemble.nc") as actual:
+            xr.testing.assert_identical(actual.load(), ds)
+
+    assert_array_equal(ds["topographic__elevation"], 2.0)
+
+
+@pytest.mark.parametrize("grid", [RasterModelGrid((4, 5)), HexModelGrid((4, 5))])
+def test_worker_graph_is_shared(grid):
+    _grid_with_bump(grid)
+    blocks = []
+    try:
+        grid_bytes = _dumps_with_shared_graph(grid, blocks)
+        assert len(blocks) > 0
+
+        with _EnsembleWorker(grid_bytes) as worker:
+            worker_grid = worker._grid
+            assert_array_equal(worker_grid.x_of_node, grid.x_of_node)
+            assert_array_equal(worker_grid.nodes_at_link, grid.nodes_at_link)
+            assert not worker_grid.nodes_at_link.flags.writeable
+
+            for block in blocks:
+                np.ndarray((block.size,), dtype=np.uint8, buffer=block.buf)[:] = 0
+
+            assert np.all(worker_grid.x_of_node == 0.0)
+            assert np.all(worker_grid.nodes_at_link == 0)
+            assert np.all(worker_grid.nodes_at_face == 0)
+            del worker_grid
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_members_run_on_shared_graph(processes):
+    grid = _grid_with_bump(RasterModelGrid((4, 5)))
+
+    ds = run_ensemble(
+        grid, record_sharing, [{}, {}], "is_shared", processes=processes
+    )
+
+    assert np.all(ds["is_shared"])
+
+
+def test_worker_close():
+    grid = _grid_with_bump(RasterModelGrid((4, 5)))
+    blocks = []
+    try:
+        worker = _EnsembleWorker(_dumps_with_shared_graph(grid, blocks))
+        worker.run(diffuse, {}, ["topographic__elevation"], "node")
+        opened = list(worker._blocks)
+        assert len(opened) == len(blocks)
+
+        worker.close()
+        assert all(block.buf is None for block in opened)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,62 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from landlab.utils.ext.stack_propagation import (
+    propagate_extreme_sum_downstream,
+    propagate_label_upstream,
+    propagate_mask_upstream,
+    propagate_min_sum_upstream_to_multiple,
+    propagate_sum_upstream,
+)
+
+# A small "Y" shaped network: 3 and 4 flow to 2, 2 to 1, 1 to the outlet 0.
+# Node 5 is a separate outlet.
+STACK = np.array([0, 5, 1, 2, 3, 4])
+RECEIVERS = np.array([0, 0, 1, 2, 2, 5])
+
+
+def test_propagate_sum_upstream():
+    out = np.zeros(6)
+    propagate_sum_upstream(STACK, RECEIVERS, np.arange(6.0), out)
+    assert_array_equal(out, [0.0, 1.0, 3.0, 6.0, 7.0, 0.0])
+
+
+def test_propagate_label_upstream():
+    out = np.arange(6)
+    propagate_label_upstream(STACK, RECEIVERS, out)
+    assert_array_equal(out, [0, 0, 0, 0, 0, 5])
+
+
+def test_propagate_mask_upstream():
+    out = np.zeros(6, dtype=np.uint8)
+    out[2] = 1
+    propagate_mask_upstream(STACK, RECEIVERS, out)
+    assert_array_equal(out, [0, 0, 1, 1, 1, 0])
+
+
+def test_propagate_min_sum_upstream_to_multiple():
+    receivers = np.array([[0, -1], [0, -1], [1, 0], [2, 1], [2, -1], [5, -1]])
+    increment = np.array(
+        [[0.0, 0.0], [1.0, 0.0], [1.0, 5.0], [1.0, 4.0], [2.0, 0.0], [0.0, 0.0]]
+    )
+    out = np.zeros(6)
+    propagate_min_sum_upstream_to_multiple(STACK, receivers, increment, out, -1)
+    assert_array_equal(out, [0.0, 1.0, 5.0, 5.0, 7.0, 0.0])
+
+
+def test_propagate_extreme_sum_downstream():
+    reset = np.array([0, 0, 0, 1, 1, 1], dtype=np.uint8)
+
+    out = np.zeros(6)
+    propagate_extreme_sum_downstream(
+        STACK, RECEIVERS.reshape((-1, 1)), np.ones((6, 1)), reset, out, -1
+    )
+    assert_array_equal(out, [3.0, 2.0, 1.0, 0.0, 0.0, 0.0])
+
+    out = np.full(6, 100.0)
+    increment = np.ones((6, 1))
+    increment[3] = 5.0
+    propagate_extreme_sum_downstream(
+        STACK, RECEIVERS.reshape((-1, 1)), increment, reset, out, -1, longest=False
+    )
+    assert_array_equal(out, [3.0, 2.0, 1.0, 0.0, 0.0, 0.0])